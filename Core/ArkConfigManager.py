@@ -30,10 +30,15 @@ Le fichier de configuration utilise le format YAML et permet de personnaliser:
 Note: La configuration des plugins BCASL est gérée exclusivement par bcasl.yml
 """
 
-import os
+import copy
 import fnmatch
-from pathlib import Path, PurePosixPath
-from typing import Any, Optional
+import os
+import re
+import stat
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable, Optional
 import yaml
 
 
@@ -156,72 +161,134 @@ def _deep_merge_dict(base: dict, override: dict) -> dict:
     return result
 
 
-def load_ark_config(workspace_dir: str) -> dict[str, Any]:
+# -----------------------------------------------------------------------------
+# CACHE DE CONFIGURATION
+# -----------------------------------------------------------------------------
+# Fichiers recherchés, par ordre de priorité
+_CONFIG_CANDIDATES = (
+    "ARK_Main_Config.yaml",
+    "ARK_Main_Config.yml",
+    ".ARK_Main_Config.yaml",
+    ".ARK_Main_Config.yml",
+)
+
+# Chargeur libyaml (extension C) si disponible, sinon chargeur Python pur
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# workspace absolu -> (signature des fichiers candidats, configuration figée)
+_CONFIG_CACHE: dict[str, tuple[tuple, "FrozenConfig"]] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+_DEFAULT_FROZEN: Optional["FrozenConfig"] = None
+
+
+class FrozenConfig(dict):
     """
-    Charge la configuration ARK depuis un fichier YAML.
+    Configuration ARK en lecture seule, partagée par le cache.
 
-    Cette fonction recherche un fichier de configuration dans le workspace
-    selon un ordre de priorité prédéfini et fusionne la configuration
-    utilisateur avec les valeurs par défaut.
+    Reste un dict (isinstance, get, itération) pour les accesseurs
+    existants; les sections imbriquées sont aussi figées et les listes
+    converties en tuples. copy.copy/copy.deepcopy et thaw_config()
+    renvoient une copie mutable.
+    """
 
-    Fichiers recherchés (ordre de priorité):
-    1. ARK_Main_Config.yaml
-    2. ARK_Main_Config.yml
-    3. .ARK_Main_Config.yaml
-    4. .ARK_Main_Config.yml
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(
+            "FrozenConfig est en lecture seule (utiliser thaw_config pour modifier)"
+        )
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __copy__(self) -> dict[str, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo) -> dict[str, Any]:
+        return thaw_config(self)
+
+    def __reduce__(self):
+        return (dict, (thaw_config(self),))
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return FrozenConfig({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def thaw_config(config: Any) -> Any:
+    """
+    Copie mutable (dict/list) d'une configuration figée.
 
     Args:
-        workspace_dir: Chemin absolu vers le répertoire du workspace
+        config: Configuration (ou valeur) renvoyée par get_ark_config
 
     Returns:
-        Dictionnaire complet de configuration, incluant les valeurs par défaut
-        et les personnalisations utilisateur
+        Copie profonde en dictionnaires et listes Python standards
     """
-    import copy
+    if isinstance(config, dict):
+        return {k: thaw_config(v) for k, v in config.items()}
+    if isinstance(config, (list, tuple)):
+        return [thaw_config(v) for v in config]
+    return config
 
-    # Commencer avec une copie complète de la configuration par défaut
-    config = copy.deepcopy(DEFAULT_CONFIG)
 
-    # Validation du paramètre d'entrée
-    if not workspace_dir:
-        # Normaliser la section build
-        build_opts = config.get("build", {})
-        if not isinstance(build_opts, dict):
-            build_opts = {}
-        entrypoint = build_opts.get("entrypoint")
-        if isinstance(entrypoint, str):
-            entrypoint = entrypoint.strip() or None
-        else:
-            entrypoint = None
-        build_opts["entrypoint"] = entrypoint
-        config["build"] = build_opts
-        return config
+def _normalize_build(config: dict[str, Any]) -> None:
+    """Normalise la section build (point d'entrée nettoyé ou None)."""
+    build_opts = config.get("build", {})
+    if not isinstance(build_opts, dict):
+        build_opts = {}
+    entrypoint = build_opts.get("entrypoint")
+    if isinstance(entrypoint, str):
+        entrypoint = entrypoint.strip() or None
+    else:
+        entrypoint = None
+    build_opts["entrypoint"] = entrypoint
+    config["build"] = build_opts
 
-    workspace_path = Path(workspace_dir)
 
-    # Liste des candidats fichiers de configuration par ordre de priorité
-    config_candidates = [
-        workspace_path / "ARK_Main_Config.yaml",
-        workspace_path / "ARK_Main_Config.yml",
-        workspace_path / ".ARK_Main_Config.yaml",
-        workspace_path / ".ARK_Main_Config.yml",
-    ]
-
-    # Rechercher le premier fichier de configuration existant
-    config_file = None
-    for candidate in config_candidates:
-        if candidate.exists() and candidate.is_file():
-            config_file = candidate
-            break
-
-    # Aucun fichier de configuration trouvé
-    if not config_file:
-        return config
+def _default_config() -> "FrozenConfig":
+    global _DEFAULT_FROZEN
+    if _DEFAULT_FROZEN is None:
+        config = copy.deepcopy(DEFAULT_CONFIG)
+        _normalize_build(config)
+        _DEFAULT_FROZEN = _freeze(config)
+    return _DEFAULT_FROZEN
+
 
+def _config_signature(workspace_dir: str) -> tuple[Optional[str], tuple]:
+    """
+    Premier fichier de configuration existant et signature de la recherche.
+
+    La signature contient (nom, mtime_ns, taille) du fichier retenu et None
+    pour les candidats prioritaires absents: créer, modifier ou supprimer
+    l'un d'eux change la signature.
+    """
+    sig: list[Optional[tuple[str, int, int]]] = []
+    for name in _CONFIG_CANDIDATES:
+        path = os.path.join(workspace_dir, name)
+        try:
+            st = os.stat(path)
+        except OSError:
+            sig.append(None)
+            continue
+        if stat.S_ISREG(st.st_mode):
+            sig.append((name, st.st_mtime_ns, st.st_size))
+            return path, tuple(sig)
+        sig.append(None)
+    return None, tuple(sig)
+
+
+def _parse_ark_config(config_file: str) -> dict[str, Any]:
+    """Lit, fusionne avec les valeurs par défaut et normalise un fichier ARK."""
+    config = copy.deepcopy(DEFAULT_CONFIG)
     try:
         # Lecture et parsing du fichier YAML
         with open(config_file, "r", encoding="utf-8") as f:
-            user_config = yaml.safe_load(f) or {}
+            user_config = yaml.load(f, Loader=_YAML_LOADER) or {}
 
         # Validation du format (doit être un dictionnaire)
         if not isinstance(user_config, dict):
@@ -236,11 +303,11 @@ def load_ark_config(workspace_dir: str) -> dict[str, Any]:
         # Les patterns utilisateur sont ajoutés à la liste par défaut
         if "exclusion_patterns" in config:
             if isinstance(config["exclusion_patterns"], list):
-                # Conversion en chaînes et过滤 des valeurs nulles
+                # Conversion en chaînes et filtrage des valeurs nulles
                 user_patterns = [str(p) for p in config["exclusion_patterns"] if p]
-                # Fusion avec les patterns par défaut (évite les doublons)
+                # Fusion avec les patterns par défaut (sans doublons, ordre stable)
                 config["exclusion_patterns"] = list(
-                    set(DEFAULT_EXCLUSION_PATTERNS + user_patterns)
+                    dict.fromkeys(DEFAULT_EXCLUSION_PATTERNS + user_patterns)
                 )
 
         # -----------------------------------------------------------------------------
@@ -255,17 +322,7 @@ def load_ark_config(workspace_dir: str) -> dict[str, Any]:
         # -----------------------------------------------------------------------------
         # NORMALISATION DU BUILD / POINT D'ENTRÉE
         # -----------------------------------------------------------------------------
-        build_opts = config.get("build", {})
-        if not isinstance(build_opts, dict):
-            build_opts = {}
-        entrypoint = build_opts.get("entrypoint")
-        if isinstance(entrypoint, str):
-            entrypoint = entrypoint.strip() or None
-        else:
-            entrypoint = None
-        build_opts["entrypoint"] = entrypoint
-        config["build"] = build_opts
-
+        _normalize_build(config)
         return config
 
     except Exception as e:
@@ -275,6 +332,82 @@ def load_ark_config(workspace_dir: str) -> dict[str, Any]:
         return config
 
 
+def get_ark_config(workspace_dir: str) -> "FrozenConfig":
+    """
+    Configuration ARK figée et normalisée, mise en cache par workspace.
+
+    Le fichier n'est relu que si sa signature (chemin, mtime_ns, taille)
+    change; sinon le même objet est renvoyé (quelques os.stat, pas de copie
+    ni de parsing YAML). L'objet est en lecture seule: utiliser
+    load_ark_config() ou thaw_config() pour obtenir une copie modifiable.
+
+    Args:
+        workspace_dir: Chemin absolu vers le répertoire du workspace
+
+    Returns:
+        Configuration complète (valeurs par défaut et personnalisations)
+    """
+    if not workspace_dir:
+        return _default_config()
+
+    key = os.path.abspath(workspace_dir)
+    config_file, sig = _config_signature(key)
+    with _CONFIG_CACHE_LOCK:
+        hit = _CONFIG_CACHE.get(key)
+    if hit is not None and hit[0] == sig:
+        return hit[1]
+
+    if config_file is None:
+        frozen = _default_config()
+    else:
+        frozen = _freeze(_parse_ark_config(config_file))
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE[key] = (sig, frozen)
+    return frozen
+
+
+def invalidate_ark_config_cache(workspace_dir: Optional[str] = None) -> None:
+    """
+    Vide le cache de configuration (un workspace ou tous).
+
+    Args:
+        workspace_dir: Workspace à invalider, ou None pour tout vider
+    """
+    with _CONFIG_CACHE_LOCK:
+        if workspace_dir is None:
+            _CONFIG_CACHE.clear()
+        else:
+            _CONFIG_CACHE.pop(os.path.abspath(workspace_dir), None)
+
+
+def load_ark_config(workspace_dir: str) -> dict[str, Any]:
+    """
+    Charge la configuration ARK depuis un fichier YAML.
+
+    Cette fonction recherche un fichier de configuration dans le workspace
+    selon un ordre de priorité prédéfini et fusionne la configuration
+    utilisateur avec les valeurs par défaut.
+
+    Fichiers recherchés (ordre de priorité):
+    1. ARK_Main_Config.yaml
+    2. ARK_Main_Config.yml
+    3. .ARK_Main_Config.yaml
+    4. .ARK_Main_Config.yml
+
+    Le parsing passe par le cache de get_ark_config(); le résultat est une
+    copie mutable. Les chemins chauds en lecture seule utilisent
+    directement get_ark_config().
+
+    Args:
+        workspace_dir: Chemin absolu vers le répertoire du workspace
+
+    Returns:
+        Dictionnaire complet de configuration, incluant les valeurs par défaut
+        et les personnalisations utilisateur
+    """
+    return thaw_config(get_ark_config(workspace_dir))
+
+
 def get_dependency_options(config: dict[str, Any]) -> dict[str, Any]:
     """
     Récupère les options de gestion des dépendances.
@@ -337,7 +470,7 @@ def save_ark_config(workspace_dir: str, config: dict[str, Any]) -> bool:
         config_file = workspace_path / "ARK_Main_Config.yml"
         with open(config_file, "w", encoding="utf-8") as f:
             yaml.safe_dump(
-                config,
+                thaw_config(config),
                 f,
                 sort_keys=False,
                 allow_unicode=True,
@@ -346,6 +479,8 @@ def save_ark_config(workspace_dir: str, config: dict[str, Any]) -> bool:
         return True
     except Exception:
         return False
+    finally:
+        invalidate_ark_config_cache(workspace_dir)
 
 
 def set_entrypoint(workspace_dir: str, entrypoint: Optional[str]) -> bool:
@@ -393,83 +528,220 @@ def _normalize_exclusion_pattern(pattern: str) -> str:
     return p
 
 
-def should_exclude_file(
-    file_path: str, workspace_dir: str, exclusion_patterns: Optional[list[str]]
-) -> bool:
-    """
-    Détermine si un fichier doit être exclu de la compilation.
+def _translate_segment(seg: str) -> str:
+    """Traduit un segment glob (sémantique Path.match) en regex sans "/"."""
+    out: list[str] = []
+    i, n = 0, len(seg)
+    while i < n:
+        c = seg[i]
+        i += 1
+        if c == "*":
+            while i < n and seg[i] == "*":
+                i += 1
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            j = i
+            if j < n and seg[j] == "!":
+                j += 1
+            if j < n and seg[j] == "]":
+                j += 1
+            while j < n and seg[j] != "]":
+                j += 1
+            if j >= n:
+                out.append("\\[")
+            else:
+                body = seg[i:j].replace("\\", "\\\\")
+                i = j + 1
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                elif body.startswith("^"):
+                    body = "\\" + body
+                out.append(f"[{body}]")
+        else:
+            out.append(re.escape(c))
+    return "".join(out)
 
-    Cette fonction compare le chemin du fichier avec les patterns
-    d'exclusion définis dans la configuration. Elle normalise les
-    séparateurs puis combine Path.match() et fnmatch pour supporter
-    les patterns glob avec "**" de façon cross-plateforme.
 
-    Args:
-        file_path: Chemin absolu du fichier à vérifier
-        workspace_dir: Chemin absolu du workspace
-        exclusion_patterns: Liste des patterns d'exclusion
+def _fnmatch_regex(pat: str) -> str:
+    """Regex fnmatch ("*" traverse "/") sans l'ancre finale."""
+    rx = fnmatch.translate(pat)
+    if rx.endswith("\\Z"):
+        rx = rx[:-2]
+    # fnmatch.fnmatch ignore la casse sous Windows (os.path.normcase)
+    return f"(?i:{rx})" if os.name == "nt" else rx
 
-    Returns:
-        True si le fichier doit être exclu, False sinon
+
+class ExclusionMatcher:
+    """
+    Patterns d'exclusion ARK compilés une fois pour un workspace.
+
+    Reproduit la sémantique de should_exclude_file en une seule regex,
+    appliquée au chemin absolu posix "<workspace>/<relatif>":
+    - patterns avec "**": fnmatch sur le chemin relatif et sur le chemin absolu
+      (plus le nom de base s'ils ne contiennent pas "/")
+    - autres patterns: Path.match (comparaison par la droite, segment par
+      segment); un pattern commençant par "/" est ancré à la racine
+
+    Les patterns "dossier/**" sans joker alimentent aussi un ensemble de
+    préfixes (test rapide, élagage des dossiers lors d'un parcours).
+    La résolution du workspace est faite une seule fois; is_excluded_rel()
+    accepte des chemins déjà relatifs (séparateur "/").
     """
-    try:
-        if not file_path or not workspace_dir:
-            return False
 
-        file_path_obj = Path(file_path)
-        workspace_path_obj = Path(workspace_dir)
+    __slots__ = ("workspace_dir", "patterns", "root", "_prefix", "_rx", "_dirs")
 
-        # Résolution pour éviter les surprises (symlinks, chemins relatifs)
+    def __init__(self, workspace_dir: str, patterns: tuple[str, ...]) -> None:
+        self.workspace_dir = workspace_dir
+        self.patterns = tuple(patterns)
         try:
-            file_abs = file_path_obj.resolve()
-            workspace_abs = workspace_path_obj.resolve()
+            root = os.path.realpath(workspace_dir)
         except Exception:
-            file_abs = file_path_obj
-            workspace_abs = workspace_path_obj
-
-        # Calcul du chemin relatif par rapport au workspace
-        try:
-            relative_path = file_abs.relative_to(workspace_abs)
-        except ValueError:
-            # Le fichier est hors du workspace
-            return True
-
-        # Normalisation vers POSIX pour matcher les patterns avec "/"
-        rel_posix = PurePosixPath(relative_path.as_posix())
-        abs_posix = PurePosixPath(file_abs.as_posix())
-        rel_str = rel_posix.as_posix()
-        abs_str = abs_posix.as_posix()
-        file_name = file_abs.name
-
-        patterns = exclusion_patterns or []
-
-        # Vérification des patterns d'exclusion
-        for pattern in patterns:
+            root = os.path.abspath(workspace_dir)
+        self.root = root.replace("\\", "/")
+        self._prefix = self.root if self.root.endswith("/") else self.root + "/"
+
+        globstar: list[str] = []
+        basename: list[str] = []
+        suffix: list[str] = []
+        rooted: list[str] = []
+        dirs: set[str] = set()
+        for pattern in self.patterns:
             pat = _normalize_exclusion_pattern(pattern)
             if not pat:
                 continue
-
-            # Patterns avec "**" : matcher via fnmatch pour supporter les répertoires
             if "**" in pat:
-                if fnmatch.fnmatch(rel_str, pat):
-                    return True
-                if fnmatch.fnmatch(abs_str, pat):
-                    return True
+                rx = _fnmatch_regex(pat)
+                globstar.append(rx)
+                if "/" not in pat:
+                    basename.append(rx)
+                head = pat[:-3]
+                if pat.endswith("/**") and head and not any(ch in head for ch in "*?["):
+                    dirs.add(head)
+                continue
+            parts = [p for p in pat.split("/") if p and p != "."]
+            if not parts:
+                continue
+            body = "/".join(_translate_segment(p) for p in parts)
+            if pat.startswith("/"):
+                rooted.append("/" + body)
             else:
-                # Comparaison avec le chemin relatif complet
-                if rel_posix.match(pat):
-                    return True
+                suffix.append(body)
+
+        alts: list[str] = []
+        if globstar:
+            any_glob = "(?:" + "|".join(globstar) + ")"
+            alts.append(re.escape(self._prefix) + any_glob)
+            alts.append(any_glob)
+        if basename:
+            alts.append("(?:.*/)?(?=[^/]*\\Z)(?:" + "|".join(basename) + ")")
+        if suffix:
+            alts.append("(?:.*/)?(?:" + "|".join(suffix) + ")")
+        alts.extend(rooted)
+        self._rx = (
+            re.compile("(?:" + "|".join(alts) + ")\\Z", re.DOTALL) if alts else None
+        )
+        self._dirs = frozenset(dirs)
 
-                # Autoriser les patterns absolus si fournis par l'utilisateur
-                if abs_posix.match(pat):
-                    return True
+    def relativize(self, file_path: str) -> Optional[str]:
+        """Chemin relatif posix (symlinks résolus), ou None hors du workspace."""
+        try:
+            path = os.path.realpath(file_path)
+        except Exception:
+            path = os.path.abspath(file_path)
+        path = path.replace("\\", "/")
+        if path == self.root:
+            return "."
+        if os.name == "nt":
+            inside = path.lower().startswith(self._prefix.lower())
+        else:
+            inside = path.startswith(self._prefix)
+        return path[len(self._prefix) :] if inside else None
 
-            # Comparaison avec juste le nom du fichier (pour patterns comme "*.pyc")
-            if "/" not in pat and PurePosixPath(file_name).match(pat):
+    def is_excluded(self, file_path: str) -> bool:
+        """Vrai si le fichier (chemin quelconque) est exclu ou hors du workspace."""
+        if not file_path:
+            return False
+        rel = self.relativize(file_path)
+        if rel is None:
+            return True
+        return self.is_excluded_rel(rel)
+
+    def is_excluded_rel(self, rel: str) -> bool:
+        """Vrai si le chemin relatif au workspace (séparateur "/") est exclu."""
+        if self._dirs:
+            head, sep, _rest = rel.partition("/")
+            if sep and head in self._dirs:
                 return True
+        return self._rx is not None and self._rx.match(self._prefix + rel) is not None
 
+    def prune_dir(self, rel_dir: str) -> bool:
+        """Vrai si tout le contenu du dossier relatif est exclu ("dossier/**")."""
+        if not self._dirs or not rel_dir or rel_dir == ".":
+            return False
+        parts = rel_dir.split("/")
+        for i in range(1, len(parts) + 1):
+            if "/".join(parts[:i]) in self._dirs:
+                return True
         return False
 
+
+@lru_cache(maxsize=64)
+def _compile_exclusion_matcher(
+    workspace_dir: str, patterns: tuple[str, ...]
+) -> ExclusionMatcher:
+    return ExclusionMatcher(workspace_dir, patterns)
+
+
+def get_exclusion_matcher(
+    workspace_dir: str, exclusion_patterns: Optional[Iterable[str]] = None
+) -> ExclusionMatcher:
+    """
+    Matcher d'exclusion compilé (cache LRU par workspace et patterns).
+
+    Args:
+        workspace_dir: Chemin du workspace
+        exclusion_patterns: Patterns à utiliser; None pour ceux de la
+            configuration ARK du workspace
+
+    Returns:
+        ExclusionMatcher réutilisable
+    """
+    if exclusion_patterns is None:
+        exclusion_patterns = get_ark_config(workspace_dir).get(
+            "exclusion_patterns", DEFAULT_EXCLUSION_PATTERNS
+        )
+    return _compile_exclusion_matcher(
+        workspace_dir, tuple(str(p) for p in exclusion_patterns or ())
+    )
+
+
+def should_exclude_file(
+    file_path: str, workspace_dir: str, exclusion_patterns: Optional[list[str]]
+) -> bool:
+    """
+    Détermine si un fichier doit être exclu de la compilation.
+
+    Cette fonction compare le chemin du fichier avec les patterns
+    d'exclusion définis dans la configuration. Path.match() et fnmatch
+    (patterns glob avec "**") sont compilés une fois par ExclusionMatcher;
+    pour de nombreux fichiers, utiliser directement get_exclusion_matcher().
+
+    Args:
+        file_path: Chemin absolu du fichier à vérifier
+        workspace_dir: Chemin absolu du workspace
+        exclusion_patterns: Liste des patterns d'exclusion
+
+    Returns:
+        True si le fichier doit être exclu, False sinon
+    """
+    try:
+        if not file_path or not workspace_dir:
+            return False
+        return get_exclusion_matcher(
+            workspace_dir, exclusion_patterns or ()
+        ).is_excluded(file_path)
     except Exception:
         # En cas d'erreur, safer de ne pas exclure le fichier
         return False
@@ -1,5 +1,6 @@
 from .auto_build import (
     _default_builder_for_engine,
+    clear_auto_args_cache,
     _detect_modules_preferring_requirements,
     compute_auto_for_engine,
     compute_for_all,
@@ -20,9 +21,16 @@ from .auto_build import (
     register_aliases,
     _tr,
 )
+from .mapping_index import (
+    CompiledMapping,
+    MappingIndex,
+    compile_mapping_file,
+    precompile_engines,
+)
 
 __all__ = [
     "_default_builder_for_engine",
+    "clear_auto_args_cache",
     "_detect_modules_preferring_requirements",
     "compute_auto_for_engine",
     "compute_for_all",
@@ -42,4 +50,8 @@ __all__ = [
     "register_auto_builder",
     "register_aliases",
     "_tr",
+    "CompiledMapping",
+    "MappingIndex",
+    "compile_mapping_file",
+    "precompile_engines",
 ]
@@ -13,12 +13,17 @@ Règles clés:
 from __future__ import annotations
 
 import ast
+import hashlib
 import importlib
 import importlib.resources as ilr
 import json
 import os
 import re
-from typing import Optional
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping, Set as AbstractSet
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
 
 from engine_sdk.utils import log_with_level, log_i18n_level
 
@@ -28,11 +33,7 @@ try:
 except Exception:  # pragma: no cover
     engines_registry = None  # type: ignore
 
-# Validation optionnelle via JSON Schema (si disponible)
-try:
-    import jsonschema  # type: ignore
-except Exception:
-    jsonschema = None
+from .mapping_index import MappingIndex, compile_mapping_file, merge_mappings
 
 # Import utilitaire d'exclusion stdlib
 try:
@@ -69,6 +70,23 @@ _MAPPING_CACHE: dict[str, dict[str, dict[str, Optional[str]]]] = {}
 # Collect validation warnings to surface them later in compute_auto_for_engine
 _VALIDATION_WARNINGS: list[str] = []
 
+# Cache de session des auto-args: un calcul par (moteur, mappings, entrées de
+# détection); réutilisé pour chaque fichier d'un build et entre builds tant que
+# les entrées sont inchangées.
+_AUTO_SESSION_MAX = 64
+_AUTO_SESSION: "OrderedDict[tuple, tuple[list[str], frozenset[str], str]]" = OrderedDict()
+# engine_id -> (signature des fichiers mapping, (mapping, chemin utilisé))
+_ENGINE_MAPPING_CACHE: dict[str, tuple[tuple, tuple[Mapping, Optional[str]]]] = {}
+# signature des entrées de détection -> (modules, source)
+_DETECT_CACHE: "OrderedDict[tuple, tuple[frozenset[str], str]]" = OrderedDict()
+# fichier -> (taille, mtime_ns, imports bruts) pour un scan d'imports incrémental
+# (LRU borné: un workspace couvre au plus ce nombre de fichiers mémorisés)
+_IMPORTS_FILE_CACHE_MAX = 20_000
+_IMPORTS_FILE_CACHE: "OrderedDict[str, tuple[int, int, frozenset[str]]]" = OrderedDict()
+_AUTO_LOCK = threading.RLock()
+# Incrémenté à chaque enregistrement d'alias/builder (invalide le cache de session)
+_REGISTRY_VERSION = 0
+
 # Aliases import_name -> package_name (mapping keys potentiels). Extensible à l'exécution.
 ALIASES_IMPORT_TO_PACKAGE: dict[str, str] = {}
 
@@ -76,6 +94,21 @@ ALIASES_IMPORT_TO_PACKAGE: dict[str, str] = {}
 PACKAGE_TO_IMPORT_NAME: dict[str, str] = {}
 
 
+def _bump_registry_version() -> None:
+    global _REGISTRY_VERSION
+    with _AUTO_LOCK:
+        _REGISTRY_VERSION += 1
+
+
+def clear_auto_args_cache() -> None:
+    """Vide les caches de session des auto-args (mappings, détection, résultats)."""
+    with _AUTO_LOCK:
+        _AUTO_SESSION.clear()
+        _ENGINE_MAPPING_CACHE.clear()
+        _DETECT_CACHE.clear()
+        _IMPORTS_FILE_CACHE.clear()
+
+
 # Fonctions d'extension d'alias (plug-and-play)
 def register_import_alias(import_name: str, package_name: str) -> None:
     try:
@@ -84,7 +117,9 @@ def register_import_alias(import_name: str, package_name: str) -> None:
             and isinstance(package_name, str)
             and import_name
         ):
-            ALIASES_IMPORT_TO_PACKAGE[import_name.lower()] = package_name
+            if ALIASES_IMPORT_TO_PACKAGE.get(import_name.lower()) != package_name:
+                ALIASES_IMPORT_TO_PACKAGE[import_name.lower()] = package_name
+                _bump_registry_version()
     except Exception:
         pass
 
@@ -96,7 +131,9 @@ def register_package_import_name(package_name: str, import_name: str) -> None:
             and isinstance(import_name, str)
             and package_name
         ):
-            PACKAGE_TO_IMPORT_NAME[package_name] = import_name
+            if PACKAGE_TO_IMPORT_NAME.get(package_name) != import_name:
+                PACKAGE_TO_IMPORT_NAME[package_name] = import_name
+                _bump_registry_version()
     except Exception:
         pass
 
@@ -134,44 +171,11 @@ def _norm(s: str) -> str:
 
 
 def _read_json_file(path: str) -> dict[str, dict[str, Optional[str]]]:
-    with open(path, encoding="utf-8-sig") as f:  # support BOM
-        data = json.load(f)
-    # Validation JSON Schema optionnelle (si schéma disponible)
-    if jsonschema is not None:
-        try:
-            repo_root = os.path.abspath(
-                os.path.join(os.path.dirname(__file__), os.pardir, os.pardir)
-            )
-            schema_path = os.path.join(
-                repo_root, "Core", "Auto_Builder", "schemas", "mapping.schema.json"
-            )
-            if os.path.isfile(schema_path):
-                with open(schema_path, encoding="utf-8") as sf:
-                    schema = json.load(sf)
-                jsonschema.validate(instance=data, schema=schema)
-        except Exception as e:
-            # Schema errors are downgraded to warnings to preserve plug-and-play
-            _VALIDATION_WARNINGS.append(f"Invalid mapping file '{path}': {e}")
-    # Normalize and validate structure: dict[str, dict]
-    normed: dict[str, dict[str, Optional[str]]] = {}
-    if isinstance(data, dict):
-        for k, v in data.items():
-            if not isinstance(k, str):
-                _VALIDATION_WARNINGS.append(
-                    f"Mapping key is not a string in '{path}': {k!r}"
-                )
-                continue
-            if isinstance(v, dict):
-                normed[k] = v
-            else:
-                # Accept simple forms by coercion where possible
-                # e.g., {"numpy": {"pyinstaller": ["--collect-all numpy"]}} is expected
-                _VALIDATION_WARNINGS.append(
-                    f"Mapping entry for '{k}' should be an object; got {type(v).__name__} in '{path}'"
-                )
-    else:
-        _VALIDATION_WARNINGS.append(f"Top-level mapping is not an object in '{path}'")
-    return normed
+    """Lit un mapping.json via l'index précompilé (validation JSON Schema à la
+    compilation uniquement, résultat mis en cache par empreinte du fichier)."""
+    compiled = compile_mapping_file(path)
+    _VALIDATION_WARNINGS.extend(compiled.warnings)
+    return compiled.as_dict()
 
 
 def _load_mapping(
@@ -256,11 +260,50 @@ def _parse_requirements(requirements_path: str) -> set[str]:
     return found
 
 
+def _file_raw_imports(path: str, size: int, mtime_ns: int) -> frozenset[str]:
+    """Imports top-level (statiques et dynamiques) d'un fichier, mémorisés par (taille, mtime)."""
+    with _AUTO_LOCK:
+        cached = _IMPORTS_FILE_CACHE.get(path)
+        if cached is not None:
+            _IMPORTS_FILE_CACHE.move_to_end(path)
+    if cached is not None and cached[0] == size and cached[1] == mtime_ns:
+        return cached[2]
+    found: set[str] = set()
+    with open(path, encoding="utf-8", errors="ignore") as f:
+        src = f.read()
+    try:
+        tree = ast.parse(src, filename=path)
+    except Exception:
+        tree = None
+    if tree is not None:
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    found.add(alias.name.split(".")[0])
+            elif isinstance(node, ast.ImportFrom):
+                if node.module:
+                    found.add(node.module.split(".")[0])
+        # Imports dynamiques
+        for m in re.findall(r"__import__\(['\"]([\w\.]+)['\"]\)", src):
+            found.add(m.split(".")[0])
+        for m in re.findall(r"importlib\.import_module\(['\"]([\w\.]+)['\"]\)", src):
+            found.add(m.split(".")[0])
+    result = frozenset(found)
+    _remember(
+        _IMPORTS_FILE_CACHE,
+        path,
+        (size, mtime_ns, result),
+        max_size=_IMPORTS_FILE_CACHE_MAX,
+    )
+    return result
+
+
 def _scan_imports(py_files: list[str], workspace_dir: str) -> set[str]:
     """Analyse les fichiers .py et retourne les noms de modules importés (top-level).
     - Ignore venv/, __pycache__/ et dossiers cachés
     - Ignore fichiers trop volumineux (>1.5 Mo) pour robustesse
     - Tolérant aux erreurs d'encodage/syntaxe
+    - Incrémental: seuls les fichiers modifiés (taille/mtime) sont relus
     """
     found: set[str] = set()
     # Exclure venv interne
@@ -274,31 +317,10 @@ def _scan_imports(py_files: list[str], workspace_dir: str) -> set[str]:
             parts = af.split(os.sep)
             if any(part.startswith(".") or part == "__pycache__" for part in parts):
                 continue
-            try:
-                if os.path.getsize(af) > size_cap:
-                    continue
-            except Exception:
-                pass
-            with open(af, encoding="utf-8", errors="ignore") as f:
-                src = f.read()
-            try:
-                tree = ast.parse(src, filename=af)
-            except Exception:
+            st = os.stat(af)
+            if st.st_size > size_cap:
                 continue
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        found.add(alias.name.split(".")[0])
-                elif isinstance(node, ast.ImportFrom):
-                    if node.module:
-                        found.add(node.module.split(".")[0])
-            # Imports dynamiques
-            for m in re.findall(r"__import__\(['\"]([\w\.]+)['\"]\)", src):
-                found.add(m.split(".")[0])
-            for m in re.findall(
-                r"importlib\.import_module\(['\"]([\w\.]+)['\"]\)", src
-            ):
-                found.add(m.split(".")[0])
+            found.update(_file_raw_imports(af, st.st_size, st.st_mtime_ns))
         except Exception:
             continue
     # Filtre stdlib et modules internes (fichiers du projet)
@@ -308,14 +330,14 @@ def _scan_imports(py_files: list[str], workspace_dir: str) -> set[str]:
 
 
 def _match_modules_to_mapping(
-    modules: set[str], mapping: dict[str, dict[str, Optional[str]]]
+    modules: AbstractSet[str], mapping: Mapping[str, dict[str, Optional[str]]]
 ) -> tuple[dict[str, dict[str, Optional[str]]], dict[str, str]]:
     """Retourne deux dicts:
     - matched: {package_key_in_mapping: mapping_entry}
     - package_to_import_name: {package_key_in_mapping: import_name}
     """
-    # Build lookup index insensible à la casse et aux tirets
-    index = {_norm(name): name for name in mapping.keys()}
+    # Index insensible à la casse et aux tirets (précompilé pour un MappingIndex)
+    index = getattr(mapping, "index", None) or {_norm(name): name for name in mapping}
 
     matched: dict[str, dict[str, Optional[str]]] = {}
     pkg_to_import: dict[str, str] = {}
@@ -351,16 +373,23 @@ def _match_modules_to_mapping(
 from typing import Optional as _Optional  # local alias to avoid confusion
 
 
-def _default_builder_for_engine(engine_id: str):
+def _default_builder_for_engine(engine_id: str, templates=None):
+    """templates: gabarits pré-découpés {package: ((partie, ...), ...)} d'un
+    MappingIndex (templates_for); à défaut les valeurs brutes sont interprétées."""
+
     def _builder(
         matched: dict[str, dict[str, _Optional[str]]], pkg_to_import: dict[str, str]
     ) -> list[str]:
         out: list[str] = []
         for pkg, entry in matched.items():
+            tmpl_import = pkg_to_import.get(pkg, pkg)
+            parts = templates.get(pkg) if templates is not None else None
+            if parts is not None:
+                out.extend(tmpl_import.join(p) for p in parts)
+                continue
             val = entry.get(engine_id)
             if val is None:
                 continue
-            tmpl_import = pkg_to_import.get(pkg, pkg)
             if isinstance(val, str):
                 out.append(val.replace("{import_name}", tmpl_import))
             elif isinstance(val, list):
@@ -398,7 +427,9 @@ def register_auto_builder(engine_id: str, builder) -> None:
     """
     if not engine_id or not callable(builder):
         return
-    _ENGINE_BUILDERS[engine_id] = builder
+    if _ENGINE_BUILDERS.get(engine_id) is not builder:
+        _ENGINE_BUILDERS[engine_id] = builder
+        _bump_registry_version()
 
 
 def _maybe_load_plugin_auto_builder(engine_id: str) -> None:
@@ -506,7 +537,7 @@ def _detect_modules_preferring_requirements(self) -> tuple[set[str], str]:
         if _tomllib is not None and os.path.isfile(pyproj):
             with open(pyproj, "rb") as f:
                 data = _tomllib.load(f)
-            mods: set[str] = set()
+            mods = set()
             # PEP 621
             proj = data.get("project") or {}
             deps = proj.get("dependencies") or []
@@ -547,11 +578,11 @@ def _detect_modules_preferring_requirements(self) -> tuple[set[str], str]:
 
 
 def _match_with_requirements_aware(
-    modules: set[str], mapping: dict[str, dict[str, Optional[str]]]
+    modules: AbstractSet[str], mapping: Mapping[str, dict[str, Optional[str]]]
 ) -> tuple[dict[str, dict[str, Optional[str]]], dict[str, str]]:
     """Essaye de matcher d'abord sur package names (requirements), sinon via alias import."""
     # D'abord, essayer correspondance directe sur package (utile pour Pillow, opencv, scikit-learn)
-    index = {_norm(name): name for name in mapping.keys()}
+    index = getattr(mapping, "index", None) or {_norm(name): name for name in mapping}
     matched: dict[str, dict[str, Optional[str]]] = {}
     pkg_to_import: dict[str, str] = {}
 
@@ -585,6 +616,8 @@ def compute_for_all(
         * moteurs enregistrés dans _ENGINE_BUILDERS
         * moteurs avec un mapping engine_plugins/<engine_id>/mapping.json
         * moteurs embarqués utils/engines/<engine_id>/mapping.json
+    La détection des modules est faite une seule fois pour tous les moteurs,
+    puis les builders sont exécutés en parallèle.
     Retourne un dict: { engine_id: List[str] }.
     """
     # Construire la liste ordonnée des moteurs à traiter
@@ -630,27 +663,58 @@ def compute_for_all(
                             _maybe_load_plugin_auto_builder(name)
         except Exception:
             pass
-    # Calculer pour chaque moteur
-    results: dict[str, list[str]] = {}
-    for e in ordered:
+    # Une seule détection des modules, partagée par tous les moteurs
+    try:
+        detection = _detect_modules_cached(self)
+    except Exception:
+        detection = None
+    # Mappings chargés en série: l'enregistrement des alias et les
+    # avertissements (états globaux) ne sont jamais modifiés par le pool
+    preloaded = _preload_engine_mappings(ordered)
+
+    def _one(engine_id: str) -> tuple[list[str], list[tuple]]:
+        actions: list[tuple] = []
         try:
-            args = compute_auto_for_engine(self, e) or []
+            args = (
+                _compute_engine_args(
+                    self, engine_id, detection, actions, preloaded.get(engine_id)
+                )
+                or []
+            )
         except Exception:
             args = []
+        return args, actions
+
+    # Builders exécutés en parallèle; logs et rapports rejoués ensuite dans
+    # ce thread, dans l'ordre des moteurs (la GUI n'est touchée qu'ici)
+    if len(ordered) > 1:
+        workers = min(len(ordered), 8)
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="auto-args"
+        ) as pool:
+            outcomes = list(pool.map(_one, ordered))
+    else:
+        outcomes = [_one(e) for e in ordered]
+
+    results: dict[str, list[str]] = {}
+    for e, (args, actions) in zip(ordered, outcomes):
+        _replay(self, actions)
         results[e] = args
     return results
 
 
 def _load_engine_package_mapping(
     engine_id: str,
-) -> tuple[dict[str, dict[str, Optional[str]]], Optional[str]]:
+) -> tuple[MappingIndex, Optional[str]]:
     """Charge le mapping spécifique au moteur depuis plusieurs emplacements, avec priorités:
     1) mapping.json embarqué dans le package du moteur importé (engine_id)
     2) ENGINES/<engine_id>/mapping.json (fichiers du projet)
     3) (optionnel) chemin défini par l'env PYCOMPILER_MAPPING (fusionné)
+    Chaque fichier est compilé une fois (index normalisé, alias, gabarits
+    d'arguments) puis fusionné dans un MappingIndex en lecture seule.
     Retourne (mapping_combiné, chemin_principal_utilisé)
     """
-    combined: dict[str, dict[str, Optional[str]]] = {}
+    sources = []
     used: Optional[str] = None
 
     # 1) mapping intégré dans le package du moteur (importé par engines_loader)
@@ -660,8 +724,7 @@ def _load_engine_package_mapping(
             p2 = str(p)
             if os.path.isfile(p2):
                 try:
-                    data_pkg = _read_json_file(p2)
-                    combined.update(data_pkg)
+                    sources.append(compile_mapping_file(p2))
                     used = used or p2
                 except Exception as e:
                     _VALIDATION_WARNINGS.append(
@@ -678,10 +741,7 @@ def _load_engine_package_mapping(
         engines_dir = os.path.join(project_root, "ENGINES", engine_id, "mapping.json")
         if os.path.isfile(engines_dir):
             try:
-                data_ext = _read_json_file(engines_dir)
-                for k, v in data_ext.items():
-                    if k not in combined:
-                        combined[k] = v
+                sources.append(compile_mapping_file(engines_dir))
                 used = used or engines_dir
             except Exception as e:
                 _VALIDATION_WARNINGS.append(
@@ -695,10 +755,7 @@ def _load_engine_package_mapping(
         env_path = os.environ.get("PYCOMPILER_MAPPING")
         if env_path and os.path.isfile(env_path):
             try:
-                data_env = _read_json_file(env_path)
-                for k, v in data_env.items():
-                    if k not in combined:
-                        combined[k] = v
+                sources.append(compile_mapping_file(env_path))
                 used = used or env_path
             except Exception as e:
                 _VALIDATION_WARNINGS.append(
@@ -707,136 +764,311 @@ def _load_engine_package_mapping(
     except Exception:
         pass
 
-    # Fusion optionnelle d'alias déclarés via "__aliases__"
-    try:
-        aliases = combined.get("__aliases__")  # type: ignore[index]
-        if isinstance(aliases, dict):
-            itp = aliases.get("import_to_package") or aliases.get("import2package")
-            if isinstance(itp, dict):
-                for k, v in itp.items():
-                    if isinstance(k, str) and isinstance(v, str):
-                        register_import_alias(k, v)
-            pti = aliases.get("package_to_import_name") or aliases.get("package2import")
-            if isinstance(pti, dict):
-                for k, v in pti.items():
-                    if isinstance(k, str) and isinstance(v, str):
-                        register_package_import_name(k, v)
-            try:
-                del combined["__aliases__"]
-            except Exception:
-                pass
-    except Exception:
-        pass
+    # Un même fichier (embarqué == ENGINES) n'est fusionné qu'une fois
+    unique = []
+    seen_paths: set[str] = set()
+    for src in sources:
+        if src.path not in seen_paths:
+            seen_paths.add(src.path)
+            unique.append(src)
+            _VALIDATION_WARNINGS.extend(src.warnings)
+    combined = merge_mappings(unique)
+
+    # Alias déclarés via "__aliases__" (tables précompilées)
+    for k, v in combined.import_to_package.items():
+        register_import_alias(k, v)
+    for k, v in combined.package_to_import.items():
+        register_package_import_name(k, v)
 
     return combined, used
 
 
-def compute_auto_for_engine(self, engine_id: str) -> list[str]:
-    """Calcule les arguments auto pour un moteur donné (plug-and-play)."""
+def _stat_sig(path: Optional[str]) -> Optional[tuple]:
+    if not path:
+        return None
+    try:
+        st = os.stat(path)
+        return (path, st.st_mtime_ns, st.st_size)
+    except OSError:
+        return (path, None)
+
+
+def _content_digest(path: str) -> Optional[str]:
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha1(f.read()).hexdigest()  # noqa: S324 - clé de cache
+    except OSError:
+        return None
+
+
+def _engine_mapping_signature(engine_id: str) -> tuple:
+    """(chemin, mtime_ns, taille) des mappings consultés par _load_engine_package_mapping."""
+    paths: list[Optional[str]] = []
     try:
-        os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir))
-        getattr(self, "workspace_dir", None)
-        # Charge uniquement le mapping spécifique moteur (package)
-        eng_mapping, eng_used_path = _load_engine_package_mapping(engine_id)
-        mapping = dict(eng_mapping)
+        pkg = importlib.import_module(engine_id)
+        paths.append(str(ilr.files(pkg).joinpath("mapping.json")))
+    except Exception:
+        paths.append(None)
+    project_root = os.path.abspath(
+        os.path.join(os.path.dirname(__file__), os.pardir, os.pardir)
+    )
+    paths.append(os.path.join(project_root, "ENGINES", engine_id, "mapping.json"))
+    paths.append(os.environ.get("PYCOMPILER_MAPPING"))
+    return tuple(_stat_sig(p) for p in paths)
+
+
+def _load_engine_mapping_cached(
+    engine_id: str,
+) -> tuple[tuple, Mapping[str, dict[str, Optional[str]]], Optional[str], bool]:
+    """_load_engine_package_mapping mémorisé tant que les fichiers mapping sont inchangés.
+    Retourne (signature, mapping, chemin_utilisé, depuis_le_cache)."""
+    sig = _engine_mapping_signature(engine_id)
+    with _AUTO_LOCK:
+        hit = _ENGINE_MAPPING_CACHE.get(engine_id)
+    if hit is not None and hit[0] == sig:
+        return sig, hit[1][0], hit[1][1], True
+    mapping, used = _load_engine_package_mapping(engine_id)
+    with _AUTO_LOCK:
+        _ENGINE_MAPPING_CACHE[engine_id] = (sig, (mapping, used))
+    return sig, mapping, used, False
+
+
+def _drain_validation_warnings() -> list[str]:
+    with _AUTO_LOCK:
+        warnings = list(_VALIDATION_WARNINGS)
+        del _VALIDATION_WARNINGS[:]
+    return warnings
+
+
+def _preload_engine_mappings(engine_ids: list[str]) -> dict[str, tuple[Any, list[str]]]:
+    """Charge les mappings des moteurs un par un, dans le thread appelant.
+
+    Retourne {engine_id: (résultat de _load_engine_mapping_cached ou exception,
+    avertissements de validation propres à ce moteur)}.
+    """
+    out: dict[str, tuple[Any, list[str]]] = {}
+    for engine_id in engine_ids:
         try:
-            if eng_used_path:
-                log_i18n_level(
-                    self,
-                    "info",
-                    f"Mapping spécifique moteur ({engine_id}): {eng_used_path}",
-                    f"Engine-specific mapping ({engine_id}): {eng_used_path}",
-                )
-            # Emit any validation warnings collected during mapping load
-            while _VALIDATION_WARNINGS:
-                w = _VALIDATION_WARNINGS.pop(0)
-                try:
-                    log_with_level(self, "warning", w)
-                except Exception:
-                    pass
+            loaded: Any = _load_engine_mapping_cached(engine_id)
+        except Exception as e:
+            loaded = e
+        out[engine_id] = (loaded, _drain_validation_warnings())
+    return out
+
+
+def _remember(
+    cache: "OrderedDict[Any, Any]",
+    key: Any,
+    value: Any,
+    max_size: int = _AUTO_SESSION_MAX,
+) -> None:
+    with _AUTO_LOCK:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > max_size:
+            cache.popitem(last=False)
+
+
+def _detect_modules_cached(self) -> tuple[tuple, frozenset[str], str]:
+    """_detect_modules_preferring_requirements mémorisé.
+
+    Clé: workspace + empreintes de requirements/pyproject; l'ensemble des
+    fichiers scannés (chemin, taille, mtime) n'y est ajouté que lorsque la
+    détection retombe sur le scan des imports.
+    Retourne (clé, modules, source).
+    """
+    ws = os.path.abspath(getattr(self, "workspace_dir", None) or "")
+    req_env = os.environ.get("PYCOMPILER_REQ_FILES", "requirements.txt,requirements.in")
+    req_sigs = tuple(
+        (n, _content_digest(os.path.join(ws, n)))
+        for n in (x.strip() for x in req_env.split(","))
+        if n
+    )
+    base = (ws, req_env, req_sigs, _content_digest(os.path.join(ws, "pyproject.toml")))
+    with _AUTO_LOCK:
+        hit = _DETECT_CACHE.get(base)
+    if hit is not None:
+        return base, hit[0], hit[1]
+
+    py_files = (
+        self.selected_files
+        if getattr(self, "selected_files", None)
+        else getattr(self, "python_files", [])
+    )
+    key = base + (tuple(_stat_sig(os.path.abspath(f)) for f in (py_files or [])),)
+    with _AUTO_LOCK:
+        hit = _DETECT_CACHE.get(key)
+    if hit is not None:
+        return key, hit[0], hit[1]
+
+    mods, source = _detect_modules_preferring_requirements(self)
+    value = (frozenset(mods), source)
+    # Sans scan d'imports, le résultat ne dépend pas des fichiers du projet
+    used_key = key if source == "imports" else base
+    _remember(_DETECT_CACHE, used_key, value)
+    return used_key, value[0], value[1]
+
+
+def _replay(self, actions: list[tuple]) -> None:
+    """Rejoue dans le thread appelant les logs/rapports différés d'un calcul."""
+    for act in actions:
+        try:
+            if act[0] == "log":
+                log_i18n_level(self, act[1], act[2], act[3])
+            elif act[0] == "raw":
+                log_with_level(self, act[1], act[2])
+            elif act[0] == "report":
+                _write_report_if_enabled(self, act[1])
         except Exception:
             pass
+
+
+def _compute_engine_args(
+    self,
+    engine_id: str,
+    detection: Optional[tuple[tuple, frozenset[str], str]],
+    actions: list[tuple],
+    preloaded: Optional[tuple[Any, list[str]]] = None,
+) -> list[str]:
+    """Calcul des auto-args d'un moteur sans toucher à la GUI.
+
+    Logs et rapport sont ajoutés à actions (rejoués ensuite par _replay), ce
+    qui permet d'exécuter plusieurs moteurs en parallèle. detection: résultat
+    partagé de _detect_modules_cached (calculé ici si None). preloaded: entrée
+    de _preload_engine_mappings (sinon le mapping est chargé ici).
+    """
+    early_warnings: list[str] = []
+    try:
+        if preloaded is not None:
+            loaded, early_warnings = preloaded
+            if isinstance(loaded, Exception):
+                raise loaded
+        else:
+            loaded = _load_engine_mapping_cached(engine_id)
+        mapping_sig, mapping, eng_used_path, mapping_cached = loaded
     except Exception as e:
-        try:
-            log_i18n_level(
-                self,
+        actions.append(
+            (
+                "log",
                 "warning",
                 f"Mapping hooks/plugins introuvable: {e}",
                 f"Mapping hooks/plugins not found: {e}",
             )
-        except Exception:
-            pass
+        )
         return []
 
-    detected, source = _detect_modules_preferring_requirements(self)
+    det_key, detected, source = (
+        detection if detection is not None else _detect_modules_cached(self)
+    )
+    session_key = (engine_id, mapping_sig, det_key, _REGISTRY_VERSION)
+    with _AUTO_LOCK:
+        hit = _AUTO_SESSION.get(session_key)
+        if hit is not None:
+            _AUTO_SESSION.move_to_end(session_key)
+    if hit is not None:
+        actions.append(
+            (
+                "log",
+                "info",
+                f"Auto-args {engine_id} réutilisés (entrées inchangées): "
+                + (" ".join(hit[0]) or "-"),
+                f"Auto-args {engine_id} reused (unchanged inputs): "
+                + (" ".join(hit[0]) or "-"),
+            )
+        )
+        return list(hit[0])
+
+    if eng_used_path and not mapping_cached:
+        actions.append(
+            (
+                "log",
+                "info",
+                f"Mapping spécifique moteur ({engine_id}): {eng_used_path}",
+                f"Engine-specific mapping ({engine_id}): {eng_used_path}",
+            )
+        )
+    # Emit any validation warnings collected during mapping load
+    warnings = early_warnings + _drain_validation_warnings()
+    actions.extend(("raw", "warning", w) for w in warnings)
+
     matched, pkg_to_import = _match_with_requirements_aware(detected, mapping)
-    builder = _ENGINE_BUILDERS.get(engine_id) or _default_builder_for_engine(engine_id)
-    try:
-        if engine_id not in _ENGINE_BUILDERS:
-            log_i18n_level(
-                self,
+    builder = _ENGINE_BUILDERS.get(engine_id) or _default_builder_for_engine(
+        engine_id,
+        mapping.templates_for(engine_id) if isinstance(mapping, MappingIndex) else None,
+    )
+    if engine_id not in _ENGINE_BUILDERS:
+        actions.append(
+            (
+                "log",
                 "info",
                 f"Builder générique utilisé pour le moteur '{engine_id}'.",
                 f"Generic builder used for engine '{engine_id}'.",
             )
-    except Exception:
-        pass
+        )
 
+    builder_failed = False
     try:
         args = builder(matched, pkg_to_import)
     except Exception as e:
         args = []
-        try:
-            log_i18n_level(
-                self,
+        builder_failed = True
+        actions.append(
+            (
+                "log",
                 "warning",
                 f"Erreur constructeur auto-args pour '{engine_id}': {e}",
                 f"Auto-args builder error for '{engine_id}': {e}",
             )
-        except Exception:
-            pass
+        )
 
     # Logging
-    try:
-        log_i18n_level(
-            self,
+    actions.append(
+        (
+            "log",
             "info",
             f"Auto-détection des modules sensibles ({engine_id}) activée.",
             f"Auto-detection of sensitive modules ({engine_id}) enabled.",
         )
-        log_i18n_level(
-            self, "info", f"   Source détection: {source}", f"   Detection source: {source}"
-        )
-        if detected:
-            log_i18n_level(
-                self,
+    )
+    actions.append(
+        ("log", "info", f"   Source détection: {source}", f"   Detection source: {source}")
+    )
+    if detected:
+        actions.append(
+            (
+                "log",
                 "info",
                 "   Modules détectés: " + ", ".join(sorted(detected)),
                 "   Detected modules: " + ", ".join(sorted(detected)),
             )
-        else:
-            log_i18n_level(
-                self,
+        )
+    else:
+        actions.append(
+            (
+                "log",
                 "info",
                 "   Aucun module externe détecté.",
                 "   No external modules detected.",
             )
-        if args:
-            log_i18n_level(
-                self,
+        )
+    if args:
+        actions.append(
+            (
+                "log",
                 "info",
                 f"   Options {engine_id} ajoutées: " + " ".join(args),
                 f"   {engine_id} options added: " + " ".join(args),
             )
-        else:
-            log_i18n_level(
-                self,
+        )
+    else:
+        actions.append(
+            (
+                "log",
                 "info",
                 f"   Aucune option {engine_id} supplémentaire requise d'après le mapping.",
                 f"   No additional {engine_id} options required from mapping.",
             )
-    except Exception:
-        pass
+        )
 
     # Rapport optionnel
     report = {
@@ -846,6 +1078,22 @@ def compute_auto_for_engine(self, engine_id: str) -> list[str]:
             engine_id: args,
         },
     }
-    _write_report_if_enabled(self, report)
+    actions.append(("report", report))
+
+    if not builder_failed:
+        _remember(_AUTO_SESSION, session_key, (list(args), frozenset(detected), source))
+    return args
 
+
+def compute_auto_for_engine(self, engine_id: str) -> list[str]:
+    """Calcule les arguments auto pour un moteur donné (plug-and-play).
+
+    Le résultat est mémorisé (cache de session) par moteur, signature des
+    fichiers mapping et entrées de détection: les appels suivants du même
+    build (un par fichier) et des builds ultérieurs aux entrées inchangées
+    ne relisent ni les mappings ni le projet.
+    """
+    actions: list[tuple] = []
+    args = _compute_engine_args(self, engine_id, None, actions)
+    _replay(self, actions)
     return args
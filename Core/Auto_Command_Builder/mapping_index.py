@@ -0,0 +1,471 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Ague Samuel Amen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Index précompilé des fichiers mapping.json des moteurs.
+
+Un mapping est compilé une seule fois en une structure figée:
+- entrées par package (clés spéciales '__aliases__'/'__meta__' à part)
+- index normalisé (casse/tirets) -> clé du mapping
+- tables d'alias import <-> package
+- gabarits d'arguments pré-découpés autour de '{import_name}', par moteur
+
+La validation JSON Schema n'a lieu qu'à la compilation. Le résultat est mis
+en cache sur disque, par empreinte SHA-256 du fichier, dans
+<projet>/.pref/mapping_cache (ou $PYCOMPILER_MAPPING_CACHE_DIR).
+
+Précompiler tous les ENGINES/*/mapping.json:
+    python -m Core.Auto_Command_Builder.mapping_index [--check]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Iterator, Optional, Sequence
+
+__all__ = [
+    "CompiledMapping",
+    "MappingIndex",
+    "compile_mapping_file",
+    "merge_mappings",
+    "mapping_cache_dir",
+    "normalize_name",
+    "precompile_engines",
+    "main",
+]
+
+# Incrémenter si le format compilé change (invalide le cache disque)
+_COMPILER_VERSION = 1
+_SPECIAL_KEYS = ("__aliases__", "__meta__")
+_PLACEHOLDER = "{import_name}"
+
+_PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), os.pardir, os.pardir)
+)
+SCHEMA_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "schemas", "mapping.schema.json"
+)
+
+_lock = threading.Lock()
+# Caches mémoire LRU, bornés à _CACHE_MAX entrées chacun (un fichier édité
+# laisse sinon une entrée par version)
+_CACHE_MAX = 64
+# (chemin, mtime_ns, taille) -> CompiledMapping
+_by_stat: "OrderedDict[tuple[str, int, int], CompiledMapping]" = OrderedDict()
+# empreinte -> CompiledMapping
+_by_digest: "OrderedDict[str, CompiledMapping]" = OrderedDict()
+
+
+def _remember(cache: "OrderedDict[Any, Any]", key: Any, value: Any) -> None:
+    """Insère key en tête de LRU (appelant: sous _lock)."""
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > _CACHE_MAX:
+        cache.popitem(last=False)
+
+
+def _lookup(cache: "OrderedDict[Any, Any]", key: Any) -> Any:
+    with _lock:
+        hit = cache.get(key)
+        if hit is not None:
+            cache.move_to_end(key)
+    return hit
+
+
+def normalize_name(name: str) -> str:
+    """Normalisation des noms de package (insensible à la casse et aux tirets)."""
+    return name.replace("_", "-").lower().strip()
+
+
+def mapping_cache_dir() -> str:
+    return os.environ.get("PYCOMPILER_MAPPING_CACHE_DIR") or os.path.join(
+        _PROJECT_ROOT, ".pref", "mapping_cache"
+    )
+
+
+@lru_cache(maxsize=1)
+def _schema() -> tuple[Optional[dict], str]:
+    """(schéma, empreinte) chargé une fois par processus."""
+    try:
+        with open(SCHEMA_PATH, "rb") as f:
+            raw = f.read()
+        return json.loads(raw), hashlib.sha256(raw).hexdigest()
+    except Exception:
+        return None, ""
+
+
+def _validator_available() -> bool:
+    try:
+        import jsonschema  # type: ignore  # noqa: F401
+
+        return True
+    except Exception:
+        return False
+
+
+def _split_template(arg: Any) -> tuple[str, ...]:
+    return tuple(str(arg).split(_PLACEHOLDER))
+
+
+def _engine_values(entry: dict) -> dict[str, Any]:
+    """Valeurs par moteur d'une entrée (forme directe ou {'engines': {...}})."""
+    nested = entry.get("engines")
+    if isinstance(nested, dict):
+        return nested
+    return entry
+
+
+def _templates_for_value(val: Any) -> Optional[list[tuple[str, ...]]]:
+    if isinstance(val, str):
+        return [_split_template(val)]
+    if isinstance(val, list):
+        return [_split_template(x) for x in val]
+    if isinstance(val, dict):
+        a = val.get("args") or val.get("flags")
+        if isinstance(a, list):
+            return [_split_template(x) for x in a]
+        if isinstance(a, str):
+            return [_split_template(a)]
+        return []
+    # True/None: sémantique propre au moteur, pas de gabarit générique
+    return None
+
+
+def _compile_payload(path: str, raw: bytes, digest: str) -> dict[str, Any]:
+    warnings: list[str] = []
+    data = json.loads(raw.decode("utf-8-sig"))
+
+    schema, schema_digest = _schema()
+    validated = False
+    if schema is not None and _validator_available():
+        import jsonschema  # type: ignore
+
+        validated = True
+        try:
+            jsonschema.validate(instance=data, schema=schema)
+        except Exception as e:
+            # Erreurs de schéma rétrogradées en avertissements (plug-and-play)
+            warnings.append(f"Invalid mapping file '{path}': {e}")
+
+    entries: dict[str, dict] = {}
+    specials: dict[str, dict] = {}
+    if isinstance(data, dict):
+        for k, v in data.items():
+            if not isinstance(k, str):
+                warnings.append(f"Mapping key is not a string in '{path}': {k!r}")
+                continue
+            if not isinstance(v, dict):
+                warnings.append(
+                    f"Mapping entry for '{k}' should be an object; got {type(v).__name__} in '{path}'"
+                )
+                continue
+            if k in _SPECIAL_KEYS:
+                specials[k] = v
+            else:
+                entries[k] = v
+    else:
+        warnings.append(f"Top-level mapping is not an object in '{path}'")
+
+    aliases = specials.get("__aliases__") or {}
+    itp = aliases.get("import_to_package") or aliases.get("import2package") or {}
+    pti = aliases.get("package_to_import_name") or aliases.get("package2import") or {}
+
+    templates: dict[str, dict[str, list[list[str]]]] = {}
+    for key, entry in entries.items():
+        for engine_id, val in _engine_values(entry).items():
+            tmpl = _templates_for_value(val)
+            if tmpl is not None:
+                templates.setdefault(engine_id, {})[key] = [list(t) for t in tmpl]
+
+    return {
+        "compiler": _COMPILER_VERSION,
+        "digest": digest,
+        "schema_digest": schema_digest,
+        "validated": validated,
+        "entries": entries,
+        "specials": specials,
+        "import_to_package": {
+            k.lower(): v
+            for k, v in itp.items()
+            if isinstance(k, str) and isinstance(v, str) and k
+        },
+        "package_to_import": {
+            k: v
+            for k, v in pti.items()
+            if isinstance(k, str) and isinstance(v, str) and k
+        },
+        "templates": templates,
+        "warnings": warnings,
+    }
+
+
+def _payload_is_current(payload: Any, digest: str) -> bool:
+    if not isinstance(payload, dict):
+        return False
+    if payload.get("compiler") != _COMPILER_VERSION or payload.get("digest") != digest:
+        return False
+    if payload.get("schema_digest") != _schema()[1]:
+        return False
+    # Compilé sans jsonschema alors qu'il est disponible: revalider
+    return bool(payload.get("validated")) or not _validator_available()
+
+
+class CompiledMapping(Mapping):
+    """mapping.json compilé, en lecture seule (Mapping clé -> entrée)."""
+
+    __slots__ = (
+        "path",
+        "digest",
+        "entries",
+        "specials",
+        "index",
+        "import_to_package",
+        "package_to_import",
+        "templates",
+        "warnings",
+    )
+
+    def __init__(self, path: str, payload: dict[str, Any]) -> None:
+        self.path = path
+        self.digest: str = payload["digest"]
+        self.entries = MappingProxyType(dict(payload["entries"]))
+        self.specials = MappingProxyType(dict(payload["specials"]))
+        self.index = MappingProxyType(
+            {normalize_name(k): k for k in payload["entries"]}
+        )
+        self.import_to_package = MappingProxyType(dict(payload["import_to_package"]))
+        self.package_to_import = MappingProxyType(dict(payload["package_to_import"]))
+        self.templates = MappingProxyType(
+            {
+                eng: MappingProxyType(
+                    {k: tuple(tuple(parts) for parts in v) for k, v in per_key.items()}
+                )
+                for eng, per_key in payload["templates"].items()
+            }
+        )
+        self.warnings: tuple[str, ...] = tuple(payload["warnings"])
+
+    def __getitem__(self, key: str) -> dict:
+        return self.entries[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def as_dict(self) -> dict[str, dict]:
+        """Entrées + clés spéciales, comme le JSON normalisé d'origine."""
+        out: dict[str, dict] = dict(self.entries)
+        out.update(self.specials)
+        return out
+
+
+def _read_disk_cache(digest: str) -> Optional[dict]:
+    path = os.path.join(mapping_cache_dir(), f"{digest}.json")
+    try:
+        with open(path, encoding="utf-8") as f:
+            payload = json.load(f)
+    except Exception:
+        return None
+    return payload if _payload_is_current(payload, digest) else None
+
+
+def _write_disk_cache(digest: str, payload: dict) -> None:
+    d = mapping_cache_dir()
+    tmp = os.path.join(d, f".{digest}.{os.getpid()}.tmp")
+    try:
+        os.makedirs(d, exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+        os.replace(tmp, os.path.join(d, f"{digest}.json"))
+    except Exception:
+        try:
+            os.unlink(tmp)
+        except Exception:
+            pass
+
+
+def compile_mapping_file(path: str, *, use_disk_cache: bool = True) -> CompiledMapping:
+    """Compile (ou relit depuis le cache) un fichier mapping.json.
+
+    Tant que (taille, mtime_ns) du fichier est inchangé, l'objet compilé est
+    servi depuis la mémoire sans relire le fichier; sinon le contenu est haché
+    et le cache disque consulté avant toute recompilation.
+    Lève OSError/ValueError si le fichier est illisible ou n'est pas du JSON.
+    """
+    apath = os.path.abspath(path)
+    st = os.stat(apath)
+    stat_key = (apath, st.st_mtime_ns, st.st_size)
+    hit = _lookup(_by_stat, stat_key)
+    if hit is not None:
+        return hit
+
+    with open(apath, "rb") as f:
+        raw = f.read()
+    digest = hashlib.sha256(raw).hexdigest()
+    compiled = _lookup(_by_digest, digest)
+    if compiled is None or compiled.path != apath:
+        payload = _read_disk_cache(digest) if use_disk_cache else None
+        if payload is None:
+            payload = _compile_payload(apath, raw, digest)
+            if use_disk_cache:
+                _write_disk_cache(digest, payload)
+        compiled = CompiledMapping(apath, payload)
+    with _lock:
+        _remember(_by_digest, digest, compiled)
+        _remember(_by_stat, stat_key, compiled)
+    return compiled
+
+
+class MappingIndex(Mapping):
+    """Fusion en lecture seule de plusieurs mappings compilés (le premier
+    l'emporte pour une même clé), avec index normalisé et gabarits fusionnés."""
+
+    __slots__ = (
+        "sources",
+        "entries",
+        "index",
+        "import_to_package",
+        "package_to_import",
+        "_templates",
+    )
+
+    def __init__(self, sources: Sequence[CompiledMapping]) -> None:
+        self.sources = tuple(sources)
+        entries: dict[str, dict] = {}
+        itp: dict[str, str] = {}
+        pti: dict[str, str] = {}
+        templates: dict[str, dict[str, tuple]] = {}
+        for src in self.sources:
+            for k, v in src.entries.items():
+                entries.setdefault(k, v)
+            for k, v in src.import_to_package.items():
+                itp.setdefault(k, v)
+            for k, v in src.package_to_import.items():
+                pti.setdefault(k, v)
+            for eng, per_key in src.templates.items():
+                dest = templates.setdefault(eng, {})
+                for k, t in per_key.items():
+                    # Gabarit lié à l'entrée retenue (même source)
+                    if entries.get(k) is src.entries.get(k):
+                        dest.setdefault(k, t)
+        self.entries = MappingProxyType(entries)
+        self.index = MappingProxyType({normalize_name(k): k for k in entries})
+        self.import_to_package = MappingProxyType(itp)
+        self.package_to_import = MappingProxyType(pti)
+        self._templates = {eng: MappingProxyType(t) for eng, t in templates.items()}
+
+    def __getitem__(self, key: str) -> dict:
+        return self.entries[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def templates_for(self, engine_id: str) -> Mapping:
+        """{clé: gabarits pré-découpés} pour un moteur."""
+        return self._templates.get(engine_id, MappingProxyType({}))
+
+
+_merged: "OrderedDict[tuple[str, ...], MappingIndex]" = OrderedDict()
+
+
+def merge_mappings(sources: Sequence[CompiledMapping]) -> MappingIndex:
+    """MappingIndex mémorisé par suite d'empreintes des sources."""
+    key = tuple(f"{s.path}:{s.digest}" for s in sources)
+    hit = _lookup(_merged, key)
+    if hit is None:
+        hit = MappingIndex(sources)
+        with _lock:
+            _remember(_merged, key, hit)
+    return hit
+
+
+def precompile_engines(
+    engines_dir: Optional[str] = None, *, use_disk_cache: bool = True
+) -> list[tuple[str, Optional[CompiledMapping], Optional[str]]]:
+    """Compile tous les <engines_dir>/*/mapping.json.
+    Retourne [(chemin, compilé|None, erreur|None)]."""
+    base = engines_dir or os.path.join(_PROJECT_ROOT, "ENGINES")
+    out: list[tuple[str, Optional[CompiledMapping], Optional[str]]] = []
+    try:
+        names = sorted(os.listdir(base))
+    except OSError:
+        return out
+    for name in names:
+        path = os.path.join(base, name, "mapping.json")
+        if not os.path.isfile(path):
+            continue
+        try:
+            out.append(
+                (path, compile_mapping_file(path, use_disk_cache=use_disk_cache), None)
+            )
+        except Exception as e:
+            out.append((path, None, str(e)))
+    return out
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m Core.Auto_Command_Builder.mapping_index",
+        description="Precompile ENGINES/*/mapping.json into the mapping cache.",
+    )
+    parser.add_argument("--engines-dir", help="Engines directory (default: ENGINES/)")
+    parser.add_argument(
+        "--cache-dir", help="Cache directory (default: .pref/mapping_cache)"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit with status 1 if a mapping is invalid or has warnings",
+    )
+    args = parser.parse_args(argv)
+    if args.cache_dir:
+        os.environ["PYCOMPILER_MAPPING_CACHE_DIR"] = args.cache_dir
+
+    results = precompile_engines(args.engines_dir)
+    failed = False
+    for path, compiled, error in results:
+        if compiled is None:
+            failed = True
+            print(f"[FAIL] {path}: {error}")
+            continue
+        status = "WARN" if compiled.warnings else "OK"
+        failed = failed or bool(compiled.warnings)
+        engines = ", ".join(sorted(compiled.templates)) or "-"
+        print(
+            f"[{status}] {path}: {len(compiled)} packages, engines: {engines}, "
+            f"sha256 {compiled.digest[:12]}"
+        )
+        for w in compiled.warnings:
+            print(f"       {w}")
+    print(f"{len(results)} mapping(s) -> {mapping_cache_dir()}")
+    return 1 if (args.check and failed) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
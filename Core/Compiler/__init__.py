@@ -200,10 +200,10 @@ def compile_all(self) -> None:
     files_to_compile = []
     entrypoint_file = None
     try:
-        from Core.ArkConfigManager import load_ark_config, get_entrypoint
+        from Core.ArkConfigManager import get_ark_config, get_entrypoint
 
         if self.workspace_dir:
-            cfg = load_ark_config(self.workspace_dir)
+            cfg = get_ark_config(self.workspace_dir)
             entry_rel = get_entrypoint(cfg)
             if entry_rel:
                 entrypoint_file = os.path.join(self.workspace_dir, entry_rel)
@@ -329,7 +329,8 @@ def compile_all(self) -> None:
     try:
         import EngineLoader as engines_loader
 
-        engine = engines_loader.registry.get_instance(engine_id)
+        # Construit l'onglet du moteur s'il n'a pas encore été activé
+        engine = engines_loader.registry.ensure_tab(self, engine_id)
     except Exception:
         engine = None
     if engine is None:
@@ -404,8 +405,50 @@ def _start_compilation_queue(self, engine, files_to_compile: list) -> None:
         )
         main_process._gui_connected = True
 
-    # Charger les patterns d'exclusion depuis ArkConfigManager
-    exclusion_patterns = main_process.get_exclusion_patterns()
+    # Prérequis du moteur vérifiés une seule fois pour toute la file: la
+    # compilation démarre quand l'outillage est prêt (installation asynchrone)
+    def _on_tools_ready(ok: bool) -> None:
+        if not ok:
+            log_i18n_level(
+                self,
+                "warning",
+                "Outils manquants, compilation annulée.",
+                "Missing tools, compilation cancelled.",
+            )
+            self.set_controls_enabled(True)
+            return
+        _enqueue_files(self, engine, main_process, files_to_compile)
+
+    _when_tools_ready(self, engine, _on_tools_ready)
+
+
+def _when_tools_ready(self, engine, callback) -> None:
+    """Appelle callback(ok) quand les outils du moteur sont prêts (sans bloquer)."""
+    if hasattr(engine, "ensure_tools_ready"):
+        try:
+            fut = engine.ensure_tools_ready(self)
+        except Exception:
+            fut = None
+        if fut is not None:
+            if fut.done():
+                callback(bool(fut.result()))
+            else:
+                log_i18n_level(
+                    self,
+                    "info",
+                    "En attente de l'installation des outils du moteur...",
+                    "Waiting for engine tools installation...",
+                )
+                fut.add_done_callback(lambda f: callback(bool(f.result())))
+            return
+    if hasattr(engine, "ensure_tools_installed"):
+        callback(bool(engine.ensure_tools_installed(self)))
+        return
+    callback(True)
+
+
+def _enqueue_files(self, engine, main_process, files_to_compile: list) -> None:
+    """Lance la compilation de chaque fichier non exclu."""
     excluded_count = 0
 
     # Compiler chaque fichier avec vérification des exclusions
@@ -430,18 +473,6 @@ def _start_compilation_queue(self, engine, files_to_compile: list) -> None:
             )
             continue
 
-        # Vérifier les prérequis du moteur
-        if hasattr(engine, "ensure_tools_installed"):
-            if not engine.ensure_tools_installed(self):
-                log_i18n_level(
-                    self,
-                    "warning",
-                    "Outils manquants, compilation annulée.",
-                    "Missing tools, compilation cancelled.",
-                )
-                self.set_controls_enabled(True)
-                return
-
         # Construire la commande
         cmd = engine.build_command(self, file_path)
         if not cmd:
@@ -599,7 +630,8 @@ def start_compilation_process(self, engine_id: str, file_path: str) -> bool:
     try:
         import EngineLoader as engines_loader
 
-        engine = engines_loader.registry.get_instance(engine_id)
+        # Construit l'onglet du moteur s'il n'a pas encore été activé
+        engine = engines_loader.registry.ensure_tab(self, engine_id)
     except Exception:
         engine = None
     if engine is None:
@@ -621,10 +653,6 @@ def start_compilation_process(self, engine_id: str, file_path: str) -> bool:
             pass
 
     def _do_start() -> bool:
-        # Vérifier les prérequis
-        if not engine.ensure_tools_installed(self):
-            return False
-
         # Construire la commande
         cmd = engine.build_command(self, file_path)
         if not cmd:
@@ -692,12 +720,13 @@ def start_compilation_process(self, engine_id: str, file_path: str) -> bool:
     self.set_controls_enabled(False)
     _set_progress_indeterminate(self)
 
-    result = {"value": None}
+    result: dict[str, Optional[bool]] = {"value": None}
 
-    def _after_bcasl(_report=None) -> None:
+    def _start_when_ready(tools_ok: bool) -> None:
         ok = False
         try:
-            ok = _do_start()
+            # Prérequis vérifiés/installés sans bloquer (voir _when_tools_ready)
+            ok = tools_ok and _do_start()
         except Exception as e:
             log_i18n_level(
                 self,
@@ -709,6 +738,19 @@ def start_compilation_process(self, engine_id: str, file_path: str) -> bool:
             self.set_controls_enabled(True)
         result["value"] = ok
 
+    def _after_bcasl(_report=None) -> None:
+        try:
+            _when_tools_ready(self, engine, _start_when_ready)
+        except Exception as e:
+            log_i18n_level(
+                self,
+                "error",
+                f"Erreur démarrage compilation : {e}",
+                f"Compilation start error: {e}",
+            )
+            self.set_controls_enabled(True)
+            result["value"] = False
+
     _run_bcasl_before_compile(self, _after_bcasl)
     if result["value"] is not None:
         return bool(result["value"])
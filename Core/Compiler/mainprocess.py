@@ -50,8 +50,8 @@ from Core.Compiler.compiler import (
 
 # Importations ArkConfigManager pour la gestion des exclusions
 from Core.ArkConfigManager import (
-    load_ark_config,
-    should_exclude_file,
+    get_ark_config,
+    get_exclusion_matcher,
     DEFAULT_EXCLUSION_PATTERNS,
 )
 
@@ -416,8 +416,10 @@ class MainProcess(QObject):
         """
         if self._workspace_dir:
             try:
-                config = load_ark_config(self._workspace_dir)
-                return config.get("exclusion_patterns", DEFAULT_EXCLUSION_PATTERNS)
+                config = get_ark_config(self._workspace_dir)
+                return list(
+                    config.get("exclusion_patterns", DEFAULT_EXCLUSION_PATTERNS)
+                )
             except Exception:
                 pass
         return DEFAULT_EXCLUSION_PATTERNS
@@ -432,10 +434,16 @@ class MainProcess(QObject):
         Returns:
             True si le fichier doit être exclu, False sinon
         """
-        if not self._workspace_dir:
+        if not self._workspace_dir or not file_path:
+            return False
+        try:
+            # Matcher compilé une fois par (workspace, patterns)
+            matcher = get_exclusion_matcher(
+                self._workspace_dir, self.get_exclusion_patterns()
+            )
+            return matcher.is_excluded(file_path)
+        except Exception:
             return False
-        patterns = self.get_exclusion_patterns()
-        return should_exclude_file(file_path, self._workspace_dir, patterns)
 
 
 # =========================================================================
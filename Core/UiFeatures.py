@@ -211,9 +211,9 @@ class UiFeatures:
         if not workspace_dir:
             return
         try:
-            from .ArkConfigManager import load_ark_config, get_entrypoint
+            from .ArkConfigManager import get_ark_config, get_entrypoint
 
-            cfg = load_ark_config(workspace_dir)
+            cfg = get_ark_config(workspace_dir)
             entry_rel = get_entrypoint(cfg)
         except Exception:
             entry_rel = None
@@ -5,6 +5,9 @@ import platform
 import shutil
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import yaml
 
 from PySide6.QtCore import QProcess, QTimer
@@ -51,6 +54,8 @@ class VenvManager:
         self._venv_check_index = 0
         self._venv_check_pip_exe = None
         self._venv_check_path = None
+        # pip processes started by ensure_tools_installed (one chain per call)
+        self._venv_tool_processes: list[QProcess] = []
 
         # For fresh venv install flow (no longer used for tool installs)
 
@@ -77,6 +82,13 @@ class VenvManager:
         self._auto_venv_cache: dict[str, str] = {}
         # Cache for manager-provided venv per workspace (None if not found)
         self._manager_venv_cache: dict[str, str | None] = {}
+        # Binding checks per venv root: root -> (cfg/python/pip stats, ok)
+        self._binding_cache: dict[str, tuple[tuple, bool]] = {}
+        self._binding_lock = threading.Lock()
+        # Resolved venv per workspace: base -> (signature, venv|None, venv cfg stat)
+        self._resolved_venv_cache: dict[
+            str, tuple[tuple, str | None, tuple | None]
+        ] = {}
 
     # ---------- Manager mapping ----------
     def _default_manager_commands(self) -> dict[str, dict[str, list[str]]]:
@@ -237,6 +249,101 @@ class VenvManager:
             if not base:
                 return None
 
+            # Resolution cache: a dict lookup while candidate venvs, manager
+            # files and pyvenv.cfg are unchanged
+            sig = self._venv_resolution_signature(base)
+            hit = self._resolved_venv_cache.get(base)
+            if (
+                hit is not None
+                and hit[0] == sig
+                and (hit[1] is None or self._venv_cfg_stat(hit[1]) == hit[2])
+            ):
+                return hit[1]
+            if hit is not None:
+                # Inputs changed: forget derived per-workspace caches too
+                self._manager_venv_cache.pop(base, None)
+                self._auto_venv_cache.pop(base, None)
+
+            resolved = self._resolve_existing_venv_uncached(base)
+            self._resolved_venv_cache[base] = (
+                sig,
+                resolved,
+                self._venv_cfg_stat(resolved) if resolved else None,
+            )
+            return resolved
+        except Exception:
+            return None
+
+    # Files whose changes can alter which venv a workspace resolves to
+    _VENV_CANDIDATE_NAMES = (".venv", "venv", ".env", "env", "virtualenv")
+    _VENV_MANAGER_FILES = (
+        "pyproject.toml",
+        "poetry.lock",
+        "Pipfile",
+        "Pipfile.lock",
+        "pdm.lock",
+        "uv.lock",
+        "environment.yml",
+        "environment.yaml",
+        "conda.yml",
+        "requirements.txt",
+        "ARK_Main_Config.yaml",
+        "ARK_Main_Config.yml",
+        ".ARK_Main_Config.yaml",
+        ".ARK_Main_Config.yml",
+    )
+
+    @staticmethod
+    def _stat_key(path: str) -> tuple | None:
+        try:
+            st = os.stat(path)
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+
+    def _venv_cfg_stat(self, venv_root: str) -> tuple | None:
+        return self._stat_key(os.path.join(venv_root, "pyvenv.cfg"))
+
+    def _venv_resolution_signature(self, base: str) -> tuple:
+        """mtimes of the workspace, candidate venv dirs (+ bin/ and pyvenv.cfg)
+        and manager/lock files: any change invalidates the resolved venv."""
+        bindir = "Scripts" if platform.system() == "Windows" else "bin"
+        parts: list = [self._stat_key(base)]
+        for name in self._VENV_CANDIDATE_NAMES:
+            vp = os.path.join(base, name)
+            parts.append(
+                (
+                    self._stat_key(vp),
+                    self._stat_key(os.path.join(vp, bindir)),
+                    self._stat_key(os.path.join(vp, "pyvenv.cfg")),
+                )
+            )
+        for name in self._VENV_MANAGER_FILES:
+            parts.append(self._stat_key(os.path.join(base, name)))
+        return tuple(parts)
+
+    def invalidate_venv_cache(self, workspace_dir: str | None = None) -> None:
+        """Forget resolved venvs (for one workspace, or all when None)."""
+        if workspace_dir is None:
+            self._resolved_venv_cache.clear()
+            self._manager_venv_cache.clear()
+            self._auto_venv_cache.clear()
+            with self._binding_lock:
+                self._binding_cache.clear()
+            return
+        base = os.path.abspath(workspace_dir)
+        for cache in (
+            self._resolved_venv_cache,
+            self._manager_venv_cache,
+            self._auto_venv_cache,
+        ):
+            cache.pop(base, None)
+        with self._binding_lock:
+            for root in [r for r in self._binding_cache if self._is_within(r, base)]:
+                del self._binding_cache[root]
+
+    def _resolve_existing_venv_uncached(self, base: str) -> str | None:
+        try:
             # Prefer manager-provided venv (poetry/pipenv/pdm/...) when available
             mgr_venv = self._detect_manager_existing_venv(base)
             if mgr_venv:
@@ -374,22 +481,151 @@ class VenvManager:
             except Exception:
                 pass
 
-    def ensure_tools_installed(self, venv_root: str, tools: list[str]) -> None:
-        """Asynchronously check/install the provided tools list with progress dialog."""
+    def ensure_tools_installed(
+        self, venv_root: str, tools: list[str], on_done=None
+    ) -> None:
+        """Asynchronously check/install the provided tools list with progress dialog.
+        on_done(ok: bool) is called exactly once, when every tool was checked/installed
+        (False if a tool failed or a pip process could not run).
+        Each call owns its state, so concurrent calls do not interfere."""
+        tools = [t for t in (tools or []) if t]
+        failed: list[str] = []
+        finished = {"v": False}
+        progress = None
+
+        def _finish(ok: bool) -> None:
+            if finished["v"]:
+                return
+            finished["v"] = True
+            try:
+                if progress is not None:
+                    progress.set_message("Vérification terminée.")
+                    progress.set_progress(len(tools), len(tools))
+                    progress.close()
+            except Exception:
+                pass
+            if callable(on_done):
+                try:
+                    on_done(bool(ok))
+                except Exception:
+                    pass
+
+        def _step(index: int) -> None:
+            if getattr(self.parent, "_closing", False):
+                _finish(False)
+                return
+            if index >= len(tools):
+                _finish(not failed)
+                # Installer les dépendances du projet si un requirements.txt est présent
+                try:
+                    if getattr(self.parent, "workspace_dir", None):
+                        self.install_requirements_if_needed(self.parent.workspace_dir)
+                except Exception:
+                    pass
+                return
+            pkg = tools[index]
+            try:
+                if progress is not None:
+                    progress.set_message(f"Vérification de {pkg}...")
+                    progress.set_progress(index, len(tools))
+            except Exception:
+                pass
+
+            def _checked(code: int) -> None:
+                if code == 0:
+                    self._safe_log(f"✅ {pkg} déjà installé dans le venv.")
+                    _step(index + 1)
+                    return
+                self._safe_log(f"📦 Installation automatique de {pkg} dans le venv...")
+                try:
+                    if progress is not None:
+                        progress.set_message(f"Installation de {pkg}...")
+                        progress.progress.setRange(0, 0)
+                except Exception:
+                    pass
+                self._run_pip_step(
+                    venv_root, pip_exe, ["install", pkg], 600_000, _installed, True
+                )
+
+            def _installed(code: int) -> None:
+                if code == 0:
+                    self._safe_log(f"✅ {pkg} installé dans le venv.")
+                else:
+                    self._safe_log(f"❌ Erreur installation {pkg} (code {code})")
+                    failed.append(pkg)
+                try:
+                    if progress is not None:
+                        progress.progress.setRange(0, len(tools))
+                except Exception:
+                    pass
+                _step(index + 1)
+
+            self._run_pip_step(venv_root, pip_exe, ["show", pkg], 30_000, _checked)
+
         try:
-            self._venv_check_pkgs = list(tools)
-            self._venv_check_index = 0
-            self._venv_check_pip_exe = self.pip_path(venv_root)
-            self._venv_check_path = venv_root
-            self.venv_check_progress = ProgressDialog(
-                "Vérification du venv", self.parent
-            )
-            self.venv_check_progress.set_message(f"Vérification de {tools[0]}...")
-            self.venv_check_progress.set_progress(0, len(tools))
-            self.venv_check_progress.show()
-            self._check_next_venv_pkg()
+            pip_exe = self.pip_path(venv_root)
+            if tools:
+                progress = ProgressDialog("Vérification du venv", self.parent)
+                self.venv_check_progress = progress
+                progress.set_message(f"Vérification de {tools[0]}...")
+                progress.set_progress(0, len(tools))
+                progress.show()
+            _step(0)
         except Exception as e:
             self._safe_log(f"❌ Erreur ensure_tools_installed: {e}")
+            _finish(False)
+
+    def _run_pip_step(
+        self,
+        venv_root: str,
+        pip_exe: str,
+        args: list[str],
+        timeout_ms: int,
+        on_exit,
+        stream_output: bool = False,
+    ) -> None:
+        """Run pip with args via QProcess; on_exit(code) is called exactly once,
+        with -1 if the process fails to start or crashes."""
+        process = QProcess(self.parent)
+        fired = {"v": False}
+
+        def _exit(code: int) -> None:
+            if fired["v"] or getattr(self.parent, "_closing", False):
+                return
+            fired["v"] = True
+            on_exit(code)
+
+        def _on_error(err) -> None:
+            if err == QProcess.ProcessError.FailedToStart:
+                self._safe_log(f"❌ Impossible de lancer pip {' '.join(args)}")
+                _exit(-1)
+
+        process.setProgram(pip_exe)
+        process.setArguments(args)
+        process.setWorkingDirectory(venv_root)
+        if stream_output:
+            process.readyReadStandardOutput.connect(
+                lambda: self._on_venv_check_output(process)
+            )
+            process.readyReadStandardError.connect(
+                lambda: self._on_venv_check_output(process, error=True)
+            )
+        process.errorOccurred.connect(_on_error)
+        process.finished.connect(
+            lambda code, status: _exit(
+                code if status == QProcess.ExitStatus.NormalExit else -1
+            )
+        )
+        self._venv_tool_processes.append(process)
+        process.finished.connect(lambda *_a: self._forget_tool_process(process))
+        process.start()
+        self._arm_process_timeout(process, timeout_ms, f"pip {' '.join(args)}")
+
+    def _forget_tool_process(self, process) -> None:
+        try:
+            self._venv_tool_processes.remove(process)
+        except ValueError:
+            pass
 
     # ---------- Utility ----------
     def _safe_decode(self, data: bytes, error_handling: str = "replace") -> str:
@@ -1145,11 +1381,44 @@ class VenvManager:
             pass
         self._safe_log(data)
 
+    def _binding_signature(self, venv_root: str) -> tuple:
+        return (
+            self._venv_cfg_stat(venv_root),
+            self._stat_key(self.python_path(venv_root)),
+            self._stat_key(self.pip_path(venv_root)),
+        )
+
+    def _cached_binding(self, venv_root: str) -> tuple[tuple, bool | None]:
+        """(signature, résultat mémorisé ou None) de la vérification de liaison."""
+        key = os.path.abspath(venv_root)
+        sig = self._binding_signature(key)
+        with self._binding_lock:
+            hit = self._binding_cache.get(key)
+        if hit is not None and hit[0] == sig:
+            return sig, hit[1]
+        return sig, None
+
+    def _store_binding(self, venv_root: str, sig: tuple, ok: bool) -> None:
+        # Seules les liaisons valides sont mémorisées: un échec peut venir d'un
+        # délai dépassé ou d'une erreur passagère et doit être revérifié
+        if not ok:
+            return
+        with self._binding_lock:
+            self._binding_cache[os.path.abspath(venv_root)] = (sig, True)
+
     def verify_venv_binding(self, venv_root: str) -> bool:
-        """Conservation de la version synchrone pour compat interne (éviter blocages ailleurs)."""
-        try:
-            import subprocess
+        """Conservation de la version synchrone pour compat interne (éviter blocages ailleurs).
+        Une liaison valide est mémorisée tant que pyvenv.cfg, python et pip du venv
+        sont inchangés; un échec n'est jamais mémorisé."""
+        sig, cached = self._cached_binding(venv_root)
+        if cached is not None:
+            return cached
+        ok = self._verify_venv_binding_uncached(venv_root)
+        self._store_binding(venv_root, sig, ok)
+        return ok
 
+    def _verify_venv_binding_uncached(self, venv_root: str) -> bool:
+        try:
             vpython = self.python_path(venv_root)
             if not os.path.isfile(vpython):
                 return False
@@ -1157,6 +1426,7 @@ class VenvManager:
                 [vpython, "-c", "import sys, os; print(os.path.realpath(sys.prefix))"],
                 capture_output=True,
                 text=True,
+                timeout=30,
             )
             if cp.returncode != 0:
                 return False
@@ -1166,7 +1436,9 @@ class VenvManager:
             vpip = self.pip_path(venv_root)
             if not os.path.isfile(vpip):
                 return False
-            cp2 = subprocess.run([vpip, "--version"], capture_output=True, text=True)
+            cp2 = subprocess.run(
+                [vpip, "--version"], capture_output=True, text=True, timeout=30
+            )
             if cp2.returncode != 0:
                 return False
             import re as _re
@@ -1183,10 +1455,19 @@ class VenvManager:
 
     def _verify_venv_binding_async(self, venv_root: str, callback):
         """Vérifie de manière asynchrone que python et pip du venv pointent bien vers ce venv, puis appelle callback(bool)."""
+        sig, cached = self._cached_binding(venv_root)
+        if cached is not None:
+            callback(cached)
+            return
+
+        def _done(ok):
+            self._store_binding(venv_root, sig, ok)
+            callback(ok)
+
         try:
             vpython = self.python_path(venv_root)
             if not os.path.isfile(vpython):
-                callback(False)
+                _done(False)
                 return
             # Étape 1: vérifier sys.prefix
             p1 = QProcess(self.parent)
@@ -1194,36 +1475,36 @@ class VenvManager:
             def _p1_finished(code, _status):
                 try:
                     if code != 0:
-                        callback(False)
+                        _done(False)
                         return
                     out = p1.readAllStandardOutput().data().decode().strip()
                     sys_prefix = os.path.realpath(out)
                     if not self._is_within(sys_prefix, venv_root):
-                        callback(False)
+                        _done(False)
                         return
                     # Étape 2: vérifier pip --version et site-path
                     vpip = self.pip_path(venv_root)
                     if not os.path.isfile(vpip):
-                        callback(False)
+                        _done(False)
                         return
                     p2 = QProcess(self.parent)
 
                     def _p2_finished(code2, _status2):
                         try:
                             if code2 != 0:
-                                callback(False)
+                                _done(False)
                                 return
                             text = p2.readAllStandardOutput().data().decode().strip()
                             import re as _re
 
                             m = _re.search(r" from (.+?) \(python ", text)
                             if not m:
-                                callback(False)
+                                _done(False)
                                 return
                             site_path = os.path.realpath(m.group(1))
-                            callback(self._is_within(site_path, venv_root))
+                            _done(self._is_within(site_path, venv_root))
                         except Exception:
-                            callback(False)
+                            _done(False)
 
                     p2.finished.connect(_p2_finished)
                     p2.setProgram(vpip)
@@ -1231,7 +1512,7 @@ class VenvManager:
                     p2.setWorkingDirectory(venv_root)
                     p2.start()
                 except Exception:
-                    callback(False)
+                    _done(False)
 
             p1.finished.connect(_p1_finished)
             p1.setProgram(vpython)
@@ -1241,7 +1522,7 @@ class VenvManager:
             p1.setWorkingDirectory(venv_root)
             p1.start()
         except Exception:
-            callback(False)
+            _done(False)
 
     def _arm_process_timeout(self, process: QProcess, timeout_ms: int, label: str):
         """Arm a one-shot timer to kill a long-running process and keep UI responsive."""
@@ -1300,21 +1581,29 @@ class VenvManager:
         except Exception:
             return []
 
-        venvs = []
-        common_names = [".venv", "venv", ".env", "env", "virtualenv"]
-
-        for name in common_names:
-            venv_path = os.path.join(base, name)
-            if os.path.isdir(venv_path):
-                ok, _ = self.validate_venv_strict(venv_path)
-                if ok:
-                    venvs.append(venv_path)
-
-        return venvs
-
-    def _score_venv(self, venv_path: str, workspace_dir: str) -> tuple[int, str]:
+        candidates = [
+            os.path.join(base, name)
+            for name in self._VENV_CANDIDATE_NAMES
+            if os.path.isdir(os.path.join(base, name))
+        ]
+        checks = self._map_concurrent(self.validate_venv_strict, candidates)
+        return [p for p, (ok, _) in zip(candidates, checks) if ok]
+
+    def _map_concurrent(self, func, items: list) -> list:
+        """Ordered map over items on a small thread pool (serial for 0/1 item)."""
+        if len(items) <= 1:
+            return [func(x) for x in items]
+        with ThreadPoolExecutor(
+            max_workers=min(len(items), 8), thread_name_prefix="venv-scan"
+        ) as pool:
+            return list(pool.map(func, items))
+
+    def _score_venv(
+        self, venv_path: str, workspace_dir: str, validated: bool = False
+    ) -> tuple[int, str]:
         """Score a venv based on its completeness and requirements satisfaction.
         Returns (score, reason) where higher score = better venv.
+        validated=True skips the strict validation already done by the caller.
 
         Scoring criteria:
         - Has requirements.txt satisfied: +100
@@ -1329,9 +1618,10 @@ class VenvManager:
 
         try:
             # Check if venv is valid
-            ok, _ = self.validate_venv_strict(venv_path)
-            if not ok:
-                return 0, "Invalid venv structure"
+            if not validated:
+                ok, _ = self.validate_venv_strict(venv_path)
+                if not ok:
+                    return 0, "Invalid venv structure"
             score += 10
             reasons.append("valid_structure")
 
@@ -1398,9 +1688,12 @@ class VenvManager:
                 f"ℹ️ {len(venvs)} venv(s) trouvé(s), sélection du meilleur..."
             )
 
+            # Binding checks (subprocesses) run concurrently; logs stay ordered
+            scores = self._map_concurrent(
+                lambda v: self._score_venv(v, workspace_dir, validated=True), venvs
+            )
             scored_venvs = []
-            for venv_path in venvs:
-                score, reason = self._score_venv(venv_path, workspace_dir)
+            for venv_path, (score, reason) in zip(venvs, scores):
                 scored_venvs.append((score, venv_path, reason))
                 self._safe_log(
                     f"  - {os.path.basename(venv_path)}: score={score} ({reason})"
@@ -1580,6 +1873,7 @@ class VenvManager:
     def _on_venv_created(self, process, code, status, venv_path):
         if getattr(self.parent, "_closing", False):
             return
+        self.invalidate_venv_cache(os.path.dirname(venv_path))
         if code == 0:
             self._safe_log("✅ Environnement virtuel créé avec succès.")
             try:
@@ -2247,6 +2541,12 @@ class VenvManager:
             except Exception:
                 pass
             setattr(self, attr, None)
+        for proc in list(self._venv_tool_processes):
+            try:
+                proc.kill()
+            except Exception:
+                pass
+        self._venv_tool_processes.clear()
         # Close dialogs
         for dlg_attr in [
             "venv_progress_dialog",
@@ -19,7 +19,7 @@ from typing import Optional
 
 from PySide6.QtWidgets import QApplication, QFileDialog, QMessageBox
 
-from Core.ArkConfigManager import load_ark_config, should_exclude_file
+from Core.ArkConfigManager import get_exclusion_matcher
 from Core.Globals import _workspace_dir_cache, _workspace_dir_lock
 from Core.WidgetsCreator import CompilationProcessDialog
 
@@ -271,6 +271,14 @@ class SetupWorkspace:
                     f"⚠️ Error during workspace setup: {e}",
                 )
 
+            # Pré-vérification (sans installation) de l'outillage de tous les moteurs
+            try:
+                from EngineLoader.readiness import get_readiness
+
+                get_readiness().warm_up(gui_instance)
+            except Exception:
+                pass
+
             # Appliquer la configuration des engines depuis .ark/<engine_id>/config.json
             try:
                 from Core.EngineConfigManager import apply_engine_configs_for_workspace
@@ -320,32 +328,52 @@ class SetupWorkspace:
 
         workspace_dir = getattr(gui_instance, "workspace_dir", None)
 
-        # Charger la configuration ARK pour les patterns d'exclusion
-        ark_config = load_ark_config(workspace_dir)
-        exclusion_patterns = ark_config.get("exclusion_patterns", [])
+        # Patterns d'exclusion ARK compilés une fois (cache par workspace)
+        matcher = (
+            get_exclusion_matcher(workspace_dir) if workspace_dir else None
+        )
+        known = set(gui_instance.python_files)
 
         last_pump = time.monotonic()
-        for root, _, files in os.walk(folder):
+        for root, dirs, files in os.walk(folder):
+            # Vérifier si le dossier est dans le workspace
+            if (
+                workspace_dir
+                and not os.path.commonpath([root, workspace_dir]) == workspace_dir
+            ):
+                dirs[:] = []
+                continue
+
+            rel_root = ""
+            if matcher is not None:
+                rel_root = os.path.relpath(root, workspace_dir).replace("\\", "/")
+                if rel_root == ".":
+                    rel_root = ""
+                # Ne pas descendre dans les dossiers entièrement exclus (venv/**, build/**...)
+                dirs[:] = [
+                    d
+                    for d in dirs
+                    if not matcher.prune_dir(f"{rel_root}/{d}" if rel_root else d)
+                ]
+
             for f in files:
                 if f.endswith(".py"):
                     full_path = os.path.join(root, f)
 
-                    # Vérifier si le fichier est dans le workspace
-                    if (
-                        workspace_dir
-                        and not os.path.commonpath([full_path, workspace_dir])
-                        == workspace_dir
-                    ):
-                        continue
-
                     # Vérifier les patterns d'exclusion depuis ARK_Main_Config.yml
-                    if should_exclude_file(
-                        full_path, workspace_dir, exclusion_patterns
-                    ):
-                        excluded_count += 1
-                        continue
+                    if matcher is not None:
+                        if os.path.islink(full_path):
+                            excluded = matcher.is_excluded(full_path)
+                        else:
+                            excluded = matcher.is_excluded_rel(
+                                f"{rel_root}/{f}" if rel_root else f
+                            )
+                        if excluded:
+                            excluded_count += 1
+                            continue
 
-                    if full_path not in gui_instance.python_files:
+                    if full_path not in known:
+                        known.add(full_path)
                         gui_instance.python_files.append(full_path)
 
                         if hasattr(gui_instance, "file_list"):
@@ -19,7 +19,7 @@ from PySide6.QtGui import QDropEvent
 from PySide6.QtWidgets import QFileDialog, QMessageBox
 
 from Core.Globals import _workspace_dir_cache, _workspace_dir_lock
-from Core.ArkConfigManager import load_ark_config, should_exclude_file
+from Core.ArkConfigManager import get_exclusion_matcher
 
 
 class WorkspaceAdvancedManipulation:
@@ -53,15 +53,12 @@ class WorkspaceAdvancedManipulation:
             gui_instance.tr("Fichiers Python (*.py)", "Python Files (*.py)"),
         )
         if files:
-            ark_config = load_ark_config(workspace_dir) if workspace_dir else {}
-            exclusion_patterns = ark_config.get("exclusion_patterns", [])
+            matcher = get_exclusion_matcher(workspace_dir) if workspace_dir else None
             valid_files = []
             excluded = 0
             for f in files:
                 if os.path.commonpath([f, workspace_dir]) == workspace_dir:
-                    if workspace_dir and should_exclude_file(
-                        f, workspace_dir, exclusion_patterns
-                    ):
+                    if matcher is not None and matcher.is_excluded(f):
                         excluded += 1
                         continue
                     valid_files.append(f)
@@ -159,8 +156,7 @@ class WorkspaceAdvancedManipulation:
         added = 0
         excluded = 0
         workspace_dir = getattr(gui_instance, "workspace_dir", None)
-        ark_config = load_ark_config(workspace_dir) if workspace_dir else {}
-        exclusion_patterns = ark_config.get("exclusion_patterns", [])
+        matcher = get_exclusion_matcher(workspace_dir) if workspace_dir else None
 
         for url in urls:
             path = url.toLocalFile()
@@ -178,9 +174,7 @@ class WorkspaceAdvancedManipulation:
                     )
                     continue
                 # Vérifie les patterns d'exclusion ARK
-                if workspace_dir and should_exclude_file(
-                    path, workspace_dir, exclusion_patterns
-                ):
+                if matcher is not None and matcher.is_excluded(path):
                     excluded += 1
                     continue
                 if path not in gui_instance.python_files:
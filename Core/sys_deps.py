@@ -28,10 +28,14 @@ Provided helpers:
 - shell_run(cmd | list[str], cwd=None, on_output=None, on_error=None, on_finished=None): non-blocking, headless
 - run_sudo_shell(cmd_str, password, cwd=None, on_output=None, on_error=None, on_finished=None): non-blocking, headless (Linux)
 - open_urls(urls): open URLs in default browser
+- detect_system_packages(packages): batched, session-cached presence of system packages/tools
 """
 
+import os
 import platform
 import shutil
+import subprocess
+import threading
 import webbrowser
 from collections.abc import Callable
 from typing import Optional, Union
@@ -601,6 +605,7 @@ class SysDependencyManager:
                     pass
 
             def _on_finished(_ec, _es):
+                invalidate_system_packages_cache()
                 _start_next()
 
             proc.readyReadStandardOutput.connect(lambda p=proc: _on_output(p, False))
@@ -915,7 +920,7 @@ class SysDependencyManager:
                 self._dbg(f"linux install cmd: {cmd}")
             except Exception:
                 pass
-            return self.run_sudo_shell_with_progress(
+            proc = self.run_sudo_shell_with_progress(
                 cmd,
                 password,
                 title_fr="Installation des dépendances système",
@@ -924,23 +929,175 @@ class SysDependencyManager:
                 start_msg_en="Downloading/Installing...",
                 timeout_s=3600,
             )
+            if proc is not None:
+                proc.finished.connect(
+                    lambda *_: invalidate_system_packages_cache()
+                )
+            return proc
         except Exception:
             return None
 
 
+# ---------------------------------------------------------------------------
+# Détection groupée des paquets système (cache de session)
+# ---------------------------------------------------------------------------
+
+_DPKG_STATUS = "/var/lib/dpkg/status"
+_PACMAN_LOCAL = "/var/lib/pacman/local"
+_RPM_DB_DIRS = ("/var/lib/rpm", "/usr/lib/sysimage/rpm")
+
+_pkg_lock = threading.Lock()
+# (source, signature) -> noms installés (dpkg/pacman, lus une fois par version de la base)
+_installed_db: dict[tuple, frozenset] = {}
+# (paquet, PATH, signature de la base) -> présent
+_presence: dict[tuple, bool] = {}
+
+
+def _stat_sig(path: str) -> Optional[tuple]:
+    try:
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+
+def _read_dpkg_status(path: str) -> frozenset:
+    """Noms des paquets 'install ok installed' du fichier status de dpkg."""
+    names: set[str] = set()
+    name = None
+    installed = False
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            if line.startswith("Package:"):
+                name = line[8:].strip()
+            elif line.startswith("Status:"):
+                installed = line.split()[-1:] == ["installed"]
+            elif not line.strip():
+                if name and installed:
+                    names.add(name)
+                name, installed = None, False
+    if name and installed:
+        names.add(name)
+    return frozenset(names)
+
+
+def _read_pacman_local(path: str) -> frozenset:
+    """Noms des paquets de la base locale pacman (dossiers nom-version-release)."""
+    names: set[str] = set()
+    for entry in os.listdir(path):
+        parts = entry.rsplit("-", 2)
+        if len(parts) == 3:
+            names.add(parts[0])
+    return frozenset(names)
+
+
+def _package_db() -> tuple[Optional[str], Optional[tuple]]:
+    """(source, signature) de la base de paquets locale, ou (None, None)."""
+    if platform.system() != "Linux":
+        return None, None
+    sig = _stat_sig(_DPKG_STATUS)
+    if sig is not None:
+        return "dpkg", sig
+    sig = _stat_sig(_PACMAN_LOCAL)
+    if sig is not None:
+        return "pacman", sig
+    for d in _RPM_DB_DIRS:
+        sig = _stat_sig(d)
+        if sig is not None and shutil.which("rpm"):
+            return "rpm", (d,) + sig
+    return None, None
+
+
+def _installed_from_db(source: str, sig: tuple) -> frozenset:
+    key = (source, sig)
+    with _pkg_lock:
+        hit = _installed_db.get(key)
+    if hit is not None:
+        return hit
+    try:
+        if source == "dpkg":
+            names = _read_dpkg_status(_DPKG_STATUS)
+        else:
+            names = _read_pacman_local(_PACMAN_LOCAL)
+    except Exception:
+        names = frozenset()
+    with _pkg_lock:
+        # Une seule version de la base conservée
+        _installed_db.clear()
+        _installed_db[key] = names
+    return names
+
+
+def _rpm_installed(packages: list[str]) -> set[str]:
+    """Un seul appel 'rpm -q' pour tous les paquets demandés."""
+    try:
+        cp = subprocess.run(
+            ["rpm", "-q", "--qf", "%{NAME}\\n", *packages],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+    except Exception:
+        return set()
+    wanted = set(packages)
+    return {ln.strip() for ln in cp.stdout.splitlines() if ln.strip() in wanted}
+
+
+def detect_system_packages(packages: list[str]) -> dict[str, bool]:
+    """
+    Detect several system packages/tools at once.
+    A name is present if it is an installed distro package (dpkg status file,
+    pacman local db read directly; one batched 'rpm -q' otherwise) or a command
+    on PATH (shutil.which). Results are cached per session, keyed by PATH and
+    the package database signature, and dropped after an install.
+    """
+    names = [p for p in dict.fromkeys(packages or []) if p]
+    if not names:
+        return {}
+    source, sig = _package_db()
+    path_env = os.environ.get("PATH", "")
+    result: dict[str, bool] = {}
+    todo: list[str] = []
+    with _pkg_lock:
+        for n in names:
+            hit = _presence.get((n, path_env, sig))
+            if hit is None:
+                todo.append(n)
+            else:
+                result[n] = hit
+    if todo:
+        installed: set[str] | frozenset = frozenset()
+        if source in ("dpkg", "pacman") and sig is not None:
+            installed = _installed_from_db(source, sig)
+        elif source == "rpm":
+            installed = _rpm_installed(todo)
+        fresh = {
+            n: (n.split(":", 1)[0] in installed) or bool(shutil.which(n)) for n in todo
+        }
+        with _pkg_lock:
+            for n, ok in fresh.items():
+                _presence[(n, path_env, sig)] = ok
+        result.update(fresh)
+    return {n: result[n] for n in names}
+
+
+def invalidate_system_packages_cache() -> None:
+    """Forget cached package presence (called after an install)."""
+    with _pkg_lock:
+        _presence.clear()
+        _installed_db.clear()
+
+
 def check_system_packages(packages: list[str]) -> bool:
     """
     Check if system packages/tools are installed.
     Returns True if all packages/tools are available, False otherwise.
-    Uses shutil.which() to check for command availability.
+    Batched and cached: see detect_system_packages().
     """
     try:
         if not packages:
             return True
-        for pkg in packages:
-            if pkg and not shutil.which(pkg):
-                return False
-        return True
+        return all(detect_system_packages(packages).values())
     except Exception:
         return False
 
@@ -13,42 +13,87 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import importlib
 import os
 import pkgutil
 import sys
+from typing import Optional
 
 
-def _discover_external_plugins(base_path: str) -> None:
-    """Import all top-level modules and packages under base_path (ENGINES/),
-    recursively importing subpackages to trigger engine registration side-effects.
+def _import_engine_package(base_path: str, name: str) -> None:
+    """Import an engine package and its submodules (registration side-effects)."""
+    importlib.import_module(name)
+    # Import submodules to trigger additional registrations if needed
+    pkg_path = os.path.join(base_path, name)
+    for __f, subname, __ispkg in pkgutil.walk_packages([pkg_path], prefix=f"{name}."):
+        try:
+            importlib.import_module(subname)
+        except Exception:
+            # Ignore broken submodules to avoid crashing global discovery
+            pass
+
+
+def _discover_external_plugins(base_path: str, lazy: Optional[bool] = None) -> None:
+    """Register all top-level packages under base_path (ENGINES/).
+
+    Lazy mode (default, see registry.lazy_enabled): engines whose metadata is
+    known from a static engine.json or from the cached manifest (unchanged
+    package fingerprint) are registered without importing their package; the
+    import happens when the engine is first used. Other packages are imported
+    (with their subpackages) to trigger engine registration, and the result is
+    stored in the manifest for the next startup.
     """
+    from EngineLoader import registry
+    from EngineLoader.manifest import EngineManifestCache, read_static_manifest
+
     try:
         if not os.path.isdir(base_path):
             return
         if base_path not in sys.path:
             sys.path.insert(0, base_path)
+        if lazy is None:
+            lazy = registry.lazy_enabled()
+        manifest = EngineManifestCache.for_directory(base_path) if lazy else None
+        seen: set[str] = set()
         # Import only top-level PACKAGES (directories with __init__.py). Skip bare modules.
         for _finder, name, ispkg in pkgutil.iter_modules([base_path]):
             if not ispkg:
                 # Enforce package-only engines
                 continue
+            seen.add(name)
+            pkg_dir = os.path.join(base_path, name)
             try:
+                if manifest is not None:
+                    entries = read_static_manifest(pkg_dir)
+                    if entries is None:
+                        entries = manifest.lookup(pkg_dir)
+                    if entries is not None:
+                        loader = functools.partial(
+                            _import_engine_package, base_path, name
+                        )
+                        for entry in entries:
+                            registry.register_lazy(entry, name, loader)
+                        continue
+                before = set(registry.available_engines())
                 # Import the package so its __init__ can self-register the engine
-                importlib.import_module(name)
-                # Import submodules to trigger additional registrations if needed
-                pkg_path = os.path.join(base_path, name)
-                for __f, subname, __ispkg in pkgutil.walk_packages(
-                    [pkg_path], prefix=f"{name}."
-                ):
-                    try:
-                        importlib.import_module(subname)
-                    except Exception:
-                        # Ignore broken submodules to avoid crashing global discovery
-                        pass
+                _import_engine_package(base_path, name)
+                if manifest is not None:
+                    new_ids = [
+                        eid for eid in registry.available_engines() if eid not in before
+                    ]
+                    entries = []
+                    for eid in new_ids:
+                        info = registry.engine_info(eid)
+                        if info:
+                            entries.append({**info, "tab": registry.has_tab(eid)})
+                    manifest.store(pkg_dir, entries)
             except Exception:
                 # Ignore broken plugins; do not crash host discovery
                 pass
+        if manifest is not None:
+            manifest.prune(seen)
+            manifest.save()
     except Exception:
         # Never let discovery break the host application
         pass
@@ -132,209 +132,26 @@ class CompilerEngine:
         """
         return {"python": [], "system": []}
 
+    def ensure_tools_ready(self, gui):
+        """
+        Return a concurrent.futures.Future[bool] resolved once all required tools
+        are available. Readiness is cached per session (keyed by venv and PATH);
+        missing tools are installed asynchronously, without blocking the GUI thread.
+        """
+        from .readiness import get_readiness
+
+        return get_readiness().ensure(self, gui)
+
     def ensure_tools_installed(self, gui) -> bool:
         """
         Check if all required tools are installed, and install missing ones.
-        Uses direct SysDependencyManager integration for system packages with full GUI support.
-        Returns True if all tools are available or installation started, False if system tool installation failed.
+        Non-blocking: returns True only when the toolchain is known to be ready.
+        While an installation is still pending it returns False, like a failure:
+        callers that need to wait for the install must use ensure_tools_ready().
         """
         try:
-            tools = self.required_tools
-            python_tools = tools.get("python", [])
-            system_tools = tools.get("system", [])
-
-            # Check Python tools using venv_manager
-            if hasattr(gui, "venv_manager") and gui.venv_manager:
-                venv_path = gui.venv_manager.resolve_project_venv()
-                if venv_path and python_tools:
-                    missing_python = []
-                    for tool in python_tools:
-                        if not gui.venv_manager.is_tool_installed(venv_path, tool):
-                            missing_python.append(tool)
-                    if missing_python:
-                        log_i18n_level(
-                            gui,
-                            "info",
-                            f"Installation des outils Python manquants: {missing_python}",
-                            f"Installing missing Python tools: {missing_python}",
-                        )
-                        gui.venv_manager.ensure_tools_installed(
-                            venv_path, missing_python
-                        )
-
-            # Check and install system tools using direct SysDependencyManager
-            if system_tools:
-                try:
-                    # Import and use SysDependencyManager directly for full GUI support
-                    from Core.sys_deps import (
-                        SysDependencyManager,
-                        check_system_packages,
-                    )
-
-                    # Get or create the system dependency manager with GUI parent
-                    if hasattr(gui, "sys_deps_manager") and gui.sys_deps_manager:
-                        sys_manager = gui.sys_deps_manager
-                    else:
-                        sys_manager = SysDependencyManager(gui)
-
-                    # Check which system tools are missing
-                    missing_system = []
-                    for tool in system_tools:
-                        if not check_system_packages([tool]):
-                            missing_system.append(tool)
-
-                    if missing_system:
-                        log_i18n_level(
-                            gui,
-                            "info",
-                            f"Installation des outils système manquants: {missing_system}",
-                            f"Installing missing system tools: {missing_system}",
-                        )
-
-                        # Detect platform and use appropriate installation method
-                        import platform
-
-                        system = platform.system().lower()
-
-                        if system == "linux":
-                            # Use Linux package installation with progress dialog
-                            process = sys_manager.install_packages_linux(missing_system)
-                            if process:
-                                # Wait for completion with timeout
-                                if process.waitForFinished(600000):  # 10 minutes
-                                    if process.exitCode() == 0:
-                                        log_i18n_level(
-                                            gui,
-                                            "success",
-                                            f"Outils système installés avec succès: {missing_system}",
-                                            f"System tools installed successfully: {missing_system}",
-                                        )
-                                    else:
-                                        log_i18n_level(
-                                            gui,
-                                            "error",
-                                            f"Échec installation outils système: {missing_system} (code: {process.exitCode()})",
-                                            f"System tools installation failed: {missing_system} (code: {process.exitCode()})",
-                                        )
-                                        return False
-                                else:
-                                    log_i18n_level(
-                                        gui,
-                                        "warning",
-                                        "Timeout lors de l'installation des outils système",
-                                        "Timeout during system tools installation",
-                                    )
-                                    return False
-                            else:
-                                log_i18n_level(
-                                    gui,
-                                    "error",
-                                    "Impossible de démarrer l'installation des outils système",
-                                    "Unable to start system tools installation",
-                                )
-                                return False
-
-                        elif system == "windows":
-                            # Convert package names to winget format for Windows
-                            winget_packages = []
-                            for tool in missing_system:
-                                # Map common Linux package names to Windows equivalents
-                                winget_map = {
-                                    "build-essential": [
-                                        {"id": "Microsoft.VisualStudio.2022.BuildTools"}
-                                    ],
-                                    "gcc": [
-                                        {"id": "Microsoft.VisualStudio.2022.BuildTools"}
-                                    ],
-                                    "g++": [
-                                        {"id": "Microsoft.VisualStudio.2022.BuildTools"}
-                                    ],
-                                    "python3-dev": [{"id": "Python.Python.3"}],
-                                    "libpython3-dev": [{"id": "Python.Python.3"}],
-                                    "patchelf": [],  # Not available on Windows
-                                }
-                                if tool in winget_map:
-                                    winget_packages.extend(winget_map[tool])
-                                else:
-                                    # Try as generic package
-                                    winget_packages.append({"id": tool})
-
-                            if winget_packages:
-                                process = sys_manager.install_packages_windows(
-                                    winget_packages
-                                )
-                                if process:
-                                    if process.waitForFinished(600000):  # 10 minutes
-                                        if process.exitCode() == 0:
-                                            log_i18n_level(
-                                                gui,
-                                                "success",
-                                                f"Outils Windows installés: {missing_system}",
-                                                f"Windows tools installed: {missing_system}",
-                                            )
-                                        else:
-                                            log_i18n_level(
-                                                gui,
-                                                "error",
-                                                f"Échec installation Windows: {missing_system}",
-                                                f"Windows installation failed: {missing_system}",
-                                            )
-                                            return False
-                                    else:
-                                        log_i18n_level(
-                                            gui,
-                                            "warning",
-                                            "Timeout lors de l'installation Windows",
-                                            "Timeout during Windows installation",
-                                        )
-                                        return False
-                                else:
-                                    log_i18n_level(
-                                        gui,
-                                        "warning",
-                                        "winget non disponible, installation manuelle requise",
-                                        "winget not available, manual installation required",
-                                    )
-                                    # Open documentation URL for manual installation
-                                    sys_manager.open_urls(
-                                        [
-                                            "https://learn.microsoft.com/en-us/windows/package-manager/winget/"
-                                        ]
-                                    )
-                                    return False
-                            else:
-                                log_i18n_level(
-                                    gui,
-                                    "warning",
-                                    f"Aucun équivalent Windows pour: {missing_system}",
-                                    f"No Windows equivalent for: {missing_system}",
-                                )
-                        else:
-                            log_i18n_level(
-                                gui,
-                                "warning",
-                                "Plateforme non supportée pour l'installation automatique",
-                                "Platform not supported for automatic installation",
-                            )
-                            return False
-                    else:
-                        log_i18n_level(
-                            gui,
-                            "success",
-                            f"Tous les outils système sont déjà installés: {system_tools}",
-                            f"All system tools are already installed: {system_tools}",
-                        )
-
-                except Exception as e:
-                    log_i18n_level(
-                        gui,
-                        "warning",
-                        f"Erreur lors de la vérification/installation des outils système: {e}",
-                        f"Error checking/installing system tools: {e}",
-                    )
-                    return False
-
-            return True
+            fut = self.ensure_tools_ready(gui)
+            return bool(fut.result()) if fut.done() else False
         except Exception as e:
             log_i18n_level(
                 gui,
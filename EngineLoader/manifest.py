@@ -0,0 +1,96 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Ague Samuel Amen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Engine manifest: engine metadata without importing engine packages.
+
+For each package under ENGINES/, the engines it registers (id, name,
+version, tab) come from:
+- a static manifest shipped with the package: <package>/engine.json, either
+  {"id": ..., "name": ..., "version": ..., "tab": true} or a list of such
+  objects; "tab" declares whether the engine adds a GUI tab (default: true)
+- otherwise the cache ENGINES/.engines_manifest.json, filled on the first
+  import and keyed by a fingerprint computed from stat() of the package files
+  (relative path, size, mtime_ns); any change triggers a real import again
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Optional
+
+from utils.package_manifest import PackageManifestCache, package_fingerprint
+
+__all__ = [
+    "MANIFEST_FILENAME",
+    "STATIC_MANIFEST_FILENAME",
+    "EngineManifestCache",
+    "package_fingerprint",
+    "read_static_manifest",
+]
+
+MANIFEST_FILENAME = ".engines_manifest.json"
+STATIC_MANIFEST_FILENAME = "engine.json"
+# Bump when the entry format changes
+_MANIFEST_SCHEMA = 2
+
+
+def _clean_entries(raw: Any) -> Optional[list[dict[str, Any]]]:
+    if isinstance(raw, dict):
+        raw = [raw]
+    if not isinstance(raw, list):
+        return None
+    out: list[dict[str, Any]] = []
+    for item in raw:
+        if not isinstance(item, dict):
+            continue
+        eid = item.get("id")
+        if not eid or not isinstance(eid, str):
+            continue
+        out.append(
+            {
+                "id": eid,
+                "name": str(item.get("name") or eid),
+                "version": str(item.get("version") or "1.0.0"),
+                "tab": item.get("tab", True) is not False,
+            }
+        )
+    return out
+
+
+def read_static_manifest(pkg_dir: str) -> Optional[list[dict[str, Any]]]:
+    """Entries declared in <pkg_dir>/engine.json, or None if absent/invalid."""
+    path = os.path.join(pkg_dir, STATIC_MANIFEST_FILENAME)
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception:
+        return None
+    if isinstance(data, dict) and "engines" in data:
+        data = data["engines"]
+    entries = _clean_entries(data)
+    return entries or None
+
+
+class EngineManifestCache(PackageManifestCache):
+    """Persistent {package -> (fingerprint, engine entries)} manifest."""
+
+    FILENAME = MANIFEST_FILENAME
+    ENTRY_KEY = "engines"
+    SCHEMA = _MANIFEST_SCHEMA
+
+    def clean_entries(self, raw: Any) -> Optional[list[dict[str, Any]]]:
+        return _clean_entries(raw)
@@ -0,0 +1,476 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Ague Samuel Amen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Toolchain readiness: checks engines' required_tools once per session and
+installs missing tools without blocking the GUI thread.
+
+- check(engine, gui): cheap status (venv console scripts, batched
+  Core.sys_deps.detect_system_packages),
+  memoized per (engine, venv, PATH, tools)
+- ensure(engine, gui): concurrent.futures.Future[bool] resolved when the
+  toolchain is ready; installs are started asynchronously (QProcess
+  signals), concurrent callers share the same pending future, which
+  resolves False if an installer fails to start or exceeds the deadline
+- warm_up(gui, engines): checks engines once, e.g. at workspace load
+  (default: built tabs and the selected engine, lazy ones stay unimported)
+
+The compile scheduler waits on the future (add_done_callback) instead of
+checking, and possibly installing, once per file.
+"""
+
+from __future__ import annotations
+
+import os
+import platform
+import shutil
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional
+
+from .base import log_i18n_level
+
+__all__ = [
+    "ToolchainStatus",
+    "ToolchainReadiness",
+    "get_readiness",
+    "reset_readiness",
+]
+
+# Équivalents winget des paquets système usuels (vide: indisponible sous Windows)
+WINGET_EQUIVALENTS: dict[str, list[dict[str, str]]] = {
+    "build-essential": [{"id": "Microsoft.VisualStudio.2022.BuildTools"}],
+    "gcc": [{"id": "Microsoft.VisualStudio.2022.BuildTools"}],
+    "g++": [{"id": "Microsoft.VisualStudio.2022.BuildTools"}],
+    "python3-dev": [{"id": "Python.Python.3"}],
+    "libpython3-dev": [{"id": "Python.Python.3"}],
+    "patchelf": [],
+}
+
+
+@dataclass(frozen=True)
+class ToolchainStatus:
+    engine_id: str
+    venv: Optional[str]
+    missing_python: tuple[str, ...]
+    missing_system: tuple[str, ...]
+
+    @property
+    def ready(self) -> bool:
+        return not self.missing_python and not self.missing_system
+
+
+def _done_future(value: bool) -> "Future[bool]":
+    fut: Future[bool] = Future()
+    fut.set_result(bool(value))
+    return fut
+
+
+def _is_failed_to_start(error) -> bool:
+    """True for QProcess.ProcessError.FailedToStart (other errors end with finished)."""
+    try:
+        from PySide6.QtCore import QProcess
+
+        return error == QProcess.ProcessError.FailedToStart
+    except ImportError:
+        return True
+
+
+def _arm_deadline(timeout_s: float, callback: Callable[[], None]) -> None:
+    """Call callback after timeout_s: on the Qt event loop when one exists, else a timer thread."""
+    if not timeout_s or timeout_s <= 0:
+        return
+    try:
+        from PySide6.QtCore import QCoreApplication, QTimer
+
+        if QCoreApplication.instance() is not None:
+            QTimer.singleShot(int(timeout_s * 1000), callback)
+            return
+    except ImportError:
+        pass
+    timer = threading.Timer(timeout_s, callback)
+    timer.daemon = True
+    timer.start()
+
+
+def _required(engine) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    try:
+        tools = engine.required_tools or {}
+    except Exception:
+        tools = {}
+    py = tuple(t for t in (tools.get("python") or []) if t)
+    sys_ = tuple(t for t in (tools.get("system") or []) if t)
+    return py, sys_
+
+
+def _missing_system_tools(tools: tuple[str, ...]) -> list[str]:
+    if not tools:
+        return []
+    try:
+        from Core.sys_deps import detect_system_packages
+
+        found = detect_system_packages(list(tools))
+        return [t for t in tools if not found.get(t)]
+    except ImportError:
+        return [t for t in tools if not shutil.which(t)]
+
+
+class ToolchainReadiness:
+    """Per-session cache of engine toolchain readiness."""
+
+    # Deadline for a whole ensure() install sequence (seconds)
+    install_timeout_s: float = 30 * 60
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._status: dict[tuple, ToolchainStatus] = {}
+        self._ready: set[tuple] = set()
+        self._pending: dict[tuple, Future] = {}
+
+    # ---------- keys / checks ----------
+    def _venv_for(self, gui) -> Optional[str]:
+        vm = getattr(gui, "venv_manager", None)
+        if not vm:
+            return None
+        try:
+            return vm.resolve_project_venv()
+        except Exception:
+            return None
+
+    def _key(self, engine, venv: Optional[str]) -> tuple:
+        py, sys_ = _required(engine)
+        return (
+            getattr(engine, "id", type(engine).__name__),
+            venv,
+            os.environ.get("PATH", ""),
+            py,
+            sys_,
+        )
+
+    def check(self, engine, gui, *, refresh: bool = False) -> ToolchainStatus:
+        """Missing tools for engine (memoized per venv/PATH; no subprocess)."""
+        venv = self._venv_for(gui)
+        key = self._key(engine, venv)
+        with self._lock:
+            hit = None if refresh else self._status.get(key)
+        if hit is not None:
+            return hit
+        py, sys_ = _required(engine)
+        missing_py: list[str] = []
+        vm = getattr(gui, "venv_manager", None)
+        if vm and venv and py:
+            for tool in py:
+                try:
+                    if not vm.is_tool_installed(venv, tool):
+                        missing_py.append(tool)
+                except Exception:
+                    missing_py.append(tool)
+        missing_sys = _missing_system_tools(sys_)
+        status = ToolchainStatus(key[0], venv, tuple(missing_py), tuple(missing_sys))
+        with self._lock:
+            self._status[key] = status
+            if status.ready:
+                self._ready.add(key)
+        return status
+
+    def warm_up(
+        self, gui, engines: Optional[Iterable[Any]] = None
+    ) -> dict[str, ToolchainStatus]:
+        """Check engines once (no install); results are cached.
+
+        By default only engines whose tab is built, plus the selected one, are
+        checked: lazy engines are not imported just to warm the cache.
+        """
+        if engines is None:
+            from . import registry
+
+            selected = None
+            try:
+                tabs = getattr(gui, "compiler_tabs", None)
+                if tabs is not None:
+                    selected = registry.get_engine_for_tab(tabs.currentIndex())
+            except Exception:
+                selected = None
+            engines = []
+            for eid in registry.available_engines():
+                eng = registry.get_instance(eid)
+                if eng is None and eid == selected:
+                    # Moteur sélectionné sans onglet construit: on l'instancie
+                    try:
+                        eng = registry.create(eid)
+                    except Exception:
+                        eng = None
+                if eng is not None:
+                    engines.append(eng)
+        out: dict[str, ToolchainStatus] = {}
+        for eng in engines:
+            try:
+                st = self.check(eng, gui)
+                out[st.engine_id] = st
+            except Exception:
+                continue
+        return out
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._status.clear()
+            self._ready.clear()
+
+    # ---------- ensure (async installs) ----------
+    def ensure(self, engine, gui) -> "Future[bool]":
+        """Future resolved with True once engine's tools are available.
+
+        Already-ready toolchains resolve immediately. Otherwise installs are
+        started without blocking: Python tools via VenvManager, system tools
+        via SysDependencyManager (QProcess finished signal). Callbacks run in
+        the thread that completes the install (the GUI thread for QProcess).
+        The future resolves False, and the pending slot is released, when an
+        installer cannot start or install_timeout_s elapses.
+        """
+        venv = self._venv_for(gui)
+        key = self._key(engine, venv)
+        with self._lock:
+            if key in self._ready:
+                return _done_future(True)
+            pending = self._pending.get(key)
+            if pending is not None:
+                return pending
+        status = self.check(engine, gui, refresh=True)
+        if status.ready:
+            sys_tools = list(_required(engine)[1])
+            if sys_tools:
+                log_i18n_level(
+                    gui,
+                    "success",
+                    f"Tous les outils système sont déjà installés: {sys_tools}",
+                    f"All system tools are already installed: {sys_tools}",
+                )
+            return _done_future(True)
+
+        fut: Future[bool] = Future()
+        with self._lock:
+            self._pending[key] = fut
+
+        def _finish(ok: bool) -> None:
+            with self._lock:
+                if self._pending.get(key) is fut:
+                    self._pending.pop(key, None)
+                self._status.pop(key, None)
+                if ok:
+                    self._ready.add(key)
+            if not fut.done():
+                fut.set_result(bool(ok))
+
+        def _expired() -> None:
+            if fut.done():
+                return
+            log_i18n_level(
+                gui,
+                "error",
+                "Délai dépassé pour l'installation des outils du moteur",
+                "Timed out waiting for engine tools installation",
+            )
+            _finish(False)
+
+        _arm_deadline(self.install_timeout_s, _expired)
+        steps: list[Callable[[Callable[[bool], None]], None]] = []
+        if status.missing_python:
+            steps.append(lambda done: self._install_python(gui, status, done))
+        if status.missing_system:
+            steps.append(lambda done: self._install_system(gui, status, done))
+        self._run_steps(gui, steps, _finish)
+        return fut
+
+    def _run_steps(self, gui, steps: list, finish: Callable[[bool], None]) -> None:
+        """Run install steps one after another; stop at the first failure."""
+        if not steps:
+            finish(True)
+            return
+        step, rest = steps[0], steps[1:]
+
+        def _next(ok: bool) -> None:
+            if not ok:
+                finish(False)
+            else:
+                self._run_steps(gui, rest, finish)
+
+        try:
+            step(_next)
+        except Exception as e:
+            log_i18n_level(
+                gui,
+                "warning",
+                f"Erreur dans ensure_tools_installed: {e}",
+                f"Error in ensure_tools_installed: {e}",
+            )
+            finish(False)
+
+    def _install_python(self, gui, status: ToolchainStatus, done) -> None:
+        missing = list(status.missing_python)
+        log_i18n_level(
+            gui,
+            "info",
+            f"Installation des outils Python manquants: {missing}",
+            f"Installing missing Python tools: {missing}",
+        )
+        vm = gui.venv_manager
+        try:
+            vm.ensure_tools_installed(status.venv, missing, on_done=done)
+        except TypeError:
+            # VenvManager sans callback de fin: installation lancée, on poursuit
+            vm.ensure_tools_installed(status.venv, missing)
+            done(True)
+
+    def _install_system(self, gui, status: ToolchainStatus, done) -> None:
+        missing = list(status.missing_system)
+        log_i18n_level(
+            gui,
+            "info",
+            f"Installation des outils système manquants: {missing}",
+            f"Installing missing system tools: {missing}",
+        )
+        from Core.sys_deps import SysDependencyManager
+
+        sys_manager = getattr(gui, "sys_deps_manager", None) or SysDependencyManager(
+            gui
+        )
+        system = platform.system().lower()
+        if system == "linux":
+            process = sys_manager.install_packages_linux(missing)
+            if not process:
+                log_i18n_level(
+                    gui,
+                    "error",
+                    "Impossible de démarrer l'installation des outils système",
+                    "Unable to start system tools installation",
+                )
+                done(False)
+                return
+            self._on_process_done(
+                gui,
+                process,
+                done,
+                ok_msg=(
+                    f"Outils système installés avec succès: {missing}",
+                    f"System tools installed successfully: {missing}",
+                ),
+                err_msg=(
+                    f"Échec installation outils système: {missing}",
+                    f"System tools installation failed: {missing}",
+                ),
+            )
+        elif system == "windows":
+            packages: list[dict[str, str]] = []
+            for tool in missing:
+                packages.extend(WINGET_EQUIVALENTS.get(tool, [{"id": tool}]))
+            if not packages:
+                log_i18n_level(
+                    gui,
+                    "warning",
+                    f"Aucun équivalent Windows pour: {missing}",
+                    f"No Windows equivalent for: {missing}",
+                )
+                done(True)
+                return
+            process = sys_manager.install_packages_windows(packages)
+            if not process:
+                log_i18n_level(
+                    gui,
+                    "warning",
+                    "winget non disponible, installation manuelle requise",
+                    "winget not available, manual installation required",
+                )
+                try:
+                    sys_manager.open_urls(
+                        [
+                            "https://learn.microsoft.com/en-us/windows/package-manager/winget/"
+                        ]
+                    )
+                except Exception:
+                    pass
+                done(False)
+                return
+            self._on_process_done(
+                gui,
+                process,
+                done,
+                ok_msg=(
+                    f"Outils Windows installés: {missing}",
+                    f"Windows tools installed: {missing}",
+                ),
+                err_msg=(
+                    f"Échec installation Windows: {missing}",
+                    f"Windows installation failed: {missing}",
+                ),
+            )
+        else:
+            log_i18n_level(
+                gui,
+                "warning",
+                "Plateforme non supportée pour l'installation automatique",
+                "Platform not supported for automatic installation",
+            )
+            done(False)
+
+    def _on_process_done(self, gui, process, done, ok_msg, err_msg) -> None:
+        """Resolve done(ok) from the QProcess finished/errorOccurred signals (non-blocking)."""
+        fired = {"v": False}
+
+        def _failed_to_start(error=None) -> None:
+            if fired["v"] or not _is_failed_to_start(error):
+                return
+            fired["v"] = True
+            log_i18n_level(gui, "error", *err_msg)
+            done(False)
+
+        def _finished(code, _status=None) -> None:
+            if fired["v"]:
+                return
+            fired["v"] = True
+            if code == 0:
+                log_i18n_level(gui, "success", *ok_msg)
+            else:
+                log_i18n_level(
+                    gui,
+                    "error",
+                    f"{err_msg[0]} (code: {code})",
+                    f"{err_msg[1]} (code: {code})",
+                )
+            done(code == 0)
+
+        process.finished.connect(_finished)
+        error_signal = getattr(process, "errorOccurred", None)
+        if error_signal is not None:
+            error_signal.connect(_failed_to_start)
+
+
+_readiness: Optional[ToolchainReadiness] = None
+_readiness_lock = threading.Lock()
+
+
+def get_readiness() -> ToolchainReadiness:
+    """Process-wide readiness service (one per session)."""
+    global _readiness
+    with _readiness_lock:
+        if _readiness is None:
+            _readiness = ToolchainReadiness()
+        return _readiness
+
+
+def reset_readiness() -> None:
+    global _readiness
+    with _readiness_lock:
+        _readiness = None
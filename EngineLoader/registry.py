@@ -16,7 +16,8 @@
 from __future__ import annotations
 
 import os
-from typing import Optional, Any
+import threading
+from typing import Any, Callable, Optional
 
 from .base import CompilerEngine
 
@@ -27,6 +28,18 @@ _TAB_INDEX: dict[str, int] = {}
 # Keep live engine instances to support dynamic interactions (e.g., i18n refresh)
 _INSTANCES: dict[str, CompilerEngine] = {}
 
+# Engines known from the manifest whose package is not imported yet:
+# engine id -> {"id", "name", "version", "tab", "package"}
+_LAZY: dict[str, dict[str, Any]] = {}
+# package name -> callable importing it (the import calls engine_register)
+_LAZY_LOADERS: dict[str, Callable[[], None]] = {}
+_LAZY_LOCK = threading.RLock()
+
+# Lazy tabs: engine id -> page widget in compiler_tabs, and engines whose
+# tab content is not built yet (built on first activation)
+_TAB_WIDGETS: dict[str, Any] = {}
+_PENDING_TABS: set[str] = set()
+
 # Default scroll behavior for engine tabs: wrap in a scroll area so large
 # option panels stay usable without bloating the overall UI.
 _ENGINE_TAB_SCROLL_MAX_HEIGHT: Optional[int] = None
@@ -113,6 +126,15 @@ def resolve_language_code(gui, tr: Optional[dict]) -> str:
     return normalize_language_code(code)
 
 
+def lazy_enabled() -> bool:
+    """Manifest-driven lazy loading (ARK_ENGINES_LAZY=0 restores eager imports and tabs)."""
+    return str(os.environ.get("ARK_ENGINES_LAZY", "1")).lower() not in (
+        "0",
+        "false",
+        "no",
+    )
+
+
 def unregister(eid: str) -> None:
     """Unregister an engine id and its tab mapping if present."""
     try:
@@ -122,6 +144,9 @@ def unregister(eid: str) -> None:
             _ORDER.remove(eid)
         if eid in _TAB_INDEX:
             del _TAB_INDEX[eid]
+        _LAZY.pop(eid, None)
+        _TAB_WIDGETS.pop(eid, None)
+        _PENDING_TABS.discard(eid)
     except Exception:
         pass
 
@@ -143,8 +168,13 @@ def unload_all() -> dict[str, Any]:
         _ORDER.clear()
         _TAB_INDEX.clear()
 
-        # Clear instances
+        # Clear instances and lazy state
         _INSTANCES.clear()
+        unloaded.extend(k for k in _LAZY.keys() if k not in unloaded)
+        _LAZY.clear()
+        _LAZY_LOADERS.clear()
+        _TAB_WIDGETS.clear()
+        _PENDING_TABS.clear()
 
     except Exception as e:
         return {"status": "error", "message": str(e), "unloaded": unloaded}
@@ -183,9 +213,102 @@ def engine_register(engine_cls: type[CompilerEngine]):
 register = engine_register
 
 
+def register_lazy(entry: dict, package: str, loader: Callable[[], None]) -> None:
+    """Register an engine from manifest metadata without importing its package.
+
+    The engine id is listed by available_engines() right away; loader() imports
+    the package the first time the engine class is needed (get_engine/create),
+    i.e. when its tab is activated or it compiles.
+    """
+    eid = entry.get("id") if isinstance(entry, dict) else None
+    if not eid or not isinstance(eid, str):
+        return
+    with _LAZY_LOCK:
+        if eid in _REGISTRY:
+            return
+        _LAZY[eid] = {
+            "id": eid,
+            "name": str(entry.get("name") or eid),
+            "version": str(entry.get("version") or "1.0.0"),
+            "tab": entry.get("tab", True) is not False,
+            "package": package,
+        }
+        _LAZY_LOADERS[package] = loader
+        if eid not in _ORDER:
+            _ORDER.append(eid)
+
+
+def _load_lazy(eid: str) -> Optional[type[CompilerEngine]]:
+    """Import the package of a lazily registered engine (once)."""
+    with _LAZY_LOCK:
+        entry = _LAZY.get(eid)
+        if entry is None:
+            return _REGISTRY.get(eid)
+        package = entry["package"]
+        loader = _LAZY_LOADERS.pop(package, None)
+        try:
+            if loader is not None:
+                loader()
+        except Exception:
+            pass
+        # The import registered every engine of the package
+        for other, ent in list(_LAZY.items()):
+            if ent.get("package") != package:
+                continue
+            del _LAZY[other]
+            if other not in _REGISTRY:
+                # Stale manifest or broken package
+                unregister(other)
+        return _REGISTRY.get(eid)
+
+
+def is_loaded(eid: str) -> bool:
+    """True once the engine class is imported and registered."""
+    return eid in _REGISTRY
+
+
+def engine_info(eid: str) -> Optional[dict[str, str]]:
+    """id/name/version of an engine, without importing a lazily registered one."""
+    try:
+        cls = _REGISTRY.get(eid)
+        if cls is not None:
+            return {
+                "id": eid,
+                "name": str(getattr(cls, "name", eid)),
+                "version": str(getattr(cls, "version", "1.0.0")),
+            }
+        entry = _LAZY.get(eid)
+        if entry is not None:
+            return {k: entry[k] for k in ("id", "name", "version")}
+    except Exception:
+        pass
+    return None
+
+
+def has_tab(eid: str) -> bool:
+    """Whether the engine adds a GUI tab, without importing a lazy engine.
+
+    Loaded engines: create_tab is overridden; lazy ones: the "tab" flag of
+    their manifest entry.
+    """
+    try:
+        cls = _REGISTRY.get(eid)
+        if cls is not None:
+            return getattr(cls, "create_tab", None) is not CompilerEngine.create_tab
+        entry = _LAZY.get(eid)
+        if entry is not None:
+            return bool(entry.get("tab", True))
+    except Exception:
+        pass
+    return False
+
+
 def get_engine(eid: str) -> Optional[type[CompilerEngine]]:
     try:
-        return _REGISTRY.get(eid)
+        cls = _REGISTRY.get(eid)
+        if cls is None and eid in _LAZY:
+            cls = _load_lazy(eid)
+        return cls
     except Exception:
         return None
 
@@ -197,16 +320,175 @@ def available_engines() -> list[str]:
         return []
 
 
+def _wrap_tab_scroll(widget):
+    try:
+        from PySide6.QtCore import Qt
+        from PySide6.QtWidgets import QFrame, QScrollArea, QSizePolicy
+
+        if isinstance(widget, QScrollArea):
+            scroll = widget
+        else:
+            scroll = QScrollArea()
+            scroll.setWidget(widget)
+
+        scroll.setWidgetResizable(True)
+        scroll.setFrameShape(QFrame.Shape.NoFrame)
+        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        scroll.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+
+        if _ENGINE_TAB_SCROLL_MAX_HEIGHT:
+            try:
+                scroll.setMaximumHeight(int(_ENGINE_TAB_SCROLL_MAX_HEIGHT))
+            except Exception:
+                pass
+
+        try:
+            name = widget.objectName()
+            if name:
+                scroll.setObjectName(f"{name}_scroll")
+        except Exception:
+            pass
+
+        return scroll
+    except Exception:
+        return widget
+
+
+def _tab_label(eid: str) -> str:
+    info = engine_info(eid)
+    return info["name"] if info else eid
+
+
+def _reindex_tabs(tabs) -> None:
+    """Recompute engine id -> tab index after tabs were removed."""
+    for eid, page in list(_TAB_WIDGETS.items()):
+        try:
+            idx = tabs.indexOf(page)
+        except Exception:
+            idx = -1
+        if isinstance(idx, int) and idx >= 0:
+            _TAB_INDEX[eid] = idx
+        else:
+            _TAB_INDEX.pop(eid, None)
+            _TAB_WIDGETS.pop(eid, None)
+
+
+def _drop_tab(tabs, eid: str, page=None) -> None:
+    """Remove the placeholder of an engine without tab (or whose tab failed).
+
+    page: the placeholder, if already forgotten by unregister (stale manifest).
+    """
+    page = _TAB_WIDGETS.pop(eid, None) or page
+    _TAB_INDEX.pop(eid, None)
+    if page is None:
+        return
+    try:
+        idx = tabs.indexOf(page)
+        if idx >= 0:
+            tabs.removeTab(idx)
+        page.deleteLater()
+    except Exception:
+        pass
+    _reindex_tabs(tabs)
+
+
+def ensure_tab(gui, eid: Optional[str]) -> Optional[CompilerEngine]:
+    """Build the tab content of eid if still pending; return its live instance.
+
+    Imports the engine package if needed, instantiates the engine, fills the
+    placeholder page with create_tab(gui), then applies the current
+    translations and the workspace engine config. No-op for built tabs.
+    """
+    if not eid:
+        return None
+    if eid not in _PENDING_TABS:
+        return _INSTANCES.get(eid)
+    _PENDING_TABS.discard(eid)
+    tabs = getattr(gui, "compiler_tabs", None)
+    page = _TAB_WIDGETS.get(eid)
+    if tabs is None or page is None:
+        return _INSTANCES.get(eid)
+    try:
+        engine = create(eid)
+        # Keep instance for later interactions (i18n, etc.)
+        _INSTANCES[eid] = engine
+        res = getattr(engine, "create_tab", None)
+        pair = res(gui) if callable(res) else None
+        if not pair:
+            _drop_tab(tabs, eid)
+            _show_hello_if_no_tabs(gui)
+            return engine
+        widget, label = pair
+        try:
+            existing = tabs.indexOf(widget)
+        except Exception:
+            existing = -1
+        if isinstance(existing, int) and existing >= 0:
+            # The engine reuses a page already present in the tab widget
+            _drop_tab(tabs, eid)
+            _TAB_WIDGETS[eid] = widget
+            _reindex_tabs(tabs)
+        else:
+            page.layout().addWidget(_wrap_tab_scroll(widget))
+            idx = tabs.indexOf(page)
+            if idx >= 0 and label:
+                tabs.setTabText(idx, str(label))
+        # Apply engine i18n immediately if GUI already has active translations
+        try:
+            tr = getattr(gui, "_tr", None)
+            fn = getattr(engine, "apply_i18n", None)
+            if callable(fn) and isinstance(tr, dict):
+                fn(gui, tr)
+        except Exception:
+            pass
+        # Options saved for this engine in the workspace
+        try:
+            workspace_dir = getattr(gui, "workspace_dir", None)
+            if workspace_dir:
+                from Core.EngineConfigManager import (
+                    apply_engine_config,
+                    load_engine_config,
+                )
+
+                data = load_engine_config(workspace_dir, eid)
+                if data:
+                    apply_engine_config(gui, engine, data)
+        except Exception:
+            pass
+        return engine
+    except Exception:
+        # keep UI responsive even if a plugin tab fails
+        _drop_tab(tabs, eid, page)
+        _show_hello_if_no_tabs(gui)
+        return _INSTANCES.get(eid)
+
+
+def _show_hello_if_no_tabs(gui) -> None:
+    """Show the Hello tab again once the last engine tab was dropped."""
+    if not _TAB_WIDGETS:
+        show_hello_tab(gui)
+
+
 def bind_tabs(gui) -> None:
-    """Create tabs for all registered engines that expose create_tab and store indexes.
+    """Create one tab per registered engine declaring one and store indexes.
+
+    Each tab starts as an empty placeholder labelled from the engine manifest
+    (no import); the engine is instantiated and its create_tab(gui) content
+    built on first activation (see ensure_tab). Engines without tab (see
+    has_tab) get no placeholder. The current tab is built immediately; with
+    ARK_ENGINES_LAZY=0 every tab is built eagerly.
     Robust to individual engine failures and avoids raising to the UI layer.
-    Also handles hiding the Hello tab when engines are available.
+    Also handles hiding the Hello tab when engines declare tabs, and showing
+    it again if none of them ends up with one.
     """
     try:
         tabs = getattr(gui, "compiler_tabs", None)
         if not tabs:
             return
 
+        from PySide6.QtWidgets import QVBoxLayout, QWidget
+
         # Get the Hello tab if it exists
         hello_tab = getattr(gui, "tab_hello", None)
         hello_tab_index = -1
@@ -216,84 +498,46 @@ def bind_tabs(gui) -> None:
             except Exception:
                 hello_tab_index = -1
 
-        # Track if any engine created a tab
+        # Track if any engine tab was added
         any_engine_tab_created = False
 
-        def _wrap_tab_scroll(widget):
-            try:
-                from PySide6.QtCore import Qt
-                from PySide6.QtWidgets import QFrame, QScrollArea, QSizePolicy
-
-                if isinstance(widget, QScrollArea):
-                    scroll = widget
-                else:
-                    scroll = QScrollArea()
-                    scroll.setWidget(widget)
-
-                scroll.setWidgetResizable(True)
-                scroll.setFrameShape(QFrame.Shape.NoFrame)
-                scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-                scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-                scroll.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-
-                if _ENGINE_TAB_SCROLL_MAX_HEIGHT:
-                    try:
-                        scroll.setMaximumHeight(int(_ENGINE_TAB_SCROLL_MAX_HEIGHT))
-                    except Exception:
-                        pass
-
-                try:
-                    name = widget.objectName()
-                    if name:
-                        scroll.setObjectName(f"{name}_scroll")
-                except Exception:
-                    pass
-
-                return scroll
-            except Exception:
-                return widget
-
         for eid in list(_ORDER):
+            if not has_tab(eid):
+                continue
             try:
-                engine = create(eid)
-                # Keep instance for later interactions (i18n, etc.)
-                _INSTANCES[eid] = engine
-                res = getattr(engine, "create_tab", None)
-                if not callable(res):
-                    continue
-                pair = res(gui)
-                if not pair:
-                    continue
+                page = QWidget()
+                page.setObjectName(f"tab_{eid}_page")
+                layout = QVBoxLayout(page)
+                layout.setContentsMargins(0, 0, 0, 0)
+                idx = tabs.addTab(page, _tab_label(eid))
+                _TAB_INDEX[eid] = int(idx)
+                _TAB_WIDGETS[eid] = page
+                _PENDING_TABS.add(eid)
                 any_engine_tab_created = True
-                widget, label = pair
-                widget = _wrap_tab_scroll(widget)
-                try:
-                    existing = tabs.indexOf(widget)
-                except Exception:
-                    existing = -1
-                if isinstance(existing, int) and existing >= 0:
-                    _TAB_INDEX[eid] = existing
-                else:
-                    idx = tabs.addTab(widget, label)
-                    _TAB_INDEX[eid] = int(idx)
-                # Apply engine i18n immediately if GUI already has active translations
-                try:
-                    tr = getattr(gui, "_tr", None)
-                    fn = getattr(engine, "apply_i18n", None)
-                    if callable(fn) and isinstance(tr, dict):
-                        fn(gui, tr)
-                except Exception:
-                    pass
             except Exception:
-                # keep UI responsive even if a plugin tab fails
                 continue
 
-        # Hide the Hello tab if any engine has created a tab
+        # Hide the Hello tab if any engine declares a tab
         if any_engine_tab_created and hello_tab_index >= 0:
             try:
-                tabs.tabBar().hideTab(hello_tab_index)
+                tabs.setTabVisible(hello_tab_index, False)
             except Exception:
                 pass
+
+        # Build tab content on first activation (connected once per tab widget)
+        if not tabs.property("_ark_lazy_tabs"):
+            tabs.setProperty("_ark_lazy_tabs", True)
+            tabs.currentChanged.connect(
+                lambda index: ensure_tab(gui, get_engine_for_tab(index))
+            )
+
+        if lazy_enabled():
+            ensure_tab(gui, get_engine_for_tab(tabs.currentIndex()))
+        else:
+            for eid in list(_ORDER):
+                ensure_tab(gui, eid)
+        if any_engine_tab_created:
+            _show_hello_if_no_tabs(gui)
     except Exception:
         # Swallow to avoid breaking app init
         pass
@@ -310,7 +554,7 @@ def show_hello_tab(gui) -> None:
             try:
                 idx = tabs.indexOf(hello_tab)
                 if idx >= 0:
-                    tabs.tabBar().showTab(idx)
+                    tabs.setTabVisible(idx, True)
                     tabs.setCurrentIndex(idx)
             except Exception:
                 pass
@@ -58,6 +58,7 @@ from bcasl import (
     PreCompileContext,
     ExecutionReport,
 )
+from bcasl.events import make_log_relay
 from bcasl.Loader import _discover_bcasl_meta
 from bcasl.tagging import compute_tag_order
 
@@ -379,6 +380,7 @@ class BcaslOnlyModApp:
                 ws_root,
                 config=cfg,
                 plugin_timeout_s=timeout,
+                event_cb=make_log_relay(log_callback),
             )
         except Exception as e:
             if log_callback:
@@ -429,8 +431,7 @@ class BcaslOnlyModApp:
             log_callback("-" * 30)
 
             for item in report:
-                state = "OK" if item.success else f"FAIL: {item.error}"
-                log_callback(f"  - {item.name}: {state} ({item.duration_ms:.1f} ms)")
+                log_callback(f"  - {item.report_line(item.name)}")
 
             log_callback("-" * 30)
             log_callback(report.summary())
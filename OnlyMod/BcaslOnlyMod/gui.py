@@ -69,6 +69,7 @@ from bcasl import (
     PreCompileContext,
     ExecutionReport,
 )
+from bcasl.events import make_log_relay
 from bcasl.Loader import (
     _discover_bcasl_meta,
     _load_workspace_config,
@@ -135,6 +136,7 @@ class BcaslExecutionThread(QThread):
                 self.workspace_root,
                 config=self.config,
                 plugin_timeout_s=self.plugin_timeout,
+                event_cb=make_log_relay(self.log_message.emit),
             )
 
             # Charger les plugins
@@ -1490,11 +1492,16 @@ class BcaslStandaloneGui(QMainWindow):
         self._log("-" * 30)
 
         for item in report:
-            state = "✓ OK" if item.success else f"✗ FAIL: {item.error}"
-            self._log(f"  - {item.name}: {state} ({item.duration_ms:.1f} ms)")
+            self._log(f"  - {item.report_line(item.name, '✓ OK', '✗ FAIL')}")
 
         self._log("-" * 30)
         self._log(report.summary())
+        top = report.top_consumers(3)
+        if top:
+            self._log(
+                tr("Top CPU consumers: ", "Plus gros consommateurs CPU : ")
+                + ", ".join(f"{i.name} ({i.cpu_s:.2f}s)" for i in top)
+            )
 
         if report.ok:
             self._log(
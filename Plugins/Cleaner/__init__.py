@@ -13,13 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import os
-from pathlib import Path
-import shutil
-from typing import Optional
-
 from bcasl import bc_register
 from Plugins_SDK.BcPluginContext import BcPluginBase, PluginMeta, PreCompileContext
+from Plugins_SDK.BcPluginContext.Context import clean_pycache
 from Plugins_SDK.GeneralContext import Dialog
 
 
@@ -98,55 +94,26 @@ class Cleaner(BcPluginBase):
             progress.show()
 
             try:
-                # Étape 1: Parcourir et supprimer les fichiers .pyc
+                # Un seul parcours (scandir) collecte __pycache__ et .pyc, en
+                # respectant les exclusions de bcasl.yml (hors celles qui visent
+                # justement les caches Python); suppression en parallèle
+                exclude_patterns = [
+                    p
+                    for p in ctx.get_exclude_patterns()
+                    if "__pycache__" not in p and not p.endswith((".pyc", ".pyo"))
+                ]
                 progress.set_message(
-                    "Scanning for .pyc files and __pycache__ directories..."
+                    "Removing .pyc files and __pycache__ directories..."
+                )
+                self.cleaned_files, self.cleaned_dirs = clean_pycache(
+                    workspace_path,
+                    exclude=exclude_patterns,
+                    progress=progress.set_progress,
+                    should_cancel=progress.is_canceled,
+                    on_error=lambda path, e: log.log_warn(
+                        f"Failed to remove {path}: {e}"
+                    ),
                 )
-
-                pyc_files = []
-                try:
-                    # Utiliser les patterns d'exclusion depuis bcasl.yml
-                    exclude_patterns = ctx.get_exclude_patterns()
-                    for file_path in ctx.iter_files(["**/*.pyc"], exclude_patterns):
-                        pyc_files.append(file_path)
-                except Exception as e:
-                    log.log_warn(f"Error iterating .pyc files: {e}")
-
-                # Étape 2: Supprimer les fichiers .pyc
-                progress.set_message("Removing .pyc files...")
-                progress.set_progress(0, len(pyc_files))
-
-                for idx, file_path in enumerate(pyc_files):
-                    if progress.is_canceled():
-                        break
-                    try:
-                        Path(file_path).unlink()
-                        self.cleaned_files += 1
-                    except Exception as e:
-                        log.log_warn(f"Failed to remove {file_path}: {e}")
-                    progress.set_progress(idx + 1, len(pyc_files))
-
-                # Étape 3: Parcourir et supprimer les dossiers __pycache__
-                progress.set_message("Removing __pycache__ directories...")
-
-                pycache_dirs = []
-                try:
-                    for pycache_dir in workspace_path.rglob("__pycache__"):
-                        pycache_dirs.append(pycache_dir)
-                except Exception as e:
-                    log.log_warn(f"Error iterating __pycache__ directories: {e}")
-
-                progress.set_progress(0, len(pycache_dirs))
-
-                for idx, pycache_dir in enumerate(pycache_dirs):
-                    if progress.is_canceled():
-                        break
-                    try:
-                        shutil.rmtree(pycache_dir)
-                        self.cleaned_dirs += 1
-                    except Exception as e:
-                        log.log_warn(f"Failed to remove {pycache_dir}: {e}")
-                    progress.set_progress(idx + 1, len(pycache_dirs))
 
             finally:
                 progress.close()
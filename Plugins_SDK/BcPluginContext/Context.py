@@ -15,8 +15,9 @@
 
 from __future__ import annotations
 
+import abc
 import ast
-import fnmatch
+import functools
 import hashlib
 import http.client
 import json
@@ -27,13 +28,14 @@ import socket
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 import urllib.parse
 import urllib.request
-from collections import defaultdict
-from dataclasses import dataclass, field
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field, replace
 from datetime import datetime
-from pathlib import Path
+from pathlib import Path, PurePath
 from typing import (
     Any,
     Optional,
@@ -92,6 +94,9 @@ def register_plugin(cls: Any) -> Any:  # type: ignore
     BCASL_PLUGIN_REGISTER_FUNC = "bcasl_register"
 
 
+from utils.pathmatch import compile_matcher, walk_files
+
+
 # -----------------------------
 # Version information
 # -----------------------------
@@ -190,6 +195,39 @@ class CodeMetrics:
     complexity_score: int = 0
 
 
+@dataclass
+class ScannedFile:
+    """Result of a single-pass scan of one Python file (see ProjectScan)."""
+
+    path: Path
+    size: int = 0
+    mtime_ns: int = 0
+    sha256: Optional[str] = None
+    info: Optional[PythonFileInfo] = None
+    metrics: CodeMetrics = field(default_factory=CodeMetrics)
+
+    @property
+    def error(self) -> Optional[str]:
+        """Syntax or read error, None when the file parsed cleanly."""
+        if self.info is None:
+            return None
+        if not self.info.is_valid_syntax or self.info.syntax_error:
+            return self.info.syntax_error or "invalid syntax"
+        return None
+
+
+@dataclass
+class TreeHash:
+    """Result of hash_tree: per-file digests and the Merkle root digest."""
+
+    root: Path
+    algorithm: str
+    digest: str
+    files: Dict[str, str] = field(default_factory=dict)  # relative posix path -> digest
+    hashed: int = 0  # files actually read
+    reused: int = 0  # files taken from the manifest
+
+
 @dataclass
 class SecurityIssue:
     """Issue de sécurité détecté."""
@@ -397,20 +435,40 @@ def match_patterns(file_path: Pathish, patterns: List[str]) -> bool:
         False
     """
     try:
-        path = Path(file_path)
-        path_str = path.as_posix()
-
-        for pattern in patterns:
-            if fnmatch.fnmatch(path_str, pattern):
-                return True
-            if path.match(pattern):
-                return True
-
-        return False
+        path_str = os.fspath(file_path).replace(os.sep, "/")
+        while path_str.startswith("./"):
+            path_str = path_str[2:]
+        path_str = path_str.lstrip("/")
+        return compile_matcher(tuple(patterns), anchored=False).matches(path_str)
     except Exception:
         return False
 
 
+_DEFAULT_EXCLUDE = [
+    "**/__pycache__/**",
+    "**/*.pyc",
+    "**/venv/**",
+    "**/.venv/**",
+    "**/.git/**",
+]
+
+
+def _rooted_patterns(patterns: List[str], root: Path) -> Tuple[str, ...]:
+    """Absolute patterns under root become '/<relative>' (anchored at root)."""
+    out: List[str] = []
+    root_str = None
+    for pat in patterns:
+        pat = str(pat)
+        if os.path.isabs(pat):
+            if root_str is None:
+                root_str = root.resolve().as_posix().rstrip("/") + "/"
+            posix = Path(pat).as_posix()
+            if posix.startswith(root_str):
+                pat = "/" + posix[len(root_str) :]
+        out.append(pat)
+    return tuple(out)
+
+
 def find_files(
     root: Pathish,
     include: Optional[List[str]] = None,
@@ -440,38 +498,12 @@ def find_files(
         include = ["**/*"]
 
     if exclude is None:
-        exclude = [
-            "**/__pycache__/**",
-            "**/*.pyc",
-            "**/venv/**",
-            "**/.venv/**",
-            "**/.git/**",
-        ]
+        exclude = _DEFAULT_EXCLUDE
 
-    def should_exclude(path: Path) -> bool:
-        path_str = path.as_posix()
-        for pattern in exclude:
-            if fnmatch.fnmatch(path_str, pattern):
-                return True
-            if path.match(pattern):
-                return True
-        return False
-
-    def get_depth(path: Path) -> int:
-        try:
-            return len(path.relative_to(root_path).parts)
-        except ValueError:
-            return 0
-
-    for pattern in include:
-        for file_path in root_path.glob(pattern):
-            if not file_path.is_file():
-                continue
-            if should_exclude(file_path):
-                continue
-            if max_depth is not None and get_depth(file_path) > max_depth:
-                continue
-            yield file_path
+    inc = compile_matcher(tuple(include), anchored=True)
+    exc = compile_matcher(_rooted_patterns(exclude, root_path), anchored=False)
+    for path_str, _rel, _entry in walk_files(str(root_path), inc, exc, max_depth):
+        yield Path(path_str)
 
 
 def count_files_by_extension(
@@ -498,11 +530,8 @@ def count_files_by_extension(
         return counts
 
     try:
-        for file_path in root_path.rglob("*"):
-            if not file_path.is_file():
-                continue
-
-            ext = file_path.suffix.lower()
+        for _path, _rel, entry in walk_files(str(root_path)):
+            ext = PurePath(entry.name).suffix.lower()
 
             if extensions is not None and ext not in extensions:
                 continue
@@ -911,18 +940,21 @@ def extract_imports_from_code(code: str) -> List[str]:
         >>> imports = extract_imports_from_code(code)
         >>> print(imports)  # ['os', 'pathlib']
     """
-    imports = []
     try:
-        tree = ast.parse(code)
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    imports.append(alias.name.split(".")[0])
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    imports.append(node.module.split(".")[0])
+        return _imports_from_tree(ast.parse(code))
     except Exception:
-        pass
+        return []
+
+
+def _imports_from_tree(tree: ast.AST) -> List[str]:
+    imports = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                imports.append(alias.name.split(".")[0])
+        elif isinstance(node, ast.ImportFrom):
+            if node.module:
+                imports.append(node.module.split(".")[0])
     return list(set(imports))
 
     # -----------------------------
@@ -944,49 +976,17 @@ def analyze_python_file(path: Pathish) -> PythonFileInfo:
         >>> if info.is_valid_syntax:
         ...     print(f"Found {len(info.functions)} functions")
     """
-    file_path = Path(path)
-    info = PythonFileInfo(path=file_path)
-
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            code = f.read()
-
-        info.line_count = len(code.splitlines())
-
-        # Try to parse AST
-        try:
-            tree = ast.parse(code)
-            info.is_valid_syntax = True
-
-            # Extract docstring
-            if isinstance(tree, ast.Module) and tree.body:
-                if isinstance(tree.body[0], ast.Expr) and isinstance(
-                    tree.body[0].value, ast.Str
-                ):
-                    info.docstring = tree.body[0].value.s
-                elif isinstance(tree.body[0], ast.Expr) and isinstance(
-                    tree.body[0].value, ast.Constant
-                ):
-                    info.docstring = str(tree.body[0].value.value)
-
-            # Extract imports
-            info.imports = extract_imports_from_code(code)
-
-            # Extract functions and classes
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    info.functions.append(node.name)
-                elif isinstance(node, ast.ClassDef):
-                    info.classes.append(node.name)
-
-        except SyntaxError as e:
-            info.is_valid_syntax = False
-            info.syntax_error = str(e)
-
-    except Exception as e:
-        info.syntax_error = str(e)
-
-    return info
+    path = Path(path)
+    info = _scan_file(path).info
+    if info is None:
+        return PythonFileInfo(path=path)
+    # Copy: the scanned result is shared through the scan cache
+    return replace(
+        info,
+        imports=list(info.imports),
+        functions=list(info.functions),
+        classes=list(info.classes),
+    )
 
 
 def validate_python_syntax(path: Pathish) -> Tuple[bool, Optional[str]]:
@@ -1031,17 +1031,254 @@ def get_python_files_with_issues(
         >>> for file, error in issues:
         ...     print(f"{file}: {error}")
     """
-    issues = []
-
     if exclude is None:
-        exclude = ["**/__pycache__/**", "**/venv/**", "**/.venv/**"]
+        exclude = _ISSUES_EXCLUDE
+    return ProjectScan(root, include=["**/*.py"], exclude=exclude).files_with_issues()
 
-    for py_file in find_files(root, include=["**/*.py"], exclude=exclude):
-        valid, error = validate_python_syntax(py_file)
-        if not valid:
-            issues.append((py_file, error))
 
-    return issues
+# Default exclusions of the syntax check (historical get_python_files_with_issues)
+_ISSUES_EXCLUDE = ["**/__pycache__/**", "**/venv/**", "**/.venv/**"]
+
+# Per-file scan results keyed by path, revalidated with (size, mtime_ns)
+_SCAN_CACHE_MAX = 20000
+_scan_cache: "OrderedDict[str, ScannedFile]" = OrderedDict()
+_scan_cache_lock = threading.Lock()
+
+
+def _count_lines(lines: List[str], metrics: CodeMetrics) -> None:
+    """Classify lines as blank, comment/docstring or code."""
+    metrics.total_lines = len(lines)
+    in_docstring = False
+    docstring_char = None
+
+    for line in lines:
+        stripped = line.strip()
+
+        # Ligne vide
+        if not stripped:
+            metrics.blank_lines += 1
+            continue
+
+        # Gestion des docstrings
+        if '"""' in stripped or "'''" in stripped:
+            if not in_docstring:
+                docstring_char = '"""' if '"""' in stripped else "'''"
+                in_docstring = True
+                metrics.comment_lines += 1
+                if stripped.count(docstring_char) >= 2:
+                    in_docstring = False
+                continue
+            else:
+                metrics.comment_lines += 1
+                if docstring_char in stripped:
+                    in_docstring = False
+                continue
+
+        if in_docstring:
+            metrics.comment_lines += 1
+            continue
+
+        # Commentaire simple
+        if stripped.startswith("#"):
+            metrics.comment_lines += 1
+            continue
+
+        # Ligne de code
+        metrics.code_lines += 1
+
+
+def _scan_source(path: Path, raw: bytes, result: ScannedFile) -> None:
+    """Fill info and metrics of result from the raw bytes of a file."""
+    info = PythonFileInfo(path=path)
+    result.info = info
+    try:
+        # Equivalent to open(..., encoding="utf-8") in text mode
+        code = raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    except Exception as e:
+        info.syntax_error = str(e)
+        return
+
+    info.line_count = len(code.splitlines())
+    lines = code.split("\n")
+    if lines and lines[-1] == "":
+        lines.pop()
+    _count_lines(lines, result.metrics)
+
+    try:
+        tree = ast.parse(code)
+    except SyntaxError as e:
+        info.is_valid_syntax = False
+        info.syntax_error = str(e)
+        return
+    except Exception as e:
+        info.syntax_error = str(e)
+        return
+
+    # Extract docstring
+    if isinstance(tree, ast.Module) and tree.body:
+        first = tree.body[0]
+        if isinstance(first, ast.Expr) and isinstance(first.value, ast.Constant):
+            info.docstring = str(first.value.value)
+
+    info.imports = _imports_from_tree(tree)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.FunctionDef):
+            info.functions.append(node.name)
+        elif isinstance(node, ast.ClassDef):
+            info.classes.append(node.name)
+
+    result.metrics.functions_count = len(info.functions)
+    result.metrics.classes_count = len(info.classes)
+    result.metrics.imports_count = len(info.imports)
+
+
+def _scan_file(path: Path, st: Optional[os.stat_result] = None) -> ScannedFile:
+    """Read a file once and compute info, metrics and SHA-256 (cached by stat)."""
+    key = str(path)
+    try:
+        st = st or os.stat(path)
+    except OSError as e:
+        return ScannedFile(
+            path=path, info=PythonFileInfo(path=path, syntax_error=str(e))
+        )
+    with _scan_cache_lock:
+        cached = _scan_cache.get(key)
+        if (
+            cached is not None
+            and cached.size == st.st_size
+            and cached.mtime_ns == st.st_mtime_ns
+        ):
+            _scan_cache.move_to_end(key)
+            return cached
+
+    res = ScannedFile(path=path, size=st.st_size, mtime_ns=st.st_mtime_ns)
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+    except Exception as e:
+        res.info = PythonFileInfo(path=path, syntax_error=str(e))
+        return res
+    res.sha256 = hashlib.sha256(raw).hexdigest()
+    _scan_source(path, raw, res)
+
+    with _scan_cache_lock:
+        _scan_cache[key] = res
+        _scan_cache.move_to_end(key)
+        while len(_scan_cache) > _SCAN_CACHE_MAX:
+            _scan_cache.popitem(last=False)
+    return res
+
+
+class ProjectScan:
+    """Single-pass, parallel scan of the Python files of a project.
+
+    Each file is read once to compute metrics, syntax validity, imports,
+    functions/classes and its SHA-256. Results are cached per file and
+    revalidated with (size, mtime_ns), so a new scan of an unchanged tree only
+    costs a stat() per file. calculate_project_metrics, validate_python_project,
+    get_python_files_with_issues and analyze_project_structure share this cache.
+
+    Example:
+        >>> scan = ProjectScan(".")
+        >>> print(scan.project_metrics()["total_code_lines"])
+        >>> for path, error in scan.files_with_issues():
+        ...     print(f"{path}: {error}")
+    """
+
+    def __init__(
+        self,
+        root: Pathish,
+        include: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        self.root = Path(root)
+        self.include = list(include) if include is not None else ["**/*.py"]
+        self.exclude = list(exclude) if exclude is not None else None
+        self.max_workers = max_workers
+        self._files: Optional[List[Path]] = None
+        self._results: Optional[Dict[Path, ScannedFile]] = None
+
+    @property
+    def files(self) -> List[Path]:
+        """Matching files (listed once, without reading them)."""
+        if self._files is None:
+            self._files = list(
+                dict.fromkeys(find_files(self.root, self.include, self.exclude))
+            )
+        return self._files
+
+    def scan(self) -> "ProjectScan":
+        """Read and analyze every file (parallel); no-op if already done."""
+        if self._results is not None:
+            return self
+        files = self.files
+        if len(files) < 8 or self.max_workers == 1:
+            scanned = [_scan_file(p) for p in files]
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+
+            workers = self.max_workers or min(32, (os.cpu_count() or 1) + 4)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                scanned = list(pool.map(_scan_file, files, chunksize=16))
+        self._results = {r.path: r for r in scanned}
+        return self
+
+    def refresh(self) -> "ProjectScan":
+        """Forget the listing and results; unchanged files stay cached."""
+        self._files = None
+        self._results = None
+        return self.scan()
+
+    @property
+    def results(self) -> Dict[Path, ScannedFile]:
+        return self.scan()._results or {}
+
+    def __iter__(self) -> Iterator[ScannedFile]:
+        return iter(self.results.values())
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    def get(self, path: Pathish) -> Optional[ScannedFile]:
+        return self.results.get(Path(path))
+
+    def files_with_issues(self) -> List[Tuple[Path, str]]:
+        """Files that could not be read or parsed, with the error message."""
+        return [(r.path, r.error) for r in self if r.error]
+
+    def imports(self) -> Set[str]:
+        """Top-level module names imported anywhere in the project."""
+        out: Set[str] = set()
+        for r in self:
+            if r.info is not None:
+                out.update(r.info.imports)
+        return out
+
+    def project_metrics(self) -> Dict[str, Any]:
+        """Aggregated metrics (same keys as calculate_project_metrics)."""
+        total = {
+            "total_files": 0,
+            "total_lines": 0,
+            "total_code_lines": 0,
+            "total_comment_lines": 0,
+            "total_blank_lines": 0,
+            "total_functions": 0,
+            "total_classes": 0,
+            "files_with_issues": 0,
+        }
+        for r in self:
+            m = r.metrics
+            total["total_files"] += 1
+            total["total_lines"] += m.total_lines
+            total["total_code_lines"] += m.code_lines
+            total["total_comment_lines"] += m.comment_lines
+            total["total_blank_lines"] += m.blank_lines
+            total["total_functions"] += m.functions_count
+            total["total_classes"] += m.classes_count
+            if r.info is not None and not r.info.is_valid_syntax:
+                total["files_with_issues"] += 1
+        return total
 
     # -----------------------------
     # Virtual environment utilities
@@ -1082,6 +1319,112 @@ def detect_venv(root: Pathish) -> Optional[Path]:
     return None
 
 
+_INSTALLED_CACHE_NS = "Plugins_SDK.installed_packages"
+
+
+def venv_site_packages(venv_path: Pathish) -> List[Path]:
+    """site-packages directories of a virtual environment (no subprocess)."""
+    venv = Path(venv_path)
+    if sys.platform == "win32":
+        sp = venv / "Lib" / "site-packages"
+        return [sp] if sp.is_dir() else []
+    found: List[Path] = []
+    for lib in ("lib", "lib64"):
+        try:
+            with os.scandir(venv / lib) as it:
+                names = sorted(
+                    e.name for e in it if e.name.startswith(("python", "pypy"))
+                )
+        except OSError:
+            continue
+        for name in names:
+            sp = venv / lib / name / "site-packages"
+            if sp.is_dir() and sp.resolve() not in {f.resolve() for f in found}:
+                found.append(sp)
+    return found
+
+
+def _read_dist_metadata(path: str) -> Optional[Tuple[str, str]]:
+    """(Name, Version) from the header block of a METADATA/PKG-INFO file."""
+    name = version = None
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                if not line.strip():
+                    break  # fin des en-têtes, le reste est la description
+                key, _, value = line.partition(":")
+                key = key.lower()
+                if key == "name":
+                    name = value.strip()
+                elif key == "version":
+                    version = value.strip()
+                if name and version:
+                    break
+    except OSError:
+        return None
+    return (name, version) if name and version else None
+
+
+def read_installed_packages(
+    site_packages: Pathish, max_workers: Optional[int] = None
+) -> Dict[str, str]:
+    """Installed distributions {name: version} read from *.dist-info/METADATA
+    (and *.egg-info) of a site-packages directory.
+
+    Metadata files are parsed in a thread pool; the result is cached in the
+    plugin cache under the directory's mtime, which changes whenever a
+    distribution is installed, upgraded or removed.
+
+    Example:
+        >>> for sp in venv_site_packages(".venv"):
+        ...     print(read_installed_packages(sp).get("requests"))
+    """
+    sp = Path(site_packages)
+    try:
+        mtime_ns = sp.stat().st_mtime_ns
+    except OSError:
+        return {}
+    cache_key = f"{sp.resolve()}|{mtime_ns}"
+    cached = cache_get(_INSTALLED_CACHE_NS, cache_key)
+    if isinstance(cached, dict):
+        return dict(cached)
+
+    meta_files: List[str] = []
+    try:
+        with os.scandir(sp) as it:
+            for entry in it:
+                if entry.name.endswith(".dist-info"):
+                    meta_files.append(os.path.join(entry.path, "METADATA"))
+                elif entry.name.endswith(".egg-info"):
+                    meta_files.append(
+                        os.path.join(entry.path, "PKG-INFO")
+                        if entry.is_dir()
+                        else entry.path
+                    )
+    except OSError:
+        return {}
+
+    packages: Dict[str, str] = {}
+    for res in _pool_map(_read_dist_metadata, sorted(meta_files), max_workers):
+        if res is not None:
+            packages.setdefault(res[0], res[1])
+    cache_set(_INSTALLED_CACHE_NS, cache_key, packages)
+    return dict(packages)
+
+
+def _venv_python_version(venv: Path) -> Optional[str]:
+    """'Python X.Y.Z' from pyvenv.cfg (same text as `python --version`)."""
+    try:
+        with open(venv / "pyvenv.cfg", encoding="utf-8") as f:
+            for line in f:
+                key, _, value = line.partition("=")
+                if key.strip().lower() in ("version", "version_info"):
+                    return f"Python {value.strip()}"
+    except OSError:
+        pass
+    return None
+
+
 def get_venv_info(venv_path: Pathish) -> VenvInfo:
     """Get information about a virtual environment.
 
@@ -1113,42 +1456,33 @@ def get_venv_info(venv_path: Pathish) -> VenvInfo:
     if not python_exe.exists():
         return info
 
-    # Get Python version
-    try:
-        result = subprocess.run(
-            [str(python_exe), "--version"], capture_output=True, text=True, timeout=5
-        )
-        if result.returncode == 0:
-            info.python_version = result.stdout.strip() or result.stderr.strip()
-    except Exception:
-        pass
-
-    # Get pip version
-    try:
-        result = subprocess.run(
-            [str(python_exe), "-m", "pip", "--version"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            info.pip_version = result.stdout.strip()
-    except Exception:
-        pass
+    # Python, pip et packages lus depuis pyvenv.cfg et les métadonnées
+    # dist-info: aucun sous-processus
+    info.python_version = _venv_python_version(venv_path_obj)
+    if info.python_version is None:
+        try:
+            result = subprocess.run(
+                [str(python_exe), "--version"],
+                capture_output=True,
+                text=True,
+                timeout=5,
+            )
+            if result.returncode == 0:
+                info.python_version = result.stdout.strip() or result.stderr.strip()
+        except Exception:
+            pass
 
-    # Get installed packages
-    try:
-        result = subprocess.run(
-            [str(python_exe), "-m", "pip", "list", "--format=json"],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-        if result.returncode == 0:
-            packages = json.loads(result.stdout)
-            info.installed_packages = {pkg["name"]: pkg["version"] for pkg in packages}
-    except Exception:
-        pass
+    for sp in venv_site_packages(venv_path_obj):
+        for name, version in read_installed_packages(sp).items():
+            info.installed_packages.setdefault(name, version)
+        if info.pip_version is None and (sp / "pip").is_dir():
+            pip_ver = info.installed_packages.get("pip")
+            if pip_ver:
+                py = (info.python_version or "").replace("Python ", "")
+                py_short = ".".join(py.split(".")[:2])
+                info.pip_version = (
+                    f"pip {pip_ver} from {sp / 'pip'} (python {py_short})"
+                )
 
     # Check if active
     try:
@@ -1163,103 +1497,217 @@ def get_venv_info(venv_path: Pathish) -> VenvInfo:
     # -----------------------------
 
 
-def get_git_info(root: Pathish) -> GitInfo:
-    """Get Git repository information.
+_GIT_CACHE_NS = "Plugins_SDK.get_git_info"
+_GIT_TIMEOUT = 5
+# Worktree edits do not touch HEAD or the index: keep memoized states short-lived
+_GIT_CACHE_TTL = 2.0
 
-    Args:
-        root: Project root directory
 
-    Returns:
-        GitInfo object with repository information
+def _git_index_sig(git_dir: Path) -> str:
+    try:
+        st = (git_dir / "index").stat()
+    except OSError:
+        return "-"
+    return f"{st.st_mtime_ns}:{st.st_size}"
 
-    Example:
-        >>> git = get_git_info(".")
-        >>> if git.is_repo and git.has_uncommitted:
-        ...     print("Warning: Uncommitted changes found")
-    """
-    root_path = Path(root)
-    info = GitInfo()
 
-    # Check if Git repo
-    git_dir = root_path / ".git"
-    if not git_dir.exists():
-        return info
+def _resolve_git_dir(root: Path) -> Optional[Path]:
+    """Repository directory of root: '.git' or the target of a 'gitdir:' file (worktree)."""
+    dot_git = root / ".git"
+    if dot_git.is_dir():
+        return dot_git
+    try:
+        text = dot_git.read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    if not text.startswith("gitdir:"):
+        return None
+    target = Path(text[len("gitdir:") :].strip())
+    if not target.is_absolute():
+        target = root / target
+    return target if target.is_dir() else None
 
-    info.is_repo = True
 
+def _git_common_dir(git_dir: Path) -> Path:
+    """Shared directory holding refs/packed-refs (differs from git_dir for worktrees)."""
     try:
-        # Get current branch
-        result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            cwd=root_path,
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            info.branch = result.stdout.strip()
-    except Exception:
-        pass
+        rel = (git_dir / "commondir").read_text(encoding="utf-8").strip()
+    except OSError:
+        return git_dir
+    common = Path(rel)
+    return common if common.is_absolute() else (git_dir / common)
 
-    try:
-        # Get staged files
-        result = subprocess.run(
-            ["git", "diff", "--name-only", "--cached"],
-            cwd=root_path,
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            info.staged_files = [f for f in result.stdout.strip().split("\n") if f]
-    except Exception:
-        pass
 
+def _read_git_ref(git_dir: Path, ref: str) -> Optional[str]:
+    """SHA of a ref from its loose file, then from packed-refs."""
+    for base in (git_dir, _git_common_dir(git_dir)):
+        try:
+            sha = (base / ref).read_text(encoding="utf-8").strip()
+        except OSError:
+            continue
+        if sha:
+            return sha
     try:
-        # Get modified files
-        result = subprocess.run(
-            ["git", "diff", "--name-only"],
-            cwd=root_path,
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            info.modified_files = [f for f in result.stdout.strip().split("\n") if f]
-    except Exception:
+        with open(_git_common_dir(git_dir) / "packed-refs", encoding="utf-8") as f:
+            for line in f:
+                if line[:1] in ("#", "^"):
+                    continue
+                parts = line.split()
+                if len(parts) == 2 and parts[1] == ref:
+                    return parts[0]
+    except OSError:
         pass
+    return None
+
 
+def _read_git_head(git_dir: Path) -> Tuple[Optional[str], Optional[str]]:
+    """(branch, sha) read from .git/HEAD; the branch is "HEAD" when detached."""
     try:
-        # Get untracked files
-        result = subprocess.run(
-            ["git", "ls-files", "--others", "--exclude-standard"],
-            cwd=root_path,
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            info.untracked_files = [f for f in result.stdout.strip().split("\n") if f]
-    except Exception:
-        pass
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        return None, None
+    if head.startswith("ref:"):
+        ref = head[len("ref:") :].strip()
+        branch = ref[len("refs/heads/") :] if ref.startswith("refs/heads/") else ref
+        return branch, _read_git_ref(git_dir, ref)
+    return "HEAD", head or None
+
+
+def _parse_git_status_v2(out: str, info: GitInfo) -> None:
+    """Fill staged/modified/untracked files from 'git status --porcelain=v2 -z'."""
+    fields = out.split("\0")
+    i = 0
+    while i < len(fields):
+        rec = fields[i]
+        i += 1
+        if not rec:
+            continue
+        kind = rec[0]
+        if kind == "?":
+            info.untracked_files.append(rec[2:])
+        elif kind in ("1", "2", "u"):
+            # 1 XY sub mH mI mW hH hI path / 2 ... Xscore path\0orig / u ... h3 path
+            nparts = {"1": 9, "2": 10, "u": 11}[kind]
+            parts = rec.split(" ", nparts - 1)
+            if len(parts) < nparts:
+                continue
+            xy, path = parts[1], parts[-1]
+            if kind == "2":
+                i += 1  # chemin d'origine du renommage
+            if kind == "u" or xy[0] != ".":
+                info.staged_files.append(path)
+            if kind == "u" or xy[1] != ".":
+                info.modified_files.append(path)
+
+
+def _collect_git_info(
+    root_path: Path, branch: Optional[str], sha: Optional[str]
+) -> GitInfo:
+    """Run the two git commands (status + log) concurrently and build GitInfo."""
+    info = GitInfo(is_repo=True, branch=branch)
+    status_cmd = [
+        "git",
+        "status",
+        "--porcelain=v2",
+        "--branch",
+        "-z",
+        "--untracked-files=all",
+    ]
+    log_cmd = ["git", "log", "-1", "--format=%H %s"]
+    procs: Dict[str, subprocess.Popen] = {}
+    for name, cmd in (("status", status_cmd), ("log", log_cmd if sha else None)):
+        if cmd is None:
+            continue
+        try:
+            procs[name] = subprocess.Popen(
+                cmd,
+                cwd=root_path,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+            )
+        except Exception:
+            pass
+    outputs: Dict[str, str] = {}
+    for name, proc in procs.items():
+        try:
+            out, _ = proc.communicate(timeout=_GIT_TIMEOUT)
+            if proc.returncode == 0:
+                outputs[name] = out
+        except Exception:
+            proc.kill()
+            proc.communicate()
 
+    if "status" in outputs:
+        _parse_git_status_v2(outputs["status"], info)
+    if "log" in outputs:
+        info.last_commit = outputs["log"].strip() or None
     info.has_uncommitted = bool(info.staged_files or info.modified_files)
+    return info
+
+
+def get_git_info(root: Pathish, refresh: bool = False) -> GitInfo:
+    """Get Git repository information.
+
+    Branch and HEAD are read directly from .git (HEAD, refs, packed-refs);
+    file states and the last commit come from one ``git status --porcelain=v2``
+    and one ``git log -1`` run concurrently. The result is memoized in memory
+    per (repository, HEAD, index mtime) for a couple of seconds, so the burst
+    of queries made by plugins during a build costs a few stat() calls while
+    later edits to the worktree are still picked up.
+
+    Args:
+        root: Project root directory
+        refresh: Ignore the memoized result
+
+    Returns:
+        GitInfo object with repository information
 
+    Example:
+        >>> git = get_git_info(".")
+        >>> if git.is_repo and git.has_uncommitted:
+        ...     print("Warning: Uncommitted changes found")
+    """
+    root_path = Path(root)
+    git_dir = _resolve_git_dir(root_path)
+    if git_dir is None:
+        return GitInfo()
+
+    branch, sha = _read_git_head(git_dir)
     try:
-        # Get last commit
-        result = subprocess.run(
-            ["git", "log", "-1", "--pretty=%H %s"],
-            cwd=root_path,
-            capture_output=True,
-            text=True,
-            timeout=5,
+        repo_key = str(root_path.resolve())
+    except OSError:
+        repo_key = str(root_path.absolute())
+    head_key = f"{repo_key}|{branch}|{sha}|"
+    index_sig = _git_index_sig(git_dir)
+
+    info = None if refresh else cache_get(_GIT_CACHE_NS, head_key + index_sig)
+    if not isinstance(info, GitInfo):
+        info = _collect_git_info(root_path, branch, sha)
+        cache_set(
+            _GIT_CACHE_NS,
+            head_key + index_sig,
+            info,
+            ttl=_GIT_CACHE_TTL,
+            persist=False,
         )
-        if result.returncode == 0:
-            info.last_commit = result.stdout.strip()
-    except Exception:
-        pass
-
-    return info
+        # git status may refresh the index: remember the new key as well
+        after = _git_index_sig(git_dir)
+        if after != index_sig:
+            cache_set(
+                _GIT_CACHE_NS, head_key + after, info, ttl=_GIT_CACHE_TTL, persist=False
+            )
+    return GitInfo(
+        is_repo=info.is_repo,
+        branch=info.branch,
+        has_uncommitted=info.has_uncommitted,
+        staged_files=list(info.staged_files),
+        modified_files=list(info.modified_files),
+        untracked_files=list(info.untracked_files),
+        last_commit=info.last_commit,
+    )
 
     # -----------------------------
     # Project structure analysis
@@ -1283,15 +1731,9 @@ def analyze_project_structure(root: Pathish) -> ProjectStructureInfo:
     root_path = Path(root)
     info = ProjectStructureInfo(root=root_path)
 
-    # Find Python files
+    # Find Python files (venv, cache and .git are excluded by the scan)
     try:
-        for py_file in root_path.rglob("*.py"):
-            # Skip venv and cache
-            if any(
-                p in py_file.parts for p in ["venv", ".venv", "__pycache__", ".git"]
-            ):
-                continue
-
+        for py_file in ProjectScan(root_path, include=["**/*.py"]).files:
             info.python_files.append(py_file)
 
             # Check if test file
@@ -1423,19 +1865,194 @@ def calculate_file_hash(path: Pathish, algorithm: str = "sha256") -> Optional[st
         >>> print(f"SHA256: {hash_val}")
     """
     try:
-        hasher = hashlib.new(algorithm)
-
-        with open(path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                hasher.update(chunk)
-
-        return hasher.hexdigest()
+        return _hash_file(path, algorithm)
     except Exception:
         return None
 
 
-def get_directory_size(
-    path: Pathish, exclude_patterns: Optional[List[str]] = None
+_HASH_CHUNK = 1024 * 1024
+_HASH_MMAP_MIN = 4 * 1024 * 1024
+_HASH_CACHE_NS = "Plugins_SDK.hash_tree"
+# mtime granularity: a file modified this close to the manifest snapshot is re-read
+_HASH_RACY_NS = 2_000_000_000
+
+
+def _hash_file(path: Pathish, algorithm: str, size: Optional[int] = None) -> str:
+    """Digest of a file: one read for small files, mmap for large ones
+    (hashlib releases the GIL on large buffers, so this scales in threads)."""
+    import mmap
+
+    hasher = hashlib.new(algorithm)
+    with open(path, "rb") as f:
+        if size is None:
+            size = os.fstat(f.fileno()).st_size
+        if size >= _HASH_MMAP_MIN:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    hasher.update(mm)
+                return hasher.hexdigest()
+            except (OSError, ValueError):
+                f.seek(0)
+        buf = bytearray(_HASH_CHUNK)
+        view = memoryview(buf)
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            hasher.update(view[:n])
+    return hasher.hexdigest()
+
+
+def _merkle_root(files: Dict[str, str], algorithm: str) -> str:
+    """Root digest of a tree: each directory hashes its sorted (kind, name, digest) children."""
+    tree: Dict[str, Any] = {}
+    for rel, digest in files.items():
+        node = tree
+        parts = rel.split("/")
+        for part in parts[:-1]:
+            node = node.setdefault(part, {})
+        node[parts[-1]] = digest
+
+    def _node_digest(node: Dict[str, Any]) -> str:
+        hasher = hashlib.new(algorithm)
+        for name in sorted(node):
+            child = node[name]
+            if isinstance(child, dict):
+                kind, value = b"tree", _node_digest(child)
+            else:
+                kind, value = b"blob", child
+            hasher.update(kind + b" " + name.encode("utf-8", "surrogateescape") + b"\0")
+            hasher.update(value.encode("ascii") + b"\n")
+        return hasher.hexdigest()
+
+    return _node_digest(tree)
+
+
+def hash_tree(
+    root: Pathish,
+    include: Optional[List[str]] = None,
+    exclude: Optional[List[str]] = None,
+    algorithm: str = "sha256",
+    incremental: bool = True,
+    max_workers: Optional[int] = None,
+) -> TreeHash:
+    """Hash every file of a tree and compute a Merkle-style root digest.
+
+    Files are hashed in a thread pool (large reads, mmap above 4 MiB). With
+    incremental, a (path, size, mtime_ns) -> digest manifest is kept in the
+    plugin cache so unchanged files are never re-read; files modified within
+    the mtime granularity of the previous run are re-hashed. The root digest
+    depends only on relative paths and contents, which makes it usable as a
+    cache key for build steps.
+
+    Args:
+        root: Directory to hash
+        include: Patterns to include (default: all files)
+        exclude: Patterns to exclude (default: same as find_files)
+        algorithm: hashlib algorithm name
+        incremental: Reuse digests of unchanged files
+        max_workers: Thread pool size (None = automatic)
+
+    Returns:
+        TreeHash with the root digest and per-file digests
+
+    Example:
+        >>> th = hash_tree(".", include=["**/*.py"])
+        >>> if cache_get("my.plugin", "src_digest") != th.digest:
+        ...     rebuild()
+    """
+    root_path = Path(root)
+    hashlib.new(algorithm)  # ValueError early for an unknown algorithm
+
+    entries: List[Tuple[str, str, int, int]] = []
+    if root_path.is_dir():
+        inc = compile_matcher(tuple(include or ["**/*"]), anchored=True)
+        exc = compile_matcher(
+            _rooted_patterns(
+                _DEFAULT_EXCLUDE if exclude is None else exclude, root_path
+            ),
+            anchored=False,
+        )
+        for path_str, rel, entry in walk_files(str(root_path), inc, exc):
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            entries.append((path_str, rel, st.st_size, st.st_mtime_ns))
+
+    # The manifest only covers the selected files: key it by the patterns too
+    patterns = json.dumps(
+        [
+            sorted(include or ["**/*"]),
+            sorted(_DEFAULT_EXCLUDE if exclude is None else exclude),
+        ]
+    )
+    patterns_sig = hashlib.sha256(patterns.encode("utf-8")).hexdigest()[:16]
+    cache_key = f"{root_path.resolve()}|{algorithm}|{patterns_sig}"
+    previous: Dict[str, Tuple[int, int, str]] = {}
+    racy_ns = 0
+    if incremental:
+        cached = cache_get(_HASH_CACHE_NS, cache_key)
+        if isinstance(cached, dict) and isinstance(cached.get("files"), dict):
+            previous = cached["files"]
+            racy_ns = int(cached.get("snapshot_ns") or 0) - _HASH_RACY_NS
+
+    snapshot_ns = time.time_ns()
+    manifest: Dict[str, Tuple[int, int, str]] = {}
+    todo: List[Tuple[str, str, int, int]] = []
+    for item in entries:
+        _path, rel, size, mtime_ns = item
+        old = previous.get(rel)
+        if (
+            old is not None
+            and old[0] == size
+            and old[1] == mtime_ns
+            and mtime_ns < racy_ns
+        ):
+            manifest[rel] = old
+        else:
+            todo.append(item)
+    reused = len(manifest)
+
+    def _work(
+        item: Tuple[str, str, int, int],
+    ) -> Tuple[str, Optional[Tuple[int, int, str]]]:
+        path_str, rel, size, mtime_ns = item
+        try:
+            return rel, (size, mtime_ns, _hash_file(path_str, algorithm, size))
+        except OSError:
+            return rel, None
+
+    hashed = 0
+    for rel, res in _pool_map(_work, todo, max_workers):
+        if res is not None:
+            manifest[rel] = res
+            hashed += 1
+
+    if incremental:
+        # Lists, not tuples: the disk tier only keeps JSON round-trippable values
+        cache_set(
+            _HASH_CACHE_NS,
+            cache_key,
+            {
+                "snapshot_ns": snapshot_ns,
+                "files": {rel: list(v) for rel, v in manifest.items()},
+            },
+        )
+
+    files = {rel: manifest[rel][2] for _p, rel, _s, _m in entries if rel in manifest}
+    return TreeHash(
+        root=root_path,
+        algorithm=algorithm,
+        digest=_merkle_root(files, algorithm),
+        files=files,
+        hashed=hashed,
+        reused=reused,
+    )
+
+
+def get_directory_size(
+    path: Pathish, exclude_patterns: Optional[List[str]] = None
 ) -> int:
     """Calculate total size of directory.
 
@@ -1459,70 +2076,220 @@ def get_directory_size(
     if exclude_patterns is None:
         exclude_patterns = []
 
-    def should_exclude(file_path: Path) -> bool:
-        path_str = file_path.as_posix()
-        for pattern in exclude_patterns:
-            if fnmatch.fnmatch(path_str, pattern):
-                return True
-        return False
-
+    exc = compile_matcher(_rooted_patterns(exclude_patterns, path_obj), anchored=False)
+    seen_inodes: Set[Tuple[int, int]] = set()
     try:
-        for item in path_obj.rglob("*"):
-            if item.is_file() and not should_exclude(item):
-                try:
-                    total += item.stat().st_size
-                except Exception:
-                    pass
+        for _path, _rel, entry in walk_files(str(path_obj), exclude=exc):
+            try:
+                # DirEntry.stat() is cached (and free on Windows)
+                st = entry.stat()
+            except Exception:
+                continue
+            if st.st_nlink > 1:
+                # Count hard-linked files once, like du
+                ino = (st.st_dev, st.st_ino)
+                if ino in seen_inodes:
+                    continue
+                seen_inodes.add(ino)
+            total += st.st_size
     except Exception:
         pass
 
     return total
 
 
-def clean_pycache(root: Pathish, dry_run: bool = False) -> Tuple[int, int]:
+# Dossiers jamais parcourus par le nettoyage des caches Python; les
+# environnements virtuels sont reconnus à leur pyvenv.cfg, pas à leur nom
+_PYCACHE_PRUNE = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        ".tox",
+        ".nox",
+        "node_modules",
+    }
+)
+_PROGRESS_INTERVAL = 0.1
+
+
+def _throttled_progress(
+    callback: Optional[Callable[[int, int], Any]], interval: float = _PROGRESS_INTERVAL
+) -> Callable[..., None]:
+    """Wrap a progress(value, maximum) callback so it fires at most once per
+    interval (plus the final value); thread-safe."""
+    lock = threading.Lock()
+    last = [0.0]
+
+    def _report(value: int, maximum: int, force: bool = False) -> None:
+        if callback is None:
+            return
+        now = time.monotonic()
+        with lock:
+            if not force and value < maximum and now - last[0] < interval:
+                return
+            last[0] = now
+        try:
+            callback(value, maximum)
+        except Exception:
+            pass
+
+    return _report
+
+
+def find_pycache(
+    root: Pathish, exclude: Optional[List[str]] = None
+) -> Tuple[List[Tuple[Path, int]], List[Path]]:
+    """Collect __pycache__ directories and stray .pyc/.pyo files in one walk.
+
+    A single os.scandir pass; __pycache__ directories are listed (with the
+    number of compiled files they hold) but not descended into, and VCS/tool
+    directories and virtual environments (any directory holding a pyvenv.cfg,
+    at any depth) are pruned.
+
+    Args:
+        root: Root directory
+        exclude: Patterns to skip (same syntax as find_files excludes)
+
+    Returns:
+        ([(pycache_dir, compiled_file_count)], [stray_compiled_file])
+    """
+    root_path = Path(root)
+    exc = (
+        compile_matcher(_rooted_patterns(exclude, root_path), anchored=False)
+        if exclude
+        else None
+    )
+    dirs: List[Tuple[Path, int]] = []
+    files: List[Path] = []
+    stack: List[Tuple[str, str]] = [(str(root_path), "")]
+    while stack:
+        dir_path, rel_dir = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            name = entry.name
+            rel = f"{rel_dir}/{name}" if rel_dir else name
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if is_dir:
+                if name in _PYCACHE_PRUNE:
+                    continue
+                if exc is not None and (exc.prune_dir(rel) or exc.matches(rel)):
+                    continue
+                if name == "__pycache__":
+                    try:
+                        with os.scandir(entry.path) as inner:
+                            count = sum(
+                                1 for e in inner if e.name.endswith((".pyc", ".pyo"))
+                            )
+                    except OSError:
+                        count = 0
+                    dirs.append((Path(entry.path), count))
+                    continue
+                if os.path.exists(os.path.join(entry.path, "pyvenv.cfg")):
+                    continue
+                stack.append((entry.path, rel))
+            elif name.endswith((".pyc", ".pyo")):
+                if exc is None or not exc.matches(rel):
+                    files.append(Path(entry.path))
+    dirs.sort()
+    files.sort()
+    return dirs, files
+
+
+def clean_pycache(
+    root: Pathish,
+    dry_run: bool = False,
+    exclude: Optional[List[str]] = None,
+    progress: Optional[Callable[[int, int], Any]] = None,
+    should_cancel: Optional[Callable[[], bool]] = None,
+    max_workers: Optional[int] = None,
+    on_error: Optional[Callable[[Path, Exception], Any]] = None,
+) -> Tuple[int, int]:
     """Remove __pycache__ directories and .pyc files.
 
+    The tree is walked once (see find_pycache); removals run in a thread
+    pool and progress(done, total) is reported at most 10 times per second.
+    progress, should_cancel and on_error are always called from the calling
+    thread, never from the pool.
+
     Args:
         root: Root directory to clean
         dry_run: If True, only count without removing
+        exclude: Patterns to skip
+        progress: Callback progress(done, total) over removal tasks
+        should_cancel: Polled between removals; True stops the cleaning
+        max_workers: Thread pool size (None = automatic)
+        on_error: Callback on_error(path, exception) for each failed removal
 
     Returns:
-        Tuple of (files_removed, dirs_removed)
+        Tuple of (files_removed, dirs_removed); files include the compiled
+        files held by the removed __pycache__ directories
 
     Example:
         >>> files, dirs = clean_pycache(".", dry_run=True)
         >>> print(f"Would remove {files} files and {dirs} directories")
     """
-    files_removed = 0
-    dirs_removed = 0
-    root_path = Path(root)
-
     try:
-        # Remove .pyc files
-        for pyc_file in root_path.rglob("*.pyc"):
-            if dry_run:
-                files_removed += 1
-            else:
-                try:
-                    pyc_file.unlink()
-                    files_removed += 1
-                except Exception:
-                    pass
-
-        # Remove __pycache__ directories
-        for pycache_dir in root_path.rglob("__pycache__"):
-            if pycache_dir.is_dir():
-                if dry_run:
-                    dirs_removed += 1
-                else:
-                    try:
-                        shutil.rmtree(pycache_dir)
-                        dirs_removed += 1
-                    except Exception:
-                        pass
+        dirs, stray = find_pycache(root, exclude)
     except Exception:
-        pass
+        return 0, 0
+    if dry_run:
+        return len(stray) + sum(n for _d, n in dirs), len(dirs)
+
+    tasks: List[Tuple[str, Path, int]] = [("dir", d, n) for d, n in dirs]
+    tasks += [("file", f, 1) for f in stray]
+    total = len(tasks)
+    report = _throttled_progress(progress)
+    report(0, total, force=True)
+    # Annulation relayée aux threads du pool par un Event
+    cancelled = threading.Event()
+
+    def _poll_cancel() -> None:
+        try:
+            if should_cancel is not None and should_cancel():
+                cancelled.set()
+        except Exception:
+            pass
 
+    def _remove(task: Tuple[str, Path, int]) -> Tuple[bool, Optional[Exception]]:
+        kind, path, _n = task
+        if cancelled.is_set():
+            return False, None
+        try:
+            if kind == "dir":
+                shutil.rmtree(path)
+            else:
+                path.unlink()
+        except Exception as e:
+            return True, e
+        return True, None
+
+    files_removed = dirs_removed = done = 0
+    _poll_cancel()
+    for (kind, path, n), (ran, error) in zip(
+        tasks, _pool_map(_remove, tasks, max_workers)
+    ):
+        if not ran:
+            continue
+        done += 1
+        if error is None:
+            files_removed += n
+            dirs_removed += kind == "dir"
+        elif on_error is not None:
+            try:
+                on_error(path, error)
+            except Exception:
+                pass
+        report(done, total)
+        _poll_cancel()
+    report(done, total, force=True)
     return files_removed, dirs_removed
 
     # -----------------------------
@@ -1628,8 +2395,9 @@ def validate_python_project(root: Pathish) -> Dict[str, Any]:
         results["issues"].append("Project directory does not exist")
         return results
 
-    # Check for Python files
-    py_files = list(root_path.rglob("*.py"))
+    # Check for Python files (one scan shared with the syntax check below)
+    scan = ProjectScan(root_path, include=["**/*.py"], exclude=_ISSUES_EXCLUDE)
+    py_files = scan.files
     if not py_files:
         results["is_valid"] = False
         results["issues"].append("No Python files found")
@@ -1664,7 +2432,7 @@ def validate_python_project(root: Pathish) -> Dict[str, Any]:
         results["info"]["test_files_count"] = len(test_files)
 
     # Check for syntax errors
-    syntax_issues = get_python_files_with_issues(root_path)
+    syntax_issues = scan.files_with_issues()
     if syntax_issues:
         results["is_valid"] = False
         for file, error in syntax_issues:
@@ -1683,22 +2451,414 @@ def validate_python_project(root: Pathish) -> Dict[str, Any]:
     # -----------------------------
 
 
-_plugin_cache: Dict[str, Any] = {}
+# Shared with sandbox workers (spawned processes inherit the environment)
+PLUGIN_CACHE_DIR_ENV = "PYCOMPILER_BCASL_CACHE_DIR"
+PLUGIN_CACHE_FILENAME = "bcasl_plugin_cache.sqlite3"
+
+
+def _new_cache_counters() -> Dict[str, int]:
+    return {"hits": 0, "misses": 0, "disk_hits": 0, "evictions": 0}
+
+
+def _json_blob(value: Any) -> Optional[bytes]:
+    """JSON encoding of value, or None when it does not round-trip unchanged."""
+    try:
+        blob = json.dumps(value, separators=(",", ":"), allow_nan=False).encode("utf-8")
+        if json.loads(blob) != value:
+            return None
+        return blob
+    except Exception:
+        return None
+
+
+def user_cache_root() -> Path:
+    """Per-user cache directory of the application (never inside a workspace)."""
+    if sys.platform.startswith("win"):
+        base = os.environ.get("LOCALAPPDATA") or str(Path.home() / "AppData" / "Local")
+    elif sys.platform == "darwin":
+        base = str(Path.home() / "Library" / "Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "pycompiler_ark"
+
+
+def plugin_cache_dir_for(workspace: Pathish) -> Path:
+    """Disk-tier directory of the plugin cache for a workspace.
+
+    The directory lives under the user's own cache dir and is keyed by a digest
+    of the resolved workspace path, so each project gets its own cache and a
+    cloned repository cannot ship a pre-filled one.
+
+    Example:
+        >>> configure_plugin_cache(plugin_cache_dir_for("/path/to/workspace"))
+    """
+    try:
+        root = str(Path(workspace).resolve())
+    except Exception:
+        root = str(workspace)
+    digest = hashlib.sha256(root.encode("utf-8", "surrogatepass")).hexdigest()[:16]
+    return user_cache_root() / "bcasl_cache" / digest
+
+
+class PluginCache:
+    """Two-tier cache for plugins: bounded in-memory LRU plus optional SQLite file.
+
+    - Keys are namespaced by plugin id ("<plugin_id>", "<key>").
+    - Memory tier evicts least recently used entries beyond max_entries or max_bytes.
+    - Entries may carry a TTL (seconds); expiry uses wall-clock time so it is
+      valid across processes and builds.
+    - The disk tier (JSON values) is shared by sandbox workers and successive
+      builds; it is trimmed to disk_max_bytes, oldest access first.
+    - Per-plugin hit/miss counters are available through stats().
+
+    Only values that survive a JSON round trip unchanged are written to disk;
+    anything else (tuples, bytes, objects) stays in memory only. Nothing read
+    from disk is ever unpickled or executed.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Pathish] = None,
+        *,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        disk_max_bytes: int = 256 * 1024 * 1024,
+        default_ttl: Optional[float] = None,
+    ) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = max(0, int(max_bytes))
+        self.disk_max_bytes = max(0, int(disk_max_bytes))
+        self.default_ttl = default_ttl
+        self.directory = Path(directory) if directory else None
+        self._lock = threading.RLock()
+        # (ns, key) -> (value, expires_at or None, size)
+        self._mem: OrderedDict[Tuple[str, str], Tuple[Any, Optional[float], int]] = (
+            OrderedDict()
+        )
+        self._mem_bytes = 0
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(_new_cache_counters)
+        self._db = None
+        self._db_failed = False
+
+    # Disk tier
+    def _conn(self):
+        if self.directory is None or self._db_failed:
+            return None
+        if self._db is None:
+            try:
+                import sqlite3
+
+                self.directory.mkdir(parents=True, exist_ok=True)
+                db = sqlite3.connect(
+                    str(self.directory / PLUGIN_CACHE_FILENAME),
+                    timeout=5.0,
+                    check_same_thread=False,
+                    isolation_level=None,
+                )
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS entries ("
+                    "ns TEXT NOT NULL, key TEXT NOT NULL, value BLOB NOT NULL, "
+                    "expires REAL, size INTEGER NOT NULL, atime REAL NOT NULL, "
+                    "PRIMARY KEY (ns, key))"
+                )
+                self._db = db
+            except Exception:
+                self._db_failed = True
+                return None
+        return self._db
+
+    def _disk_get(self, ns: str, key: str) -> Tuple[bool, Any, Optional[float], int]:
+        db = self._conn()
+        if db is None:
+            return False, None, None, 0
+        try:
+            row = db.execute(
+                "SELECT value, expires FROM entries WHERE ns=? AND key=?", (ns, key)
+            ).fetchone()
+            if row is None:
+                return False, None, None, 0
+            blob, expires = row
+            now = time.time()
+            if expires is not None and expires <= now:
+                db.execute("DELETE FROM entries WHERE ns=? AND key=?", (ns, key))
+                return False, None, None, 0
+            db.execute(
+                "UPDATE entries SET atime=? WHERE ns=? AND key=?", (now, ns, key)
+            )
+            return True, json.loads(blob), expires, len(blob)
+        except Exception:
+            return False, None, None, 0
+
+    def _disk_set(
+        self, ns: str, key: str, blob: bytes, expires: Optional[float]
+    ) -> None:
+        db = self._conn()
+        if db is None:
+            return
+        try:
+            db.execute(
+                "INSERT OR REPLACE INTO entries (ns, key, value, expires, size, atime) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (ns, key, blob, expires, len(blob), time.time()),
+            )
+            self._disk_trim(db)
+        except Exception:
+            pass
+
+    def _disk_trim(self, db) -> None:
+        db.execute(
+            "DELETE FROM entries WHERE expires IS NOT NULL AND expires <= ?",
+            (time.time(),),
+        )
+        if not self.disk_max_bytes:
+            return
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.disk_max_bytes:
+            return
+        excess = total - self.disk_max_bytes
+        victims: List[Tuple[str, str]] = []
+        for ns, key, size in db.execute(
+            "SELECT ns, key, size FROM entries ORDER BY atime"
+        ):
+            victims.append((ns, key))
+            excess -= size
+            if excess <= 0:
+                break
+        db.executemany("DELETE FROM entries WHERE ns=? AND key=?", victims)
+
+    # Memory tier
+    def _mem_drop(self, k: Tuple[str, str]) -> None:
+        item = self._mem.pop(k, None)
+        if item is not None:
+            self._mem_bytes -= item[2]
+
+    def _mem_put(
+        self, k: Tuple[str, str], value: Any, expires: Optional[float], size: int
+    ) -> None:
+        self._mem_drop(k)
+        self._mem[k] = (value, expires, size)
+        self._mem_bytes += size
+        while len(self._mem) > self.max_entries or (
+            self.max_bytes and self._mem_bytes > self.max_bytes and len(self._mem) > 1
+        ):
+            old_k, (_v, _e, old_size) = self._mem.popitem(last=False)
+            self._mem_bytes -= old_size
+            self._stats[old_k[0]]["evictions"] += 1
+
+    # Public API
+    def set(
+        self,
+        plugin_id: str,
+        key: str,
+        value: Any,
+        *,
+        ttl: Optional[float] = None,
+        persist: bool = True,
+    ) -> None:
+        ns, key = str(plugin_id), str(key)
+        ttl = self.default_ttl if ttl is None else ttl
+        expires = time.time() + float(ttl) if ttl is not None else None
+        blob = _json_blob(value)
+        size = len(blob) if blob is not None else sys.getsizeof(value)
+        with self._lock:
+            self._mem_put((ns, key), value, expires, size)
+            if persist and blob is not None:
+                self._disk_set(ns, key, blob, expires)
+
+    def get(self, plugin_id: str, key: str, default: Any = None) -> Any:
+        ns, key = str(plugin_id), str(key)
+        k = (ns, key)
+        with self._lock:
+            stats = self._stats[ns]
+            item = self._mem.get(k)
+            if item is not None:
+                value, expires, _size = item
+                if expires is None or expires > time.time():
+                    self._mem.move_to_end(k)
+                    stats["hits"] += 1
+                    return value
+                self._mem_drop(k)
+            found, value, expires, size = self._disk_get(ns, key)
+            if found:
+                stats["hits"] += 1
+                stats["disk_hits"] += 1
+                self._mem_put(k, value, expires, size)
+                return value
+            stats["misses"] += 1
+            return default
+
+    def delete(self, plugin_id: str, key: str) -> None:
+        ns, key = str(plugin_id), str(key)
+        with self._lock:
+            self._mem_drop((ns, key))
+            db = self._conn()
+            if db is not None:
+                try:
+                    db.execute("DELETE FROM entries WHERE ns=? AND key=?", (ns, key))
+                except Exception:
+                    pass
+
+    def clear(self, plugin_id: Optional[str] = None) -> None:
+        with self._lock:
+            if plugin_id is None:
+                self._mem.clear()
+                self._mem_bytes = 0
+                self._stats.clear()
+            else:
+                ns = str(plugin_id)
+                for k in [k for k in self._mem if k[0] == ns]:
+                    self._mem_drop(k)
+                self._stats.pop(ns, None)
+            db = self._conn()
+            if db is not None:
+                try:
+                    if plugin_id is None:
+                        db.execute("DELETE FROM entries")
+                    else:
+                        db.execute("DELETE FROM entries WHERE ns=?", (str(plugin_id),))
+                except Exception:
+                    pass
+
+    def stats(self, plugin_id: Optional[str] = None) -> Dict[str, Any]:
+        """Hit/miss counters (per plugin, or totals) and memory usage."""
+        with self._lock:
+            if plugin_id is not None:
+                counters = dict(
+                    self._stats.get(str(plugin_id)) or _new_cache_counters()
+                )
+                entries = sum(1 for k in self._mem if k[0] == str(plugin_id))
+            else:
+                counters = _new_cache_counters()
+                for c in self._stats.values():
+                    for name, val in c.items():
+                        counters[name] += val
+                entries = len(self._mem)
+            out: Dict[str, Any] = dict(counters)
+            out["memory_entries"] = entries
+            out["memory_bytes"] = self._mem_bytes
+            out["disk"] = str(self.directory) if self._conn() is not None else None
+            return out
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                try:
+                    self._db.close()
+                except Exception:
+                    pass
+                self._db = None
+
+
+_plugin_cache: Optional[PluginCache] = None
+# Directory set through configure_plugin_cache(); None = follow the env variable
+_plugin_cache_dir: Optional[str] = None
+_plugin_cache_explicit = False
+
 
+def _plugin_cache_target() -> Optional[str]:
+    if _plugin_cache_explicit:
+        return _plugin_cache_dir
+    return os.environ.get(PLUGIN_CACHE_DIR_ENV) or None
 
-def cache_set(plugin_id: str, key: str, value: Any) -> None:
+
+def _get_plugin_cache() -> PluginCache:
+    """Process-wide cache.
+
+    The disk tier is the directory given to configure_plugin_cache(), or else
+    PYCOMPILER_BCASL_CACHE_DIR; without either the cache is memory only.
+    """
+    global _plugin_cache
+    target = _plugin_cache_target()
+    cur = _plugin_cache
+    current = str(cur.directory) if cur is not None and cur.directory else None
+    if cur is None or current != target:
+        limits: Dict[str, Any] = {}
+        if cur is not None:
+            cur.close()
+            limits = {
+                "max_entries": cur.max_entries,
+                "max_bytes": cur.max_bytes,
+                "disk_max_bytes": cur.disk_max_bytes,
+                "default_ttl": cur.default_ttl,
+            }
+        _plugin_cache = cur = PluginCache(target, **limits)
+    return cur
+
+
+def configure_plugin_cache(
+    directory: Optional[Pathish] = None,
+    *,
+    max_entries: int = 1024,
+    max_bytes: int = 64 * 1024 * 1024,
+    disk_max_bytes: int = 256 * 1024 * 1024,
+    default_ttl: Optional[float] = None,
+) -> PluginCache:
+    """Replace the process-wide plugin cache (None directory = memory only).
+
+    The directory takes precedence over PYCOMPILER_BCASL_CACHE_DIR for this
+    process. Use plugin_cache_dir_for() to get the per-user directory of a
+    workspace; the BCASL executor passes it to its sandbox workers explicitly.
+
+    Example:
+        >>> configure_plugin_cache(plugin_cache_dir_for("/path/to/workspace"))
+    """
+    global _plugin_cache, _plugin_cache_dir, _plugin_cache_explicit
+    if _plugin_cache is not None:
+        _plugin_cache.close()
+    _plugin_cache_dir = str(directory) if directory else None
+    _plugin_cache_explicit = True
+    _plugin_cache = PluginCache(
+        _plugin_cache_dir,
+        max_entries=max_entries,
+        max_bytes=max_bytes,
+        disk_max_bytes=disk_max_bytes,
+        default_ttl=default_ttl,
+    )
+    return _plugin_cache
+
+
+def set_plugin_cache_dir(directory: Optional[Pathish]) -> PluginCache:
+    """Point the process-wide cache at directory, keeping its current limits.
+
+    The cache is only rebuilt when the directory actually changes.
+    """
+    global _plugin_cache_dir, _plugin_cache_explicit
+    _plugin_cache_dir = str(directory) if directory else None
+    _plugin_cache_explicit = True
+    return _get_plugin_cache()
+
+
+def reset_plugin_cache() -> None:
+    """Drop the process-wide cache and go back to following the env variable."""
+    global _plugin_cache, _plugin_cache_dir, _plugin_cache_explicit
+    if _plugin_cache is not None:
+        _plugin_cache.close()
+    _plugin_cache = None
+    _plugin_cache_dir = None
+    _plugin_cache_explicit = False
+
+
+def cache_set(
+    plugin_id: str,
+    key: str,
+    value: Any,
+    ttl: Optional[float] = None,
+    persist: bool = True,
+) -> None:
     """Set a value in plugin cache.
 
     Args:
         plugin_id: Plugin identifier
         key: Cache key
         value: Value to cache
+        ttl: Lifetime in seconds (None = no expiry)
+        persist: Also write to the disk tier when one is configured
 
     Example:
-        >>> cache_set("my.plugin", "processed_files", file_list)
+        >>> cache_set("my.plugin", "processed_files", file_list, ttl=3600)
     """
-    cache_key = f"{plugin_id}:{key}"
-    _plugin_cache[cache_key] = value
+    _get_plugin_cache().set(plugin_id, key, value, ttl=ttl, persist=persist)
 
 
 def cache_get(plugin_id: str, key: str, default: Any = None) -> Any:
@@ -1715,8 +2875,7 @@ def cache_get(plugin_id: str, key: str, default: Any = None) -> Any:
     Example:
         >>> files = cache_get("my.plugin", "processed_files", [])
     """
-    cache_key = f"{plugin_id}:{key}"
-    return _plugin_cache.get(cache_key, default)
+    return _get_plugin_cache().get(plugin_id, key, default)
 
 
 def cache_clear(plugin_id: Optional[str] = None) -> None:
@@ -1729,26 +2888,170 @@ def cache_clear(plugin_id: Optional[str] = None) -> None:
         >>> cache_clear("my.plugin")  # Clear specific plugin
         >>> cache_clear()  # Clear all plugins
     """
-    global _plugin_cache
-    if plugin_id is None:
-        _plugin_cache.clear()
-    else:
-        keys_to_remove = [
-            k for k in _plugin_cache.keys() if k.startswith(f"{plugin_id}:")
-        ]
-        for key in keys_to_remove:
-            del _plugin_cache[key]
+    _get_plugin_cache().clear(plugin_id)
+
+
+def cache_stats(plugin_id: Optional[str] = None) -> Dict[str, Any]:
+    """Get cache counters (hits, misses, disk_hits, evictions) and memory usage.
+
+    Example:
+        >>> stats = cache_stats("my.plugin")
+        >>> print(f"{stats['hits']} hits / {stats['misses']} misses")
+    """
+    return _get_plugin_cache().stats(plugin_id)
 
     # -----------------------------
     # Report generation utilities
     # -----------------------------
 
 
-def get_outdated_packages(root: Pathish) -> List[PackageInfo]:
+_PRE_PHASES = {
+    "dev": 0,
+    "a": 1,
+    "alpha": 1,
+    "b": 2,
+    "beta": 2,
+    "c": 3,
+    "rc": 3,
+    "pre": 3,
+}
+
+
+def _version_key(version: str) -> Tuple[Any, ...]:
+    """Sortable key for a version string (packaging.version when available)."""
+    try:
+        from packaging.version import Version
+
+        return (1, Version(version))
+    except Exception:
+        pass
+    m = re.match(r"v?(\d+(?:\.\d+)*)[-_.]?([a-z]*)[-_.]?(\d*)", version.strip().lower())
+    if not m:
+        return (0, (), 4, 0)
+    release = tuple(int(x) for x in m.group(1).split("."))
+    while release and release[-1] == 0:
+        release = release[:-1]
+    tag, num = m.group(2), int(m.group(3) or 0)
+    # Pré-versions avant la version finale, post-versions après
+    phase = 5 if tag in ("post", "rev", "r") else _PRE_PHASES.get(tag, 4)
+    return (0, release, phase, num)
+
+
+def _is_prerelease(version: str) -> bool:
+    return (
+        re.search(r"\d[-_.]?(a|b|c|rc|alpha|beta|pre|dev)\d*", version.lower())
+        is not None
+    )
+
+
+class PackageIndexClient(abc.ABC):
+    """Source of "latest version" answers for get_outdated_packages.
+
+    Subclass and implement latest_version(); the default PyPIJSONClient uses
+    the PyPI JSON API and SimpleIndexClient any PEP 503/691 simple index
+    (for example a local mirror).
+    """
+
+    @abc.abstractmethod
+    def latest_version(self, name: str) -> Optional[str]:
+        """Latest published version of name, or None if unknown."""
+
+
+class PyPIJSONClient(PackageIndexClient):
+    """Latest versions from the PyPI JSON API (https://pypi.org/pypi/<name>/json)."""
+
+    def __init__(
+        self, base_url: str = "https://pypi.org/pypi", timeout: float = 10.0
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+
+    def latest_version(self, name: str) -> Optional[str]:
+        url = f"{self.base_url}/{urllib.parse.quote(name)}/json"
+        try:
+            req = urllib.request.Request(url)
+            req.add_header("User-Agent", "PyCompiler-BC-Plugin/1.0")
+            with urllib.request.urlopen(req, timeout=self.timeout) as response:
+                data = json.loads(response.read())
+            return (data.get("info") or {}).get("version") or None
+        except Exception:
+            return None
+
+
+class SimpleIndexClient(PackageIndexClient):
+    """Latest (final) versions from a PEP 503/691 simple index."""
+
+    _ANCHOR_RX = re.compile(r"<a\b[^>]*>\s*([^<]+?)\s*</a>", re.IGNORECASE)
+
+    def __init__(
+        self, index_url: str = "https://pypi.org/simple", timeout: float = 10.0
+    ) -> None:
+        self.index_url = index_url.rstrip("/")
+        self.timeout = timeout
+
+    @staticmethod
+    def _version_from_filename(norm: str, filename: str) -> Optional[str]:
+        if filename.endswith(".whl"):
+            parts = filename[:-4].split("-")
+            if len(parts) >= 5 and re.sub(r"[-_.]+", "-", parts[0]).lower() == norm:
+                return parts[1]
+            return None
+        for ext in (".tar.gz", ".zip", ".tar.bz2"):
+            if filename.endswith(ext):
+                stem = filename[: -len(ext)]
+                # nom-version, le nom d'un sdist ancien pouvant contenir des '-'
+                for i, ch in enumerate(stem):
+                    if ch == "-" and re.sub(r"[-_.]+", "-", stem[:i]).lower() == norm:
+                        return stem[i + 1 :] or None
+        return None
+
+    def _versions(self, norm: str, payload: bytes, content_type: str) -> List[str]:
+        if "json" in content_type:
+            data = json.loads(payload)
+            if data.get("versions"):
+                return [str(v) for v in data["versions"]]
+            filenames = [str(f.get("filename", "")) for f in data.get("files", [])]
+        else:
+            filenames = self._ANCHOR_RX.findall(
+                payload.decode("utf-8", errors="replace")
+            )
+        versions = (self._version_from_filename(norm, fn) for fn in filenames)
+        return sorted({v for v in versions if v})
+
+    def latest_version(self, name: str) -> Optional[str]:
+        norm = re.sub(r"[-_.]+", "-", name).lower()
+        try:
+            req = urllib.request.Request(f"{self.index_url}/{norm}/")
+            req.add_header("User-Agent", "PyCompiler-BC-Plugin/1.0")
+            req.add_header(
+                "Accept",
+                "application/vnd.pypi.simple.v1+json, text/html;q=0.1",
+            )
+            with urllib.request.urlopen(req, timeout=self.timeout) as response:
+                ctype = response.headers.get("Content-Type", "")
+                versions = self._versions(norm, response.read(), ctype)
+        except Exception:
+            return None
+        final = [v for v in versions if not _is_prerelease(v)] or versions
+        return max(final, key=_version_key) if final else None
+
+
+def get_outdated_packages(
+    root: Pathish,
+    index_client: Optional[PackageIndexClient] = None,
+    max_workers: Optional[int] = None,
+) -> List[PackageInfo]:
     """Liste les packages obsolètes dans le projet.
 
+    Les versions installées sont lues depuis les métadonnées dist-info du venv
+    (sans lancer pip); seule la dernière version de chaque package est
+    demandée à index_client (PyPI JSON par défaut), en parallèle.
+
     Args:
-    root: Répertoire racine du projet
+        root: Répertoire racine du projet
+        index_client: Source des dernières versions (ex: SimpleIndexClient
+            vers un miroir local)
+        max_workers: Nombre de requêtes simultanées (None = automatique)
 
     Returns:
         Liste de PackageInfo pour les packages obsolètes
@@ -1759,40 +3062,37 @@ def get_outdated_packages(root: Pathish) -> List[PackageInfo]:
         ...     print(f"{pkg.name}: {pkg.version} -> {pkg.latest_version}")
     """
     root_path = Path(root)
-    outdated = []
+    outdated: List[PackageInfo] = []
 
     venv = detect_venv(root_path)
     if not venv:
         return outdated
 
-    if sys.platform == "win32":
-        pip_exe = venv / "Scripts" / "pip.exe"
-    else:
-        pip_exe = venv / "bin" / "pip"
-
-    if not pip_exe.exists():
+    installed: Dict[str, str] = {}
+    for sp in venv_site_packages(venv):
+        for name, version in read_installed_packages(sp).items():
+            installed.setdefault(name, version)
+    if not installed:
         return outdated
 
-    try:
-        code, out, err = run_command(
-            [str(pip_exe), "list", "--outdated", "--format=json"],
-            cwd=root_path,
-            timeout=60,
-        )
+    client = index_client or PyPIJSONClient()
 
-        if code == 0:
-            packages = json.loads(out)
-            for pkg in packages:
-                info = PackageInfo(
-                    name=pkg.get("name", ""),
-                    version=pkg.get("version", ""),
-                    latest_version=pkg.get("latest_version", ""),
-                    is_outdated=True,
+    def _check(item: Tuple[str, str]) -> Optional[PackageInfo]:
+        name, version = item
+        try:
+            latest = client.latest_version(name)
+            if latest and _version_key(latest) > _version_key(version):
+                return PackageInfo(
+                    name=name, version=version, latest_version=latest, is_outdated=True
                 )
-                outdated.append(info)
-    except Exception:
-        pass
+        except Exception:
+            pass
+        return None
 
+    items = sorted(installed.items(), key=lambda kv: kv[0].lower())
+    for res in _pool_map(_check, items, max_workers or 16):
+        if res is not None:
+            outdated.append(res)
     return outdated
 
 
@@ -1814,65 +3114,8 @@ def calculate_code_metrics(path: Pathish) -> CodeMetrics:
         >>> metrics = calculate_code_metrics("main.py")
         >>> print(f"LOC: {metrics.code_lines}, Comments: {metrics.comment_lines}")
     """
-    metrics = CodeMetrics()
-
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-
-        metrics.total_lines = len(lines)
-
-        in_docstring = False
-        docstring_char = None
-
-        for line in lines:
-            stripped = line.strip()
-
-            # Ligne vide
-            if not stripped:
-                metrics.blank_lines += 1
-                continue
-
-            # Gestion des docstrings
-            if '"""' in stripped or "'''" in stripped:
-                if not in_docstring:
-                    docstring_char = '"""' if '"""' in stripped else "'''"
-                    in_docstring = True
-                    metrics.comment_lines += 1
-                    if stripped.count(docstring_char) >= 2:
-                        in_docstring = False
-                    continue
-                else:
-                    metrics.comment_lines += 1
-                    if docstring_char in stripped:
-                        in_docstring = False
-                    continue
-
-            if in_docstring:
-                metrics.comment_lines += 1
-                continue
-
-            # Commentaire simple
-            if stripped.startswith("#"):
-                metrics.comment_lines += 1
-                continue
-
-            # Ligne de code
-            metrics.code_lines += 1
-
-        # Analyser l'AST pour les fonctions/classes
-        try:
-            info = analyze_python_file(path)
-            metrics.functions_count = len(info.functions)
-            metrics.classes_count = len(info.classes)
-            metrics.imports_count = len(info.imports)
-        except Exception:
-            pass
-
-    except Exception:
-        pass
-
-    return metrics
+    # Copie: le résultat du scan est partagé via le cache
+    return replace(_scan_file(Path(path)).metrics)
 
 
 def calculate_project_metrics(root: Pathish) -> Dict[str, Any]:
@@ -1888,45 +3131,101 @@ def calculate_project_metrics(root: Pathish) -> Dict[str, Any]:
     >>> metrics = calculate_project_metrics(".")
     >>> print(f"Total LOC: {metrics['total_code_lines']}")
     """
-    root_path = Path(root)
-    total_metrics = {
-        "total_files": 0,
-        "total_lines": 0,
-        "total_code_lines": 0,
-        "total_comment_lines": 0,
-        "total_blank_lines": 0,
-        "total_functions": 0,
-        "total_classes": 0,
-        "files_with_issues": 0,
-    }
+    return ProjectScan(root, include=["**/*.py"]).project_metrics()
 
-    for py_file in find_files(root_path, include=["**/*.py"]):
-        total_metrics["total_files"] += 1
 
-        metrics = calculate_code_metrics(py_file)
-        total_metrics["total_lines"] += metrics.total_lines
-        total_metrics["total_code_lines"] += metrics.code_lines
-        total_metrics["total_comment_lines"] += metrics.comment_lines
-        total_metrics["total_blank_lines"] += metrics.blank_lines
-        total_metrics["total_functions"] += metrics.functions_count
-        total_metrics["total_classes"] += metrics.classes_count
+# -----------------------------
+# Analyse de sécurité
+# -----------------------------
+
 
-        if not analyze_python_file(py_file).is_valid_syntax:
-            total_metrics["files_with_issues"] += 1
+# Rules of scan_for_secrets: (name, bytes regex, literal anchor, case-insensitive).
+# Whitespace and values never cross a line, as in the historical per-line scan.
+_SECRET_ASSIGN = rb"[\"']?[^\S\n]*[:=][^\S\n]*[\"'](?:[^\"'\n]+)[\"']"
+_SECRET_RULES: List[Tuple[str, bytes, bytes, bool]] = [
+    ("aws_key", rb"AKIA[0-9A-Z]{16}", b"AKIA", False),
+    ("Plugins_key", rb"plugins[_-]?key" + _SECRET_ASSIGN, b"plugins", True),
+    ("password", rb"password" + _SECRET_ASSIGN, b"password", True),
+    ("token", rb"token" + _SECRET_ASSIGN, b"token", True),
+    ("secret", rb"secret" + _SECRET_ASSIGN, b"secret", True),
+    ("private_key", rb"-----BEGIN [A-Z ]+ PRIVATE KEY-----", b"-----BEGIN ", False),
+]
 
-    return total_metrics
 
+def _secret_pass(case_insensitive: bool) -> Tuple[Pattern[bytes], Pattern[bytes]]:
+    """One alternation (a named group per rule) and its literal prefilter.
+
+    Case-insensitive rules are compiled with re.IGNORECASE (ASCII-only on
+    bytes) and run directly on the buffer, so an mmap is never copied.
+    """
+    rules = [r for r in _SECRET_RULES if r[3] == case_insensitive]
+    flags = re.IGNORECASE if case_insensitive else 0
+    rx = re.compile(
+        b"|".join(b"(?P<%s>%s)" % (name.encode(), pat) for name, pat, _a, _ci in rules),
+        flags,
+    )
+    anchors = re.compile(
+        b"|".join(re.escape(anchor) for _n, _p, anchor, _ci in rules), flags
+    )
+    return rx, anchors
 
-# -----------------------------
-# Analyse de sécurité
-# -----------------------------
 
+_SECRET_PASSES = (_secret_pass(False), _secret_pass(True))
+_SECRET_RULE_INDEX = {r[0]: i for i, r in enumerate(_SECRET_RULES)}
+_SECRET_MMAP_MIN = 256 * 1024
+_SECRETS_CACHE_NS = "Plugins_SDK.scan_for_secrets"
 
-def scan_for_secrets(root: Pathish) -> List[SecurityIssue]:
+
+def _scan_secrets_buffer(buf: Any) -> List[Tuple[int, str]]:
+    """(line, rule) pairs found in a bytes-like buffer, in line then rule order."""
+    hits: List[Tuple[int, str]] = []
+    for rx, anchors in _SECRET_PASSES:
+        # Préfiltre: aucune ancre littérale => aucune règle de cette passe ne peut matcher
+        if anchors.search(buf) is None:
+            continue
+        pos = 0
+        while True:
+            m = rx.search(buf, pos)
+            if m is None:
+                break
+            hits.append((m.start(), m.lastgroup or ""))
+            # Reprendre juste après le début: une autre règle peut matcher dans ce match
+            pos = m.start() + 1
+
+    found: Set[Tuple[int, str]] = set()
+    line, last = 1, 0
+    for start, rule in sorted(hits):
+        line += buf[last:start].count(b"\n")
+        last = start
+        found.add((line, rule))
+    return sorted(found, key=lambda x: (x[0], _SECRET_RULE_INDEX.get(x[1], 0)))
+
+
+def _scan_secrets_file(path: Path, size: int) -> List[Tuple[int, str]]:
+    import mmap
+
+    with open(path, "rb") as f:
+        if size >= _SECRET_MMAP_MIN:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _scan_secrets_buffer(mm)
+        return _scan_secrets_buffer(f.read())
+
+
+def scan_for_secrets(
+    root: Pathish, incremental: bool = True, max_workers: Optional[int] = None
+) -> List[SecurityIssue]:
     """Scanne le code pour détecter des secrets hardcodés.
 
+    Toutes les règles sont compilées en une seule expression (groupes nommés)
+    appliquée aux octets de chaque fichier (mmap pour les gros fichiers), dans
+    un pool de threads. Avec incremental, seuls les fichiers dont (taille,
+    mtime_ns) a changé sont relus; les résultats sont conservés dans le cache
+    plugins (partagé entre builds et workers sandbox).
+
     Args:
         root: Répertoire racine du projet
+        incremental: Réutiliser les résultats des fichiers inchangés
+        max_workers: Taille du pool (None = automatique)
 
     Returns:
         Liste de SecurityIssue détectés
@@ -1936,45 +3235,82 @@ def scan_for_secrets(root: Pathish) -> List[SecurityIssue]:
         >>> for issue in issues:
         ...     print(f"Secret trouvé: {issue.file_path}:{issue.line_number}")
     """
-    issues = []
     root_path = Path(root)
+    files = list(
+        dict.fromkeys(
+            find_files(
+                root_path, include=["**/*.py", "**/*.json", "**/*.yml", "**/*.yaml"]
+            )
+        )
+    )
 
-    # Patterns pour détecter les secrets
-    patterns = {
-        "aws_key": re.compile(r"AKIA[0-9A-Z]{16}"),
-        "Plugins_key": re.compile(
-            r'Plugins[_-]?key["\']?\s*[:=]\s*["\']([^"\']+)["\']', re.IGNORECASE
-        ),
-        "password": re.compile(
-            r'password["\']?\s*[:=]\s*["\']([^"\']+)["\']', re.IGNORECASE
-        ),
-        "token": re.compile(r'token["\']?\s*[:=]\s*["\']([^"\']+)["\']', re.IGNORECASE),
-        "secret": re.compile(
-            r'secret["\']?\s*[:=]\s*["\']([^"\']+)["\']', re.IGNORECASE
-        ),
-        "private_key": re.compile(r"-----BEGIN [A-Z ]+ PRIVATE KEY-----"),
-    }
+    cache_key = str(root_path.resolve())
+    previous: Dict[str, Tuple[int, int, List[Tuple[int, str]]]] = {}
+    if incremental:
+        cached = cache_get(_SECRETS_CACHE_NS, cache_key)
+        if isinstance(cached, dict):
+            previous = cached
 
-    for py_file in find_files(
-        root_path, include=["**/*.py", "**/*.json", "**/*.yml", "**/*.yaml"]
-    ):
+    results: Dict[str, Tuple[int, int, List[Tuple[int, str]]]] = {}
+    todo: List[Tuple[Path, os.stat_result]] = []
+    for path in files:
         try:
-            with open(py_file, "r", encoding="utf-8") as f:
-                for line_num, line in enumerate(f, 1):
-                    for issue_type, pattern in patterns.items():
-                        if pattern.search(line):
-                            issue = SecurityIssue(
-                                severity="high",
-                                issue_type=f"hardcoded_{issue_type}",
-                                file_path=py_file,
-                                line_number=line_num,
-                                description=f"Possible {issue_type} hardcodé détecté",
-                                recommendation="Utiliser des variables d'environnement ou un gestionnaire de secrets",
-                            )
-                            issues.append(issue)
-        except Exception:
+            st = path.stat()
+        except OSError:
             continue
+        old = previous.get(str(path))
+        if old is not None and old[0] == st.st_size and old[1] == st.st_mtime_ns:
+            results[str(path)] = old
+        else:
+            todo.append((path, st))
 
+    def _work(item: Tuple[Path, os.stat_result]) -> Tuple[str, Any]:
+        path, st = item
+        try:
+            return str(path), (
+                st.st_size,
+                st.st_mtime_ns,
+                _scan_secrets_file(path, st.st_size),
+            )
+        except Exception:
+            return str(path), None
+
+    if len(todo) < 8 or max_workers == 1:
+        scanned = [_work(item) for item in todo]
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+
+        workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            scanned = list(pool.map(_work, todo, chunksize=16))
+    for key, res in scanned:
+        if res is not None:
+            results[key] = res
+
+    if incremental:
+        # Listes plutôt que tuples: seul le JSON est persisté sur disque
+        cache_set(
+            _SECRETS_CACHE_NS,
+            cache_key,
+            {k: [v[0], v[1], [list(hit) for hit in v[2]]] for k, v in results.items()},
+        )
+
+    issues = []
+    for path in files:
+        res = results.get(str(path))
+        if res is None:
+            continue
+        for line_num, issue_type in res[2]:
+            issues.append(
+                SecurityIssue(
+                    severity="high",
+                    issue_type=f"hardcoded_{issue_type}",
+                    file_path=path,
+                    line_number=line_num,
+                    description=f"Possible {issue_type} hardcodé détecté",
+                    recommendation="Utiliser des variables d'environnement ou un gestionnaire de secrets",
+                )
+            )
     return issues
 
 
@@ -2148,18 +3484,263 @@ def bump_version(root: Pathish, bump_type: str = "patch") -> Tuple[bool, str, st
 # -----------------------------
 
 
-def run_tests(root: Pathish, coverage: bool = False) -> TestResults:
+_TEST_FILE_PATTERNS = ["**/test_*.py", "**/*_test.py"]
+# Fichiers dont la modification impose de relancer toute la suite
+_TEST_CONFIG_FILES = {
+    "conftest.py",
+    "pytest.ini",
+    "pyproject.toml",
+    "setup.cfg",
+    "setup.py",
+    "tox.ini",
+}
+
+
+def _module_names(rel: str) -> List[str]:
+    """Dotted names under which a project file may be imported (every suffix,
+    so 'src/pkg/mod.py' answers to src.pkg.mod, pkg.mod and mod)."""
+    parts = rel[:-3].split("/")
+    if parts[-1] == "__init__":
+        parts = parts[:-1]
+    return [".".join(parts[i:]) for i in range(len(parts))]
+
+
+@functools.lru_cache(maxsize=4096)
+def _full_imports(path: str, rel: str, size: int, mtime_ns: int) -> Tuple[str, ...]:
+    """Fully qualified modules imported by a file (relative imports resolved
+    against its package, taken from rel); size/mtime_ns key the cache."""
+    try:
+        with open(path, "rb") as f:
+            tree = ast.parse(f.read())
+    except Exception:
+        return ()
+    package = rel.rpartition("/")[0].replace("/", ".")
+    names: Set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                parent = package.split(".") if package else []
+                parent = parent[: max(0, len(parent) - node.level + 1)]
+                base = ".".join(parent + ([base] if base else []))
+            if not base:
+                continue
+            names.add(base)
+            names.update(
+                f"{base}.{alias.name}" for alias in node.names if alias.name != "*"
+            )
+    # Importer a.b.c exécute aussi a et a.b
+    out: Set[str] = set()
+    for name in names:
+        parts = name.split(".")
+        out.update(".".join(parts[: i + 1]) for i in range(len(parts)))
+    return tuple(sorted(out))
+
+
+def select_affected_tests(
+    root: Pathish, changed_files: List[Pathish]
+) -> Optional[List[Path]]:
+    """Test files affected by a set of changed files.
+
+    A test is affected when it changed itself or imports, directly or through
+    other project modules, a changed module (including a deleted or renamed
+    one, through its former module names). Returns None when every test must
+    run (conftest.py or test configuration changed); other non-Python files are
+    ignored.
+
+    Example:
+        >>> tests = select_affected_tests(".", ["src/app/models.py"])
+    """
+    root_path = Path(root)
+    root_abs = root_path.resolve()
+    changed: Set[str] = set()
+    for item in changed_files:
+        p = Path(item)
+        p = p.resolve() if p.is_absolute() else (root_abs / p).resolve()
+        try:
+            rel = p.relative_to(root_abs).as_posix()
+        except ValueError:
+            continue
+        if p.name in _TEST_CONFIG_FILES:
+            return None
+        if rel.endswith(".py"):
+            changed.add(rel)
+    if not changed:
+        return []
+
+    by_name: Dict[str, Set[str]] = defaultdict(set)
+    files: Dict[str, Tuple[str, os.stat_result]] = {}
+    for path_str, rel, entry in walk_files(
+        str(root_path),
+        compile_matcher(("**/*.py",), anchored=True),
+        compile_matcher(tuple(_DEFAULT_EXCLUDE), anchored=False),
+    ):
+        try:
+            files[rel] = (path_str, entry.stat())
+        except OSError:
+            continue
+        for name in _module_names(rel):
+            by_name[name].add(rel)
+    # Fichiers supprimés ou renommés: leurs importeurs restent concernés
+    for rel in changed:
+        if rel not in files:
+            for name in _module_names(rel):
+                by_name[name].add(rel)
+
+    # Graphe inverse: module -> fichiers qui l'importent
+    importers: Dict[str, Set[str]] = defaultdict(set)
+    for rel, (path_str, st) in files.items():
+        for name in _full_imports(path_str, rel, st.st_size, st.st_mtime_ns):
+            for target in by_name.get(name, ()):
+                if target != rel:
+                    importers[target].add(rel)
+
+    affected = set(changed)
+    stack = list(changed)
+    while stack:
+        for rel in importers.get(stack.pop(), ()):
+            if rel not in affected:
+                affected.add(rel)
+                stack.append(rel)
+
+    tests = compile_matcher(tuple(_TEST_FILE_PATTERNS), anchored=True)
+    return [
+        root_path / rel
+        for rel in sorted(affected)
+        if rel in files and tests.matches(rel)
+    ]
+
+
+def _parse_junit_xml(path: Pathish, results: TestResults) -> bool:
+    """Accumulate a JUnit XML report (pytest --junitxml) into results."""
+    import xml.etree.ElementTree as ET
+
+    try:
+        tree = ET.parse(str(path))
+    except Exception:
+        return False
+    for case in tree.getroot().iter("testcase"):
+        results.total += 1
+        outcome = None
+        for child in case:
+            if child.tag in ("failure", "error", "skipped"):
+                outcome = child
+                break
+        if outcome is None:
+            results.passed += 1
+        elif outcome.tag == "skipped":
+            results.skipped += 1
+        else:
+            results.failed += 1
+            classname = case.get("classname") or ""
+            results.failures.append(
+                {
+                    "test": f"{classname}::{case.get('name', '')}"
+                    if classname
+                    else case.get("name", ""),
+                    "type": outcome.tag,
+                    "message": outcome.get("message")
+                    or (outcome.text or "").strip()[:2000],
+                }
+            )
+    return True
+
+
+def _shard_files(files: List[Path], shards: int) -> List[List[Path]]:
+    """Greedy split by file size (largest first) into at most `shards` groups."""
+    buckets: List[Tuple[int, List[Path]]] = [(0, []) for _ in range(max(1, shards))]
+    sized = []
+    for f in files:
+        try:
+            sized.append((f.stat().st_size, f))
+        except OSError:
+            sized.append((0, f))
+    for size, f in sorted(sized, key=lambda t: (-t[0], str(t[1]))):
+        i = min(range(len(buckets)), key=lambda k: buckets[k][0])
+        buckets[i] = (buckets[i][0] + size, buckets[i][1] + [f])
+    return [sorted(b[1]) for b in buckets if b[1]]
+
+
+def _venv_python(venv: Path) -> Path:
+    if sys.platform == "win32":
+        return venv / "Scripts" / "python.exe"
+    return venv / "bin" / "python"
+
+
+def _venv_has_module(venv: Path, name: str) -> bool:
+    for sp in venv_site_packages(venv):
+        if (sp / name).is_dir() or (sp / f"{name}.py").is_file():
+            return True
+    return False
+
+
+def _test_runner(root_path: Path) -> Tuple[List[str], List[str], bool]:
+    """(commande pytest, commande unittest, xdist disponible) pour le projet.
+
+    L'interpréteur du venv du projet est préféré; à défaut, pytest/python
+    trouvés dans le PATH (jamais l'interpréteur de l'hôte).
+    """
+    venv = detect_venv(root_path)
+    if venv is not None:
+        py = str(_venv_python(venv))
+        return (
+            [py, "-m", "pytest", "-q"],
+            [py, "-m", "unittest", "discover"],
+            _venv_has_module(venv, "xdist"),
+        )
+    python = shutil.which("python3") or shutil.which("python") or "python"
+    return ["pytest", "-q"], [python, "-m", "unittest", "discover"], False
+
+
+def _record_run_error(
+    results: TestResults, test: str, code: int, out: str, err: str
+) -> None:
+    """Compte une exécution sans rapport exploitable (délai dépassé, lancement impossible)."""
+    message = (err or out or f"exit code {code}").strip()[-2000:]
+    results.total += 1
+    results.failed += 1
+    results.failures.append(
+        {
+            "test": test,
+            "type": "timeout" if err == "Command timed out" else "error",
+            "message": message,
+        }
+    )
+
+
+def run_tests(
+    root: Pathish,
+    coverage: bool = False,
+    workers: Optional[int] = 1,
+    changed_files: Optional[List[Pathish]] = None,
+    timeout: int = 300,
+) -> TestResults:
     """Exécute les tests du projet.
 
+    Les tests tournent avec l'interpréteur du venv du projet (detect_venv),
+    sinon avec pytest/python du PATH. Les résultats pytest sont lus depuis un
+    rapport JUnit XML. Avec workers > 1 (None = un par CPU), la suite est
+    parallélisée par pytest-xdist s'il est installé dans le venv, sinon
+    découpée par fichier en processus pytest concurrents. Une exécution (ou un
+    groupe) sans rapport, par exemple après un délai dépassé, est comptée comme
+    une erreur dans failures. Avec changed_files, seuls les tests affectés par
+    ces fichiers sont lancés (voir select_affected_tests); aucun test affecté
+    => aucun lancement.
+
     Args:
         root: Répertoire racine du projet
         coverage: Activer la couverture de code
+        workers: Nombre de processus de test (1 = série)
+        changed_files: Fichiers modifiés (mode "tests affectés uniquement")
+        timeout: Délai maximal de l'exécution, en secondes
 
     Returns:
         TestResults avec les résultats
 
     Example:
-        >>> results = run_tests(".", coverage=True)
+        >>> results = run_tests(".", workers=None, changed_files=["src/app.py"])
         >>> print(f"Tests: {results.passed}/{results.total} passés")
     """
     root_path = Path(root)
@@ -2169,39 +3750,69 @@ def run_tests(root: Pathish, coverage: bool = False) -> TestResults:
     has_pytest = (root_path / "pytest.ini").exists() or (
         root_path / "pyproject.toml"
     ).exists()
-    has_unittest = any(f.name.startswith("test_") for f in root_path.rglob("test_*.py"))
+    test_files = list(find_files(root_path, include=_TEST_FILE_PATTERNS))
+    has_unittest = any(p.name.startswith("test_") for p in test_files)
 
     if not (has_pytest or has_unittest):
         return results
 
+    selected: Optional[List[Path]] = None
+    if changed_files is not None and has_pytest:
+        selected = select_affected_tests(root_path, list(changed_files))
+        if selected is not None and not selected:
+            return results
+
+    n_workers = (os.cpu_count() or 1) if workers is None else max(1, int(workers))
+    start_time = time.time()
     try:
+        base, unittest_cmd, has_xdist = _test_runner(root_path)
         if has_pytest:
-            cmd = ["pytest", "-v"]
             if coverage:
-                cmd.extend(["--cov", "--cov-report=json"])
-        else:
-            cmd = ["python", "-m", "unittest", "discover"]
-
-        start_time = time.time()
-        code, out, err = run_command(cmd, cwd=root_path, timeout=300)
-        results.duration_seconds = time.time() - start_time
-
-        # Parser les résultats pytest
-        if has_pytest:
-            if "passed" in out:
-                match = re.search(r"(\d+) passed", out)
-                if match:
-                    results.passed = int(match.group(1))
-            if "failed" in out:
-                match = re.search(r"(\d+) failed", out)
-                if match:
-                    results.failed = int(match.group(1))
-            if "skipped" in out:
-                match = re.search(r"(\d+) skipped", out)
-                if match:
-                    results.skipped = int(match.group(1))
-
-            results.total = results.passed + results.failed + results.skipped
+                base.extend(["--cov", "--cov-report=json"])
+            targets = [str(p.relative_to(root_path)) for p in (selected or [])]
+            files_for_shards = test_files if selected is None else selected
+            xdist = n_workers > 1 and has_xdist
+
+            with tempfile.TemporaryDirectory(prefix="pycompiler_tests_") as tmp:
+                if (
+                    n_workers > 1
+                    and not xdist
+                    and not coverage
+                    and len(files_for_shards) > 1
+                ):
+                    # Découpage maison: un processus pytest par groupe de fichiers
+                    from concurrent.futures import ThreadPoolExecutor
+
+                    shards = _shard_files(files_for_shards, n_workers)
+
+                    def _run_shard(
+                        item: Tuple[int, List[Path]],
+                    ) -> Tuple[int, str, str]:
+                        idx, shard = item
+                        report = os.path.join(tmp, f"junit_{idx}.xml")
+                        cmd = base + [f"--junitxml={report}"]
+                        cmd += [str(p.relative_to(root_path)) for p in shard]
+                        return run_command(cmd, cwd=root_path, timeout=timeout)
+
+                    with ThreadPoolExecutor(max_workers=len(shards)) as pool:
+                        outcomes = list(pool.map(_run_shard, enumerate(shards)))
+                    for idx, (shard, outcome) in enumerate(zip(shards, outcomes)):
+                        report = os.path.join(tmp, f"junit_{idx}.xml")
+                        if not _parse_junit_xml(report, results):
+                            names = " ".join(
+                                str(p.relative_to(root_path)) for p in shard
+                            )
+                            _record_run_error(
+                                results, f"shard {idx}: {names}", *outcome
+                            )
+                else:
+                    report = os.path.join(tmp, "junit.xml")
+                    cmd = base + [f"--junitxml={report}"]
+                    if xdist:
+                        cmd.extend(["-n", str(n_workers)])
+                    outcome = run_command(cmd + targets, cwd=root_path, timeout=timeout)
+                    if not _parse_junit_xml(report, results):
+                        _record_run_error(results, "pytest", *outcome)
 
             # Lire la couverture si disponible
             if coverage:
@@ -2215,10 +3826,30 @@ def run_tests(root: Pathish, coverage: bool = False) -> TestResults:
                             )
                     except Exception:
                         pass
+        else:
+            code, out, err = run_command(unittest_cmd, cwd=root_path, timeout=timeout)
+            # unittest écrit son résumé sur stderr
+            summary = err or out
+            match = re.search(r"Ran (\d+) tests?", summary)
+            if not match:
+                _record_run_error(results, "unittest", code, out, err)
+            else:
+                results.total = int(match.group(1))
+                for key in ("failures", "errors"):
+                    m = re.search(rf"{key}=(\d+)", summary)
+                    if m:
+                        results.failed += int(m.group(1))
+                m = re.search(r"skipped=(\d+)", summary)
+                if m:
+                    results.skipped = int(m.group(1))
+                results.passed = max(
+                    0, results.total - results.failed - results.skipped
+                )
 
     except Exception:
         pass
 
+    results.duration_seconds = time.time() - start_time
     return results
 
 
@@ -2458,6 +4089,212 @@ def get_external_ip() -> Optional[str]:
 # -----------------------------
 
 
+_REGEX_META = frozenset(".^$*+?{}[]\\|()")
+# Constructions dont le sens dépend des limites de ligne: recherche ligne par ligne
+_LINE_BOUND_RX = re.compile(r"\^|\$|\\[AZ]|\(\?[=!<]")
+_SEARCH_MMAP_MIN = 256 * 1024
+
+
+def _is_literal(pattern: Any) -> bool:
+    return isinstance(pattern, str) and not any(c in _REGEX_META for c in pattern)
+
+
+def _search_literal(
+    path: Path, needle: bytes, ignore_case: bool
+) -> List[Tuple[Path, int, str]]:
+    """Literal search on the raw bytes (mmap for large files); only matching
+    lines are located and decoded. Binary files are skipped."""
+    import mmap
+
+    results: List[Tuple[Path, int, str]] = []
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return results
+        buf: Any = (
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            if size >= _SEARCH_MMAP_MIN
+            else f.read()
+        )
+        try:
+            if buf.find(b"\0", 0, 8192) != -1:
+                return results
+            # Insensible à la casse: regex compilée sur le buffer (pas de copie)
+            rx = re.compile(re.escape(needle), re.IGNORECASE) if ignore_case else None
+            pos, line, last = 0, 1, 0
+            while True:
+                if rx is None:
+                    i = buf.find(needle, pos)
+                else:
+                    m = rx.search(buf, pos)
+                    i = m.start() if m is not None else -1
+                if i < 0:
+                    break
+                start = buf.rfind(b"\n", 0, i) + 1
+                end = buf.find(b"\n", i)
+                end = size if end < 0 else end
+                line += buf[last:start].count(b"\n")
+                last = start
+                try:
+                    text = buf[start:end].decode("utf-8")
+                    results.append((path, line, text.rstrip()))
+                except UnicodeDecodeError:
+                    pass
+                pos = end + 1
+        finally:
+            if not isinstance(buf, bytes):
+                buf.close()
+    return results
+
+
+def _iter_lines(text: str) -> Iterator[Tuple[int, str]]:
+    """(line number, line with its newline), like iterating a text file."""
+    start, line_num, n = 0, 1, len(text)
+    while start < n:
+        end = text.find("\n", start)
+        end = n if end < 0 else end + 1
+        yield line_num, text[start:end]
+        start, line_num = end, line_num + 1
+
+
+@functools.lru_cache(maxsize=64)
+def _candidate_regex(regex: Pattern) -> Optional[Pattern]:
+    """Regex used to find candidate lines in the whole text, or None when only
+    a line-by-line search is exact (\\A, \\Z, lookarounds). '^' and '$' are
+    made per-line with re.MULTILINE."""
+    src = regex.pattern if isinstance(regex.pattern, str) else ""
+    bounds = set(_LINE_BOUND_RX.findall(src))
+    if not bounds:
+        return regex
+    if bounds <= {"^", "$"}:
+        return re.compile(src, regex.flags | re.MULTILINE)
+    return None
+
+
+def _search_regex(path: Path, regex: Pattern) -> List[Tuple[Path, int, str]]:
+    """Regex search over the whole decoded file, line numbers computed lazily.
+
+    Each candidate line is confirmed with the same regex applied to the line
+    alone, so results match a line-by-line search exactly.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    results: List[Tuple[Path, int, str]] = []
+    finder = _candidate_regex(regex)
+    if finder is None:
+        for line_num, line in _iter_lines(text):
+            if regex.search(line):
+                results.append((path, line_num, line.rstrip()))
+        return results
+
+    n = len(text)
+    pos, line_num, last = 0, 1, 0
+    while pos < n:
+        m = finder.search(text, pos)
+        if m is None:
+            break
+        start = text.rfind("\n", 0, m.start()) + 1
+        if start >= n:
+            break
+        end = text.find("\n", m.start())
+        end = n if end < 0 else end + 1
+        line_num += text.count("\n", last, start)
+        last = start
+        line = text[start:end]
+        if regex.search(line):
+            results.append((path, line_num, line.rstrip()))
+        pos = end
+    return results
+
+
+def _pool_map(
+    func: Callable[[Any], Any], items: List[Any], max_workers: Optional[int]
+) -> Iterator[Any]:
+    """Ordered, streamed map over a thread pool (serial for small inputs)."""
+    if len(items) < 8 or max_workers == 1:
+        for item in items:
+            yield func(item)
+        return
+    from concurrent.futures import ThreadPoolExecutor
+
+    workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+    pool = ThreadPoolExecutor(max_workers=workers)
+    try:
+        yield from pool.map(func, items)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def iter_search_in_files(
+    root: Pathish,
+    pattern: Union[str, Pattern],
+    include: Optional[List[str]] = None,
+    exclude: Optional[List[str]] = None,
+    case_sensitive: bool = True,
+    literal: bool = False,
+    max_workers: Optional[int] = None,
+) -> Iterator[Tuple[Path, int, str]]:
+    """Recherche un pattern dans les fichiers, résultats produits au fil de l'eau.
+
+    Les fichiers sont traités dans un pool de threads; les résultats sont
+    produits dans l'ordre des fichiers, dès qu'un fichier est terminé.
+    Un pattern sans métacaractère (ou literal=True) est cherché directement
+    dans les octets du fichier (mmap), sans décoder les lignes non concernées.
+
+    Args:
+        root: Répertoire racine
+        pattern: Pattern à rechercher (str ou regex compilé)
+        include: Patterns de fichiers à inclure
+        exclude: Patterns de fichiers à exclure
+        case_sensitive: Recherche sensible à la casse
+        literal: Traiter pattern comme une chaîne littérale
+        max_workers: Taille du pool (None = automatique)
+
+    Yields:
+        Tuples (fichier, ligne, contenu)
+
+    Example:
+        >>> for file, line, content in iter_search_in_files(".", "TODO"):
+        ...     print(f"{file}:{line}: {content}")
+    """
+    root_path = Path(root)
+    if include is None:
+        include = ["**/*"]
+
+    search: Callable[[Path], List[Tuple[Path, int, str]]]
+    if (
+        isinstance(pattern, str)
+        and (literal or _is_literal(pattern))
+        and pattern
+        and (case_sensitive or pattern.isascii())
+    ):
+        needle = (pattern if case_sensitive else pattern.lower()).encode("utf-8")
+        ignore_case = not case_sensitive
+
+        def search(path: Path) -> List[Tuple[Path, int, str]]:
+            return _search_literal(path, needle, ignore_case)
+
+    else:
+        if isinstance(pattern, str):
+            flags = 0 if case_sensitive else re.IGNORECASE
+            regex = re.compile(re.escape(pattern) if literal else pattern, flags)
+        else:
+            regex = pattern
+
+        def search(path: Path) -> List[Tuple[Path, int, str]]:
+            return _search_regex(path, regex)
+
+    def _safe(path: Path) -> List[Tuple[Path, int, str]]:
+        try:
+            return search(path)
+        except Exception:
+            return []
+
+    files = list(find_files(root_path, include=include, exclude=exclude))
+    for found in _pool_map(_safe, files, max_workers):
+        yield from found
+
+
 def search_in_files(
     root: Pathish,
     pattern: Union[str, Pattern],
@@ -2482,28 +4319,37 @@ def search_in_files(
         >>> for file, line, content in results:
         ...     print(f"{file}:{line}: {content}")
     """
-    results = []
-    root_path = Path(root)
+    return list(
+        iter_search_in_files(
+            root,
+            pattern,
+            include=include,
+            exclude=exclude,
+            case_sensitive=case_sensitive,
+        )
+    )
 
-    if isinstance(pattern, str):
-        flags = 0 if case_sensitive else re.IGNORECASE
-        regex = re.compile(pattern, flags)
-    else:
-        regex = pattern
 
-    if include is None:
-        include = ["**/*"]
-
-    for file_path in find_files(root_path, include=include, exclude=exclude):
+def _write_text_atomic(path: Path, text: str) -> bool:
+    """Atomic write (engine_sdk.utils.atomic_write_text) keeping the file mode."""
+    try:
+        mode = path.stat().st_mode & 0o7777
+    except OSError:
+        mode = None
+    try:
+        from engine_sdk.utils import atomic_write_text
+    except Exception:  # pragma: no cover - engine_sdk indisponible
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        ok = True
+    else:
+        ok = atomic_write_text(path, text)
+    if ok and mode is not None:
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                for line_num, line in enumerate(f, 1):
-                    if regex.search(line):
-                        results.append((file_path, line_num, line.rstrip()))
-        except Exception:
-            continue
-
-    return results
+            os.chmod(path, mode)
+        except OSError:
+            pass
+    return ok
 
 
 def replace_in_files(
@@ -2513,9 +4359,16 @@ def replace_in_files(
     include: Optional[List[str]] = None,
     exclude: Optional[List[str]] = None,
     dry_run: bool = False,
+    literal: bool = False,
+    max_workers: Optional[int] = None,
 ) -> Dict[Path, int]:
     """Remplace un pattern dans les fichiers.
 
+    Les fichiers sont traités dans un pool de threads et réécrits de façon
+    atomique (fichier temporaire puis renommage). Un pattern sans
+    métacaractère (ou literal=True) utilise str.replace; les fichiers ne
+    contenant pas le littéral sont écartés sans être décodés.
+
     Args:
         root: Répertoire racine
         search_pattern: Pattern à rechercher
@@ -2523,6 +4376,8 @@ def replace_in_files(
         include: Patterns de fichiers à inclure
         exclude: Patterns de fichiers à exclure
         dry_run: Si True, ne modifie pas les fichiers
+        literal: Traiter search_pattern et replacement comme des chaînes littérales
+        max_workers: Taille du pool (None = automatique)
 
     Returns:
         Dictionnaire {fichier: nombre_de_remplacements}
@@ -2531,33 +4386,48 @@ def replace_in_files(
         >>> changes = replace_in_files(".", "TODO", "DONE", include=["**/*.py"], dry_run=True)
         >>> print(f"Fichiers affectés: {len(changes)}")
     """
-    changes = {}
     root_path = Path(root)
-
-    if isinstance(search_pattern, str):
-        regex = re.compile(search_pattern)
-    else:
-        regex = search_pattern
-
     if include is None:
         include = ["**/*"]
 
-    for file_path in find_files(root_path, include=include, exclude=exclude):
+    literal_text = search_pattern if isinstance(search_pattern, str) else ""
+    use_literal = bool(literal_text) and (
+        literal or (_is_literal(literal_text) and "\\" not in replacement)
+    )
+    regex: Optional[Pattern] = None
+    if not use_literal:
+        regex = (
+            re.compile(search_pattern)
+            if isinstance(search_pattern, str)
+            else search_pattern
+        )
+    needle = literal_text.encode("utf-8") if use_literal else b""
+
+    def _replace(file_path: Path) -> Tuple[Path, int]:
         try:
+            if use_literal:
+                with open(file_path, "rb") as f:
+                    if needle not in f.read():
+                        return file_path, 0
             with open(file_path, "r", encoding="utf-8") as f:
                 content = f.read()
-
-            new_content, count = regex.subn(replacement, content)
-
-            if count > 0:
-                changes[file_path] = count
-
-                if not dry_run:
-                    with open(file_path, "w", encoding="utf-8") as f:
-                        f.write(new_content)
+            if regex is None:
+                count = content.count(literal_text)
+                new_content = content.replace(literal_text, replacement)
+            else:
+                new_content, count = regex.subn(replacement, content)
+            if count > 0 and not dry_run:
+                if not _write_text_atomic(file_path, new_content):
+                    return file_path, 0
+            return file_path, count
         except Exception:
-            continue
+            return file_path, 0
 
+    files = list(find_files(root_path, include=include, exclude=exclude))
+    changes = {}
+    for file_path, count in _pool_map(_replace, files, max_workers):
+        if count > 0:
+            changes[file_path] = count
     return changes
 
 
@@ -2588,12 +4458,7 @@ def generate_requirements_from_imports(root: Pathish) -> List[str]:
         set(sys.stdlib_module_names) if hasattr(sys, "stdlib_module_names") else set()
     )
 
-    for py_file in find_files(root_path, include=["**/*.py"]):
-        try:
-            info = analyze_python_file(py_file)
-            all_imports.update(info.imports)
-        except Exception:
-            continue
+    all_imports.update(ProjectScan(root_path, include=["**/*.py"]).imports())
 
     # Filtrer les modules stdlib
     external_packages = [imp for imp in all_imports if imp not in stdlib_modules]
@@ -2990,6 +4855,9 @@ __all__ = [
     "get_project_dependencies",
     "extract_imports_from_code",
     "get_outdated_packages",
+    "PackageIndexClient",
+    "PyPIJSONClient",
+    "SimpleIndexClient",
     # Python file analysis
     "analyze_python_file",
     "validate_python_syntax",
@@ -2997,11 +4865,15 @@ __all__ = [
     # Virtual environment
     "detect_venv",
     "get_venv_info",
+    "venv_site_packages",
+    "read_installed_packages",
     # Git utilities
     "get_git_info",
     # Project structure
     "analyze_project_structure",
     # Code metrics
+    "ProjectScan",
+    "ScannedFile",
     "calculate_code_metrics",
     "calculate_project_metrics",
     # Security analysis
@@ -3012,6 +4884,7 @@ __all__ = [
     "bump_version",
     # Testing
     "run_tests",
+    "select_affected_tests",
     # Docker
     "analyze_docker_config",
     # CI/CD
@@ -3024,9 +4897,13 @@ __all__ = [
     "safe_backup_file",
     "safe_restore_file",
     "calculate_file_hash",
+    "hash_tree",
+    "TreeHash",
     "get_directory_size",
     "clean_pycache",
+    "find_pycache",
     # Search and replace
+    "iter_search_in_files",
     "search_in_files",
     "replace_in_files",
     # File pattern utilities
@@ -3043,9 +4920,15 @@ __all__ = [
     # Validation
     "validate_python_project",
     # Cache management
+    "PluginCache",
+    "configure_plugin_cache",
+    "plugin_cache_dir_for",
+    "set_plugin_cache_dir",
+    "reset_plugin_cache",
     "cache_set",
     "cache_get",
     "cache_clear",
+    "cache_stats",
     # Documentation generation
     "generate_requirements_from_imports",
     "generate_readme",
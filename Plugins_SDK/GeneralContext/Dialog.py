@@ -30,6 +30,23 @@ from Core.WidgetsCreator import (
     _invoke_in_main_thread,
 )
 
+from bcasl.events import emit_log, emit_phase, emit_progress
+
+
+class _EventProgressDialog(ProgressDialog):
+    """ProgressDialog that mirrors its updates on the BCASL event channel."""
+
+    _last_message = ""
+
+    def set_message(self, msg):
+        self._last_message = str(msg or "")
+        super().set_message(msg)
+        emit_phase(self._last_message)
+
+    def set_progress(self, value, maximum=None):
+        super().set_progress(value, maximum)
+        emit_progress(value, maximum, self._last_message)
+
 
 class Dialog:
     """Dialog class for plugins - uses Core.dialogs classes for all UI operations."""
@@ -78,14 +95,17 @@ class Dialog:
     def log_info(self, message: str) -> None:
         """Log an info message."""
         self.console.print(f"[bold green][INFO][/bold green] {message}")
+        emit_log(message, "info")
 
     def log_warn(self, message: str) -> None:
         """Log a warning message."""
         self.console.print(f"[bold yellow][WARN][/bold yellow] {message}")
+        emit_log(message, "warn")
 
     def log_error(self, message: str) -> None:
         """Log an error message."""
         self.console.print(f"[bold red][ERROR][/bold red] {message}")
+        emit_log(message, "error")
 
     def sys_msgbox_for_installing(
         self,
@@ -112,7 +132,10 @@ class Dialog:
             maximum: Maximum value (0 = indeterminate)
             cancelable: If True, show a Cancel button
 
+        Progress updates are also streamed as BCASL events so the host log shows
+        them even when the plugin runs in a sandbox process.
+
         Returns:
             ProgressDialog instance from Core.dialogs
         """
-        return ProgressDialog(title=title, cancelable=cancelable)
+        return _EventProgressDialog(title=title, cancelable=cancelable)
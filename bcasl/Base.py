@@ -15,13 +15,13 @@
 
 from __future__ import annotations
 
-import fnmatch
 import logging
 from collections.abc import Iterable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional
 
+from utils.pathmatch import compile_matcher, walk_files
 
 __all__ = [
     "BcPluginBase",
@@ -460,7 +460,10 @@ class PreCompileContext:
 
         - include: motifs type glob (ex: "**/*.py", "src/**/*.c")
         - exclude: motifs à exclure (ex: "venv/**", "**/__pycache__/**")
-        Optimisé: évite la création de grosses listes; yield au fil de l'eau.
+        Optimisé: une seule marche os.scandir, motifs compilés en une regex,
+        dossiers exclus ('dir/**') élagués sans y descendre; yield au fil de l'eau.
+        Les motifs d'exclusion sont relatifs à project_root; un motif sans '/'
+        (ex: "*.pyc") s'applique aussi au nom de base.
         """
         root = self.project_root
         inc = tuple(include) if include else ("**/*",)
@@ -490,31 +493,35 @@ class PreCompileContext:
             except Exception:
                 enable_cache = False
 
-        # Fonction pour vérifier si un chemin doit être exclu
-        def is_excluded(p: Path) -> bool:
-            s = p.as_posix()
-            for pat in exc:
-                if fnmatch.fnmatch(s, pat):
-                    return True
-            return False
-
-        # Collecter les fichiers avec déduplication (utiliser un set pour éviter les doublons)
-        seen: set[Path] = set()
+        # Motifs compilés une fois (une regex include, une regex exclude);
+        # exclusions relatives à project_root, un motif sans '/' vise le nom de base
+        root_posix = root.as_posix().rstrip("/") + "/"
+        exc_rel = tuple(
+            str(p)[len(root_posix) :] if str(p).startswith(root_posix) else str(p)
+            for p in exc
+        )
+        inc_m = compile_matcher(tuple(str(p) for p in inc), anchored=True)
+        exc_m = compile_matcher(
+            tuple("/" + p.lstrip("/") if "/" in p.rstrip("/") else p for p in exc_rel),
+            anchored=False,
+        )
+
+        # Marche unique os.scandir avec élagage des dossiers exclus;
+        # déduplication sur (st_dev, st_ino) plutôt que resolve()
+        seen: set[Any] = set()
         collected: list[Path] = []
-
-        for pat in inc:
+        for path_str, rel, entry in walk_files(str(root), inc_m, exc_m):
             try:
-                for path in root.glob(pat):
-                    if path.is_file() and not is_excluded(path):
-                        # Utiliser le chemin résolu pour la déduplication
-                        resolved = path.resolve()
-                        if resolved not in seen:
-                            seen.add(resolved)
-                            collected.append(path)
-                            yield path
-            except (OSError, ValueError):
-                # Ignorer les patterns invalides ou les erreurs d'accès
+                st = entry.stat()
+                key: Any = (st.st_dev, st.st_ino) if st.st_ino else path_str
+            except OSError:
+                continue
+            if key in seen:
                 continue
+            seen.add(key)
+            path = root / rel
+            collected.append(path)
+            yield path
 
         # Mettre en cache le résultat si activé
         if enable_cache and cache_key is not None:
@@ -524,6 +531,16 @@ class PreCompileContext:
                 pass
 
 
+def _fmt_bytes(n: float) -> str:
+    if n < 1024:
+        return f"{n:.0f} B"
+    for unit in ("KiB", "MiB", "GiB"):
+        n /= 1024.0
+        if n < 1024 or unit == "GiB":
+            break
+    return f"{n:.1f} {unit}"
+
+
 @dataclass
 class ExecutionItem:
     plugin_id: str
@@ -531,6 +548,41 @@ class ExecutionItem:
     success: bool
     duration_ms: float
     error: str = ""
+    # Consommation mesurée pendant on_pre_compile (0 si indisponible)
+    cpu_user_s: float = 0.0
+    cpu_sys_s: float = 0.0
+    max_rss_kb: int = 0
+    read_bytes: int = 0
+    write_bytes: int = 0
+
+    @property
+    def cpu_s(self) -> float:
+        return self.cpu_user_s + self.cpu_sys_s
+
+    def resources_label(self) -> str:
+        """Résumé court des ressources (vide si rien n'a été mesuré)."""
+        parts: list[str] = []
+        if self.cpu_s > 0:
+            parts.append(f"cpu {self.cpu_user_s:.2f}s+{self.cpu_sys_s:.2f}s")
+        if self.max_rss_kb > 0:
+            parts.append(f"rss {_fmt_bytes(self.max_rss_kb * 1024)}")
+        if self.read_bytes or self.write_bytes:
+            parts.append(
+                f"io r {_fmt_bytes(self.read_bytes)} / w {_fmt_bytes(self.write_bytes)}"
+            )
+        return ", ".join(parts)
+
+    def report_line(
+        self, label: Optional[str] = None, ok: str = "OK", fail: str = "FAIL"
+    ) -> str:
+        """Ligne de rapport "<label>: <état> (<durée> ms[, ressources])".
+
+        Partagée par le Loader et les OnlyMod; label vaut plugin_id par défaut.
+        """
+        state = ok if self.success else f"{fail}: {self.error}"
+        res = self.resources_label()
+        extra = f", {res}" if res else ""
+        return f"{label or self.plugin_id}: {state} ({self.duration_ms:.1f} ms{extra})"
 
 
 @dataclass
@@ -546,12 +598,32 @@ class ExecutionReport:
     def ok(self) -> bool:
         return all(i.success for i in self.items)
 
+    def top_consumers(self, n: int = 3, key: str = "cpu_s") -> list[ExecutionItem]:
+        """Plugins les plus coûteux selon key (cpu_s, max_rss_kb, read_bytes, write_bytes, duration_ms)."""
+        measured = [i for i in self.items if float(getattr(i, key, 0) or 0) > 0]
+        measured.sort(key=lambda i: float(getattr(i, key, 0) or 0), reverse=True)
+        return measured[: max(0, int(n))]
+
     def summary(self) -> str:
         total = len(self.items)
         ok = sum(1 for i in self.items if i.success)
         ko = total - ok
         dur = sum(i.duration_ms for i in self.items)
-        return f"Plugins: {ok}/{total} ok, {ko} échec(s), temps total {dur:.1f} ms"
+        text = f"Plugins: {ok}/{total} ok, {ko} échec(s), temps total {dur:.1f} ms"
+        cpu = sum(i.cpu_s for i in self.items)
+        if cpu > 0:
+            text += f", CPU total {cpu:.2f}s"
+            top = self.top_consumers(1)
+            if top:
+                text += f" (max: {top[0].plugin_id} {top[0].cpu_s:.2f}s)"
+        rss = max((i.max_rss_kb for i in self.items), default=0)
+        if rss > 0:
+            text += f", RSS max {_fmt_bytes(rss * 1024)}"
+        rd = sum(i.read_bytes for i in self.items)
+        wr = sum(i.write_bytes for i in self.items)
+        if rd or wr:
+            text += f", E/S {_fmt_bytes(rd)} lus / {_fmt_bytes(wr)} écrits"
+        return text
 
     def __iter__(self):
         return iter(self.items)
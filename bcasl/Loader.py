@@ -35,6 +35,8 @@ import yaml
 from .executor import BCASL
 
 from .Base import PreCompileContext
+from .events import make_log_relay
+from .manifest import plugin_to_entry
 from .tagging import compute_tag_order
 
 # Qt (facultatif). Ne pas importer QtWidgets au niveau module pour compatibilité headless.
@@ -58,117 +60,29 @@ def _has_bcasl_marker(pkg_dir: Path) -> bool:
 
 
 def _discover_bcasl_meta(Plugins_dir: Path) -> dict[str, dict[str, Any]]:
-    """Découvre les plugins en important chaque package et en appelant bcasl_register(manager).
-    Supporte également les plugins enregistrés avec le décorateur @bc_register.
-    Retourne un mapping plugin_id -> meta dict {id, name, version, description, author, requirements}
+    """Découvre les plugins et leurs métadonnées via le manifeste en cache.
+
+    Les packages inchangés (empreinte stat identique) sont lus depuis
+    <Plugins>/.bcasl_manifest.json sans import; les autres sont importés une fois
+    (bcasl_register(manager) ou décorateur @bc_register) puis mis en cache.
+    Retourne un mapping plugin_id -> meta dict {id, name, version, description, author, tags, requirements}
     """
     meta: dict[str, dict[str, Any]] = {}
     try:
-        import importlib.util as _ilu
-        import sys as _sys
-
-        for pkg_dir in sorted(Plugins_dir.iterdir(), key=lambda p: p.name):
+        mgr = BCASL(Plugins_dir, config={}, sandbox=False, plugin_timeout_s=0.0)  # type: ignore[call-arg]
+        mgr.load_plugins_from_directory(Plugins_dir)
+        for pid, rec in getattr(mgr, "_registry", {}).items():
             try:
-                if not pkg_dir.is_dir():
-                    continue
-                init_py = pkg_dir / "__init__.py"
-                if not init_py.exists():
-                    continue
-                mod_name = f"bcasl_meta_{pkg_dir.name}"
-                spec = _ilu.spec_from_file_location(
-                    mod_name, str(init_py), submodule_search_locations=[str(pkg_dir)]
-                )
-                if spec is None or spec.loader is None:
-                    continue
-                module = _ilu.module_from_spec(spec)
-                _sys.modules[mod_name] = module
-                spec.loader.exec_module(module)  # type: ignore[attr-defined]
-
-                # Utilise un gestionnaire temporaire pour enregistrer et lire les métadonnées
-                mgr = BCASL(Plugins_dir, config={}, sandbox=False, plugin_timeout_s=0.0)  # type: ignore[call-arg]
-
-                # Méthode 1: chercher fonction bcasl_register
-                reg = getattr(module, "bcasl_register", None)
-                if callable(reg):
-                    reg(mgr)
-                else:
-                    # Méthode 2: chercher classes marquées avec @bc_register
-                    for attr_name in dir(module):
-                        try:
-                            attr = getattr(module, attr_name, None)
-                            if attr is None:
-                                continue
-                            if not getattr(attr, "__bcasl_plugin__", False):
-                                continue
-                            if not isinstance(attr, type):
-                                continue
-                            # C'est une classe de plugin décorée avec @bc_register
-                            plugin_instance = getattr(attr, "_bcasl_instance_", None)
-                            if plugin_instance is None:
-                                try:
-                                    plugin_instance = attr()
-                                except Exception:
-                                    continue
-                            # Enregistrer temporairement pour récupérer les métadonnées
-                            pid = plugin_instance.meta.id
-                            if pid not in mgr._registry:
-                                mgr.add_plugin(plugin_instance)
-                        except Exception:
-                            continue
-
-                # Récupère les plugins enregistrés
-                for pid, rec in getattr(mgr, "_registry", {}).items():
-                    try:
-                        plg = rec.plugin
-                        # Récupérer les tags depuis PluginMeta (normalisés)
-                        tags: list[str] = []
-                        try:
-                            meta_tags = getattr(plg.meta, "tags", ())
-                            if isinstance(meta_tags, (list, tuple)):
-                                tags = [
-                                    str(x).strip().lower()
-                                    for x in meta_tags
-                                    if str(x).strip()
-                                ]
-                        except Exception:
-                            tags = []
-
-                        # Récupérer les requirements
-                        reqs: list[str] = []
-                        try:
-                            if plg.meta.required_bcasl_version != "1.0.0":
-                                reqs.append(
-                                    f"BCASL >= {plg.meta.required_bcasl_version}"
-                                )
-                            if plg.meta.required_core_version != "1.0.0":
-                                reqs.append(f"Core >= {plg.meta.required_core_version}")
-                            if plg.meta.required_plugins_sdk_version != "1.0.0":
-                                reqs.append(
-                                    f"Plugins SDK >= {plg.meta.required_plugins_sdk_version}"
-                                )
-                            if plg.meta.required_bc_plugin_context_version != "1.0.0":
-                                reqs.append(
-                                    f"BcPluginContext >= {plg.meta.required_bc_plugin_context_version}"
-                                )
-                            if plg.meta.required_general_context_version != "1.0.0":
-                                reqs.append(
-                                    f"GeneralContext >= {plg.meta.required_general_context_version}"
-                                )
-                        except Exception:
-                            pass
-
-                        m = {
-                            "id": plg.meta.id,
-                            "name": plg.meta.name,
-                            "version": plg.meta.version,
-                            "description": plg.meta.description,
-                            "author": plg.meta.author,
-                            "tags": tags,
-                            "requirements": reqs,
-                        }
-                        meta[plg.meta.id] = m
-                    except Exception:
-                        continue
+                entry = plugin_to_entry(rec.plugin)
+                meta[pid] = {
+                    "id": entry["id"],
+                    "name": entry["name"],
+                    "version": entry["version"],
+                    "description": entry["description"],
+                    "author": entry["author"],
+                    "tags": [str(t).strip().lower() for t in entry["tags"]],
+                    "requirements": entry["requirements"],
+                }
             except Exception:
                 continue
     except Exception:
@@ -286,7 +200,12 @@ def _run_bcasl_sync(
     log_cb: Optional[callable] = None,
 ):
     """Exécute BCASL en mode synchrone et retourne le rapport."""
-    manager = BCASL(workspace_root, config=cfg, plugin_timeout_s=plugin_timeout)
+    manager = BCASL(
+        workspace_root,
+        config=cfg,
+        plugin_timeout_s=plugin_timeout,
+        event_cb=make_log_relay(log_cb, suffix="\n"),
+    )
     loaded, errors = manager.load_plugins_from_directory(plugins_dir)
     _emit_log(log_cb, f"🧩 BCASL: {loaded} package(s) chargé(s) depuis Plugins/\n")
     for mod, msg in errors or []:
@@ -460,15 +379,15 @@ def _load_workspace_config(workspace_root: Path) -> dict[str, Any]:
         plugin_timeout = 0.0
 
         try:
-            from Core.ArkConfigManager import load_ark_config
+            from Core.ArkConfigManager import get_ark_config
 
-            ark_config = load_ark_config(str(workspace_root))
+            ark_config = get_ark_config(str(workspace_root))
 
             if "inclusion_patterns" in ark_config:
-                file_patterns = ark_config["inclusion_patterns"]
+                file_patterns = list(ark_config["inclusion_patterns"])
 
             if "exclusion_patterns" in ark_config:
-                exclude_patterns = ark_config["exclusion_patterns"]
+                exclude_patterns = list(ark_config["exclusion_patterns"])
 
             plugin_opts = ark_config.get("plugins", {})
             if "bcasl_enabled" in plugin_opts:
@@ -487,6 +406,7 @@ def _load_workspace_config(workspace_root: Path) -> dict[str, Any]:
                 "plugin_timeout_s": plugin_timeout,
                 "sandbox": True,
                 "plugin_parallelism": 0,
+                "thread_pool": False,
                 "iter_files_cache": True,
             },
             "plugins": detected_plugins,
@@ -569,14 +489,7 @@ if QObject is not None and Signal is not None:  # pragma: no cover
                     self._gui.log.append("BCASL - Rapport:\n")
                     for item in rep:
                         try:
-                            state = (
-                                "OK"
-                                if getattr(item, "success", False)
-                                else f"FAIL: {getattr(item, 'error', '')}"
-                            )
-                            dur = getattr(item, "duration_ms", 0.0)
-                            pid = getattr(item, "plugin_id", "?")
-                            self._gui.log.append(f" - {pid}: {state} ({dur:.1f} ms)\n")
+                            self._gui.log.append(f" - {item.report_line()}\n")
                         except Exception:
                             pass
                     try:
@@ -999,10 +912,7 @@ def run_pre_compile(self) -> Optional[object]:
         if hasattr(self, "log") and self.log is not None:
             self.log.append("BCASL - Rapport:\n")
             for item in report:
-                state = "OK" if item.success else f"FAIL: {item.error}"
-                self.log.append(
-                    f" - {item.plugin_id}: {state} ({item.duration_ms:.1f} ms)\n"
-                )
+                self.log.append(f" - {item.report_line()}\n")
             self.log.append(report.summary() + "\n")
         return report
     except Exception as e:
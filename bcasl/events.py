@@ -0,0 +1,217 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Ague Samuel Amen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Canal d'événements structurés des plugins BCASL.
+
+Un plugin (ou le SDK) émet des événements pendant on_pre_compile:
+
+    from bcasl.events import emit_progress, emit_log, emit_phase
+    emit_phase("scan")
+    emit_progress(3, 10, "fichiers analysés")
+    emit_log("3 fichiers nettoyés", level="info")
+
+Types d'événements (dicts picklables, clé "kind"):
+- progress: value, maximum, message
+- log: message, level
+- phase: name
+- resource: cpu_user_s, cpu_sys_s, max_rss_kb
+
+En sandbox, les événements sont groupés (EventBatcher) avant d'être envoyés
+sur la queue du worker; en processus, ils sont remis directement au callback
+du gestionnaire BCASL.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Optional
+
+__all__ = [
+    "EventBatcher",
+    "emit",
+    "emit_log",
+    "emit_phase",
+    "emit_progress",
+    "format_event",
+    "make_log_relay",
+    "set_event_sink",
+]
+
+EventSink = Callable[[dict[str, Any]], None]
+
+# Le sink est propre au thread: en mode thread-pool, chaque plugin a le sien
+_local = threading.local()
+_global_sink: Optional[tuple[EventSink, str]] = None
+
+
+def set_event_sink(
+    sink: Optional[EventSink], plugin_id: str = "", *, thread_local: bool = False
+) -> None:
+    """Installe (ou retire si None) la destination des événements émis."""
+    global _global_sink
+    value = (sink, plugin_id) if sink is not None else None
+    if thread_local:
+        _local.sink = value
+    else:
+        _global_sink = value
+
+
+def _current_sink() -> Optional[tuple[EventSink, str]]:
+    return getattr(_local, "sink", None) or _global_sink
+
+
+def emit(kind: str, **data: Any) -> None:
+    """Émet un événement vers le sink courant (sans effet si aucun sink)."""
+    cur = _current_sink()
+    if cur is None:
+        return
+    sink, plugin_id = cur
+    ev: dict[str, Any] = {"kind": kind, "plugin_id": plugin_id, "ts": time.time()}
+    ev.update(data)
+    try:
+        sink(ev)
+    except Exception:
+        pass
+
+
+def emit_progress(
+    value: float, maximum: Optional[float] = None, message: str = ""
+) -> None:
+    emit("progress", value=value, maximum=maximum, message=str(message or ""))
+
+
+def emit_log(message: str, level: str = "info") -> None:
+    emit("log", message=str(message), level=str(level or "info").lower())
+
+
+def emit_phase(name: str) -> None:
+    emit("phase", name=str(name))
+
+
+def format_event(ev: dict[str, Any]) -> str:
+    """Représentation courte d'un événement pour les logs UI/CLI."""
+    pid = ev.get("plugin_id") or "?"
+    kind = ev.get("kind")
+    if kind == "progress":
+        val = ev.get("value") or 0
+        mx = ev.get("maximum")
+        msg = ev.get("message") or ""
+        if mx:
+            pct = 100.0 * float(val) / float(mx)
+            txt = f"{pct:.0f}% ({val}/{mx})"
+        else:
+            txt = f"{val}"
+        return f"[{pid}] ⏳ {txt}" + (f" {msg}" if msg else "")
+    if kind == "log":
+        level = str(ev.get("level") or "info").upper()
+        return f"[{pid}] [{level}] {ev.get('message', '')}"
+    if kind == "phase":
+        return f"[{pid}] ▶ {ev.get('name', '')}"
+    if kind == "resource":
+        return (
+            f"[{pid}] cpu {float(ev.get('cpu_user_s') or 0):.2f}s user / "
+            f"{float(ev.get('cpu_sys_s') or 0):.2f}s sys, "
+            f"rss max {int(ev.get('max_rss_kb') or 0) // 1024} MiB"
+        )
+    return f"[{pid}] {kind}: {ev}"
+
+
+def make_log_relay(
+    log_cb: Optional[Callable[[str], Any]], *, suffix: str = ""
+) -> Optional[EventSink]:
+    """Adapte un callback de log texte (GUI/CLI) en callback d'événements.
+
+    La progression est limitée à un message par tranche de 10% (ou par seconde
+    si le maximum est inconnu); seules les mesures de ressources finales sont loguées.
+    """
+    if not callable(log_cb):
+        return None
+    last_bucket: dict[str, int] = {}
+    last_ts: dict[str, float] = {}
+
+    def _relay(ev: dict[str, Any]) -> None:
+        kind = ev.get("kind")
+        pid = str(ev.get("plugin_id") or "")
+        if kind == "resource" and not ev.get("final"):
+            return
+        if kind == "progress":
+            mx = ev.get("maximum")
+            try:
+                if mx:
+                    bucket = int(10.0 * float(ev.get("value") or 0) / float(mx))
+                    if last_bucket.get(pid) == bucket:
+                        return
+                    last_bucket[pid] = bucket
+                else:
+                    now = time.monotonic()
+                    if now - last_ts.get(pid, 0.0) < 1.0:
+                        return
+                    last_ts[pid] = now
+            except Exception:
+                return
+        log_cb(format_event(ev) + suffix)
+
+    return _relay
+
+
+class EventBatcher:
+    """Regroupe les événements et les transmet par lots.
+
+    Un lot part dès max_batch événements, ou au plus tard après interval_s
+    (vérifié à chaque ajout et par tick() appelé périodiquement).
+    """
+
+    def __init__(
+        self,
+        send: Callable[[list[dict[str, Any]]], None],
+        *,
+        max_batch: int = 64,
+        interval_s: float = 0.1,
+    ) -> None:
+        self._send = send
+        self._max_batch = max(1, int(max_batch))
+        self._interval_s = max(0.0, float(interval_s))
+        self._buf: list[dict[str, Any]] = []
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+    def add(self, ev: dict[str, Any]) -> None:
+        with self._lock:
+            self._buf.append(ev)
+            due = len(self._buf) >= self._max_batch or (
+                time.monotonic() - self._last_flush >= self._interval_s
+            )
+        if due:
+            self.flush()
+
+    def tick(self) -> None:
+        with self._lock:
+            due = bool(self._buf) and (
+                time.monotonic() - self._last_flush >= self._interval_s
+            )
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            batch, self._buf = self._buf, []
+            self._last_flush = time.monotonic()
+        if batch:
+            try:
+                self._send(batch)
+            except Exception:
+                pass
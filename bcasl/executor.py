@@ -23,15 +23,25 @@ from .Base import (
     PreCompileContext,
     _logger,
 )
+from .events import set_event_sink
+from .manifest import PluginManifestCache, entry_to_meta, plugin_to_entry
 
 import heapq
 import importlib.util
 import multiprocessing as mp
 import os
+import queue
 import sys
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
+
+EventCallback = Callable[[dict[str, Any]], None]
+
+# Intervalle de scrutation des workers sandbox (vidage de la queue d'événements)
+_WORKER_POLL_S = 0.05
 
 
 def _normalize_tags(tags: Any) -> list[str]:
@@ -77,7 +87,9 @@ def _add_report_item(
     success: bool,
     duration_ms: float,
     error: str = "",
+    usage: Optional[dict[str, Any]] = None,
 ) -> None:
+    usage = usage or {}
     report.add(
         ExecutionItem(
             plugin_id=plugin_id,
@@ -85,21 +97,52 @@ def _add_report_item(
             success=success,
             duration_ms=duration_ms,
             error=error if not success else "",
+            cpu_user_s=float(usage.get("cpu_user_s", 0.0) or 0.0),
+            cpu_sys_s=float(usage.get("cpu_sys_s", 0.0) or 0.0),
+            max_rss_kb=int(usage.get("max_rss_kb", 0) or 0),
+            read_bytes=int(usage.get("read_bytes", 0) or 0),
+            write_bytes=int(usage.get("write_bytes", 0) or 0),
         )
     )
 
 
+def _dispatch_event(event_cb: Optional[EventCallback], ev: dict[str, Any]) -> None:
+    if event_cb is None:
+        return
+    try:
+        event_cb(ev)
+    except Exception:
+        pass
+
+
+def _drain_worker_queue(q, event_cb: Optional[EventCallback]) -> Optional[dict]:
+    """Vide la queue d'un worker: relaie les lots d'événements, retourne le résultat final éventuel."""
+    result: Optional[dict] = None
+    while True:
+        try:
+            msg = q.get_nowait()
+        except Exception:
+            break
+        if not isinstance(msg, dict):
+            continue
+        if msg.get("type") == "events":
+            for ev in msg.get("events") or ():
+                if isinstance(ev, dict):
+                    _dispatch_event(event_cb, ev)
+        else:
+            result = msg
+    return result
+
+
 def _record_worker_result(
     report: ExecutionReport,
     *,
     plugin_id: str,
     name: str,
     start_t: float,
-    q,
+    res: Optional[dict],
 ) -> None:
-    try:
-        res = q.get_nowait()
-    except Exception:
+    if res is None:
         res = {
             "ok": False,
             "error": "aucun résultat renvoyé (crash du processus enfant ?)",
@@ -108,6 +151,7 @@ def _record_worker_result(
     duration_ms = float(
         res.get("duration_ms", (time.perf_counter() - start_t) * 1000.0)
     )
+    usage = res.get("usage") if isinstance(res.get("usage"), dict) else None
     if res.get("ok"):
         _add_report_item(
             report,
@@ -115,6 +159,7 @@ def _record_worker_result(
             name=name,
             success=True,
             duration_ms=duration_ms,
+            usage=usage,
         )
     else:
         _add_report_item(
@@ -124,6 +169,7 @@ def _record_worker_result(
             success=False,
             duration_ms=duration_ms,
             error=str(res.get("error", "")),
+            usage=usage,
         )
 
 
@@ -173,6 +219,50 @@ def _resolve_exec_options(
     return eff_sandbox, parallelism
 
 
+def _resolve_thread_pool(config: dict[str, Any]) -> bool:
+    """Mode thread-pool (hors sandbox) via options.thread_pool ou env PYCOMPILER_BCASL_THREADS."""
+    env = os.environ.get("PYCOMPILER_BCASL_THREADS", "").strip().lower()
+    if env:
+        return env in ("1", "true", "yes", "on")
+    try:
+        opts = dict(config or {}).get("options", {}) if isinstance(config, dict) else {}
+        return bool(opts.get("thread_pool", False))
+    except Exception:
+        return False
+
+
+def _resolve_plugin_cache_dir(
+    config: dict[str, Any], project_root: Path
+) -> Optional[str]:
+    """Dossier disque du cache plugins pour ce workspace, ou None (options.plugin_cache=false).
+
+    Le dossier est pris dans le cache utilisateur (jamais dans l'arborescence du projet).
+    """
+    try:
+        opts = dict(config or {}).get("options", {}) if isinstance(config, dict) else {}
+        enabled = bool(opts.get("plugin_cache", True))
+    except Exception:
+        enabled = True
+    if not enabled:
+        return None
+    try:
+        from Plugins_SDK.BcPluginContext.Context import plugin_cache_dir_for
+
+        return str(plugin_cache_dir_for(project_root))
+    except Exception:
+        return None
+
+
+def _apply_plugin_cache_dir(cache_dir: Optional[str]) -> None:
+    """Oriente le cache plugins du processus courant (None = mémoire seule)."""
+    try:
+        from Plugins_SDK.BcPluginContext.Context import set_plugin_cache_dir
+
+        set_plugin_cache_dir(cache_dir)
+    except Exception:
+        pass
+
+
 def _build_dependency_graph(
     active_items: dict[str, _PluginRecord],
 ) -> tuple[dict[str, int], dict[str, list[str]]]:
@@ -227,6 +317,8 @@ def _run_plugin_sequential(
     project_root: Path,
     timeout_s: float,
     eff_sandbox: bool,
+    event_cb: Optional[EventCallback] = None,
+    cache_dir: Optional[str] = None,
 ) -> None:
     plg = rec.plugin
     start = time.perf_counter()
@@ -241,14 +333,26 @@ def _run_plugin_sequential(
                 str(project_root),
                 ctx.config,
                 q,
+                cache_dir,
             ),
         )
         p.start()
-        if timeout_s and timeout_s > 0:
-            p.join(timeout_s)
-        else:
-            p.join()
-        if p.is_alive():
+        # Attente active: la queue est vidée au fil de l'eau (événements en flux)
+        res: Optional[dict] = None
+        timed_out = False
+        while True:
+            res = _drain_worker_queue(q, event_cb) or res
+            if not p.is_alive():
+                break
+            if (
+                timeout_s
+                and timeout_s > 0
+                and (time.perf_counter() - start) >= timeout_s
+            ):
+                timed_out = True
+                break
+            p.join(_WORKER_POLL_S)
+        if timed_out:
             try:
                 p.terminate()
             except Exception:
@@ -257,6 +361,7 @@ def _run_plugin_sequential(
                 p.join(1.0)
             except Exception:
                 pass
+            _drain_worker_queue(q, event_cb)
             _record_timeout(
                 report,
                 plugin_id=plg.meta.id,
@@ -265,14 +370,18 @@ def _run_plugin_sequential(
                 timeout_s=timeout_s,
             )
         else:
+            res = _drain_worker_queue(q, event_cb) or res
             _record_worker_result(
                 report,
                 plugin_id=plg.meta.id,
                 name=plg.meta.name,
                 start_t=start,
-                q=q,
+                res=res,
             )
     else:
+        if event_cb is not None:
+            set_event_sink(event_cb, plg.meta.id)
+        before = _resource_snapshot(per_thread=True)
         try:
             plg.on_pre_compile(ctx)
             duration_ms = (time.perf_counter() - start) * 1000.0
@@ -282,6 +391,7 @@ def _run_plugin_sequential(
                 name=plg.meta.name,
                 success=True,
                 duration_ms=duration_ms,
+                usage=_usage_delta(before, _resource_snapshot(per_thread=True)),
             )
         except Exception as exc:
             duration_ms = (time.perf_counter() - start) * 1000.0
@@ -292,7 +402,11 @@ def _run_plugin_sequential(
                 success=False,
                 duration_ms=duration_ms,
                 error=str(exc),
+                usage=_usage_delta(before, _resource_snapshot(per_thread=True)),
             )
+        finally:
+            if event_cb is not None:
+                set_event_sink(None)
 
 
 def _run_parallel_sandbox(
@@ -305,9 +419,12 @@ def _run_parallel_sandbox(
     project_root: Path,
     timeout_s: float,
     parallelism: int,
+    event_cb: Optional[EventCallback] = None,
+    cache_dir: Optional[str] = None,
 ) -> None:
     _ctx = mp.get_context("spawn")
     running: dict[str, tuple[mp.Process, mp.Queue, float]] = {}
+    results: dict[str, dict] = {}
     while ready or running:
         while ready and len(running) < parallelism:
             _, _, pid = heapq.heappop(ready)
@@ -321,6 +438,7 @@ def _run_parallel_sandbox(
                     str(project_root),
                     ctx.config,
                     q,
+                    cache_dir,
                 ),
             )
             p.start()
@@ -328,6 +446,10 @@ def _run_parallel_sandbox(
 
         to_remove: list[str] = []
         for pid, (proc, q, start_t) in list(running.items()):
+            # Relayer les événements en flux et mémoriser le résultat final
+            res = _drain_worker_queue(q, event_cb)
+            if res is not None:
+                results[pid] = res
             alive = proc.is_alive()
             timed_out = False
             if timeout_s and timeout_s > 0 and alive:
@@ -344,15 +466,19 @@ def _run_parallel_sandbox(
             if not alive or timed_out:
                 rec = active_items[pid]
                 plg = rec.plugin
+                res = _drain_worker_queue(q, event_cb)
+                if res is not None:
+                    results[pid] = res
                 if not timed_out:
                     _record_worker_result(
                         report,
                         plugin_id=pid,
                         name=plg.meta.name,
                         start_t=start_t,
-                        q=q,
+                        res=results.pop(pid, None),
                     )
                 else:
+                    results.pop(pid, None)
                     _record_timeout(
                         report,
                         plugin_id=pid,
@@ -382,6 +508,148 @@ def _run_parallel_sandbox(
             time.sleep(0.01)
 
 
+def _drain_event_queue(
+    q: "queue.SimpleQueue", event_cb: Optional[EventCallback]
+) -> None:
+    """Relaie, dans le thread appelant, les événements émis par les threads du pool."""
+    while True:
+        try:
+            ev = q.get_nowait()
+        except queue.Empty:
+            break
+        _dispatch_event(event_cb, ev)
+
+
+def _thread_plugin_task(
+    plg: BcPluginBase,
+    ctx: PreCompileContext,
+    event_cb: Optional[EventCallback],
+    started: dict[str, float],
+) -> dict[str, Any]:
+    """Exécute on_pre_compile dans un thread du pool; retourne un résultat au format worker."""
+    pid = plg.meta.id
+    start = time.perf_counter()
+    started[pid] = start
+    if event_cb is not None:
+        set_event_sink(event_cb, pid, thread_local=True)
+    before = _resource_snapshot(per_thread=True)
+    try:
+        plg.on_pre_compile(ctx)
+        res: dict[str, Any] = {"ok": True}
+    except Exception as exc:
+        res = {"ok": False, "error": str(exc)}
+    finally:
+        if event_cb is not None:
+            set_event_sink(None, thread_local=True)
+    res["duration_ms"] = (time.perf_counter() - start) * 1000.0
+    res["usage"] = _usage_delta(before, _resource_snapshot(per_thread=True))
+    return res
+
+
+def _run_parallel_threads(
+    report: ExecutionReport,
+    active_items: dict[str, _PluginRecord],
+    children: dict[str, list[str]],
+    indeg: dict[str, int],
+    ready: list[tuple[int, int, str]],
+    ctx: PreCompileContext,
+    timeout_s: float,
+    parallelism: int,
+    event_cb: Optional[EventCallback] = None,
+) -> None:
+    """Exécution en processus sur un ThreadPoolExecutor, en respectant le DAG.
+
+    Le timeout est compté à partir du démarrage effectif du plugin. Un thread
+    ne pouvant pas être interrompu, un plugin en timeout est abandonné
+    (consigné en échec, dépendants libérés) et son thread occupe le pool
+    jusqu'à sa fin. Les événements des plugins sont mis en file par les
+    threads du pool et relayés à event_cb depuis le thread appelant (boucle
+    d'attente), comme pour la queue des workers sandbox: event_cb peut donc
+    toucher des widgets Qt.
+    """
+    events: "queue.SimpleQueue[dict[str, Any]]" = queue.SimpleQueue()
+    cb: Optional[EventCallback] = events.put if event_cb is not None else None
+    started: dict[str, float] = {}
+    running: dict[Future, str] = {}
+    abandoned: list[str] = []
+
+    def _release(pid: str) -> None:
+        for ch in children[pid]:
+            indeg[ch] -= 1
+            if indeg[ch] == 0:
+                rch = active_items[ch]
+                heapq.heappush(ready, (rch.priority, rch.insert_idx, ch))
+
+    pool = ThreadPoolExecutor(max_workers=parallelism, thread_name_prefix="bcasl")
+    try:
+        while ready or running:
+            while ready and len(running) < parallelism:
+                _, _, pid = heapq.heappop(ready)
+                fut = pool.submit(
+                    _thread_plugin_task, active_items[pid].plugin, ctx, cb, started
+                )
+                running[fut] = pid
+
+            wait_s: Optional[float] = None
+            if timeout_s and timeout_s > 0:
+                now = time.perf_counter()
+                deadlines = [
+                    started[pid] + timeout_s - now
+                    for pid in running.values()
+                    if pid in started
+                ]
+                # Plugins en file d'attente: re-vérifier périodiquement leur démarrage
+                wait_s = max(0.0, min(deadlines)) if deadlines else _WORKER_POLL_S
+                if len(deadlines) < len(running):
+                    wait_s = min(wait_s, _WORKER_POLL_S)
+            if cb is not None:
+                wait_s = (
+                    _WORKER_POLL_S if wait_s is None else min(wait_s, _WORKER_POLL_S)
+                )
+            done, _ = wait(list(running), timeout=wait_s, return_when=FIRST_COMPLETED)
+            _drain_event_queue(events, event_cb)
+
+            for fut in done:
+                pid = running.pop(fut)
+                try:
+                    res = fut.result()
+                except Exception as exc:
+                    res = {"ok": False, "error": str(exc)}
+                _record_worker_result(
+                    report,
+                    plugin_id=pid,
+                    name=active_items[pid].plugin.meta.name,
+                    start_t=started.get(pid, time.perf_counter()),
+                    res=res,
+                )
+                _release(pid)
+
+            if timeout_s and timeout_s > 0:
+                now = time.perf_counter()
+                for fut, pid in list(running.items()):
+                    st = started.get(pid)
+                    if st is None or fut.done() or now - st < timeout_s:
+                        continue
+                    running.pop(fut)
+                    abandoned.append(pid)
+                    _record_timeout(
+                        report,
+                        plugin_id=pid,
+                        name=active_items[pid].plugin.meta.name,
+                        start_t=st,
+                        timeout_s=timeout_s,
+                    )
+                    _release(pid)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+        _drain_event_queue(events, event_cb)
+    if abandoned:
+        _logger.warning(
+            "Plugins abandonnés après timeout (threads encore actifs): %s",
+            ", ".join(abandoned),
+        )
+
+
 def _configure_worker_env(config: dict[str, Any]) -> None:
     try:
         _opts = (
@@ -523,15 +791,14 @@ def _apply_resource_limits(config: dict[str, Any]) -> None:
         pass
 
 
-def _load_plugin_instance(
-    module_path: str, plugin_id: str, project_root: str, config: dict[str, Any]
-):
+def _exec_plugin_module(module_path: str, module_name: str) -> Any:
+    """Importe le package plugin depuis module_path sous le nom module_name."""
     import importlib.util as _ilu
     import sys as _sys
     from pathlib import Path as _Path
 
     spec = _ilu.spec_from_file_location(
-        "bcasl_sandbox_module",
+        module_name,
         module_path,
         submodule_search_locations=[str(_Path(module_path).parent)],
     )
@@ -540,6 +807,26 @@ def _load_plugin_instance(
     module = _ilu.module_from_spec(spec)
     _sys.modules[spec.name] = module
     spec.loader.exec_module(module)  # type: ignore[attr-defined]
+    return module
+
+
+def _load_plugin_instance(
+    module_path: str,
+    plugin_id: str,
+    project_root: str,
+    config: dict[str, Any],
+    module_name: str = "bcasl_sandbox_module",
+):
+    module = _exec_plugin_module(module_path, module_name)
+    return _plugin_from_module(module, plugin_id, project_root, config)
+
+
+def _plugin_from_module(
+    module: Any, plugin_id: str, project_root: str, config: dict[str, Any]
+):
+    """Retrouve l'instance du plugin plugin_id dans un module déjà importé."""
+    from pathlib import Path as _Path
+
     plg = getattr(module, "PLUGIN", None)
     if plg is None or getattr(getattr(plg, "meta", None), "id", None) != plugin_id:
         try:
@@ -579,6 +866,69 @@ def _load_plugin_instance(
     return plg
 
 
+class _DeferredPackage:
+    """Package plugin différé: importé une seule fois pour tous ses plugins."""
+
+    def __init__(self, module_path: Path, module_name: str) -> None:
+        self.module_path = Path(module_path)
+        self.module_name = module_name
+        # Sérialise l'import et l'instanciation (plugins du package en parallèle)
+        self.lock = threading.Lock()
+        self._module: Any = None
+
+    def module(self) -> Any:
+        """Module du package (à appeler sous self.lock)."""
+        if self._module is None:
+            self._module = _exec_plugin_module(str(self.module_path), self.module_name)
+        return self._module
+
+
+class _DeferredPlugin(BcPluginBase):
+    """Plugin enregistré depuis le manifeste sans import du package.
+
+    Le module n'est importé qu'à la première exécution (mode non sandbox),
+    une seule fois par package; en sandbox, le worker l'importe lui-même
+    depuis module_path.
+    """
+
+    def __init__(
+        self,
+        meta: PluginMeta,
+        requires: tuple[str, ...],
+        priority: int,
+        package: _DeferredPackage,
+    ) -> None:
+        super().__init__(meta, requires=requires, priority=priority)
+        self.package = package
+        self.module_path = package.module_path
+        self.module_name = package.module_name
+        self._instance: Optional[BcPluginBase] = None
+
+    def resolve(
+        self, project_root: Path, config: Optional[dict[str, Any]] = None
+    ) -> BcPluginBase:
+        inst = self._instance
+        if inst is not None:
+            return inst
+        with self.package.lock:
+            if self._instance is None:
+                inst = _plugin_from_module(
+                    self.package.module(),
+                    self.meta.id,
+                    str(project_root),
+                    dict(config or {}),
+                )
+                inst.priority = self.priority
+                self._instance = inst
+            return self._instance
+
+    def on_pre_compile(self, ctx: PreCompileContext) -> None:
+        self.resolve(ctx.project_root, ctx.config).on_pre_compile(ctx)
+
+    def apply_i18n(self, gui, tr: dict[str, str]) -> None:
+        self.resolve(Path(".")).apply_i18n(gui, tr)
+
+
 class BCASL:
     """Gestionnaire principal des plugins et de leur exécution avant compilation."""
 
@@ -589,6 +939,7 @@ class BCASL:
         *,
         sandbox: bool = True,
         plugin_timeout_s: float = 3.0,
+        event_cb: Optional[EventCallback] = None,
     ) -> None:
         self.project_root = Path(project_root).resolve()
         self.config = dict(config or {})
@@ -598,6 +949,8 @@ class BCASL:
         self.sandbox = bool(sandbox)
         # Timeout settings
         self.plugin_timeout_s = float(plugin_timeout_s)
+        # Événements en flux (progression, logs, phases, ressources), voir bcasl.events
+        self.event_cb = event_cb
 
     # Plugins publique
     def add_plugin(self, plugin: BcPluginBase) -> None:
@@ -648,10 +1001,14 @@ class BCASL:
 
     # Chargement automatique
     def load_plugins_from_directory(
-        self, directory: Path
+        self, directory: Path, *, use_manifest: bool = True
     ) -> tuple[int, list[tuple[str, str]]]:
         """Charge automatiquement tous les plugins depuis un dossier.
 
+        Avec use_manifest (défaut), les packages dont l'empreinte n'a pas changé
+        sont enregistrés depuis le manifeste en cache (voir bcasl.manifest) sans
+        être importés; l'import n'a lieu qu'à l'exécution du plugin.
+
         Retourne (nombre_plugins_enregistrés, liste_erreurs[(module, message)]).
         """
         directory = Path(directory)
@@ -659,6 +1016,9 @@ class BCASL:
             _logger.warning("Dossier plugins introuvable: %s", directory)
             return 0, [(str(directory), "non trouvé ou non répertoire")]
 
+        manifest = (
+            PluginManifestCache.for_directory(directory) if use_manifest else None
+        )
         count = 0
         errors: list[tuple[str, str]] = []
         # Parcourt uniquement les packages Python (dossiers contenant __init__.py)
@@ -668,75 +1028,33 @@ class BCASL:
             )
         except Exception:
             pkg_dirs = []
+        seen_pkgs: set[str] = set()
         for pkg_dir in pkg_dirs:
             if pkg_dir.name.startswith("__"):
                 continue
             init_file = pkg_dir / "__init__.py"
             if not init_file.exists():
                 continue
+            seen_pkgs.add(pkg_dir.name)
             mod_name = f"bcasl_Plugins_{pkg_dir.name}"
             try:
-                spec = importlib.util.spec_from_file_location(
-                    mod_name, str(init_file), submodule_search_locations=[str(pkg_dir)]
-                )
-                if spec is None or spec.loader is None:
-                    raise ImportError("spec invalide")
-                module = importlib.util.module_from_spec(spec)
-                sys.modules[mod_name] = module
-                spec.loader.exec_module(module)  # type: ignore[attr-defined]
-
-                # Recherche et appel de la fonction d'enregistrement si présente
-                reg = getattr(module, BCASL_PLUGIN_REGISTER_FUNC, None)
-                is_decorator_plugin = False
-                new_ids: list[str] = []
-
-                if callable(reg):
-                    # Ancien style: fonction bcasl_register(manager)
-                    before_ids = set(self._registry.keys())
-                    reg(self)  # le package appelle self.add_plugin(...)
-                    new_ids = [k for k in self._registry.keys() if k not in before_ids]
+                entries = manifest.lookup(pkg_dir) if manifest is not None else None
+                if entries is not None:
+                    new_ids = self._register_from_manifest(entries, init_file, mod_name)
+                    is_decorator_plugin = bool(entries)
                 else:
-                    # Nouveau style: chercher les classes marquées avec @bc_register
-                    # Ces classes ont l'attribut __bcasl_plugin__ = True
-                    # et peuvent avoir _bcasl_instance_ pour l'instance
-                    for attr_name in dir(module):
-                        try:
-                            attr = getattr(module, attr_name, None)
-                            if attr is None:
-                                continue
-                            # Vérifier si c'est une classe marquée comme plugin
-                            if not getattr(attr, "__bcasl_plugin__", False):
-                                continue
-                            if not isinstance(attr, type):
-                                continue
-                            # C'est une classe de plugin décorée avec @bc_register
-                            plugin_instance = getattr(attr, "_bcasl_instance_", None)
-                            if plugin_instance is None:
-                                try:
-                                    plugin_instance = attr()
-                                except Exception as e:
-                                    _logger.warning(
-                                        "Impossible d'instancier le plugin %s: %s",
-                                        attr_name,
-                                        e,
-                                    )
-                                    continue
-                            # Enregistrer le plugin
-                            pid = plugin_instance.meta.id
-                            if pid not in self._registry:
-                                # Appliquer la priorité basée sur les tags si pas déjà définie
-                                # et si la priorité par défaut (100) est utilisée
-                                if plugin_instance.priority == 100:
-                                    tag_priority = _tag_priority_from_tags(
-                                        getattr(plugin_instance.meta, "tags", ())
-                                    )
-                                    if tag_priority != _tag_priority_from_tags([]):
-                                        plugin_instance.priority = tag_priority
-                                self.add_plugin(plugin_instance)
-                                new_ids.append(pid)
-                                is_decorator_plugin = True
-                        except Exception:
-                            continue
+                    new_ids, is_decorator_plugin = self._register_from_package(
+                        pkg_dir, init_file, mod_name
+                    )
+                    if manifest is not None:
+                        manifest.store(
+                            pkg_dir,
+                            [
+                                plugin_to_entry(self._registry[pid].plugin)
+                                for pid in new_ids
+                                if pid in self._registry
+                            ],
+                        )
 
                 for pid in new_ids:
                     rec = self._registry.get(pid)
@@ -763,8 +1081,98 @@ class BCASL:
                 msg = f"échec chargement: {exc}"
                 errors.append((pkg_dir.name, msg))
                 _logger.error("%s: %s", pkg_dir.name, msg)
+        if manifest is not None:
+            manifest.prune(seen_pkgs)
+            manifest.save()
         return count, errors
 
+    def _register_from_manifest(
+        self, entries: list[dict[str, Any]], init_file: Path, mod_name: str
+    ) -> list[str]:
+        """Enregistre des plugins différés depuis les entrées du manifeste (sans import)."""
+        new_ids: list[str] = []
+        package = _DeferredPackage(init_file, mod_name)
+        for entry in entries:
+            meta = entry_to_meta(entry)
+            if meta.id in self._registry:
+                continue
+            plugin = _DeferredPlugin(
+                meta,
+                requires=tuple(entry.get("requires") or ()),
+                priority=int(entry.get("priority", 100)),
+                package=package,
+            )
+            self.add_plugin(plugin)
+            new_ids.append(meta.id)
+        return new_ids
+
+    def _register_from_package(
+        self, pkg_dir: Path, init_file: Path, mod_name: str
+    ) -> tuple[list[str], bool]:
+        """Importe le package et enregistre ses plugins (bcasl_register ou @bc_register)."""
+        spec = importlib.util.spec_from_file_location(
+            mod_name, str(init_file), submodule_search_locations=[str(pkg_dir)]
+        )
+        if spec is None or spec.loader is None:
+            raise ImportError("spec invalide")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[mod_name] = module
+        spec.loader.exec_module(module)  # type: ignore[attr-defined]
+
+        # Recherche et appel de la fonction d'enregistrement si présente
+        reg = getattr(module, BCASL_PLUGIN_REGISTER_FUNC, None)
+        is_decorator_plugin = False
+        new_ids: list[str] = []
+
+        if callable(reg):
+            # Ancien style: fonction bcasl_register(manager)
+            before_ids = set(self._registry.keys())
+            reg(self)  # le package appelle self.add_plugin(...)
+            new_ids = [k for k in self._registry.keys() if k not in before_ids]
+        else:
+            # Nouveau style: chercher les classes marquées avec @bc_register
+            # Ces classes ont l'attribut __bcasl_plugin__ = True
+            # et peuvent avoir _bcasl_instance_ pour l'instance
+            for attr_name in dir(module):
+                try:
+                    attr = getattr(module, attr_name, None)
+                    if attr is None:
+                        continue
+                    # Vérifier si c'est une classe marquée comme plugin
+                    if not getattr(attr, "__bcasl_plugin__", False):
+                        continue
+                    if not isinstance(attr, type):
+                        continue
+                    # C'est une classe de plugin décorée avec @bc_register
+                    plugin_instance = getattr(attr, "_bcasl_instance_", None)
+                    if plugin_instance is None:
+                        try:
+                            plugin_instance = attr()
+                        except Exception as e:
+                            _logger.warning(
+                                "Impossible d'instancier le plugin %s: %s",
+                                attr_name,
+                                e,
+                            )
+                            continue
+                    # Enregistrer le plugin
+                    pid = plugin_instance.meta.id
+                    if pid not in self._registry:
+                        # Appliquer la priorité basée sur les tags si pas déjà définie
+                        # et si la priorité par défaut (100) est utilisée
+                        if plugin_instance.priority == 100:
+                            tag_priority = _tag_priority_from_tags(
+                                getattr(plugin_instance.meta, "tags", ())
+                            )
+                            if tag_priority != _tag_priority_from_tags([]):
+                                plugin_instance.priority = tag_priority
+                        self.add_plugin(plugin_instance)
+                        new_ids.append(pid)
+                        is_decorator_plugin = True
+                except Exception:
+                    continue
+        return new_ids, is_decorator_plugin
+
     # Ordonnancement et exécution
     def _resolve_order_with_tags(self) -> list[str]:
         """Résout l'ordre d'exécution en respectant dépendances, priorités et tags.
@@ -923,6 +1331,8 @@ class BCASL:
 
         Optimisations de performance:
         - Exécution parallèle des plugins sandboxés en respectant dépendances/priorités
+        - Hors sandbox, pool de threads optionnel (options.thread_pool ou env
+          PYCOMPILER_BCASL_THREADS) pour les ensembles de plugins de confiance
         - Cache optionnel des itérations de fichiers (voir PreCompileContext.iter_files)
         - Paramètres via options.sandbox, options.plugin_parallelism et env PYCOMPILER_BCASL_PARALLELISM
         """
@@ -934,6 +1344,8 @@ class BCASL:
 
         report = ExecutionReport()
         eff_sandbox, parallelism = _resolve_exec_options(self.config, self.sandbox)
+        cache_dir = _resolve_plugin_cache_dir(self.config, ctx.project_root)
+        _apply_plugin_cache_dir(cache_dir)
 
         # Construire graphe des dépendances des plugins actifs
         active_items = {pid: rec for pid, rec in self._registry.items() if rec.active}
@@ -946,6 +1358,22 @@ class BCASL:
 
         ready = _build_ready_queue(active_items, indeg)
 
+        # Hors sandbox: pool de threads si demandé (plugins de confiance, I/O-bound)
+        if not eff_sandbox and parallelism > 1 and _resolve_thread_pool(self.config):
+            _run_parallel_threads(
+                report,
+                active_items,
+                children,
+                dict(indeg),
+                ready,
+                ctx,
+                self.plugin_timeout_s,
+                parallelism,
+                self.event_cb,
+            )
+            _logger.info(report.summary())
+            return report
+
         # Fallback: si pas de sandbox ou parallélisme=1, revient au mode séquentiel
         if not eff_sandbox or parallelism <= 1:
             indeg_seq = dict(indeg)
@@ -960,6 +1388,8 @@ class BCASL:
                     self.project_root,
                     self.plugin_timeout_s,
                     eff_sandbox,
+                    self.event_cb,
+                    cache_dir,
                 )
             _logger.info(report.summary())
             return report
@@ -976,18 +1406,140 @@ class BCASL:
             self.project_root,
             self.plugin_timeout_s,
             parallelism,
+            self.event_cb,
+            cache_dir,
         )
         _logger.info(report.summary())
         return report
 
 
+def _read_proc_io(path: str) -> Optional[tuple[int, int]]:
+    """(octets lus, octets écrits) depuis /proc/.../io (rchar/wchar), sinon None."""
+    try:
+        vals: dict[str, int] = {}
+        with open(path, encoding="ascii") as f:
+            for line in f:
+                k, _, v = line.partition(":")
+                vals[k.strip()] = int(v.strip() or 0)
+        return vals.get("rchar", 0), vals.get("wchar", 0)
+    except Exception:
+        return None
+
+
+def _resource_snapshot(per_thread: bool = False) -> Optional[dict[str, Any]]:
+    """Consommation cumulée du processus (ou du thread courant si per_thread).
+
+    CPU via resource.getrusage (RUSAGE_THREAD si disponible), E/S via
+    /proc/<self|thread-self>/io ou psutil. Le pic RSS n'est relevé que pour le
+    processus entier (worker sandbox): dans l'hôte, c'est le pic de toute la
+    session et non celui d'un plugin, il est donc omis avec per_thread.
+    None si rien n'est mesurable.
+    """
+    snap: dict[str, Any] = {}
+    try:
+        import resource as _res
+
+        who = _res.RUSAGE_SELF
+        if per_thread and hasattr(_res, "RUSAGE_THREAD"):
+            who = _res.RUSAGE_THREAD
+        ru = _res.getrusage(who)
+        snap["cpu_user_s"] = float(ru.ru_utime)
+        snap["cpu_sys_s"] = float(ru.ru_stime)
+        if not per_thread:
+            max_rss_kb = int(ru.ru_maxrss)
+            if sys.platform == "darwin":  # ru_maxrss en octets sur macOS
+                max_rss_kb //= 1024
+            snap["max_rss_kb"] = max_rss_kb
+    except Exception:
+        pass
+    io = _read_proc_io("/proc/thread-self/io" if per_thread else "/proc/self/io")
+    if io is None and not per_thread:
+        try:
+            import psutil as _ps  # type: ignore[import-untyped]
+
+            c = _ps.Process().io_counters()
+            io = (
+                int(getattr(c, "read_chars", c.read_bytes)),
+                int(getattr(c, "write_chars", c.write_bytes)),
+            )
+        except Exception:
+            io = None
+    if io is not None:
+        snap["read_bytes"], snap["write_bytes"] = io
+    if not snap and not per_thread:
+        try:
+            import psutil as _ps  # type: ignore[import-untyped]
+
+            proc = _ps.Process()
+            t = proc.cpu_times()
+            snap["cpu_user_s"] = float(t.user)
+            snap["cpu_sys_s"] = float(t.system)
+            snap["max_rss_kb"] = (
+                int(getattr(proc.memory_info(), "peak_wset", proc.memory_info().rss))
+                // 1024
+            )
+        except Exception:
+            pass
+    return snap or None
+
+
+def _usage_delta(
+    before: Optional[dict[str, Any]], after: Optional[dict[str, Any]]
+) -> Optional[dict[str, Any]]:
+    """Différence entre deux instantanés (le pic RSS est repris tel quel)."""
+    if not after:
+        return None
+    before = before or {}
+    out: dict[str, Any] = {}
+    for key in ("cpu_user_s", "cpu_sys_s", "read_bytes", "write_bytes"):
+        if key in after:
+            out[key] = max(0, after[key] - before.get(key, 0))
+    if "max_rss_kb" in after:
+        out["max_rss_kb"] = int(after["max_rss_kb"])
+    return out
+
+
+def _start_event_ticker(
+    batcher, stop, interval_s: float = 0.1, resource_every_s: float = 1.0
+):
+    """Thread démon du worker: vide le lot d'événements à intervalle fixe et
+    publie périodiquement la consommation de ressources."""
+    import threading as _th
+
+    from bcasl import events as _events
+
+    def _loop() -> None:
+        last_res = time.monotonic()
+        while not stop.wait(interval_s):
+            now = time.monotonic()
+            if now - last_res >= resource_every_s:
+                last_res = now
+                snap = _resource_snapshot()
+                if snap:
+                    _events.emit("resource", **snap)
+            batcher.tick()
+
+    t = _th.Thread(target=_loop, name="bcasl-events", daemon=True)
+    t.start()
+    return t
+
+
 def _plugin_worker(
-    module_path: str, plugin_id: str, project_root: str, config: dict[str, Any], q
+    module_path: str,
+    plugin_id: str,
+    project_root: str,
+    config: dict[str, Any],
+    q,
+    cache_dir: Optional[str] = None,
 ) -> None:
     """Charge un module de plugin depuis son chemin et exécute on_pre_compile dans un processus isolé.
 
-    Renvoie un dict via la queue: {ok: bool, error: str, duration_ms: float}
+    Envoie sur la queue:
+    - des lots d'événements {type: "events", events: [...]} (progression, logs, phases, ressources)
+    - puis un résultat final {type: "result", ok: bool, error: str, duration_ms: float,
+      usage: {cpu_user_s, cpu_sys_s, max_rss_kb, read_bytes, write_bytes}}
     """
+    import threading as _th
     import time as _time
     import traceback as _tb
     from pathlib import Path as _Path
@@ -996,14 +1548,52 @@ def _plugin_worker(
     _maybe_init_qt_app(config)
     _enforce_sdk_progress()
     _apply_resource_limits(config)
+    _apply_plugin_cache_dir(cache_dir)
+
+    from bcasl import events as _events
+
+    batcher = _events.EventBatcher(
+        lambda batch: q.put({"type": "events", "events": batch})
+    )
+    _events.set_event_sink(batcher.add, plugin_id)
+    stop = _th.Event()
+    _start_event_ticker(batcher, stop)
+    result: dict[str, Any]
+    dur = 0.0
+    usage: Optional[dict[str, Any]] = None
     try:
         from bcasl import PreCompileContext as _PCC
 
+        _events.emit_phase("load")
         plg = _load_plugin_instance(module_path, plugin_id, project_root, config)
         ctx = _PCC(_Path(project_root), config=dict(config or {}))
+        _events.emit_phase("run")
+        before = _resource_snapshot()
         t0 = _time.perf_counter()
-        plg.on_pre_compile(ctx)
-        dur = (_time.perf_counter() - t0) * 1000.0
-        q.put({"ok": True, "error": "", "duration_ms": dur})
+        try:
+            plg.on_pre_compile(ctx)
+        finally:
+            dur = (_time.perf_counter() - t0) * 1000.0
+            usage = _usage_delta(before, _resource_snapshot())
+        result = {
+            "type": "result",
+            "ok": True,
+            "error": "",
+            "duration_ms": dur,
+            "usage": usage,
+        }
     except Exception:
-        q.put({"ok": False, "error": _tb.format_exc(), "duration_ms": 0.0})
+        result = {
+            "type": "result",
+            "ok": False,
+            "error": _tb.format_exc(),
+            "duration_ms": dur,
+            "usage": usage,
+        }
+    stop.set()
+    if usage:
+        _events.emit("resource", final=True, **usage)
+    _events.emit_phase("done")
+    batcher.flush()
+    _events.set_event_sink(None)
+    q.put(result)
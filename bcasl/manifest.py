@@ -0,0 +1,106 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Ague Samuel Amen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Cache du manifeste des plugins BCASL.
+
+Chaque package de Plugins/ est identifié par une empreinte calculée sur les
+(chemin relatif, taille, mtime_ns) de ses fichiers (stat uniquement, aucune
+lecture). Tant que l'empreinte ne change pas, les métadonnées (id, nom,
+version, tags, requirements, requires, priorité) sont relues depuis
+<Plugins>/.bcasl_manifest.json sans importer le package.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from utils.package_manifest import PackageManifestCache, package_fingerprint
+
+from .Base import BcPluginBase, PluginMeta, _logger
+
+__all__ = [
+    "MANIFEST_FILENAME",
+    "PluginManifestCache",
+    "package_fingerprint",
+    "plugin_to_entry",
+    "entry_to_meta",
+    "entry_requirements",
+]
+
+MANIFEST_FILENAME = ".bcasl_manifest.json"
+# Incrémenter si le format des entrées change
+_MANIFEST_SCHEMA = 1
+
+_REQUIRED_FIELDS = (
+    ("required_bcasl_version", "BCASL"),
+    ("required_core_version", "Core"),
+    ("required_plugins_sdk_version", "Plugins SDK"),
+    ("required_bc_plugin_context_version", "BcPluginContext"),
+    ("required_general_context_version", "GeneralContext"),
+)
+
+
+def entry_requirements(entry: dict[str, Any]) -> list[str]:
+    """Liste lisible des versions minimales requises (valeurs != 1.0.0)."""
+    reqs: list[str] = []
+    for key, label in _REQUIRED_FIELDS:
+        val = str(entry.get(key, "1.0.0") or "1.0.0")
+        if val != "1.0.0":
+            reqs.append(f"{label} >= {val}")
+    return reqs
+
+
+def plugin_to_entry(plugin: BcPluginBase, priority: Optional[int] = None) -> dict:
+    """Sérialise les métadonnées d'un plugin chargé en entrée de manifeste."""
+    meta = plugin.meta
+    entry: dict[str, Any] = {
+        "id": meta.id,
+        "name": meta.name,
+        "version": meta.version,
+        "description": meta.description,
+        "author": meta.author,
+        "tags": [str(t) for t in (getattr(meta, "tags", ()) or ())],
+        "requires": [str(r) for r in (getattr(plugin, "requires", ()) or ())],
+        "priority": int(plugin.priority if priority is None else priority),
+    }
+    for key, _label in _REQUIRED_FIELDS:
+        entry[key] = str(getattr(meta, key, "1.0.0") or "1.0.0")
+    entry["requirements"] = entry_requirements(entry)
+    return entry
+
+
+def entry_to_meta(entry: dict[str, Any]) -> PluginMeta:
+    """Reconstruit un PluginMeta depuis une entrée de manifeste."""
+    kwargs: dict[str, Any] = {
+        "id": str(entry["id"]),
+        "name": str(entry.get("name") or entry["id"]),
+        "version": str(entry.get("version") or ""),
+        "description": str(entry.get("description") or ""),
+        "author": str(entry.get("author") or ""),
+        "tags": tuple(entry.get("tags") or ()),
+    }
+    for key, _label in _REQUIRED_FIELDS:
+        kwargs[key] = str(entry.get(key, "1.0.0") or "1.0.0")
+    return PluginMeta(**kwargs)
+
+
+class PluginManifestCache(PackageManifestCache):
+    """Manifeste persistant {package -> (empreinte, entrées plugins)}."""
+
+    FILENAME = MANIFEST_FILENAME
+    ENTRY_KEY = "plugins"
+    SCHEMA = _MANIFEST_SCHEMA
+    logger = _logger
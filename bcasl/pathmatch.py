@@ -0,0 +1,30 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Ague Samuel Amen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compatibilité: les motifs glob compilés vivent dans utils.pathmatch."""
+
+from utils.pathmatch import (
+    PathMatcher,
+    compile_matcher,
+    glob_to_regex,
+    walk_files,
+)
+
+__all__ = [
+    "glob_to_regex",
+    "PathMatcher",
+    "compile_matcher",
+    "walk_files",
+]
@@ -16,7 +16,9 @@
 from __future__ import annotations
 
 from pathlib import Path
+import platform
 import shutil
+from typing import Callable, Iterable, Optional
 
 import pytest
 
@@ -28,3 +30,43 @@ def test_workspace(tmp_path: Path) -> Path:
     dest = tmp_path / "workspace"
     shutil.copytree(src, dest)
     return dest
+
+
+class DummyParent:
+    """Minimal GUI stand-in accepted by VenvManager."""
+
+    def __init__(self, workspace: Optional[Path] = None):
+        self.log: list = []
+        self.workspace_dir = str(workspace) if workspace is not None else None
+        self.venv_path_manuel = None
+        self.use_system_python = False
+
+    def tr(self, fr: str, en: str) -> str:
+        return en
+
+
+@pytest.fixture()
+def dummy_parent() -> type[DummyParent]:
+    """Return the DummyParent factory: dummy_parent(workspace=None)."""
+    return DummyParent
+
+
+def _make_fake_venv(path: Path, tools: Iterable[str] = ()) -> Path:
+    bin_path = path / ("Scripts" if platform.system() == "Windows" else "bin")
+    bin_path.mkdir(parents=True, exist_ok=True)
+    (path / "pyvenv.cfg").write_text(
+        "include-system-site-packages = false\n", encoding="utf-8"
+    )
+    py_name = "python.exe" if platform.system() == "Windows" else "python"
+    (bin_path / py_name).write_text("", encoding="utf-8")
+    for tool in tools:
+        exe = bin_path / tool
+        exe.write_text("", encoding="utf-8")
+        exe.chmod(0o755)
+    return path
+
+
+@pytest.fixture()
+def make_fake_venv() -> Callable[..., Path]:
+    """Return a factory creating a minimal venv layout: make_fake_venv(path, tools=())."""
+    return _make_fake_venv
@@ -0,0 +1,117 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Ague Samuel Amen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the parsed-config cache of Core.ArkConfigManager."""
+
+import copy
+import os
+from pathlib import Path
+
+import pytest
+import yaml
+
+from Core import ArkConfigManager as acm
+from Core.ArkConfigManager import (
+    DEFAULT_EXCLUSION_PATTERNS,
+    FrozenConfig,
+    get_ark_config,
+    invalidate_ark_config_cache,
+    load_ark_config,
+    set_entrypoint,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache():
+    invalidate_ark_config_cache()
+    yield
+    invalidate_ark_config_cache()
+
+
+def _write(path: Path, data: dict, ns: int) -> None:
+    path.write_text(yaml.safe_dump(data), encoding="utf-8")
+    os.utime(path, ns=(ns, ns))
+
+
+def test_cached_object_is_frozen_and_shared(tmp_path: Path, monkeypatch) -> None:
+    _write(
+        tmp_path / "ARK_Main_Config.yml",
+        {
+            "exclusion_patterns": ["*.pyc", "generated/**"],
+            "build": {"entrypoint": " a.py "},
+        },
+        1_000,
+    )
+    parses = []
+    real = acm._parse_ark_config
+    monkeypatch.setattr(acm, "_parse_ark_config", lambda p: parses.append(p) or real(p))
+
+    cfg = get_ark_config(str(tmp_path))
+    assert get_ark_config(str(tmp_path)) is cfg
+    assert len(parses) == 1
+
+    assert isinstance(cfg, FrozenConfig) and isinstance(cfg, dict)
+    assert cfg["build"]["entrypoint"] == "a.py"
+    patterns = cfg["exclusion_patterns"]
+    assert isinstance(patterns, tuple)
+    assert list(patterns[: len(DEFAULT_EXCLUSION_PATTERNS)]) == list(
+        dict.fromkeys(DEFAULT_EXCLUSION_PATTERNS)
+    )
+    assert patterns[-1] == "generated/**"
+    with pytest.raises(TypeError):
+        cfg["build"]["entrypoint"] = "b.py"
+    with pytest.raises(TypeError):
+        cfg.update({})
+
+    # Copies mutables
+    mutable = load_ark_config(str(tmp_path))
+    mutable["build"]["entrypoint"] = "b.py"
+    mutable["exclusion_patterns"].append("x")
+    deep = copy.deepcopy(cfg)
+    deep["inclusion_patterns"].append("y")
+    assert get_ark_config(str(tmp_path))["build"]["entrypoint"] == "a.py"
+    assert len(parses) == 1
+
+
+def test_cache_follows_file_changes(tmp_path: Path) -> None:
+    ws = str(tmp_path)
+    assert get_ark_config(ws)["build"]["entrypoint"] is None
+
+    # Création d'un fichier
+    _write(tmp_path / "ARK_Main_Config.yml", {"build": {"entrypoint": "a.py"}}, 1_000)
+    assert get_ark_config(ws)["build"]["entrypoint"] == "a.py"
+
+    # Modification (mtime_ns différent)
+    _write(tmp_path / "ARK_Main_Config.yml", {"build": {"entrypoint": "b.py"}}, 2_000)
+    assert get_ark_config(ws)["build"]["entrypoint"] == "b.py"
+
+    # Un candidat prioritaire apparaît
+    _write(tmp_path / "ARK_Main_Config.yaml", {"build": {"entrypoint": "c.py"}}, 1_000)
+    assert get_ark_config(ws)["build"]["entrypoint"] == "c.py"
+
+    # Suppression
+    (tmp_path / "ARK_Main_Config.yaml").unlink()
+    assert get_ark_config(ws)["build"]["entrypoint"] == "b.py"
+
+
+def test_save_invalidates_cache(tmp_path: Path) -> None:
+    ws = str(tmp_path)
+    assert set_entrypoint(ws, "main.py") is True
+    cfg = get_ark_config(ws)
+    assert cfg["build"]["entrypoint"] == "main.py"
+    # Même taille, même seconde: seule l'invalidation explicite garantit la relecture
+    assert set_entrypoint(ws, "app.py") is True
+    assert get_ark_config(ws)["build"]["entrypoint"] == "app.py"
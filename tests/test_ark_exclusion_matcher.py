@@ -0,0 +1,192 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Ague Samuel Amen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests (and benchmark) for Core.ArkConfigManager.ExclusionMatcher.
+
+Benchmark (opt-in, timing dependent):
+    ARK_RUN_BENCHMARKS=1 python -m pytest -s tests/test_ark_exclusion_matcher.py -k benchmark
+"""
+
+import fnmatch
+import os
+import time
+from pathlib import Path, PurePosixPath
+
+import pytest
+
+from Core.ArkConfigManager import (
+    DEFAULT_EXCLUSION_PATTERNS,
+    _normalize_exclusion_pattern,
+    get_exclusion_matcher,
+    should_exclude_file,
+)
+
+_PATTERNS = tuple(DEFAULT_EXCLUSION_PATTERNS) + (
+    "docs/",
+    "*.log",
+    "tests/test_?.py",
+    "/abs/only.py",
+    "gen[0-9]/*.py",
+    "**/snapshots/**",
+    "tmp**",
+)
+
+_REL_PATHS = [
+    "main.py",
+    "pkg/mod.py",
+    "pkg/__pycache__/mod.cpython-311.pyc",
+    "__pycache__/x.py",
+    "venv/lib/site.py",
+    "src/venv/lib/site.py",
+    "build/out.py",
+    "a/build/out.py",
+    "foo.egg-info/PKG-INFO",
+    "src/foo.egg-info/x.py",
+    "docs/conf.py",
+    "run.log",
+    "deep/a/b/run.log",
+    "tests/test_a.py",
+    "tests/test_ab.py",
+    "x/tests/test_b.py",
+    "gen1/a.py",
+    "gen1/sub/a.py",
+    "genx/a.py",
+    "pkg/snapshots/a/b.py",
+    "tmpfile.py",
+    "sub/tmp_cache.py",
+    "site-packages/x.py",
+    ".git/config",
+    "node_modules/a/b.js",
+    "mod.pyd",
+]
+
+
+def _legacy_should_exclude(file_path, workspace_dir, exclusion_patterns):
+    """Implémentation de référence (boucle par pattern) avant ExclusionMatcher."""
+    try:
+        file_abs = Path(file_path).resolve()
+        workspace_abs = Path(workspace_dir).resolve()
+        try:
+            relative_path = file_abs.relative_to(workspace_abs)
+        except ValueError:
+            return True
+        rel_posix = PurePosixPath(relative_path.as_posix())
+        abs_posix = PurePosixPath(file_abs.as_posix())
+        rel_str = rel_posix.as_posix()
+        abs_str = abs_posix.as_posix()
+        for pattern in exclusion_patterns or []:
+            pat = _normalize_exclusion_pattern(pattern)
+            if not pat:
+                continue
+            if "**" in pat:
+                if fnmatch.fnmatch(rel_str, pat) or fnmatch.fnmatch(abs_str, pat):
+                    return True
+            else:
+                if rel_posix.match(pat) or abs_posix.match(pat):
+                    return True
+            if "/" not in pat and PurePosixPath(file_abs.name).match(pat):
+                return True
+        return False
+    except Exception:
+        return False
+
+
+def test_matches_legacy_semantics(tmp_path: Path) -> None:
+    ws = tmp_path / "ws"
+    ws.mkdir()
+    matcher = get_exclusion_matcher(str(ws), _PATTERNS)
+    for rel in _REL_PATHS:
+        path = str(ws / rel)
+        expected = _legacy_should_exclude(path, str(ws), list(_PATTERNS))
+        assert matcher.is_excluded(path) is expected, rel
+        assert matcher.is_excluded_rel(rel) is expected, rel
+        assert should_exclude_file(path, str(ws), list(_PATTERNS)) is expected, rel
+
+    # Hors du workspace, chemin absolu ancré
+    assert matcher.is_excluded(str(tmp_path / "other.py")) is True
+    abs_matcher = get_exclusion_matcher(str(ws), (str(ws / "main.py"),))
+    assert abs_matcher.is_excluded(str(ws / "main.py")) is True
+    assert abs_matcher.is_excluded(str(ws / "pkg" / "main.py")) is False
+
+
+def test_matcher_is_cached_and_prunes(tmp_path: Path) -> None:
+    ws = str(tmp_path)
+    m = get_exclusion_matcher(ws, _PATTERNS)
+    assert get_exclusion_matcher(ws, list(_PATTERNS)) is m
+    assert m.prune_dir("venv") and m.prune_dir("venv/lib") and m.prune_dir("docs")
+    assert not m.prune_dir("src") and not m.prune_dir("src/venv")
+    # Patterns lus depuis la configuration ARK du workspace
+    assert get_exclusion_matcher(ws).patterns == tuple(DEFAULT_EXCLUSION_PATTERNS)
+
+
+def test_symlink_outside_workspace_is_excluded(tmp_path: Path) -> None:
+    ws = tmp_path / "ws"
+    ws.mkdir()
+    outside = tmp_path / "outside.py"
+    outside.write_text("", encoding="utf-8")
+    link = ws / "link.py"
+    try:
+        link.symlink_to(outside)
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks unavailable")
+    assert get_exclusion_matcher(str(ws), ()).is_excluded(str(link)) is True
+
+
+def _bench_paths(n: int) -> list[str]:
+    dirs = ["src/pkg", "src/pkg/sub", "app", "venv/lib", "tests", "build", "lib/a/b"]
+    names = ["mod.py", "mod.pyc", "test_x.py", "run.log", "__init__.py"]
+    return [
+        f"{dirs[i % len(dirs)]}/d{i % 97}/{names[i % len(names)]}" for i in range(n)
+    ]
+
+
+def run_benchmark(n: int = 100_000, legacy_sample: int = 5_000) -> dict[str, float]:
+    """Coût par chemin (µs): matcher sur n chemins, référence sur un échantillon."""
+    ws = os.path.abspath(".")
+    rels = _bench_paths(n)
+    matcher = get_exclusion_matcher(ws, _PATTERNS)
+
+    t0 = time.perf_counter()
+    for rel in rels:
+        matcher.is_excluded_rel(rel)
+    rel_us = (time.perf_counter() - t0) / n * 1e6
+
+    abs_paths = [os.path.join(ws, r) for r in rels[:legacy_sample]]
+    t0 = time.perf_counter()
+    for p in abs_paths:
+        matcher.is_excluded(p)
+    abs_us = (time.perf_counter() - t0) / len(abs_paths) * 1e6
+
+    t0 = time.perf_counter()
+    for p in abs_paths:
+        _legacy_should_exclude(p, ws, list(_PATTERNS))
+    legacy_us = (time.perf_counter() - t0) / len(abs_paths) * 1e6
+    return {"matcher_rel_us": rel_us, "matcher_abs_us": abs_us, "legacy_us": legacy_us}
+
+
+@pytest.mark.skipif(
+    os.environ.get("ARK_RUN_BENCHMARKS") != "1",
+    reason="benchmark: set ARK_RUN_BENCHMARKS=1",
+)
+def test_benchmark_100k_paths() -> None:
+    res = run_benchmark(100_000, legacy_sample=2_000)
+    print(
+        "\nExclusionMatcher: {matcher_rel_us:.2f} µs/path (relative), "
+        "{matcher_abs_us:.2f} µs/path (absolute); legacy: {legacy_us:.2f} µs/path".format(
+            **res
+        )
+    )
+    assert res["matcher_rel_us"] * 5 < res["legacy_us"]
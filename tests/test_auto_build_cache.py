@@ -0,0 +1,125 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Ague Samuel Amen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the auto-args session cache of Core.Auto_Command_Builder."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from Core.Auto_Command_Builder import auto_build as ab
+
+
+class _Gui:
+    def __init__(self, workspace: Path, files):
+        self.workspace_dir = str(workspace)
+        self.python_files = [str(f) for f in files]
+        self.selected_files = []
+        self.logs = []
+
+    def log_message(self, msg):  # pragma: no cover - sink for log helpers
+        self.logs.append(msg)
+
+
+@pytest.fixture
+def workspace(tmp_path: Path, monkeypatch):
+    mapping = tmp_path / "mapping.json"
+    mapping.write_text(
+        json.dumps({"numpy": {"fake_engine": ["--collect {import_name}"]}}),
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("PYCOMPILER_MAPPING", str(mapping))
+    monkeypatch.setenv("PYCOMPILER_MAPPING_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.delenv("PYCOMPILER_REQ_FILES", raising=False)
+    ws = tmp_path / "ws"
+    ws.mkdir()
+    (ws / "main.py").write_text("import numpy\n", encoding="utf-8")
+    (ws / "util.py").write_text("import os\n", encoding="utf-8")
+    ab.clear_auto_args_cache()
+    yield ws, mapping
+    ab.clear_auto_args_cache()
+
+
+def _counting(monkeypatch, name):
+    calls = []
+    real = getattr(ab, name)
+
+    def _wrapped(*args, **kwargs):
+        calls.append(args)
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(ab, name, _wrapped)
+    return calls
+
+
+def test_one_computation_per_build(workspace, monkeypatch) -> None:
+    ws, _mapping = workspace
+    gui = _Gui(ws, [ws / "main.py", ws / "util.py"])
+    detect = _counting(monkeypatch, "_detect_modules_preferring_requirements")
+    load = _counting(monkeypatch, "_load_engine_package_mapping")
+
+    results = [ab.compute_auto_for_engine(gui, "fake_engine") for _ in range(30)]
+    assert results[0] == ["--collect numpy"]
+    assert all(r == results[0] for r in results)
+    assert len(detect) == 1 and len(load) == 1
+
+    results[0].append("mutated")
+    assert ab.compute_auto_for_engine(gui, "fake_engine") == ["--collect numpy"]
+
+
+def test_cache_follows_inputs(workspace, monkeypatch) -> None:
+    ws, mapping = workspace
+    gui = _Gui(ws, [ws / "main.py", ws / "util.py"])
+    assert ab.compute_auto_for_engine(gui, "fake_engine") == ["--collect numpy"]
+
+    # Fichier source modifié: nouveau scan des imports (incrémental)
+    util_entry = ab._IMPORTS_FILE_CACHE[os.path.abspath(ws / "util.py")]
+    (ws / "main.py").write_text("import os\n", encoding="utf-8")
+    os.utime(ws / "main.py", ns=(1, 1))
+    assert ab.compute_auto_for_engine(gui, "fake_engine") == []
+    assert ab._IMPORTS_FILE_CACHE[os.path.abspath(ws / "util.py")] is util_entry
+
+    # requirements.txt prioritaire: la liste des fichiers n'est plus dans la clé
+    (ws / "requirements.txt").write_text("numpy>=1.26\n", encoding="utf-8")
+    assert ab.compute_auto_for_engine(gui, "fake_engine") == ["--collect numpy"]
+
+    # Mapping modifié
+    mapping.write_text(
+        json.dumps({"numpy": {"fake_engine": ["--numpy"]}}), encoding="utf-8"
+    )
+    os.utime(mapping, ns=(2, 2))
+    assert ab.compute_auto_for_engine(gui, "fake_engine") == ["--numpy"]
+
+    # Builder enregistré: invalide le cache de session
+    ab.register_auto_builder("fake_engine", lambda matched, imp: ["--custom"])
+    try:
+        assert ab.compute_auto_for_engine(gui, "fake_engine") == ["--custom"]
+    finally:
+        ab._ENGINE_BUILDERS.pop("fake_engine", None)
+
+
+def test_imports_file_cache_is_bounded(workspace, monkeypatch) -> None:
+    ws, _mapping = workspace
+    monkeypatch.setattr(ab, "_IMPORTS_FILE_CACHE_MAX", 2)
+    files = []
+    for i in range(4):
+        path = ws / f"mod{i}.py"
+        path.write_text(f"import pkg{i}\n", encoding="utf-8")
+        files.append(str(path))
+    assert ab._scan_imports(files, str(ws)) >= {"pkg0", "pkg3"}
+    assert list(ab._IMPORTS_FILE_CACHE) == [os.path.abspath(f) for f in files[2:]]
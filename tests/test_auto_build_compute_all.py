@@ -0,0 +1,131 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Ague Samuel Amen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the shared-detection, parallel compute_for_all."""
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from Core.Auto_Command_Builder import auto_build as ab
+
+ENGINES = ("eng_a", "eng_b", "eng_c")
+
+
+class _Gui:
+    def __init__(self, workspace: Path):
+        self.workspace_dir = str(workspace)
+        self.python_files = [str(workspace / "main.py")]
+        self.selected_files = []
+        self.logs = []
+        self.log_threads = set()
+
+
+@pytest.fixture
+def gui(tmp_path: Path, monkeypatch):
+    mapping = tmp_path / "mapping.json"
+    mapping.write_text(
+        json.dumps(
+            {
+                "numpy": {e: [f"--{e}-{{import_name}}"] for e in ENGINES},
+                "lxml": {"eng_b": "--lxml"},
+            }
+        ),
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("PYCOMPILER_MAPPING", str(mapping))
+    monkeypatch.setenv("PYCOMPILER_MAPPING_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.delenv("PYCOMPILER_REQ_FILES", raising=False)
+    ws = tmp_path / "ws"
+    ws.mkdir()
+    (ws / "main.py").write_text("import numpy\nimport lxml\n", encoding="utf-8")
+    g = _Gui(ws)
+
+    def _log(gui_, level, msg, **kw):
+        g.logs.append(msg)
+        g.log_threads.add(threading.current_thread().name)
+
+    monkeypatch.setattr(ab, "log_with_level", _log)
+    monkeypatch.setattr(
+        ab, "log_i18n_level", lambda gui_, level, fr, en, **kw: _log(gui_, level, en)
+    )
+    ab.clear_auto_args_cache()
+    yield g
+    ab.clear_auto_args_cache()
+
+
+def test_single_detection_and_parallel_builders(gui, monkeypatch) -> None:
+    detect_calls = []
+    real_detect = ab._detect_modules_preferring_requirements
+
+    def _detect(self):
+        detect_calls.append(1)
+        return real_detect(self)
+
+    monkeypatch.setattr(ab, "_detect_modules_preferring_requirements", _detect)
+
+    builder_threads = set()
+    barrier = threading.Barrier(len(ENGINES), timeout=5)
+
+    def _make(engine_id):
+        def _builder(matched, pkg_to_import):
+            builder_threads.add(threading.current_thread().name)
+            # Tous les builders tournent en même temps
+            barrier.wait()
+            return [f"--{engine_id}-" + ",".join(sorted(matched))]
+
+        return _builder
+
+    for e in ENGINES:
+        monkeypatch.setitem(ab._ENGINE_BUILDERS, e, _make(e))
+
+    results = ab.compute_for_all(gui, list(ENGINES))
+    assert list(results) == list(ENGINES)
+    assert results["eng_a"] == ["--eng_a-lxml,numpy"]
+    assert results["eng_b"] == ["--eng_b-lxml,numpy"]
+    assert len(detect_calls) == 1
+    assert len(builder_threads) == len(ENGINES)
+    assert threading.current_thread().name not in builder_threads
+    # Logs rejoués dans le thread appelant, groupés par moteur dans l'ordre
+    assert gui.log_threads == {threading.current_thread().name}
+    firsts = [next(i for i, m in enumerate(gui.logs) if f"({e})" in m) for e in ENGINES]
+    assert firsts == sorted(firsts)
+
+
+def test_generic_builder_results_match_single_engine(gui) -> None:
+    together = ab.compute_for_all(gui, list(ENGINES))
+    ab.clear_auto_args_cache()
+    alone = {e: ab.compute_auto_for_engine(gui, e) for e in ENGINES}
+    assert together == alone
+    assert together["eng_b"] in (
+        ["--eng_b-numpy", "--lxml"],
+        ["--lxml", "--eng_b-numpy"],
+    )
+
+
+def test_mappings_are_loaded_serially_in_caller_thread(gui, monkeypatch) -> None:
+    load_threads = []
+    real_load = ab._load_engine_package_mapping
+
+    def _load(engine_id):
+        load_threads.append(threading.current_thread().name)
+        return real_load(engine_id)
+
+    monkeypatch.setattr(ab, "_load_engine_package_mapping", _load)
+    ab.compute_for_all(gui, list(ENGINES))
+    assert load_threads == [threading.current_thread().name] * len(ENGINES)
@@ -0,0 +1,150 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Ague Samuel Amen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the precompiled engine mapping index."""
+
+import json
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+
+from Core.Auto_Command_Builder import auto_build as ab
+from Core.Auto_Command_Builder import mapping_index as mi
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path: Path, monkeypatch):
+    d = tmp_path / "cache"
+    monkeypatch.setenv("PYCOMPILER_MAPPING_CACHE_DIR", str(d))
+    return d
+
+
+def _write(path: Path, data) -> Path:
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+def test_compile_builds_index_aliases_and_templates(tmp_path: Path):
+    p = _write(
+        tmp_path / "mapping.json",
+        {
+            "__aliases__": {
+                "import_to_package": {"cv2": "opencv-python"},
+                "package_to_import_name": {"opencv-python": "cv2"},
+            },
+            "opencv-python": {"eng": "--include-module={import_name}"},
+            "Scikit_Learn": {"eng": {"args": ["--pkg", "{import_name}.x"]}},
+            "numpy": {"engines": {"eng": ["--collect {import_name}"], "other": True}},
+        },
+    )
+    cm = mi.compile_mapping_file(str(p))
+    assert set(cm) == {"opencv-python", "Scikit_Learn", "numpy"}
+    assert "__aliases__" in cm.specials
+    assert cm.index["scikit-learn"] == "Scikit_Learn"
+    assert cm.import_to_package == {"cv2": "opencv-python"}
+    assert cm.templates["eng"]["opencv-python"] == (("--include-module=", ""),)
+    assert cm.templates["eng"]["numpy"] == (("--collect ", ""),)
+    assert "other" not in cm.templates
+    assert cm.warnings == ()
+
+
+def test_schema_errors_become_warnings(tmp_path: Path):
+    p = _write(tmp_path / "mapping.json", {"numpy": {"eng": 3}, "bad": "x"})
+    cm = mi.compile_mapping_file(str(p))
+    assert list(cm) == ["numpy"]
+    assert any("Invalid mapping file" in w for w in cm.warnings)
+    assert any("'bad'" in w for w in cm.warnings)
+
+
+def test_disk_cache_is_reused_by_content_digest(tmp_path: Path, cache_dir, monkeypatch):
+    data = {"numpy": {"eng": ["--collect {import_name}"]}}
+    first = mi.compile_mapping_file(str(_write(tmp_path / "a.json", data)))
+    assert (cache_dir / f"{first.digest}.json").is_file()
+
+    def _boom(*a, **k):
+        raise AssertionError("recompiled")
+
+    monkeypatch.setattr(mi, "_compile_payload", _boom)
+    # Même contenu, autre fichier: relu depuis le cache disque
+    second = mi.compile_mapping_file(str(_write(tmp_path / "b.json", data)))
+    assert second.digest == first.digest
+    assert dict(second.templates["eng"]) == dict(first.templates["eng"])
+
+
+def test_merge_first_source_wins(tmp_path: Path):
+    a = mi.compile_mapping_file(
+        str(_write(tmp_path / "a.json", {"numpy": {"eng": "--a"}}))
+    )
+    b = mi.compile_mapping_file(
+        str(
+            _write(
+                tmp_path / "b.json", {"numpy": {"eng": "--b"}, "lxml": {"eng": "--l"}}
+            )
+        )
+    )
+    merged = mi.merge_mappings([a, b])
+    assert merged["numpy"] == {"eng": "--a"}
+    assert merged.templates_for("eng")["numpy"] == (("--a",),)
+    assert merged.templates_for("eng")["lxml"] == (("--l",),)
+    assert mi.merge_mappings([a, b]) is merged
+
+
+def test_default_builder_uses_templates(tmp_path: Path):
+    p = _write(tmp_path / "m.json", {"Pillow": {"eng": ["--x={import_name}", "--y"]}})
+    idx = mi.merge_mappings([mi.compile_mapping_file(str(p))])
+    matched, pkg_to_import = ab._match_with_requirements_aware({"pillow"}, idx)
+    assert list(matched) == ["Pillow"]
+    build = ab._default_builder_for_engine("eng", idx.templates_for("eng"))
+    assert build(matched, {"Pillow": "PIL"}) == ["--x=PIL", "--y"]
+
+
+def test_engines_mappings_are_valid_and_cli_precompiles(
+    tmp_path: Path, cache_dir, capsys
+):
+    results = mi.precompile_engines()
+    assert results
+    for path, compiled, error in results:
+        assert error is None, path
+        assert compiled.warnings == (), compiled.warnings
+
+    engines = tmp_path / "engines"
+    (engines / "good").mkdir(parents=True)
+    _write(engines / "good" / "mapping.json", {"numpy": {"good": "--n"}})
+    assert mi.main(["--engines-dir", str(engines), "--check"]) == 0
+    assert "[OK]" in capsys.readouterr().out
+
+    (engines / "bad").mkdir()
+    _write(engines / "bad" / "mapping.json", {"numpy": {"bad": 1}})
+    assert mi.main(["--engines-dir", str(engines)]) == 0
+    assert mi.main(["--engines-dir", str(engines), "--check"]) == 1
+    assert "[WARN]" in capsys.readouterr().out
+
+
+def test_memory_caches_are_bounded(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(mi, "_CACHE_MAX", 3)
+    for name in ("_by_stat", "_by_digest", "_merged"):
+        monkeypatch.setattr(mi, name, OrderedDict())
+    first = None
+    for i in range(6):
+        p = _write(tmp_path / f"mapping{i}.json", {f"pkg{i}": {"eng": "--x"}})
+        cm = mi.compile_mapping_file(str(p), use_disk_cache=False)
+        first = first or cm
+        mi.merge_mappings([cm])
+        # Utilisé à chaque tour: le premier index fusionné n'est pas évincé
+        hot = mi.merge_mappings([first])
+    assert len(mi._by_stat) == len(mi._by_digest) == len(mi._merged) == 3
+    assert mi.merge_mappings([first]) is hot
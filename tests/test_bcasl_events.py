@@ -0,0 +1,64 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Ague Samuel Amen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the BCASL plugin event channel."""
+
+from pathlib import Path
+
+from bcasl import BcPluginBase, PluginMeta
+from bcasl.events import (
+    EventBatcher,
+    emit_log,
+    emit_progress,
+    make_log_relay,
+)
+from bcasl.executor import BCASL
+
+
+def test_event_batcher_groups_events() -> None:
+    batches: list[list[dict]] = []
+    batcher = EventBatcher(batches.append, max_batch=3, interval_s=60.0)
+    for i in range(7):
+        batcher.add({"kind": "log", "i": i})
+    assert [len(b) for b in batches] == [3, 3]
+    batcher.flush()
+    assert [len(b) for b in batches] == [3, 3, 1]
+
+
+def test_log_relay_throttles_progress() -> None:
+    lines: list[str] = []
+    relay = make_log_relay(lines.append)
+    for i in range(1, 101):
+        relay({"kind": "progress", "plugin_id": "p", "value": i, "maximum": 100})
+    relay({"kind": "resource", "plugin_id": "p", "cpu_user_s": 1.0})
+    assert len(lines) == 11
+    assert lines[-1].startswith("[p] ⏳ 100%")
+
+
+class _Chatty(BcPluginBase):
+    def on_pre_compile(self, ctx) -> None:
+        emit_progress(1, 2, "half")
+        emit_log("hello")
+
+
+def test_in_process_plugin_events_reach_callback(tmp_path: Path) -> None:
+    events: list[dict] = []
+    mgr = BCASL(tmp_path, config={}, sandbox=False, event_cb=events.append)
+    mgr.add_plugin(_Chatty(PluginMeta(id="chatty", name="Chatty", version="1")))
+    assert mgr.run_pre_compile().ok
+    assert [e["kind"] for e in events] == ["progress", "log"]
+    assert all(e["plugin_id"] == "chatty" for e in events)
+    emit_log("after run")  # no sink installed anymore
+    assert len(events) == 2
@@ -0,0 +1,66 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Ague Samuel Amen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for PreCompileContext.iter_files and compiled glob patterns."""
+
+from pathlib import Path
+
+from bcasl.Base import PreCompileContext
+from bcasl.pathmatch import compile_matcher
+
+
+def _touch(root: Path, rel: str) -> None:
+    p = root / rel
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_text("", encoding="utf-8")
+
+
+def _rel(root: Path, paths) -> list[str]:
+    return sorted(p.relative_to(root).as_posix() for p in paths)
+
+
+def test_iter_files_include_exclude(tmp_path: Path) -> None:
+    for rel in (
+        "main.py",
+        "src/a.py",
+        "src/pkg/b.py",
+        "src/pkg/c.txt",
+        "venv/lib/x.py",
+        "src/__pycache__/a.py",
+    ):
+        _touch(tmp_path, rel)
+    ctx = PreCompileContext(tmp_path)
+    files = ctx.iter_files(["**/*.py"], ["venv/**", "**/__pycache__/**"])
+    assert _rel(tmp_path, files) == ["main.py", "src/a.py", "src/pkg/b.py"]
+
+
+def test_iter_files_dedups_overlapping_patterns(tmp_path: Path) -> None:
+    _touch(tmp_path, "src/a.py")
+    ctx = PreCompileContext(tmp_path, config={"options": {"iter_files_cache": False}})
+    files = list(ctx.iter_files(["**/*.py", "src/*.py"]))
+    assert _rel(tmp_path, files) == ["src/a.py"]
+
+
+def test_compiled_patterns_semantics() -> None:
+    inc = compile_matcher(("**/*.py", "src/**/*.c"), anchored=True)
+    exc = compile_matcher(("*.pyc", "/build/**"), anchored=False)
+    assert inc.matches("main.py")
+    assert inc.matches("a/b/c.py")
+    assert inc.matches("src/x/y.c")
+    assert not inc.matches("lib/y.c")
+    assert exc.matches("a/b.pyc")
+    assert exc.prune_dir("build")
+    assert not exc.prune_dir("src/build")
+    assert not exc.prune_dir("src")
@@ -0,0 +1,153 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Ague Samuel Amen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the cached BCASL plugin manifest."""
+
+import sys
+import threading
+from pathlib import Path
+
+from bcasl.executor import BCASL, _DeferredPlugin
+from bcasl.Loader import _discover_bcasl_meta
+from bcasl.manifest import MANIFEST_FILENAME, PluginManifestCache
+from EngineLoader.manifest import EngineManifestCache
+
+_PLUGIN_SRC = """
+from pathlib import Path
+from bcasl import BcPluginBase, PluginMeta, bc_register
+
+@bc_register
+class Marker(BcPluginBase):
+    meta = PluginMeta(id="marker", name="Marker", version="1.2.3", tags=["check"])
+
+    def on_pre_compile(self, ctx) -> None:
+        (Path(ctx.project_root) / "ran.txt").write_text("ok", encoding="utf-8")
+"""
+
+
+def _make_plugins_dir(tmp_path: Path) -> Path:
+    plugins = tmp_path / "Plugins"
+    pkg = plugins / "Marker"
+    pkg.mkdir(parents=True)
+    (pkg / "__init__.py").write_text(_PLUGIN_SRC, encoding="utf-8")
+    return plugins
+
+
+def test_discover_meta_uses_manifest_without_import(tmp_path: Path) -> None:
+    plugins = _make_plugins_dir(tmp_path)
+    meta = _discover_bcasl_meta(plugins)
+    assert meta["marker"]["version"] == "1.2.3"
+    assert meta["marker"]["tags"] == ["check"]
+    assert (plugins / MANIFEST_FILENAME).is_file()
+
+    sys.modules.pop("bcasl_Plugins_Marker", None)
+    again = _discover_bcasl_meta(plugins)
+    assert again == meta
+    assert "bcasl_Plugins_Marker" not in sys.modules
+
+
+def test_deferred_plugin_imports_on_run(tmp_path: Path) -> None:
+    plugins = _make_plugins_dir(tmp_path)
+    _discover_bcasl_meta(plugins)
+    workspace = tmp_path / "ws"
+    workspace.mkdir()
+
+    mgr = BCASL(workspace, config={}, sandbox=False)
+    loaded, errors = mgr.load_plugins_from_directory(plugins)
+    assert (loaded, errors) == (1, [])
+    assert isinstance(mgr._registry["marker"].plugin, _DeferredPlugin)
+
+    report = mgr.run_pre_compile()
+    assert report.ok
+    assert (workspace / "ran.txt").read_text(encoding="utf-8") == "ok"
+
+
+def test_manifest_invalidated_on_change(tmp_path: Path) -> None:
+    plugins = _make_plugins_dir(tmp_path)
+    _discover_bcasl_meta(plugins)
+    init = plugins / "Marker" / "__init__.py"
+    init.write_text(_PLUGIN_SRC.replace("1.2.3", "2.0.0") + "\n", encoding="utf-8")
+    assert _discover_bcasl_meta(plugins)["marker"]["version"] == "2.0.0"
+
+
+def test_plugin_and_engine_caches_share_one_implementation(tmp_path: Path) -> None:
+    plugins = _make_plugins_dir(tmp_path)
+    pkg = plugins / "Marker"
+    bc = PluginManifestCache.for_directory(plugins)
+    eng = EngineManifestCache.for_directory(plugins)
+    assert bc is PluginManifestCache.for_directory(plugins)
+    assert bc is not eng
+
+    bc.store(pkg, [{"id": "marker"}])
+    eng.store(pkg, [{"id": "engine", "tab": False}])
+    bc.save()
+    eng.save()
+    assert PluginManifestCache(plugins).lookup(pkg) == [{"id": "marker"}]
+    assert EngineManifestCache(plugins).lookup(pkg) == [
+        {"id": "engine", "name": "engine", "version": "1.0.0", "tab": False}
+    ]
+
+
+_TWO_PLUGINS_SRC = """
+from pathlib import Path
+from bcasl import BcPluginBase, PluginMeta, bc_register
+
+# Hors du package: son empreinte reste inchangée
+_log = Path(__file__).parents[2] / "imports.log"
+_log.write_text(_log.read_text() + "x" if _log.exists() else "x")
+
+@bc_register
+class First(BcPluginBase):
+    meta = PluginMeta(id="first", name="First", version="1.0.0")
+
+    def on_pre_compile(self, ctx) -> None:
+        pass
+
+@bc_register
+class Second(BcPluginBase):
+    meta = PluginMeta(id="second", name="Second", version="1.0.0")
+
+    def on_pre_compile(self, ctx) -> None:
+        pass
+"""
+
+
+def test_deferred_plugins_share_one_package_import(tmp_path: Path) -> None:
+    plugins = tmp_path / "Plugins"
+    pkg = plugins / "Pair"
+    pkg.mkdir(parents=True)
+    (pkg / "__init__.py").write_text(_TWO_PLUGINS_SRC, encoding="utf-8")
+    _discover_bcasl_meta(plugins)
+    log = tmp_path / "imports.log"
+    log.unlink()
+
+    mgr = BCASL(tmp_path, config={}, sandbox=False)
+    assert mgr.load_plugins_from_directory(plugins) == (2, [])
+    deferred = [mgr._registry[pid].plugin for pid in ("first", "second")]
+    assert all(isinstance(p, _DeferredPlugin) for p in deferred)
+    assert not log.exists()
+
+    out: list = []
+    threads = [
+        threading.Thread(target=lambda p=p: out.append(p.resolve(tmp_path)))
+        for p in deferred * 4
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert log.read_text() == "x"
+    assert {p.meta.id for p in out} == {"first", "second"}
+    assert len({id(p) for p in out}) == 2
@@ -0,0 +1,64 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Ague Samuel Amen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for BCASL execution report resource accounting."""
+
+from pathlib import Path
+
+from bcasl import BcPluginBase, PluginMeta
+from bcasl.Base import ExecutionItem, ExecutionReport
+from bcasl.executor import BCASL
+
+
+def test_summary_includes_resources_and_top_consumer() -> None:
+    rep = ExecutionReport()
+    rep.add(ExecutionItem("a", "A", True, 10.0, cpu_user_s=1.0, max_rss_kb=2048))
+    rep.add(ExecutionItem("b", "B", True, 5.0, cpu_user_s=3.0, cpu_sys_s=0.5))
+    text = rep.summary()
+    assert "CPU total 4.50s" in text
+    assert "max: b 3.50s" in text
+    assert "RSS max 2.0 MiB" in text
+    assert [i.plugin_id for i in rep.top_consumers(2)] == ["b", "a"]
+
+
+def test_summary_without_measurements_is_unchanged() -> None:
+    rep = ExecutionReport()
+    rep.add(ExecutionItem("a", "A", True, 1.0))
+    assert rep.summary() == "Plugins: 1/1 ok, 0 échec(s), temps total 1.0 ms"
+    assert rep.items[0].resources_label() == ""
+
+
+class _Busy(BcPluginBase):
+    def on_pre_compile(self, ctx) -> None:
+        (Path(ctx.project_root) / "out.bin").write_bytes(b"x" * 4096)
+
+
+def test_in_process_run_records_usage(tmp_path: Path) -> None:
+    mgr = BCASL(tmp_path, config={}, sandbox=False)
+    mgr.add_plugin(_Busy(PluginMeta(id="busy", name="Busy", version="1")))
+    item = mgr.run_pre_compile().items[0]
+    assert item.success
+    assert item.cpu_s >= 0
+    if Path("/proc/thread-self/io").exists():
+        assert item.write_bytes >= 4096
+    # Pic RSS de l'hôte (toute la session): non attribué à un plugin
+    assert item.max_rss_kb == 0
+
+
+def test_report_line() -> None:
+    ok = ExecutionItem("a", "A", True, 1.25, cpu_user_s=1.0, max_rss_kb=2048)
+    assert ok.report_line() == "a: OK (1.2 ms, cpu 1.00s+0.00s, rss 2.0 MiB)"
+    ko = ExecutionItem("b", "B", False, 3.0, error="boom")
+    assert ko.report_line(ko.name, "✓ OK", "✗ FAIL") == "B: ✗ FAIL: boom (3.0 ms)"
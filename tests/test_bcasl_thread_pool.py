@@ -0,0 +1,103 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Ague Samuel Amen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the in-process thread-pool execution mode of BCASL."""
+
+import threading
+import time
+from pathlib import Path
+
+from bcasl import BcPluginBase, PluginMeta
+from bcasl.events import emit_log
+from bcasl.executor import BCASL
+
+_CFG = {"options": {"sandbox": False, "thread_pool": True, "plugin_parallelism": 4}}
+
+
+class _Sleeper(BcPluginBase):
+    def __init__(self, pid: str, log: list, delay: float = 0.2, requires=()) -> None:
+        super().__init__(PluginMeta(id=pid, name=pid, version="1"), requires=requires)
+        self.log = log
+        self.delay = delay
+
+    def on_pre_compile(self, ctx) -> None:
+        self.log.append(("start", self.meta.id, threading.get_ident()))
+        emit_log(f"hello from {self.meta.id}")
+        time.sleep(self.delay)
+        self.log.append(("end", self.meta.id, threading.get_ident()))
+
+
+def test_independent_plugins_overlap_and_dag_is_respected(tmp_path: Path) -> None:
+    log: list = []
+    events: list = []
+    mgr = BCASL(tmp_path, config=_CFG, event_cb=events.append)
+    mgr.add_plugin(_Sleeper("a", log))
+    mgr.add_plugin(_Sleeper("b", log))
+    mgr.add_plugin(_Sleeper("c", log, delay=0.0, requires=("a", "b")))
+
+    report = mgr.run_pre_compile()
+
+    assert report.ok and len(report.items) == 3
+    pos = {(k, pid): i for i, (k, pid, _t) in enumerate(log)}
+    # a et b en parallèle: chacun démarre avant la fin de l'autre
+    assert pos[("start", "b")] < pos[("end", "a")]
+    assert pos[("start", "a")] < pos[("end", "b")]
+    assert pos[("start", "c")] > pos[("end", "a")]
+    assert pos[("start", "c")] > pos[("end", "b")]
+    # Chaque événement est attribué au plugin qui l'a émis
+    assert sorted(e["plugin_id"] for e in events if e["kind"] == "log") == [
+        "a",
+        "b",
+        "c",
+    ]
+    for e in events:
+        assert e["message"] == f"hello from {e['plugin_id']}"
+
+
+def test_events_are_delivered_on_caller_thread(tmp_path: Path) -> None:
+    log: list = []
+    threads: list = []
+    mgr = BCASL(
+        tmp_path,
+        config=_CFG,
+        event_cb=lambda ev: threads.append(threading.get_ident()),
+    )
+    mgr.add_plugin(_Sleeper("a", log, delay=0.05))
+    mgr.add_plugin(_Sleeper("b", log, delay=0.05))
+    assert mgr.run_pre_compile().ok
+    # Plugins exécutés dans le pool, événements relayés dans ce thread
+    assert threading.get_ident() not in {t for _k, _p, t in log}
+    assert len(threads) >= 2 and set(threads) == {threading.get_ident()}
+
+
+def test_timeout_marks_plugin_failed_and_releases_dependents(tmp_path: Path) -> None:
+    log: list = []
+    mgr = BCASL(tmp_path, config=_CFG, plugin_timeout_s=0.1)
+    mgr.add_plugin(_Sleeper("slow", log, delay=0.5))
+    mgr.add_plugin(_Sleeper("after", log, delay=0.0, requires=("slow",)))
+    report = mgr.run_pre_compile()
+    by_id = {i.plugin_id: i for i in report.items}
+    assert not by_id["slow"].success and "timeout" in by_id["slow"].error
+    assert by_id["after"].success
+    time.sleep(0.5)  # laisser le thread abandonné se terminer
+
+
+def test_without_option_runs_sequentially_on_caller_thread(tmp_path: Path) -> None:
+    log: list = []
+    mgr = BCASL(tmp_path, config={"options": {"sandbox": False}})
+    mgr.add_plugin(_Sleeper("a", log, delay=0.0))
+    mgr.add_plugin(_Sleeper("b", log, delay=0.0))
+    assert mgr.run_pre_compile().ok
+    assert {t for _k, _p, t in log} == {threading.get_ident()}
@@ -0,0 +1,230 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Ague Samuel Amen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for manifest-driven lazy engine discovery and lazy engine tabs."""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from EngineLoader import registry
+from EngineLoader.Loader.EngineLoader import _discover_external_plugins
+from EngineLoader.manifest import MANIFEST_FILENAME, EngineManifestCache
+
+_ENGINE_SRC = """
+from EngineLoader.base import CompilerEngine
+from EngineLoader.registry import engine_register
+
+
+@engine_register
+class Engine(CompilerEngine):
+    id = "{eid}"
+    name = "{name}"
+    version = "2.0.0"
+
+    def create_tab(self, gui):
+        from PySide6.QtWidgets import QWidget
+
+        self.tab = QWidget()
+        return self.tab, "{name}"
+"""
+
+
+@pytest.fixture
+def engines_dir(tmp_path: Path, monkeypatch):
+    for attr, value in (
+        ("_REGISTRY", {}),
+        ("_ORDER", []),
+        ("_TAB_INDEX", {}),
+        ("_INSTANCES", {}),
+        ("_LAZY", {}),
+        ("_LAZY_LOADERS", {}),
+        ("_TAB_WIDGETS", {}),
+        ("_PENDING_TABS", set()),
+    ):
+        monkeypatch.setattr(registry, attr, value)
+    monkeypatch.setattr(EngineManifestCache, "_instances", {})
+    monkeypatch.delenv("ARK_ENGINES_LAZY", raising=False)
+    base = tmp_path / "ENGINES"
+    for pkg, name in (("lazy_eng_alpha", "Alpha"), ("lazy_eng_beta", "Beta")):
+        (base / pkg).mkdir(parents=True)
+        (base / pkg / "__init__.py").write_text(
+            _ENGINE_SRC.format(eid=pkg, name=name), encoding="utf-8"
+        )
+    yield base
+    if str(base) in sys.path:
+        sys.path.remove(str(base))
+    for mod in ("lazy_eng_alpha", "lazy_eng_beta"):
+        sys.modules.pop(mod, None)
+
+
+def _restart(monkeypatch) -> None:
+    """Simulate a new session: empty registry, modules and manifest instances."""
+    registry.unload_all()
+    monkeypatch.setattr(EngineManifestCache, "_instances", {})
+    for mod in ("lazy_eng_alpha", "lazy_eng_beta"):
+        sys.modules.pop(mod, None)
+
+
+def test_manifest_defers_imports(engines_dir: Path, monkeypatch) -> None:
+    _discover_external_plugins(str(engines_dir))
+    assert registry.available_engines() == ["lazy_eng_alpha", "lazy_eng_beta"]
+    assert "lazy_eng_alpha" in sys.modules
+    assert (engines_dir / MANIFEST_FILENAME).is_file()
+
+    _restart(monkeypatch)
+    _discover_external_plugins(str(engines_dir))
+    assert registry.available_engines() == ["lazy_eng_alpha", "lazy_eng_beta"]
+    assert "lazy_eng_alpha" not in sys.modules
+    assert registry.engine_info("lazy_eng_beta") == {
+        "id": "lazy_eng_beta",
+        "name": "Beta",
+        "version": "2.0.0",
+    }
+
+    cls = registry.get_engine("lazy_eng_alpha")
+    assert cls is not None and cls.name == "Alpha"
+    assert registry.is_loaded("lazy_eng_alpha")
+    assert not registry.is_loaded("lazy_eng_beta")
+    assert registry.available_engines() == ["lazy_eng_alpha", "lazy_eng_beta"]
+
+
+def test_changed_package_is_reimported(engines_dir: Path, monkeypatch) -> None:
+    _discover_external_plugins(str(engines_dir))
+    _restart(monkeypatch)
+    init = engines_dir / "lazy_eng_beta" / "__init__.py"
+    init.write_text(init.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    os.utime(init, ns=(1, 1))
+    _discover_external_plugins(str(engines_dir))
+    assert "lazy_eng_alpha" not in sys.modules
+    assert "lazy_eng_beta" in sys.modules
+
+
+def test_static_manifest_and_eager_mode(engines_dir: Path, monkeypatch) -> None:
+    (engines_dir / "lazy_eng_alpha" / "engine.json").write_text(
+        json.dumps({"id": "lazy_eng_alpha", "name": "Alpha", "version": "2.0.0"}),
+        encoding="utf-8",
+    )
+    _discover_external_plugins(str(engines_dir))
+    assert "lazy_eng_alpha" not in sys.modules
+    assert "lazy_eng_beta" in sys.modules
+
+    _restart(monkeypatch)
+    monkeypatch.setenv("ARK_ENGINES_LAZY", "0")
+    _discover_external_plugins(str(engines_dir))
+    assert "lazy_eng_alpha" in sys.modules
+
+
+def test_tabs_built_on_first_activation(engines_dir: Path, monkeypatch) -> None:
+    pytest.importorskip("PySide6")
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication, QTabWidget
+
+    app = QApplication.instance() or QApplication([])
+    _discover_external_plugins(str(engines_dir))
+    _restart(monkeypatch)
+    _discover_external_plugins(str(engines_dir))
+
+    class _Gui:
+        compiler_tabs = QTabWidget()
+        workspace_dir = None
+
+    gui = _Gui()
+    registry.bind_tabs(gui)
+    tabs = gui.compiler_tabs
+    assert [tabs.tabText(i) for i in range(tabs.count())] == ["Alpha", "Beta"]
+    # Onglet courant construit, l'autre reste un placeholder non importé
+    assert registry.get_instance("lazy_eng_alpha") is not None
+    assert registry.get_instance("lazy_eng_beta") is None
+    assert "lazy_eng_beta" not in sys.modules
+
+    tabs.setCurrentIndex(1)
+    beta = registry.get_instance("lazy_eng_beta")
+    assert beta is not None and "lazy_eng_beta" in sys.modules
+    assert registry.get_engine_for_tab(1) == "lazy_eng_beta"
+    assert tabs.widget(1).isAncestorOf(beta.tab)
+    assert registry.ensure_tab(gui, "lazy_eng_beta") is beta
+    tabs.deleteLater()
+    app.processEvents()
+
+
+def test_engines_without_tab_get_no_placeholder(engines_dir: Path, monkeypatch) -> None:
+    pytest.importorskip("PySide6")
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication, QTabWidget, QWidget
+
+    app = QApplication.instance() or QApplication([])
+    (engines_dir / "lazy_eng_beta" / "engine.json").write_text(
+        json.dumps({"id": "lazy_eng_beta", "name": "Beta", "tab": False}),
+        encoding="utf-8",
+    )
+    _discover_external_plugins(str(engines_dir))
+    manifest = json.loads((engines_dir / MANIFEST_FILENAME).read_text("utf-8"))
+    assert manifest["packages"]["lazy_eng_alpha"]["engines"][0]["tab"] is True
+    assert registry.has_tab("lazy_eng_alpha") and not registry.has_tab("lazy_eng_beta")
+
+    class _Gui:
+        compiler_tabs = QTabWidget()
+        tab_hello = QWidget()
+        workspace_dir = None
+
+    gui = _Gui()
+    gui.compiler_tabs.addTab(gui.tab_hello, "Hello")
+    registry.bind_tabs(gui)
+    tabs = gui.compiler_tabs
+    assert [tabs.tabText(i) for i in range(tabs.count())] == ["Hello", "Alpha"]
+    assert not tabs.isTabVisible(0)
+    assert "lazy_eng_beta" not in sys.modules
+
+    # Onglet déclaré mais jamais produit: le Hello réapparaît
+    registry.unload_all()
+    registry.register_lazy(
+        {"id": "lazy_eng_beta", "tab": True}, "lazy_eng_beta", lambda: None
+    )
+    monkeypatch.setenv("ARK_ENGINES_LAZY", "0")
+    tabs.removeTab(1)
+    registry.bind_tabs(gui)
+    assert tabs.count() == 1 and tabs.isTabVisible(0)
+    tabs.deleteLater()
+    app.processEvents()
+
+
+def test_warm_up_does_not_import_lazy_engines(engines_dir: Path, monkeypatch) -> None:
+    from EngineLoader.readiness import ToolchainReadiness
+
+    _discover_external_plugins(str(engines_dir))
+    _restart(monkeypatch)
+    _discover_external_plugins(str(engines_dir))
+    assert registry.get_instance("lazy_eng_alpha") is None
+    assert ToolchainReadiness().warm_up(object()) == {}
+    assert "lazy_eng_alpha" not in sys.modules
+    assert "lazy_eng_beta" not in sys.modules
+
+    # Seul le moteur sélectionné est importé pour la vérification
+    class _Tabs:
+        def currentIndex(self) -> int:
+            return 1
+
+    class _Gui:
+        compiler_tabs = _Tabs()
+
+    registry._TAB_INDEX["lazy_eng_beta"] = 1
+    out = ToolchainReadiness().warm_up(_Gui())
+    assert sorted(out) == ["lazy_eng_beta"]
+    assert "lazy_eng_alpha" not in sys.modules
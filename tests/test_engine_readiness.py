@@ -0,0 +1,256 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Ague Samuel Amen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the session toolchain readiness service of EngineLoader."""
+
+import pytest
+
+from EngineLoader import readiness as rd
+from EngineLoader.base import CompilerEngine
+
+
+class _Engine(CompilerEngine):
+    id = "fake"
+    name = "Fake"
+
+    def __init__(self, python=("faketool",), system=()):
+        self._tools = {"python": list(python), "system": list(system)}
+
+    @property
+    def required_tools(self):
+        return self._tools
+
+
+class _VenvManager:
+    def __init__(self, installed=()):
+        self.installed = set(installed)
+        self.checks = 0
+        self.pending = []
+
+    def resolve_project_venv(self):
+        return "/fake/venv"
+
+    def is_tool_installed(self, venv, tool):
+        self.checks += 1
+        return tool in self.installed
+
+    def ensure_tools_installed(self, venv, tools, on_done=None):
+        self.pending.append((list(tools), on_done))
+
+
+class _Signal:
+    def __init__(self):
+        self._slots = []
+
+    def connect(self, slot):
+        self._slots.append(slot)
+
+    def emit(self, *args):
+        for slot in list(self._slots):
+            slot(*args)
+
+
+class _Process:
+    def __init__(self):
+        self.finished = _Signal()
+        self.errorOccurred = _Signal()
+
+
+class _SysDeps:
+    def __init__(self):
+        self.process = _Process()
+        self.calls = []
+
+    def install_packages_linux(self, packages):
+        self.calls.append(list(packages))
+        return self.process
+
+
+class _Gui:
+    def __init__(self, vm):
+        self.venv_manager = vm
+        self.sys_deps_manager = _SysDeps()
+        self.log = None
+
+
+@pytest.fixture
+def service():
+    return rd.ToolchainReadiness()
+
+
+def test_ready_toolchain_is_checked_once(service) -> None:
+    gui = _Gui(_VenvManager(installed={"faketool"}))
+    eng = _Engine()
+    for _ in range(50):
+        fut = service.ensure(eng, gui)
+        assert fut.done() and fut.result() is True
+    assert gui.venv_manager.checks == 1
+    assert eng.ensure_tools_installed(gui) is True
+
+
+def test_python_install_resolves_future_without_blocking(service) -> None:
+    vm = _VenvManager()
+    gui = _Gui(vm)
+    eng = _Engine()
+    fut = service.ensure(eng, gui)
+    assert not fut.done()
+    # Un second appelant (fichier suivant) partage l'installation en cours
+    assert service.ensure(eng, gui) is fut
+    assert len(vm.pending) == 1
+    tools, on_done = vm.pending[0]
+    assert tools == ["faketool"]
+
+    seen = []
+    fut.add_done_callback(lambda f: seen.append(f.result()))
+    on_done(True)
+    assert seen == [True]
+    checks = vm.checks
+    assert service.ensure(eng, gui).result() is True
+    assert vm.checks == checks
+
+
+def test_system_install_waits_on_process_signal(service, monkeypatch) -> None:
+    monkeypatch.setattr(rd.platform, "system", lambda: "Linux")
+    pytest.importorskip("PySide6")
+    import Core.sys_deps as sys_deps
+
+    monkeypatch.setattr(
+        sys_deps, "detect_system_packages", lambda pkgs: {p: False for p in pkgs}
+    )
+    gui = _Gui(_VenvManager(installed={"faketool"}))
+    eng = _Engine(system=("patchelf",))
+
+    fut = service.ensure(eng, gui)
+    assert gui.sys_deps_manager.calls == [["patchelf"]]
+    assert not fut.done()
+    gui.sys_deps_manager.process.finished.emit(1, None)
+    assert fut.result() is False
+
+    # Échec non mémorisé: une nouvelle tentative relance l'installation
+    fut2 = service.ensure(eng, gui)
+    assert fut2 is not fut and len(gui.sys_deps_manager.calls) == 2
+    gui.sys_deps_manager.process.finished.emit(0, None)
+    assert fut2.result() is True
+
+
+def test_pending_install_is_not_reported_ready(service, monkeypatch) -> None:
+    monkeypatch.setattr(rd, "_readiness", service)
+    vm = _VenvManager()
+    gui = _Gui(vm)
+    eng = _Engine()
+    assert eng.ensure_tools_installed(gui) is False
+    vm.pending[0][1](True)
+    assert eng.ensure_tools_installed(gui) is True
+
+
+def test_process_failing_to_start_releases_pending(service, monkeypatch) -> None:
+    monkeypatch.setattr(rd.platform, "system", lambda: "Linux")
+    pytest.importorskip("PySide6")
+    from PySide6.QtCore import QProcess
+
+    import Core.sys_deps as sys_deps
+
+    monkeypatch.setattr(
+        sys_deps, "detect_system_packages", lambda pkgs: {p: False for p in pkgs}
+    )
+    gui = _Gui(_VenvManager(installed={"faketool"}))
+    eng = _Engine(system=("patchelf",))
+
+    fut = service.ensure(eng, gui)
+    gui.sys_deps_manager.process.errorOccurred.emit(QProcess.ProcessError.FailedToStart)
+    assert fut.result() is False
+    assert service.ensure(eng, gui) is not fut
+
+
+def test_install_deadline_resolves_false(service, monkeypatch) -> None:
+    deadlines = []
+    monkeypatch.setattr(rd, "_arm_deadline", lambda t, cb: deadlines.append(cb))
+    vm = _VenvManager()
+    gui = _Gui(vm)
+    eng = _Engine()
+    fut = service.ensure(eng, gui)
+    assert not fut.done() and len(deadlines) == 1
+    deadlines[0]()
+    assert fut.result() is False
+    # L'installation suivante n'est pas bloquée par l'ancien futur
+    fut2 = service.ensure(eng, gui)
+    assert fut2 is not fut and len(vm.pending) == 2
+    # Fin tardive de la première installation: sans effet sur le nouveau futur
+    vm.pending[0][1](False)
+    assert not fut2.done()
+    vm.pending[1][1](True)
+    assert fut2.result() is True
+
+
+def test_venv_manager_tool_installs_have_per_call_callbacks(
+    tmp_path, monkeypatch
+) -> None:
+    pytest.importorskip("PySide6")
+    from Core.Venv_Manager import Manager as mgr_mod
+
+    class _Dialog:
+        def __init__(self, *_a, **_k):
+            self.progress = self
+
+        def __getattr__(self, _name):
+            return lambda *_a, **_k: None
+
+    class _Parent:
+        workspace_dir = None
+
+    monkeypatch.setattr(mgr_mod, "ProgressDialog", _Dialog)
+    vm = mgr_mod.VenvManager(_Parent())
+    steps = []
+    monkeypatch.setattr(
+        vm,
+        "_run_pip_step",
+        lambda venv, pip, args, timeout, on_exit, *_a: steps.append((args, on_exit)),
+    )
+    first, second = [], []
+    vm.ensure_tools_installed(str(tmp_path), ["a"], on_done=first.append)
+    vm.ensure_tools_installed(str(tmp_path), ["b"], on_done=second.append)
+    assert [a for a, _ in steps] == [["show", "a"], ["show", "b"]]
+
+    steps[1][1](0)
+    assert second == [True] and first == []
+    steps[0][1](1)
+    assert steps[2][0] == ["install", "a"]
+    steps[2][1](1)
+    assert first == [False] and second == [True]
+
+
+def test_cache_is_keyed_by_path(service, monkeypatch) -> None:
+    gui = _Gui(_VenvManager(installed={"faketool"}))
+    eng = _Engine()
+    service.ensure(eng, gui)
+    monkeypatch.setenv("PATH", "/elsewhere")
+    service.ensure(eng, gui)
+    assert gui.venv_manager.checks == 2
+
+
+def test_compiler_waits_for_tools_future(monkeypatch) -> None:
+    pytest.importorskip("PySide6")
+    from Core import Compiler
+
+    vm = _VenvManager()
+    gui = _Gui(vm)
+    eng = _Engine()
+    monkeypatch.setattr(rd, "_readiness", rd.ToolchainReadiness())
+    results = []
+    Compiler._when_tools_ready(gui, eng, results.append)
+    assert results == []
+    vm.pending[0][1](True)
+    assert results == [True]
@@ -0,0 +1,135 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Ague Samuel Amen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the Plugins_SDK plugin cache (LRU, TTL, disk tier, counters)."""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from Plugins_SDK.BcPluginContext import Context as sdk
+from Plugins_SDK.BcPluginContext.Context import PluginCache
+
+
+@pytest.fixture(autouse=True)
+def _memory_only_cache(monkeypatch):
+    monkeypatch.delenv(sdk.PLUGIN_CACHE_DIR_ENV, raising=False)
+    sdk.reset_plugin_cache()
+    yield
+    sdk.reset_plugin_cache()
+
+
+def test_lru_eviction_and_counters() -> None:
+    cache = PluginCache(max_entries=2)
+    cache.set("p", "a", 1)
+    cache.set("p", "b", 2)
+    assert cache.get("p", "a") == 1  # a devient le plus récent
+    cache.set("p", "c", 3)
+    assert cache.get("p", "b") is None
+    assert cache.get("p", "c") == 3
+    stats = cache.stats("p")
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (2, 1, 1)
+    assert stats["memory_entries"] == 2
+
+
+def test_size_bound_and_ttl() -> None:
+    cache = PluginCache(max_bytes=4096)
+    cache.set("p", "big1", b"x" * 3000)
+    cache.set("p", "big2", b"y" * 3000)
+    assert cache.get("p", "big1") is None
+    cache.set("p", "short", 1, ttl=0.05)
+    time.sleep(0.1)
+    assert cache.get("p", "short", "gone") == "gone"
+
+
+def test_disk_tier_is_shared_and_namespaced(tmp_path: Path) -> None:
+    writer = PluginCache(tmp_path)
+    writer.set("p1", "k", {"files": [1, 2]})
+    writer.set("p2", "k", "other")
+    writer.set("p1", "memonly", 5, persist=False)
+    writer.close()
+
+    reader = PluginCache(tmp_path)
+    assert reader.get("p1", "k") == {"files": [1, 2]}
+    assert reader.get("p2", "k") == "other"
+    assert reader.get("p1", "memonly") is None
+    assert reader.stats("p1")["disk_hits"] == 1
+    reader.clear("p1")
+    assert reader.get("p1", "k") is None
+    assert reader.get("p2", "k") == "other"
+    reader.close()
+
+
+def test_module_api_follows_cache_dir_env(tmp_path: Path, monkeypatch) -> None:
+    sdk.cache_set("my.plugin", "files", ["a.py"])
+    assert sdk.cache_get("my.plugin", "files") == ["a.py"]
+    assert sdk.cache_stats("my.plugin")["hits"] == 1
+
+    monkeypatch.setenv(sdk.PLUGIN_CACHE_DIR_ENV, str(tmp_path))
+    sdk.cache_set("my.plugin", "files", ["b.py"])
+    assert (tmp_path / sdk.PLUGIN_CACHE_FILENAME).exists()
+    sdk.cache_clear()
+    assert sdk.cache_get("my.plugin", "files", []) == []
+
+
+def test_disk_tier_stores_json_only(tmp_path: Path) -> None:
+    writer = PluginCache(tmp_path)
+    writer.set("p", "tuple", (1, 2))
+    writer.set("p", "obj", object())
+    writer.set("p", "json", {"a": [1, "x", None]})
+    writer.close()
+
+    reader = PluginCache(tmp_path)
+    assert reader.get("p", "tuple") is None
+    assert reader.get("p", "obj") is None
+    assert reader.get("p", "json") == {"a": [1, "x", None]}
+    reader.close()
+
+
+def test_module_api_drops_disk_tier_when_env_unset(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv(sdk.PLUGIN_CACHE_DIR_ENV, str(tmp_path))
+    sdk.cache_set("my.plugin", "k", 1)
+    assert sdk.cache_stats()["disk"] == str(tmp_path)
+    monkeypatch.delenv(sdk.PLUGIN_CACHE_DIR_ENV)
+    assert sdk.cache_stats()["disk"] is None
+
+
+def test_workspace_cache_dir_is_outside_workspace(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    ws = tmp_path / "ws"
+    ws.mkdir()
+    d = sdk.plugin_cache_dir_for(ws)
+    assert ws not in d.parents
+    assert d == sdk.plugin_cache_dir_for(ws)
+    assert d != sdk.plugin_cache_dir_for(tmp_path)
+
+
+def test_executor_resolves_cache_dir_per_workspace(tmp_path: Path, monkeypatch) -> None:
+    from bcasl import executor
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    on = executor._resolve_plugin_cache_dir({}, tmp_path)
+    assert on == str(sdk.plugin_cache_dir_for(tmp_path))
+    off = {"options": {"plugin_cache": False}}
+    assert executor._resolve_plugin_cache_dir(off, tmp_path) is None
+
+    executor._apply_plugin_cache_dir(on)
+    assert sdk.cache_stats()["disk"] == on
+    executor._apply_plugin_cache_dir(None)
+    assert sdk.cache_stats()["disk"] is None
+    assert sdk.PLUGIN_CACHE_DIR_ENV not in os.environ
@@ -0,0 +1,129 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Ague Samuel Amen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the batched, memoized get_git_info provider."""
+
+import shutil
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+
+from Plugins_SDK.BcPluginContext import Context as sdk
+
+
+@pytest.fixture(autouse=True)
+def _memory_cache():
+    sdk.configure_plugin_cache(None)
+    yield
+    sdk.configure_plugin_cache(None)
+
+
+def _git(root: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-c", "user.email=t@t", "-c", "user.name=t", *args],
+        cwd=root,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+def test_parse_status_v2() -> None:
+    out = "\0".join(
+        [
+            "# branch.oid 0123",
+            "# branch.head main",
+            "1 M. N... 100644 100644 100644 aaa bbb staged.py",
+            "1 .M N... 100644 100644 100644 aaa bbb dirty file.py",
+            "2 R. N... 100644 100644 100644 aaa bbb R100 new.py",
+            "old.py",
+            "u UU N... 100644 100644 100644 100644 aaa bbb ccc conflict.py",
+            "? notes.txt",
+            "",
+        ]
+    )
+    info = sdk.GitInfo(is_repo=True)
+    sdk._parse_git_status_v2(out, info)
+    assert info.staged_files == ["staged.py", "new.py", "conflict.py"]
+    assert info.modified_files == ["dirty file.py", "conflict.py"]
+    assert info.untracked_files == ["notes.txt"]
+
+
+def test_head_from_packed_refs_and_detached(tmp_path: Path) -> None:
+    git_dir = tmp_path / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "HEAD").write_text("ref: refs/heads/feature/x\n", encoding="utf-8")
+    (git_dir / "packed-refs").write_text(
+        "# pack-refs with: peeled\nabc123 refs/heads/feature/x\n^def456\n",
+        encoding="utf-8",
+    )
+    assert sdk._read_git_head(git_dir) == ("feature/x", "abc123")
+
+    (git_dir / "refs" / "heads" / "feature").mkdir()
+    (git_dir / "refs" / "heads" / "feature" / "x").write_text("fff\n", encoding="utf-8")
+    assert sdk._read_git_head(git_dir) == ("feature/x", "fff")
+
+    (git_dir / "HEAD").write_text("0123456789\n", encoding="utf-8")
+    assert sdk._read_git_head(git_dir) == ("HEAD", "0123456789")
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_get_git_info_is_memoized(tmp_path: Path, monkeypatch) -> None:
+    _git(tmp_path, "init", "-q", "-b", "main")
+    (tmp_path / "a.py").write_text("a = 1\n", encoding="utf-8")
+    _git(tmp_path, "add", "a.py")
+    _git(tmp_path, "commit", "-q", "-m", "initial import")
+    (tmp_path / "a.py").write_text("a = 2\n", encoding="utf-8")
+    (tmp_path / "b.py").write_text("b = 1\n", encoding="utf-8")
+
+    info = sdk.get_git_info(tmp_path)
+    assert info.is_repo and info.branch == "main"
+    assert info.modified_files == ["a.py"] and info.untracked_files == ["b.py"]
+    assert info.has_uncommitted and info.last_commit.endswith(" initial import")
+
+    def _no_spawn(*_a, **_k):
+        raise AssertionError("git should not run for a memoized query")
+
+    monkeypatch.setattr(sdk.subprocess, "Popen", _no_spawn)
+    again = sdk.get_git_info(tmp_path)
+    assert again == info and again.modified_files is not info.modified_files
+
+    monkeypatch.undo()
+    _git(tmp_path, "add", "b.py")
+    assert sdk.get_git_info(tmp_path).staged_files == ["b.py"]
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_worktree_edits_are_seen_after_ttl(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(sdk, "_GIT_CACHE_TTL", 0.05)
+    _git(tmp_path, "init", "-q", "-b", "main")
+    (tmp_path / "a.py").write_text("a = 1\n", encoding="utf-8")
+    _git(tmp_path, "add", "a.py")
+    _git(tmp_path, "commit", "-q", "-m", "initial import")
+    assert not sdk.get_git_info(tmp_path).has_uncommitted
+
+    (tmp_path / "a.py").write_text("a = 2\n", encoding="utf-8")
+    (tmp_path / "c.py").write_text("c = 1\n", encoding="utf-8")
+    time.sleep(0.1)
+    info = sdk.get_git_info(tmp_path)
+    assert info.modified_files == ["a.py"] and info.untracked_files == ["c.py"]
+    assert info.has_uncommitted
+
+
+def test_not_a_repo(tmp_path: Path) -> None:
+    assert sdk.get_git_info(tmp_path) == sdk.GitInfo()
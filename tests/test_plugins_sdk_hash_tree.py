@@ -0,0 +1,112 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Ague Samuel Amen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for hash_tree (parallel hashing with a persisted manifest)."""
+
+import hashlib
+import os
+from pathlib import Path
+
+import pytest
+
+from Plugins_SDK.BcPluginContext import Context as sdk
+
+
+@pytest.fixture(autouse=True)
+def _memory_cache():
+    sdk.configure_plugin_cache(None)
+    yield
+    sdk.configure_plugin_cache(None)
+
+
+def _tree(root: Path, n: int = 12) -> None:
+    for i in range(n):
+        path = root / ("pkg" if i % 2 else "src") / f"m{i}.py"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"value = {i}\n", encoding="utf-8")
+    (root / ".venv").mkdir()
+    (root / ".venv" / "skip.py").write_text("x\n", encoding="utf-8")
+
+
+def _age(root: Path) -> None:
+    # Sortir les fichiers de la fenêtre "racy" du manifeste
+    old = 1_000_000_000
+    for p in root.rglob("*"):
+        if p.is_file():
+            os.utime(p, ns=(old, old))
+
+
+def test_digests_and_root_are_stable(tmp_path: Path) -> None:
+    _tree(tmp_path)
+    th = sdk.hash_tree(tmp_path, incremental=False, max_workers=4)
+    assert sorted(th.files) == sorted(
+        f"{'pkg' if i % 2 else 'src'}/m{i}.py" for i in range(12)
+    )
+    assert th.files["src/m0.py"] == hashlib.sha256(b"value = 0\n").hexdigest()
+    assert th.files["src/m0.py"] == sdk.calculate_file_hash(tmp_path / "src" / "m0.py")
+    assert th.hashed == 12 and th.reused == 0
+
+    other = tmp_path / "copy"
+    _tree(other)
+    assert sdk.hash_tree(other, incremental=False).digest == th.digest
+
+    (other / "src" / "m0.py").rename(other / "src" / "renamed.py")
+    assert sdk.hash_tree(other, incremental=False).digest != th.digest
+
+
+def test_manifest_skips_unchanged_files(tmp_path: Path) -> None:
+    _tree(tmp_path)
+    _age(tmp_path)
+    first = sdk.hash_tree(tmp_path, include=["**/*.py"])
+    assert first.hashed == 12
+
+    second = sdk.hash_tree(tmp_path, include=["**/*.py"])
+    assert (second.hashed, second.reused) == (0, 12)
+    assert second.digest == first.digest
+
+    (tmp_path / "pkg" / "m1.py").write_text("value = 'changed'\n", encoding="utf-8")
+    third = sdk.hash_tree(tmp_path, include=["**/*.py"])
+    assert (third.hashed, third.reused) == (1, 11)
+    assert third.digest != first.digest
+
+
+def test_unknown_algorithm(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        sdk.hash_tree(tmp_path, algorithm="nope")
+
+
+def test_manifest_survives_the_disk_tier(tmp_path: Path) -> None:
+    ws = tmp_path / "ws"
+    _tree(ws)
+    _age(ws)
+    sdk.configure_plugin_cache(tmp_path / "cache")
+    assert sdk.hash_tree(ws).hashed == 12
+    # Nouveau processus simulé: mémoire vide, seul le tier disque subsiste
+    sdk.configure_plugin_cache(tmp_path / "cache")
+    assert (sdk.hash_tree(ws).hashed, sdk.hash_tree(ws).reused) == (0, 12)
+
+
+def test_manifest_is_keyed_by_patterns(tmp_path: Path) -> None:
+    _tree(tmp_path)
+    (tmp_path / "notes.txt").write_text("n\n", encoding="utf-8")
+    _age(tmp_path)
+    assert sdk.hash_tree(tmp_path, include=["**/*.py"]).hashed == 12
+    assert sdk.hash_tree(tmp_path, include=["**/*.txt"]).hashed == 1
+    # Le manifeste des .py n'a pas été remplacé par celui des .txt
+    again = sdk.hash_tree(tmp_path, include=["**/*.py"])
+    assert (again.hashed, again.reused) == (0, 12)
+    excl = sdk.hash_tree(tmp_path, include=["**/*.py"], exclude=["pkg/**"])
+    assert excl.reused == 0 and "pkg/m1.py" not in excl.files
@@ -0,0 +1,141 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Ague Samuel Amen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for venv metadata reading and pluggable index lookups."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+from Plugins_SDK.BcPluginContext import Context as sdk
+
+
+@pytest.fixture(autouse=True)
+def _memory_cache():
+    sdk.configure_plugin_cache(None)
+    yield
+    sdk.configure_plugin_cache(None)
+
+
+def _venv(root: Path) -> Path:
+    venv = root / ".venv"
+    if sys.platform == "win32":
+        sp = venv / "Lib" / "site-packages"
+        exe = venv / "Scripts" / "python.exe"
+    else:
+        sp = venv / "lib" / "python3.12" / "site-packages"
+        exe = venv / "bin" / "python"
+    sp.mkdir(parents=True)
+    exe.parent.mkdir(parents=True, exist_ok=True)
+    exe.write_text("", encoding="utf-8")
+    (venv / "pyvenv.cfg").write_text(
+        "home = /usr/bin\nversion = 3.12.4\n", encoding="utf-8"
+    )
+    for name, version in (
+        ("pip", "24.0"),
+        ("requests", "2.31.0"),
+        ("Foo_Bar", "1.0rc1"),
+    ):
+        dist = sp / f"{name}-{version}.dist-info"
+        dist.mkdir()
+        (dist / "METADATA").write_text(
+            f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n\nName: ignored\n",
+            encoding="utf-8",
+        )
+    (sp / "pip").mkdir()
+    (sp / "legacy.egg-info").write_text(
+        "Name: legacy\nVersion: 0.1\n", encoding="utf-8"
+    )
+    return sp
+
+
+class _FakeIndex(sdk.PackageIndexClient):
+    def __init__(self, latest):
+        self.latest = latest
+        self.calls = []
+
+    def latest_version(self, name):
+        self.calls.append(name)
+        return self.latest.get(name)
+
+
+def test_venv_info_from_metadata(tmp_path: Path) -> None:
+    sp = _venv(tmp_path)
+    info = sdk.get_venv_info(tmp_path / ".venv")
+    assert info.exists and info.python_version == "Python 3.12.4"
+    assert info.installed_packages == {
+        "pip": "24.0",
+        "requests": "2.31.0",
+        "Foo_Bar": "1.0rc1",
+        "legacy": "0.1",
+    }
+    assert info.pip_version.startswith("pip 24.0 from ") and info.pip_version.endswith(
+        "(python 3.12)"
+    )
+    assert sdk.venv_site_packages(tmp_path / ".venv") == [sp]
+
+
+def test_installed_packages_cache_follows_mtime(tmp_path: Path) -> None:
+    sp = _venv(tmp_path)
+    assert "new" not in sdk.read_installed_packages(sp)
+    dist = sp / "new-2.0.dist-info"
+    dist.mkdir()
+    (dist / "METADATA").write_text("Name: new\nVersion: 2.0\n", encoding="utf-8")
+    assert sdk.read_installed_packages(sp)["new"] == "2.0"
+
+
+def test_outdated_uses_index_client(tmp_path: Path) -> None:
+    _venv(tmp_path)
+    index = _FakeIndex({"requests": "2.32.3", "pip": "24.0", "Foo_Bar": "1.0"})
+    outdated = sdk.get_outdated_packages(tmp_path, index_client=index)
+    assert [(p.name, p.version, p.latest_version) for p in outdated] == [
+        ("Foo_Bar", "1.0rc1", "1.0"),
+        ("requests", "2.31.0", "2.32.3"),
+    ]
+    assert all(p.is_outdated for p in outdated)
+    assert sorted(index.calls) == ["Foo_Bar", "legacy", "pip", "requests"]
+
+
+def test_simple_index_parsing() -> None:
+    client = sdk.SimpleIndexClient("http://mirror.invalid/simple")
+    html = (
+        b"<html><body>"
+        b'<a href="../../f/foo_bar-1.2.0-py3-none-any.whl#sha256=1">foo_bar-1.2.0-py3-none-any.whl</a>'
+        b'<a href="../../f/foo-bar-1.10.0.tar.gz">foo-bar-1.10.0.tar.gz</a>'
+        b'<a href="../../f/foo_bar-2.0b1.tar.gz">foo_bar-2.0b1.tar.gz</a>'
+        b'<a href="../../f/other-9.0.tar.gz">other-9.0.tar.gz</a>'
+        b"</body></html>"
+    )
+    versions = client._versions("foo-bar", html, "text/html")
+    assert versions == ["1.10.0", "1.2.0", "2.0b1"]
+    data = b'{"meta": {"api-version": "1.1"}, "versions": ["1.0", "1.1"], "files": []}'
+    assert client._versions("foo-bar", data, "application/vnd.pypi.simple.v1+json") == [
+        "1.0",
+        "1.1",
+    ]
+
+
+def test_version_key_fallback(monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, "packaging.version", None)
+    key = sdk._version_key
+    assert key("1.10") > key("1.9") > key("1.9rc1") > key("1.9.dev0")
+    assert key("2.0.post1") > key("2.0") == key("2.0.0")
+
+
+def test_index_client_is_abstract() -> None:
+    with pytest.raises(TypeError):
+        sdk.PackageIndexClient()  # type: ignore[abstract]
@@ -0,0 +1,201 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Ague Samuel Amen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests (and benchmark) for the shared PathMatcher used by the Plugins_SDK
+file helpers.
+
+Benchmark (opt-in, builds a 100k-file tree):
+    ARK_RUN_BENCHMARKS=1 python -m pytest -s tests/test_plugins_sdk_pathmatch.py -k benchmark
+"""
+
+import fnmatch
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from Plugins_SDK.BcPluginContext import Context as sdk
+from utils.pathmatch import compile_matcher, walk_files
+
+
+def _tree(root: Path) -> None:
+    for rel in (
+        "main.py",
+        "README.md",
+        "src/pkg/mod.py",
+        "src/pkg/data.txt",
+        ".venv/lib/site.py",
+        ".git/HEAD",
+        "src/__pycache__/mod.cpython-312.pyc",
+    ):
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x" * 10, encoding="utf-8")
+
+
+def test_double_star_matches_zero_or_more_dirs() -> None:
+    anchored = compile_matcher(("**/*.py",), anchored=True)
+    assert anchored.matches("main.py")
+    assert anchored.matches("src/pkg/mod.py")
+    assert not anchored.matches("src/pkg/data.txt")
+
+    suffix = compile_matcher(("pkg/*.py",), anchored=False)
+    assert suffix.matches("src/pkg/mod.py")
+    assert not suffix.matches("src/pkg/sub/mod.py")
+    assert compile_matcher(("pkg/*.py",), anchored=False) is suffix
+
+
+def test_walk_prunes_excluded_dirs(tmp_path: Path) -> None:
+    _tree(tmp_path)
+    exclude = compile_matcher(("**/.venv/**", "**/.git/**"), anchored=False)
+    rels = [rel for _p, rel, _e in walk_files(str(tmp_path), None, exclude)]
+    assert rels == [
+        "README.md",
+        "main.py",
+        "src/__pycache__/mod.cpython-312.pyc",
+        "src/pkg/data.txt",
+        "src/pkg/mod.py",
+    ]
+    assert exclude.prune_dir(".venv") and not exclude.prune_dir("src")
+
+
+def test_walk_stops_at_pattern_depth(tmp_path: Path, monkeypatch) -> None:
+    _tree(tmp_path)
+    visited: list = []
+    real = os.scandir
+
+    def _spy(path):
+        visited.append(os.path.relpath(path, tmp_path))
+        return real(path)
+
+    monkeypatch.setattr(os, "scandir", _spy)
+    top = compile_matcher(("*.py", "src/*.txt"), anchored=True)
+    assert top.max_depth == 2
+    assert compile_matcher(("src/**/*.py",), anchored=True).max_depth is None
+    rels = [rel for _p, rel, _e in walk_files(str(tmp_path), top)]
+    assert rels == ["main.py"]
+    # Pas de descente sous src/: aucun motif ne dépasse deux segments
+    assert sorted(visited) == [".", ".git", ".venv", "src"]
+
+
+def test_find_files_defaults_and_depth(tmp_path: Path) -> None:
+    _tree(tmp_path)
+    found = {p.relative_to(tmp_path).as_posix() for p in sdk.find_files(tmp_path)}
+    assert found == {"main.py", "README.md", "src/pkg/mod.py", "src/pkg/data.txt"}
+
+    shallow = {
+        p.name for p in sdk.find_files(tmp_path, include=["**/*.py"], max_depth=1)
+    }
+    assert shallow == {"main.py"}
+
+    absolute = str(tmp_path / "src" / "**")
+    rest = {p.name for p in sdk.find_files(tmp_path, exclude=[absolute])}
+    assert "mod.py" not in rest and "main.py" in rest
+
+
+def test_match_patterns_and_directory_size(tmp_path: Path) -> None:
+    assert sdk.match_patterns("src/main.py", ["**/*.py"])
+    assert sdk.match_patterns("main.py", ["**/*.py"])
+    assert not sdk.match_patterns("README.md", ["**/*.py"])
+    assert sdk.match_patterns("./docs/a.txt", ["/docs/*.txt"])
+
+    _tree(tmp_path)
+    assert sdk.get_directory_size(tmp_path) == 70
+    assert sdk.get_directory_size(tmp_path, ["**/.venv/**", "**/.git/**"]) == 50
+
+
+def _legacy_find_files(root: Path, include, exclude):
+    """Implémentation de référence (root.glob + fnmatch) avant PathMatcher."""
+    for pattern in include:
+        for file_path in root.glob(pattern):
+            if not file_path.is_file():
+                continue
+            path_str = file_path.as_posix()
+            if any(
+                fnmatch.fnmatch(path_str, pat) or file_path.match(pat)
+                for pat in exclude
+            ):
+                continue
+            yield file_path
+
+
+def _legacy_directory_size(root: Path, exclude) -> int:
+    total = 0
+    for item in root.rglob("*"):
+        if item.is_file() and not any(
+            fnmatch.fnmatch(item.as_posix(), pat) for pat in exclude
+        ):
+            total += item.stat().st_size
+    return total
+
+
+def _legacy_match_patterns(path_str: str, patterns) -> bool:
+    path = Path(path_str)
+    return any(fnmatch.fnmatch(path_str, pat) or path.match(pat) for pat in patterns)
+
+
+def _bench_tree(root: Path, n: int) -> list[str]:
+    """n fichiers répartis sous src/.venv/.git/build, moitié en .py."""
+    dirs = ["src/pkg", "src/pkg/sub", ".venv/lib/site", ".git/objects", "build/lib"]
+    rels = []
+    for i in range(n):
+        rel = f"{dirs[i % len(dirs)]}/d{i % 50}/f{i}.{'py' if i % 2 else 'txt'}"
+        rels.append(rel)
+    for d in {os.path.dirname(r) for r in rels}:
+        (root / d).mkdir(parents=True, exist_ok=True)
+    for rel in rels:
+        (root / rel).write_bytes(b"x")
+    return rels
+
+
+def run_benchmark(root: Path, n: int = 100_000) -> dict[str, tuple[float, float]]:
+    """Durées (s) (référence, actuelle) de find_files, get_directory_size et
+    match_patterns sur un arbre synthétique de n fichiers."""
+    rels = _bench_tree(root, n)
+    exclude = ["**/.venv/**", "**/.git/**", "**/build/**"]
+
+    def _time(fn):
+        t0 = time.perf_counter()
+        fn()
+        return time.perf_counter() - t0
+
+    include = ["**/*.py"]
+    return {
+        "find_files": (
+            _time(lambda: list(_legacy_find_files(root, include, exclude))),
+            _time(lambda: list(sdk.find_files(root, include, exclude))),
+        ),
+        "get_directory_size": (
+            _time(lambda: _legacy_directory_size(root, exclude)),
+            _time(lambda: sdk.get_directory_size(root, exclude)),
+        ),
+        "match_patterns": (
+            _time(lambda: [_legacy_match_patterns(r, exclude) for r in rels]),
+            _time(lambda: [sdk.match_patterns(r, exclude) for r in rels]),
+        ),
+    }
+
+
+@pytest.mark.skipif(
+    os.environ.get("ARK_RUN_BENCHMARKS") != "1",
+    reason="benchmark: set ARK_RUN_BENCHMARKS=1",
+)
+def test_benchmark_100k_files(tmp_path: Path) -> None:
+    res = run_benchmark(tmp_path, 100_000)
+    for name, (legacy, current) in res.items():
+        print(f"\n{name}: legacy {legacy:.2f}s -> {current:.2f}s")
+    assert all(current < legacy for legacy, current in res.values())
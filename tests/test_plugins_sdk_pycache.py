@@ -0,0 +1,124 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Ague Samuel Amen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the single-walk pycache cleaner and du-style directory size."""
+
+import os
+import threading
+from pathlib import Path
+
+from Plugins_SDK.BcPluginContext import Context as sdk
+
+
+def _tree(root: Path) -> None:
+    for rel in (
+        "app/__pycache__/a.cpython-312.pyc",
+        "app/__pycache__/b.cpython-312.pyc",
+        "app/legacy.pyc",
+        "app/sub/__pycache__/c.cpython-312.pyc",
+        "vendor/__pycache__/v.cpython-312.pyc",
+        ".venv/lib/__pycache__/site.cpython-312.pyc",
+        "myenv/lib/__pycache__/x.cpython-312.pyc",
+        "app/env/__pycache__/e.cpython-312.pyc",
+        "tools/nested/venv/lib/__pycache__/n.cpython-312.pyc",
+        ".git/objects/keep.pyc",
+        "app/main.py",
+    ):
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"x")
+    for venv in (".venv", "myenv", "tools/nested/venv"):
+        (root / venv / "pyvenv.cfg").write_text("home = /usr\n", encoding="utf-8")
+
+
+def test_find_pycache_single_walk(tmp_path: Path) -> None:
+    _tree(tmp_path)
+    dirs, files = sdk.find_pycache(tmp_path, exclude=["vendor/**"])
+    assert [(d.relative_to(tmp_path).as_posix(), n) for d, n in dirs] == [
+        ("app/__pycache__", 2),
+        ("app/env/__pycache__", 1),
+        ("app/sub/__pycache__", 1),
+    ]
+    assert [f.relative_to(tmp_path).as_posix() for f in files] == ["app/legacy.pyc"]
+
+
+def test_clean_pycache_removes_and_throttles(tmp_path: Path) -> None:
+    _tree(tmp_path)
+    assert sdk.clean_pycache(tmp_path, dry_run=True) == (6, 4)
+    assert (tmp_path / "app" / "__pycache__").is_dir()
+
+    calls = []
+    files, dirs = sdk.clean_pycache(
+        tmp_path, progress=lambda v, m: calls.append((v, m)), max_workers=2
+    )
+    assert (files, dirs) == (6, 4)
+    assert not (tmp_path / "app" / "__pycache__").exists()
+    assert not (tmp_path / "app" / "legacy.pyc").exists()
+    assert (tmp_path / ".venv" / "lib" / "__pycache__").is_dir()
+    assert (tmp_path / "myenv" / "lib" / "__pycache__").is_dir()
+    assert (tmp_path / "tools" / "nested" / "venv" / "lib" / "__pycache__").is_dir()
+    assert not (tmp_path / "app" / "env" / "__pycache__").exists()
+    assert (tmp_path / "app" / "main.py").exists()
+    # 0/total et total/total toujours émis, le reste est limité en fréquence
+    assert calls[0] == (0, 5) and calls[-1] == (5, 5) and len(calls) <= 7
+
+
+def test_clean_pycache_cancel(tmp_path: Path) -> None:
+    _tree(tmp_path)
+    assert sdk.clean_pycache(tmp_path, should_cancel=lambda: True) == (0, 0)
+    assert (tmp_path / "app" / "__pycache__").is_dir()
+
+
+def test_clean_pycache_callbacks_in_caller_thread(tmp_path: Path, monkeypatch) -> None:
+    _tree(tmp_path)
+    for i in range(12):
+        (tmp_path / "many" / f"m{i}.pyc").parent.mkdir(exist_ok=True)
+        (tmp_path / "many" / f"m{i}.pyc").write_bytes(b"x")
+    real_unlink = Path.unlink
+
+    def _unlink(self, *args, **kwargs):
+        if self.name == "m3.pyc":
+            raise PermissionError("locked")
+        return real_unlink(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "unlink", _unlink)
+    caller = threading.get_ident()
+    threads = set()
+    errors = []
+
+    def _progress(v, m):
+        threads.add(threading.get_ident())
+
+    def _on_error(path, e):
+        threads.add(threading.get_ident())
+        errors.append((path.name, str(e)))
+
+    files, _dirs = sdk.clean_pycache(
+        tmp_path, progress=_progress, on_error=_on_error, max_workers=4
+    )
+    assert files == 6 + 11
+    assert errors == [("m3.pyc", "locked")]
+    assert threads == {caller}
+
+
+def test_directory_size_counts_hardlinks_once(tmp_path: Path) -> None:
+    (tmp_path / "a.bin").write_bytes(b"x" * 100)
+    (tmp_path / "b.bin").write_bytes(b"y" * 10)
+    try:
+        os.link(tmp_path / "a.bin", tmp_path / "a_link.bin")
+    except OSError:
+        return
+    assert sdk.get_directory_size(tmp_path) == 110
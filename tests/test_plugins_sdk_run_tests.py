@@ -0,0 +1,141 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Ague Samuel Amen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for run_tests (JUnit parsing, sharding, affected-tests mode)."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+from Plugins_SDK.BcPluginContext import Context as sdk
+
+
+def _project(root: Path) -> None:
+    files = {
+        "pyproject.toml": '[tool.pytest.ini_options]\npythonpath = ["."]\n',
+        "pkg/__init__.py": "",
+        "pkg/a.py": "def one():\n    return 1\n",
+        "pkg/b.py": "from .a import one\n\ndef two():\n    return one() + 1\n",
+        "pkg/c.py": "def three():\n    return 3\n",
+        "tests/test_a.py": "from pkg.a import one\n\ndef test_one():\n    assert one() == 1\n",
+        "tests/test_b.py": (
+            "import pytest\nfrom pkg import b\n\n"
+            "def test_two():\n    assert b.two() == 2\n\n"
+            "def test_broken():\n    assert b.two() == 3, 'boom'\n\n"
+            "@pytest.mark.skip(reason='later')\ndef test_later():\n    pass\n"
+        ),
+        "tests/test_c.py": "from pkg.c import three\n\ndef test_three():\n    assert three() == 3\n",
+        "README.md": "demo\n",
+    }
+    for rel, text in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+
+
+def test_select_affected_tests(tmp_path: Path) -> None:
+    _project(tmp_path)
+
+    def names(changed):
+        selected = sdk.select_affected_tests(tmp_path, changed)
+        return None if selected is None else [p.name for p in selected]
+
+    assert names(["pkg/a.py"]) == ["test_a.py", "test_b.py"]
+    assert names([tmp_path / "pkg" / "c.py"]) == ["test_c.py"]
+    assert names(["tests/test_c.py"]) == ["test_c.py"]
+    assert names(["README.md"]) == []
+    assert names(["pyproject.toml"]) is None
+
+
+def test_select_affected_tests_deleted_module(tmp_path: Path) -> None:
+    _project(tmp_path)
+    (tmp_path / "pkg" / "a.py").unlink()
+    selected = sdk.select_affected_tests(tmp_path, ["pkg/a.py"])
+    assert [p.name for p in selected or []] == ["test_a.py", "test_b.py"]
+    # Renommage: l'ancien nom reste la clé des importeurs
+    (tmp_path / "pkg" / "c.py").rename(tmp_path / "pkg" / "c2.py")
+    selected = sdk.select_affected_tests(tmp_path, ["pkg/c.py", "pkg/c2.py"])
+    assert [p.name for p in selected or []] == ["test_c.py"]
+
+
+def test_parse_junit_xml(tmp_path: Path) -> None:
+    report = tmp_path / "junit.xml"
+    report.write_text(
+        '<?xml version="1.0"?><testsuites><testsuite name="pytest">'
+        '<testcase classname="tests.test_x" name="test_ok"/>'
+        '<testcase classname="tests.test_x" name="test_bad">'
+        '<failure message="assert 1 == 2">trace</failure></testcase>'
+        '<testcase classname="tests.test_x" name="test_err"><error message="boom"/></testcase>'
+        '<testcase classname="tests.test_x" name="test_skip"><skipped message="s"/></testcase>'
+        "</testsuite></testsuites>",
+        encoding="utf-8",
+    )
+    results = sdk.TestResults()
+    assert sdk._parse_junit_xml(report, results)
+    assert (results.total, results.passed, results.failed, results.skipped) == (
+        4,
+        1,
+        2,
+        1,
+    )
+    assert results.failures[0] == {
+        "test": "tests.test_x::test_bad",
+        "type": "failure",
+        "message": "assert 1 == 2",
+    }
+
+
+def test_run_tests_sharded_and_affected(tmp_path: Path) -> None:
+    _project(tmp_path)
+
+    full = sdk.run_tests(tmp_path, workers=2)
+    assert (full.total, full.passed, full.failed, full.skipped) == (5, 3, 1, 1)
+    assert full.failures[0]["test"].endswith("::test_broken")
+
+    affected = sdk.run_tests(tmp_path, changed_files=["pkg/c.py"])
+    assert (affected.total, affected.passed) == (1, 1)
+
+    nothing = sdk.run_tests(tmp_path, changed_files=["README.md"])
+    assert nothing.total == 0
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX venv layout")
+def test_run_tests_uses_project_venv_interpreter(tmp_path: Path) -> None:
+    _project(tmp_path)
+    marker = tmp_path / "used.txt"
+    python = tmp_path / ".venv" / "bin" / "python"
+    python.parent.mkdir(parents=True)
+    python.write_text(
+        f'#!/bin/sh\necho "$@" >> "{marker}"\nexec "{sys.executable}" "$@"\n',
+        encoding="utf-8",
+    )
+    python.chmod(0o755)
+
+    results = sdk.run_tests(tmp_path, changed_files=["pkg/c.py"])
+    assert (results.total, results.passed) == (1, 1)
+    assert marker.read_text(encoding="utf-8").startswith("-m pytest")
+
+
+def test_shard_timeout_is_reported(tmp_path: Path, monkeypatch) -> None:
+    _project(tmp_path)
+    monkeypatch.setattr(
+        sdk, "run_command", lambda *a, **k: (-1, "", "Command timed out")
+    )
+    results = sdk.run_tests(tmp_path, workers=2, timeout=1)
+    assert results.failed == len(results.failures) == 2
+    assert {f["type"] for f in results.failures} == {"timeout"}
+    assert all(f["test"].startswith("shard ") for f in results.failures)
@@ -0,0 +1,86 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Ague Samuel Amen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the single-pass ProjectScan of the Plugins_SDK."""
+
+import hashlib
+from pathlib import Path
+
+from Plugins_SDK.BcPluginContext import Context as sdk
+
+
+def _make_project(root: Path) -> None:
+    (root / "pkg").mkdir()
+    (root / "pkg" / "mod.py").write_text(
+        '"""Doc."""\nimport os\nfrom json import loads\n\n\nclass A:\n'
+        "    def f(self):\n        return 1  # ok\n",
+        encoding="utf-8",
+    )
+    (root / "bad.py").write_text("def broken(:\n", encoding="utf-8")
+    (root / ".venv" / "lib").mkdir(parents=True)
+    (root / ".venv" / "lib" / "skip.py").write_text("x = (\n", encoding="utf-8")
+
+
+def test_scan_collects_everything_in_one_pass(tmp_path: Path) -> None:
+    _make_project(tmp_path)
+    scan = sdk.ProjectScan(tmp_path)
+    assert sorted(p.name for p in scan.files) == ["bad.py", "mod.py"]
+
+    mod = scan.get(tmp_path / "pkg" / "mod.py")
+    assert mod.info.docstring == "Doc."
+    assert sorted(mod.info.imports) == ["json", "os"]
+    assert (mod.info.functions, mod.info.classes) == (["f"], ["A"])
+    assert mod.metrics.total_lines == 8 and mod.metrics.blank_lines == 2
+    assert (
+        mod.sha256
+        == hashlib.sha256((tmp_path / "pkg" / "mod.py").read_bytes()).hexdigest()
+    )
+
+    issues = scan.files_with_issues()
+    assert [p.name for p, _err in issues] == ["bad.py"]
+    totals = scan.project_metrics()
+    assert totals["total_files"] == 2 and totals["files_with_issues"] == 1
+
+
+def test_helpers_share_results_and_rescan_changed_files(tmp_path: Path) -> None:
+    _make_project(tmp_path)
+    target = tmp_path / "pkg" / "mod.py"
+    first = sdk.ProjectScan(tmp_path).get(target)
+    # Résultat réutilisé tant que (taille, mtime) ne changent pas
+    assert sdk.ProjectScan(tmp_path).get(target) is first
+    assert sdk.calculate_code_metrics(target) == first.metrics
+
+    # Les helpers publics renvoient des copies: le cache reste intact
+    info = sdk.analyze_python_file(target)
+    info.imports.append("hacked")
+    info.syntax_error = "mutated"
+    metrics = sdk.calculate_code_metrics(target)
+    metrics.code_lines = -1
+    assert "hacked" not in first.info.imports and first.info.syntax_error is None
+    assert first.metrics.code_lines > 0
+    assert sdk.analyze_python_file(target).imports == first.info.imports
+
+    target.write_text("import sys\n", encoding="utf-8")
+    again = sdk.ProjectScan(tmp_path).get(target)
+    assert again is not first and again.info.imports == ["sys"]
+
+    assert [p.name for p, _e in sdk.get_python_files_with_issues(tmp_path)] == [
+        "bad.py"
+    ]
+    result = sdk.validate_python_project(tmp_path)
+    assert result["info"]["python_files_count"] == 2
+    assert any("bad.py" in msg for msg in result["issues"])
+    assert len(sdk.analyze_project_structure(tmp_path).python_files) == 2
@@ -0,0 +1,91 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Ague Samuel Amen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the Plugins_SDK search and replace engine."""
+
+import os
+import stat
+from pathlib import Path
+
+from Plugins_SDK.BcPluginContext import Context as sdk
+
+
+def _tree(root: Path) -> None:
+    (root / "a.py").write_text(
+        "# TODO: one\nx = 1\n\ndef main():\n    return x  # todo two\n",
+        encoding="utf-8",
+    )
+    (root / "b.txt").write_text("nothing here\nTODO\n", encoding="utf-8")
+    (root / "img.bin").write_bytes(b"\x00\x01TODO\xff")
+
+
+def test_literal_and_regex_results(tmp_path: Path) -> None:
+    _tree(tmp_path)
+    literal = sdk.search_in_files(tmp_path, "TODO", include=["*.py", "*.txt", "*.bin"])
+    assert sorted((p.name, n, t) for p, n, t in literal) == [
+        ("a.py", 1, "# TODO: one"),
+        ("b.txt", 2, "TODO"),
+    ]
+    nocase = sdk.search_in_files(
+        tmp_path, "todo", include=["*.py"], case_sensitive=False
+    )
+    assert [n for _p, n, _t in nocase] == [1, 5]
+    # '^' / '$' gardent leur sens ligne par ligne
+    anchored = sdk.search_in_files(tmp_path, r"^def \w+\(\):$", include=["*.py"])
+    assert [(n, t) for _p, n, t in anchored] == [(4, "def main():")]
+    # Un match qui traverserait deux lignes n'est pas retenu
+    assert sdk.search_in_files(tmp_path, r"1\s+def", include=["*.py"]) == []
+
+
+def test_iter_search_streams_results(tmp_path: Path) -> None:
+    for i in range(20):
+        (tmp_path / f"f{i:02d}.py").write_text(
+            f"value = {i}\nneedle\n", encoding="utf-8"
+        )
+    it = sdk.iter_search_in_files(tmp_path, "needle", include=["*.py"], max_workers=4)
+    first = next(it)
+    assert first[1] == 2 and first[2] == "needle"
+    assert len(list(it)) == 19
+
+
+def test_replace_is_atomic_and_keeps_mode(tmp_path: Path) -> None:
+    _tree(tmp_path)
+    target = tmp_path / "a.py"
+    os.chmod(target, 0o755)
+    assert sdk.replace_in_files(
+        tmp_path, "TODO", "DONE", include=["*.py"], dry_run=True
+    ) == {target: 1}
+    assert "TODO" in target.read_text(encoding="utf-8")
+
+    changes = sdk.replace_in_files(tmp_path, r"x\b", "y", include=["*.py"])
+    assert changes == {target: 2}
+    assert "y = 1" in target.read_text(encoding="utf-8")
+    assert stat.S_IMODE(target.stat().st_mode) == 0o755
+    assert not [p for p in tmp_path.iterdir() if p.name.startswith(".sdk_")]
+
+    literal = sdk.replace_in_files(
+        tmp_path, "one", r"\1", include=["*.py"], literal=True
+    )
+    assert literal == {target: 1}
+    assert r"# TODO: \1" in target.read_text(encoding="utf-8")
+
+
+def test_large_file_case_insensitive_literal(tmp_path: Path) -> None:
+    # Au-delà du seuil mmap: recherche sans copie du buffer
+    pad = "x = 1\n" * (sdk._SEARCH_MMAP_MIN // 6 + 1)
+    (tmp_path / "big.py").write_text(pad + "# ToDo: late\n", encoding="utf-8")
+    hits = sdk.search_in_files(tmp_path, "todo", include=["*.py"], case_sensitive=False)
+    assert [(n, t) for _p, n, t in hits] == [(pad.count("\n") + 1, "# ToDo: late")]
@@ -0,0 +1,104 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Ague Samuel Amen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for batched, cached system package detection in Core.sys_deps."""
+
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from Core import sys_deps
+
+DPKG_STATUS = """\
+Package: patchelf
+Status: install ok installed
+Version: 0.18.0-1
+
+Package: gcc
+Status: deinstall ok config-files
+Version: 4:13.2.0-7
+
+Package: build-essential
+Status: install ok installed
+Version: 12.10
+"""
+
+
+@pytest.fixture
+def dpkg(tmp_path: Path, monkeypatch):
+    status = tmp_path / "status"
+    status.write_text(DPKG_STATUS, encoding="utf-8")
+    monkeypatch.setattr(sys_deps.platform, "system", lambda: "Linux")
+    monkeypatch.setattr(sys_deps, "_DPKG_STATUS", str(status))
+    monkeypatch.setattr(sys_deps.shutil, "which", lambda name: None)
+    sys_deps.invalidate_system_packages_cache()
+    yield status
+    sys_deps.invalidate_system_packages_cache()
+
+
+def test_dpkg_status_read_once_for_all_packages(dpkg, monkeypatch) -> None:
+    reads = []
+    real = sys_deps._read_dpkg_status
+
+    def _read(path):
+        reads.append(path)
+        return real(path)
+
+    monkeypatch.setattr(sys_deps, "_read_dpkg_status", _read)
+    found = sys_deps.detect_system_packages(["patchelf", "gcc", "build-essential"])
+    assert found == {"patchelf": True, "gcc": False, "build-essential": True}
+    assert sys_deps.check_system_packages(["patchelf", "build-essential"]) is True
+    assert sys_deps.check_system_packages(["gcc"]) is False
+    assert len(reads) == 1
+
+
+def test_which_fallback_and_invalidation(dpkg, monkeypatch) -> None:
+    assert sys_deps.detect_system_packages(["gcc"]) == {"gcc": False}
+    # Cache de session: PATH et base inchangés -> pas de nouvelle sonde
+    monkeypatch.setattr(sys_deps.shutil, "which", lambda name: f"/usr/bin/{name}")
+    assert sys_deps.detect_system_packages(["gcc"]) == {"gcc": False}
+    sys_deps.invalidate_system_packages_cache()
+    assert sys_deps.detect_system_packages(["gcc"]) == {"gcc": True}
+
+
+def test_database_change_refreshes(dpkg) -> None:
+    assert sys_deps.detect_system_packages(["gcc"]) == {"gcc": False}
+    dpkg.write_text(
+        DPKG_STATUS.replace("deinstall ok config-files", "install ok installed"),
+        encoding="utf-8",
+    )
+    assert sys_deps.detect_system_packages(["gcc"]) == {"gcc": True}
+
+
+def test_pacman_local_db(tmp_path: Path, monkeypatch) -> None:
+    local = tmp_path / "local"
+    for entry in ("patchelf-0.18.0-1", "python-pip-24.0-2", "ALPM_DB_VERSION"):
+        (local / entry).mkdir(parents=True)
+    monkeypatch.setattr(sys_deps.platform, "system", lambda: "Linux")
+    monkeypatch.setattr(sys_deps, "_DPKG_STATUS", str(tmp_path / "missing"))
+    monkeypatch.setattr(sys_deps, "_PACMAN_LOCAL", str(local))
+    monkeypatch.setattr(sys_deps.shutil, "which", lambda name: None)
+    sys_deps.invalidate_system_packages_cache()
+    try:
+        assert sys_deps.detect_system_packages(["patchelf", "python-pip", "gcc"]) == {
+            "patchelf": True,
+            "python-pip": True,
+            "gcc": False,
+        }
+    finally:
+        sys_deps.invalidate_system_packages_cache()
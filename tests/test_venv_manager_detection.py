@@ -18,7 +18,6 @@
 from __future__ import annotations
 
 import os
-import platform
 from pathlib import Path
 
 import pytest
@@ -28,35 +27,14 @@ pytest.importorskip("PySide6")
 from Core.Venv_Manager.Manager import VenvManager
 
 
-class DummyParent:
-    def __init__(self):
-        self.log = []
-        self.workspace_dir = None
-        self.venv_path_manuel = None
-        self.use_system_python = False
-
-    def tr(self, fr: str, en: str) -> str:
-        return en
-
-
-def _make_fake_venv(path: Path) -> Path:
-    path.mkdir(parents=True, exist_ok=True)
-    cfg = path / "pyvenv.cfg"
-    cfg.write_text("include-system-site-packages = false\n", encoding="utf-8")
-    bindir = "Scripts" if platform.system() == "Windows" else "bin"
-    bin_path = path / bindir
-    bin_path.mkdir(parents=True, exist_ok=True)
-    py_name = "python.exe" if platform.system() == "Windows" else "python"
-    (bin_path / py_name).write_text("", encoding="utf-8")
-    return path
-
-
-def test_create_venv_prefers_manager_mapping(test_workspace: Path, monkeypatch) -> None:
+def test_create_venv_prefers_manager_mapping(
+    test_workspace: Path, monkeypatch, dummy_parent
+) -> None:
     # Simulate a Poetry-managed project
     pyproject = test_workspace / "pyproject.toml"
     pyproject.write_text("[tool.poetry]\nname = 'demo'\n", encoding="utf-8")
 
-    parent = DummyParent()
+    parent = dummy_parent()
     parent.workspace_dir = str(test_workspace)
     mgr = VenvManager(parent)
 
@@ -75,8 +53,10 @@ def test_create_venv_prefers_manager_mapping(test_workspace: Path, monkeypatch)
     assert called.get("venv_path", "").endswith(os.path.join("", ".venv"))
 
 
-def test_resolve_existing_venv_prefers_manager(monkeypatch, test_workspace: Path) -> None:
-    parent = DummyParent()
+def test_resolve_existing_venv_prefers_manager(
+    monkeypatch, test_workspace: Path, dummy_parent
+) -> None:
+    parent = dummy_parent()
     parent.workspace_dir = str(test_workspace)
     mgr = VenvManager(parent)
 
@@ -97,8 +77,10 @@ def test_resolve_existing_venv_prefers_manager(monkeypatch, test_workspace: Path
     assert called["select"] is False
 
 
-def test_install_requirements_prefers_manager(monkeypatch, test_workspace: Path) -> None:
-    parent = DummyParent()
+def test_install_requirements_prefers_manager(
+    monkeypatch, test_workspace: Path, dummy_parent
+) -> None:
+    parent = dummy_parent()
     mgr = VenvManager(parent)
 
     called: dict[str, str] = {}
@@ -119,12 +101,14 @@ def test_install_requirements_prefers_manager(monkeypatch, test_workspace: Path)
     assert called.get("workspace") == str(test_workspace)
 
 
-def test_detect_manager_existing_venv_poetry(test_workspace: Path, monkeypatch) -> None:
+def test_detect_manager_existing_venv_poetry(
+    test_workspace: Path, monkeypatch, dummy_parent, make_fake_venv
+) -> None:
     pyproject = test_workspace / "pyproject.toml"
     pyproject.write_text("[tool.poetry]\nname = 'demo'\n", encoding="utf-8")
-    venv_path = _make_fake_venv(test_workspace / "poetry-venv")
+    venv_path = make_fake_venv(test_workspace / "poetry-venv")
 
-    mgr = VenvManager(DummyParent())
+    mgr = VenvManager(dummy_parent())
     monkeypatch.setattr(mgr, "_is_tool_available", lambda tool: True)
     monkeypatch.setattr(
         mgr, "_run_cmd_capture", lambda cmd, cwd, timeout=5: str(venv_path)
@@ -134,12 +118,14 @@ def test_detect_manager_existing_venv_poetry(test_workspace: Path, monkeypatch)
     assert result == str(venv_path)
 
 
-def test_detect_manager_existing_venv_pipenv(test_workspace: Path, monkeypatch) -> None:
+def test_detect_manager_existing_venv_pipenv(
+    test_workspace: Path, monkeypatch, dummy_parent, make_fake_venv
+) -> None:
     pipfile = test_workspace / "Pipfile"
     pipfile.write_text("[packages]\n", encoding="utf-8")
-    venv_path = _make_fake_venv(test_workspace / "pipenv-venv")
+    venv_path = make_fake_venv(test_workspace / "pipenv-venv")
 
-    mgr = VenvManager(DummyParent())
+    mgr = VenvManager(dummy_parent())
     monkeypatch.setattr(mgr, "_is_tool_available", lambda tool: True)
     monkeypatch.setattr(
         mgr, "_run_cmd_capture", lambda cmd, cwd, timeout=5: str(venv_path)
@@ -149,12 +135,14 @@ def test_detect_manager_existing_venv_pipenv(test_workspace: Path, monkeypatch)
     assert result == str(venv_path)
 
 
-def test_detect_manager_existing_venv_pdm(test_workspace: Path, monkeypatch) -> None:
+def test_detect_manager_existing_venv_pdm(
+    test_workspace: Path, monkeypatch, dummy_parent, make_fake_venv
+) -> None:
     pyproject = test_workspace / "pyproject.toml"
     pyproject.write_text("[tool.pdm]\n", encoding="utf-8")
-    venv_path = _make_fake_venv(test_workspace / "pdm-venv")
+    venv_path = make_fake_venv(test_workspace / "pdm-venv")
 
-    mgr = VenvManager(DummyParent())
+    mgr = VenvManager(dummy_parent())
     monkeypatch.setattr(mgr, "_is_tool_available", lambda tool: True)
     monkeypatch.setattr(
         mgr, "_run_cmd_capture", lambda cmd, cwd, timeout=5: str(venv_path)
@@ -165,13 +153,13 @@ def test_detect_manager_existing_venv_pdm(test_workspace: Path, monkeypatch) ->
 
 
 def test_detect_manager_existing_venv_conda_prefix(
-    test_workspace: Path, monkeypatch
+    test_workspace: Path, monkeypatch, dummy_parent, make_fake_venv
 ) -> None:
-    venv_path = _make_fake_venv(test_workspace / "conda-env")
+    venv_path = make_fake_venv(test_workspace / "conda-env")
     env_file = test_workspace / "environment.yml"
     env_file.write_text(f"name: demo\nprefix: {venv_path}\n", encoding="utf-8")
 
-    mgr = VenvManager(DummyParent())
+    mgr = VenvManager(dummy_parent())
     monkeypatch.setattr(mgr, "_is_tool_available", lambda tool: True)
 
     result = mgr._detect_manager_existing_venv(str(test_workspace))
@@ -179,14 +167,14 @@ def test_detect_manager_existing_venv_conda_prefix(
 
 
 def test_detect_manager_existing_venv_conda_name(
-    test_workspace: Path, monkeypatch
+    test_workspace: Path, monkeypatch, dummy_parent, make_fake_venv
 ) -> None:
-    venv_path = _make_fake_venv(test_workspace / "conda-name-env")
+    venv_path = make_fake_venv(test_workspace / "conda-name-env")
     env_file = test_workspace / "environment.yml"
     env_name = venv_path.name
     env_file.write_text(f"name: {env_name}\n", encoding="utf-8")
 
-    mgr = VenvManager(DummyParent())
+    mgr = VenvManager(dummy_parent())
     monkeypatch.setattr(mgr, "_is_tool_available", lambda tool: True)
 
     class _FakeResult:
@@ -202,8 +190,10 @@ def test_detect_manager_existing_venv_conda_name(
     assert result == str(venv_path)
 
 
-def test_create_venv_with_manager_fallback(monkeypatch, test_workspace: Path) -> None:
-    mgr = VenvManager(DummyParent())
+def test_create_venv_with_manager_fallback(
+    monkeypatch, test_workspace: Path, dummy_parent
+) -> None:
+    mgr = VenvManager(dummy_parent())
     monkeypatch.setattr(mgr, "_detect_environment_manager", lambda path: "poetry")
     monkeypatch.setattr(mgr, "_is_tool_available", lambda tool: False)
     called: dict[str, bool] = {}
@@ -218,9 +208,9 @@ def test_create_venv_with_manager_fallback(monkeypatch, test_workspace: Path) ->
 
 
 def test_install_dependencies_with_manager_fallback(
-    monkeypatch, test_workspace: Path
+    monkeypatch, test_workspace: Path, dummy_parent
 ) -> None:
-    mgr = VenvManager(DummyParent())
+    mgr = VenvManager(dummy_parent())
     monkeypatch.setattr(mgr, "_detect_environment_manager", lambda path: "poetry")
     monkeypatch.setattr(mgr, "_is_tool_available", lambda tool: False)
     called: dict[str, bool] = {}
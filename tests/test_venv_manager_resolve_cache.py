@@ -0,0 +1,99 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Ague Samuel Amen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from Core.Venv_Manager.Manager import VenvManager
+
+
+def _bump(path: Path, ns: int) -> None:
+    os.utime(path, ns=(ns, ns))
+
+
+@pytest.fixture
+def mgr(tmp_path: Path, monkeypatch, dummy_parent):
+    m = VenvManager(dummy_parent(tmp_path))
+    calls = {"select": 0}
+    real_select = m.select_best_venv
+
+    def _select(base):
+        calls["select"] += 1
+        return real_select(base)
+
+    monkeypatch.setattr(m, "_detect_environment_manager", lambda base: "pip")
+    monkeypatch.setattr(m, "verify_venv_binding", lambda root: True)
+    monkeypatch.setattr(m, "select_best_venv", _select)
+    m.calls = calls
+    return m
+
+
+def test_resolution_is_cached_until_inputs_change(
+    tmp_path: Path, mgr, make_fake_venv
+) -> None:
+    venv = make_fake_venv(tmp_path / ".venv")
+    expected = str(venv)
+
+    assert mgr.resolve_project_venv() == expected
+    for _ in range(20):
+        assert mgr.resolve_project_venv() == expected
+    assert mgr.calls["select"] == 1
+
+    # pyvenv.cfg modifié (recréation du venv): nouvelle résolution
+    (venv / "pyvenv.cfg").write_text(
+        "include-system-site-packages = true\n", encoding="utf-8"
+    )
+    _bump(venv / "pyvenv.cfg", 1)
+    assert mgr.resolve_existing_venv() is None
+    assert mgr.calls["select"] == 2
+
+
+def test_new_candidate_or_lock_file_invalidates(
+    tmp_path: Path, mgr, make_fake_venv
+) -> None:
+    assert mgr.resolve_existing_venv() is None
+    assert mgr.resolve_existing_venv() is None
+    assert mgr.calls["select"] == 1
+
+    venv = make_fake_venv(tmp_path / "venv")
+    _bump(tmp_path, 2)
+    assert mgr.resolve_existing_venv() == str(venv)
+    assert mgr.calls["select"] == 2
+
+    (tmp_path / "poetry.lock").write_text("", encoding="utf-8")
+    assert mgr.resolve_existing_venv() == str(venv)
+    assert mgr.calls["select"] == 3
+
+    mgr.invalidate_venv_cache(str(tmp_path))
+    assert mgr.resolve_existing_venv() == str(venv)
+    assert mgr.calls["select"] == 4
+
+
+def test_manual_and_system_python_bypass_cache(
+    tmp_path: Path, mgr, make_fake_venv
+) -> None:
+    make_fake_venv(tmp_path / ".venv")
+    assert mgr.resolve_existing_venv() == str(tmp_path / ".venv")
+    mgr.parent.venv_path_manuel = str(tmp_path / "other")
+    assert mgr.resolve_project_venv() == str(tmp_path / "other")
+    mgr.parent.use_system_python = True
+    assert mgr.resolve_project_venv() is None
@@ -0,0 +1,105 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Ague Samuel Amen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from Core.Venv_Manager.Manager import VenvManager
+
+
+def test_candidates_scored_concurrently_without_revalidation(
+    tmp_path: Path, monkeypatch, dummy_parent, make_fake_venv
+) -> None:
+    make_fake_venv(tmp_path / ".venv", tools=("pip",))
+    best = make_fake_venv(tmp_path / "venv", tools=("pip", "pyinstaller"))
+    make_fake_venv(tmp_path / "env", tools=("pip",))
+    mgr = VenvManager(dummy_parent(tmp_path))
+
+    validations: list[str] = []
+    real_validate = mgr.validate_venv_strict
+
+    def _validate(root):
+        validations.append(os.path.basename(root))
+        return real_validate(root)
+
+    barrier = threading.Barrier(3, timeout=5)
+    binding_threads: set[str] = set()
+
+    def _binding(root):
+        binding_threads.add(threading.current_thread().name)
+        barrier.wait()  # les trois vérifications sont en vol simultanément
+        return True
+
+    monkeypatch.setattr(mgr, "validate_venv_strict", _validate)
+    monkeypatch.setattr(mgr, "_verify_venv_binding_uncached", _binding)
+
+    assert mgr.select_best_venv(str(tmp_path)) == str(best)
+    assert sorted(validations) == [".venv", "env", "venv"]
+    assert len(binding_threads) == 3
+
+
+def test_binding_memoized_per_pyvenv_cfg(
+    tmp_path: Path, monkeypatch, dummy_parent, make_fake_venv
+) -> None:
+    venv = make_fake_venv(tmp_path / ".venv", tools=("pip",))
+    mgr = VenvManager(dummy_parent(tmp_path))
+    calls: list[str] = []
+
+    def _binding(root):
+        calls.append(root)
+        return True
+
+    monkeypatch.setattr(mgr, "_verify_venv_binding_uncached", _binding)
+    assert mgr.verify_venv_binding(str(venv)) is True
+    assert mgr.verify_venv_binding(str(venv)) is True
+    results: list[bool] = []
+    mgr._verify_venv_binding_async(str(venv), results.append)
+    assert results == [True] and len(calls) == 1
+
+    os.utime(venv / "pyvenv.cfg", ns=(1, 1))
+    assert mgr.verify_venv_binding(str(venv)) is True
+    assert len(calls) == 2
+
+    mgr.invalidate_venv_cache(str(tmp_path))
+    assert mgr.verify_venv_binding(str(venv)) is True
+    assert len(calls) == 3
+
+
+def test_binding_failures_are_not_memoized(
+    tmp_path: Path, monkeypatch, dummy_parent, make_fake_venv
+) -> None:
+    venv = make_fake_venv(tmp_path / ".venv", tools=("pip",))
+    mgr = VenvManager(dummy_parent(tmp_path))
+    outcomes = [False, True]
+    calls: list[str] = []
+
+    def _binding(root):
+        calls.append(root)
+        return outcomes[len(calls) - 1]
+
+    monkeypatch.setattr(mgr, "_verify_venv_binding_uncached", _binding)
+    # Échec passager (délai dépassé, pip occupé...): revérifié au prochain appel
+    assert mgr.verify_venv_binding(str(venv)) is False
+    assert mgr.verify_venv_binding(str(venv)) is True
+    assert mgr.verify_venv_binding(str(venv)) is True
+    assert len(calls) == 2
@@ -0,0 +1,165 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Ague Samuel Amen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Manifeste persistant de packages, indexé par empreinte.
+
+Chaque sous-dossier (package) d'un répertoire est identifié par une empreinte
+calculée sur les (chemin relatif, taille, mtime_ns) de ses fichiers (stat
+uniquement, aucune lecture). Tant que l'empreinte ne change pas, les entrées
+mémorisées pour ce package sont relues depuis un fichier JSON placé à la
+racine du répertoire, sans importer le package.
+
+Les caches des plugins BCASL et des moteurs en dérivent: seuls le nom du
+fichier, la clé des entrées et la validation des entrées diffèrent.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Any, ClassVar, Optional, TypeVar, Union
+
+__all__ = ["PackageManifestCache", "package_fingerprint"]
+
+_PathLike = Union[str, "os.PathLike[str]"]
+_C = TypeVar("_C", bound="PackageManifestCache")
+
+
+def package_fingerprint(pkg_dir: _PathLike) -> str:
+    """Empreinte d'un package basée sur stat() de ses fichiers (hors __pycache__)."""
+    h = hashlib.sha1()  # noqa: S324 - empreinte de cache, pas de sécurité
+    base = os.fspath(pkg_dir)
+    rows: list[str] = []
+    for dirpath, dirnames, filenames in os.walk(base):
+        dirnames[:] = [d for d in dirnames if d != "__pycache__"]
+        rel_dir = os.path.relpath(dirpath, base)
+        for fn in filenames:
+            if fn.endswith((".pyc", ".pyo")):
+                continue
+            try:
+                st = os.stat(os.path.join(dirpath, fn))
+            except OSError:
+                continue
+            rows.append(f"{rel_dir}/{fn}:{st.st_size}:{st.st_mtime_ns}")
+    for row in sorted(rows):
+        h.update(row.encode("utf-8", "surrogateescape"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+class PackageManifestCache:
+    """Manifeste persistant {package -> (empreinte, entrées)}.
+
+    Les sous-classes fixent FILENAME, ENTRY_KEY et SCHEMA, et peuvent
+    redéfinir clean_entries() pour valider les entrées relues. Le fichier est
+    écrit au mieux (dossier en lecture seule => cache mémoire seul).
+    """
+
+    FILENAME: ClassVar[str] = ".manifest.json"
+    ENTRY_KEY: ClassVar[str] = "entries"
+    # Incrémenter dans la sous-classe si le format des entrées change
+    SCHEMA: ClassVar[int] = 1
+    logger: ClassVar[Optional[logging.Logger]] = None
+
+    # Une instance par (classe, dossier) pour éviter de relire le JSON à chaque appel
+    _instances: ClassVar[dict[Any, "PackageManifestCache"]] = {}
+    _instances_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, directory: _PathLike) -> None:
+        self.directory = os.fspath(directory)
+        self.path = os.path.join(self.directory, self.FILENAME)
+        self._lock = threading.Lock()
+        self._packages: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    @classmethod
+    def for_directory(cls: type[_C], directory: _PathLike) -> _C:
+        path = os.path.realpath(os.fspath(directory))
+        key = (cls, path)
+        with cls._instances_lock:
+            inst = cls._instances.get(key)
+            if not isinstance(inst, cls):
+                inst = cls(path)
+                cls._instances[key] = inst
+            return inst
+
+    def clean_entries(self, raw: Any) -> Optional[list[dict[str, Any]]]:
+        """Entrées valides (dictionnaires avec un "id"), ou None si illisibles."""
+        if not isinstance(raw, list):
+            return None
+        return [dict(e) for e in raw if isinstance(e, dict) and e.get("id")]
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if (
+                isinstance(data, dict)
+                and data.get("schema") == self.SCHEMA
+                and isinstance(data.get("packages"), dict)
+            ):
+                self._packages = dict(data["packages"])
+        except Exception:
+            self._packages = {}
+
+    def lookup(self, pkg_dir: _PathLike) -> Optional[list[dict[str, Any]]]:
+        """Retourne les entrées du package si l'empreinte est inchangée, sinon None."""
+        fp = package_fingerprint(pkg_dir)
+        with self._lock:
+            cached = self._packages.get(os.path.basename(os.fspath(pkg_dir)))
+        if not isinstance(cached, dict) or cached.get("fingerprint") != fp:
+            return None
+        return self.clean_entries(cached.get(self.ENTRY_KEY))
+
+    def store(self, pkg_dir: _PathLike, entries: list[dict[str, Any]]) -> None:
+        fp = package_fingerprint(pkg_dir)
+        with self._lock:
+            self._packages[os.path.basename(os.fspath(pkg_dir))] = {
+                "fingerprint": fp,
+                self.ENTRY_KEY: [dict(e) for e in entries],
+            }
+            self._dirty = True
+
+    def prune(self, keep: set[str]) -> None:
+        """Oublie les packages disparus du dossier."""
+        with self._lock:
+            for name in list(self._packages):
+                if name not in keep:
+                    del self._packages[name]
+                    self._dirty = True
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = {"schema": self.SCHEMA, "packages": self._packages}
+            tmp = self.path + ".tmp"
+            try:
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(payload, f, indent=2, ensure_ascii=False)
+                os.replace(tmp, self.path)
+                self._dirty = False
+            except Exception as exc:
+                if self.logger is not None:
+                    self.logger.debug("Manifeste non écrit (%s): %s", self.path, exc)
+                try:
+                    os.unlink(tmp)
+                except Exception:
+                    pass
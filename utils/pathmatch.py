@@ -0,0 +1,249 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Ague Samuel Amen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compilation de motifs glob en expressions régulières uniques.
+
+Sémantique (chemins relatifs, séparateur '/'):
+- '*'  : n'importe quelle suite de caractères hors '/'
+- '?'  : un caractère hors '/'
+- '[..]': classe de caractères ('!' ou '^' pour la négation)
+- '**' : zéro ou plusieurs segments de dossier complets
+- motif sans '/' (ex: '*.pyc'): comparé aussi au nom de base du fichier
+
+PathMatcher compile un ensemble de motifs seul (ancré à la racine, ou par la
+droite comme Path.match) et walk_files parcourt un arbre en élaguant les
+dossiers exclus; ils servent à bcasl (PreCompileContext.iter_files) et aux
+utilitaires fichiers du Plugins_SDK. Module sans dépendance vers l'hôte.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from functools import lru_cache
+from typing import Iterator, Optional
+
+__all__ = [
+    "glob_to_regex",
+    "PathMatcher",
+    "compile_matcher",
+    "walk_files",
+]
+
+
+def _normalize_pattern(pattern: str) -> str:
+    pat = str(pattern or "").strip().replace("\\", "/")
+    while pat.startswith("./"):
+        pat = pat[2:]
+    while "//" in pat:
+        pat = pat.replace("//", "/")
+    return pat
+
+
+def _translate_segment(seg: str) -> str:
+    out: list[str] = []
+    i, n = 0, len(seg)
+    while i < n:
+        c = seg[i]
+        i += 1
+        if c == "*":
+            # '***' et plus équivalent à '*' dans un segment
+            while i < n and seg[i] == "*":
+                i += 1
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            j = i
+            if j < n and seg[j] in "!^":
+                j += 1
+            if j < n and seg[j] == "]":
+                j += 1
+            while j < n and seg[j] != "]":
+                j += 1
+            if j >= n:
+                out.append("\\[")
+            else:
+                body = seg[i:j].replace("\\", "\\\\").replace("[", "\\[")
+                i = j + 1
+                if body and body[0] in "!^":
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+        else:
+            out.append(re.escape(c))
+    return "".join(out)
+
+
+def glob_to_regex(pattern: str) -> str:
+    """Traduit un motif glob (avec '**') en regex non ancrée."""
+    pat = _normalize_pattern(pattern)
+    if not pat:
+        return ""
+    segs = pat.rstrip("/").split("/")
+    parts: list[str] = []
+    last = len(segs) - 1
+    for i, seg in enumerate(segs):
+        if seg == "**":
+            parts.append(".*" if i == last else "(?:.*/)?")
+        else:
+            parts.append(_translate_segment(seg) + ("" if i == last else "/"))
+    return "".join(parts)
+
+
+def _join(regexes: list[str]) -> Optional[re.Pattern[str]]:
+    if not regexes:
+        return None
+    return re.compile("(?:" + "|".join(regexes) + r")\Z", re.DOTALL)
+
+
+def _literal_prefix(pat: str) -> tuple[str, ...]:
+    """Segments de dossier sans joker en tête d'un motif."""
+    lit: list[str] = []
+    for seg in _normalize_pattern(pat).split("/")[:-1]:
+        if any(ch in seg for ch in "*?["):
+            break
+        lit.append(seg)
+    return tuple(lit)
+
+
+class PathMatcher:
+    """Ensemble de motifs glob compilé en une seule regex.
+
+    - anchored=True: le motif décrit le chemin relatif complet depuis la racine
+      (sémantique de Path.glob, '**' compris)
+    - anchored=False: le motif peut matcher n'importe quel suffixe de segments
+      (comme Path.match, comparaison par la droite); un motif commençant par
+      '/' reste ancré à la racine
+    - prune_dir(rel): tout le contenu du dossier matche ('dir/**' ou 'dir/'),
+      inutile d'y descendre
+    - may_contain(rel): (ancré) un motif peut encore matcher sous ce dossier
+    - max_depth: (ancré) nombre maximal de segments d'un chemin accepté, None
+      si un motif contient '**'; au-delà, walk_files ne descend plus
+    """
+
+    __slots__ = ("patterns", "anchored", "max_depth", "_rx", "_prune", "_prefixes")
+
+    def __init__(self, patterns: tuple[str, ...], anchored: bool = True) -> None:
+        self.patterns = tuple(patterns)
+        self.anchored = bool(anchored)
+        rx: list[str] = []
+        prune: list[str] = []
+        prefixes: list[tuple[str, ...]] = []
+        walk_all = False
+        depth: Optional[int] = 0 if anchored else None
+        for pat in self.patterns:
+            norm = _normalize_pattern(pat)
+            # '/motif' : ancré à la racine même en mode non ancré
+            rooted = norm.startswith("/")
+            norm = norm.lstrip("/")
+            body = glob_to_regex(norm)
+            if not body:
+                continue
+            lead = "" if anchored or rooted else "(?:.*/)?"
+            rx.append(lead + body)
+            if norm.endswith("/**") and len(norm) > 3:
+                prune.append(lead + glob_to_regex(norm[:-3]))
+            elif norm.endswith("/"):
+                prune.append(lead + body)
+            if anchored:
+                segs = norm.rstrip("/").split("/")
+                if depth is not None:
+                    depth = None if "**" in segs else max(depth, len(segs))
+                lit = _literal_prefix(norm)
+                if not lit:
+                    walk_all = True
+                prefixes.append(lit)
+        self._rx = _join(rx)
+        self._prune = _join(prune)
+        self._prefixes: Optional[tuple[tuple[str, ...], ...]] = (
+            None if (walk_all or not anchored) else tuple(prefixes)
+        )
+        # Motifs sans '**' (ex: '*.py'): profondeur bornée même sans préfixe littéral
+        self.max_depth = depth if rx else None
+
+    def matches(self, rel: str) -> bool:
+        return self._rx is not None and self._rx.match(rel) is not None
+
+    __call__ = matches
+
+    def prune_dir(self, rel: str) -> bool:
+        return self._prune is not None and self._prune.match(rel) is not None
+
+    def may_contain(self, rel: str) -> bool:
+        segs = tuple(rel.split("/")) if rel else ()
+        if self.max_depth is not None and len(segs) >= self.max_depth:
+            return False
+        if self._prefixes is None:
+            return True
+        for pref in self._prefixes:
+            n = min(len(pref), len(segs))
+            if pref[:n] == segs[:n]:
+                return True
+        return False
+
+
+@lru_cache(maxsize=256)
+def compile_matcher(patterns: tuple[str, ...], anchored: bool = True) -> PathMatcher:
+    """Compile (avec cache LRU) un ensemble de motifs."""
+    return PathMatcher(tuple(str(p) for p in patterns), anchored)
+
+
+def walk_files(
+    root: str,
+    include: Optional[PathMatcher] = None,
+    exclude: Optional[PathMatcher] = None,
+    max_depth: Optional[int] = None,
+) -> Iterator[tuple[str, str, os.DirEntry]]:
+    """Parcourt root et produit (chemin, chemin relatif posix, DirEntry) des fichiers.
+
+    Un seul passage os.scandir, entrées triées; les dossiers entièrement
+    exclus ('dir/**'), hors préfixe ou profondeur d'inclusion, ou au-delà de max_depth
+    (profondeur = nombre de segments du chemin relatif) ne sont pas parcourus. Les liens symboliques vers des
+    dossiers ne sont pas suivis (comme Path.glob('**')).
+    """
+    stack: list[tuple[str, str, int]] = [(root, "", 0)]
+    while stack:
+        dir_path, rel_dir, depth = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+        subdirs: list[tuple[str, str, int]] = []
+        for entry in entries:
+            rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if max_depth is not None and depth + 1 >= max_depth:
+                        continue
+                    if exclude is not None and exclude.prune_dir(rel):
+                        continue
+                    if include is not None and not include.may_contain(rel):
+                        continue
+                    subdirs.append((entry.path, rel, depth + 1))
+                    continue
+                if not entry.is_file():
+                    continue
+            except OSError:
+                continue
+            if max_depth is not None and depth + 1 > max_depth:
+                continue
+            if include is not None and not include.matches(rel):
+                continue
+            if exclude is not None and exclude.matches(rel):
+                continue
+            yield entry.path, rel, entry
+        stack.extend(reversed(subdirs))